@@ -13,12 +13,9 @@ from app.services.experiment_engine import (
     ABTestResult,
     generate_experiment_id,
     generate_variant_id,
-    calculate_engagement_rate,
-    calculate_statistical_significance,
+    analyze_variants,
     determine_minimum_sample_size,
     is_result_conclusive,
-    identify_winner,
-    calculate_lift
 )
 
 logger = logging.getLogger(__name__)
@@ -213,22 +210,23 @@ class ABTestingAgent(BaseAgent):
         if len(experiment.variants) < 2:
             raise ValueError("Need at least 2 variants to analyze")
 
-        # Calculate engagement rates for all variants
-        for variant in experiment.variants:
-            variant.engagement_rate = calculate_engagement_rate(
-                variant.engagements,
-                variant.impressions
-            )
-
-        # Compare variants (assuming first is control)
+        # Engagement rates and all comparisons in one vectorized pass
+        report = analyze_variants(experiment.variants)
         control = experiment.variants[0]
-        test = experiment.variants[1]
 
-        # Calculate statistical significance
-        significance = calculate_statistical_significance(control, test)
+        # Strongest challenger against the control decides winner, lift and p-value
+        # (significant improvements first, then the lowest adjusted p)
+        best = min(
+            report.versus_control,
+            key=lambda c: (not (c.is_significant and c.lift_percent > 0), c.adjusted_p_value)
+        )
+        significance = best.adjusted_p_value
+        lift = best.lift_percent
 
-        # Determine winner
-        winner = identify_winner(experiment.variants)
+        # Winner only when that comparison is significant; if it is a loss, the control wins
+        winner = None
+        if best.is_significant:
+            winner = best.challenger if lift > 0 else control.variant_name
 
         # Check if conclusive
         avg_sample_size = sum(v.impressions for v in experiment.variants) // len(experiment.variants)
@@ -238,17 +236,19 @@ class ABTestingAgent(BaseAgent):
             experiment.target_sample_size
         )
 
-        # Calculate lift
-        lift = calculate_lift(control.engagement_rate, test.engagement_rate)
+        variant_lines = "".join(
+            f"Variant {c.challenger}: {c.challenger_rate:.2%} engagement rate, "
+            f"lift {c.lift_percent:.1f}%, p={c.adjusted_p_value:.3f}\n"
+            for c in report.versus_control
+        )
 
         # Generate AI insights
         prompt = (
             f"Analyze these A/B test results:\n\n"
             f"Variable tested: {experiment.variable_tested}\n"
-            f"Control (A): {control.engagement_rate:.2%} engagement rate\n"
-            f"Test (B): {test.engagement_rate:.2%} engagement rate\n"
-            f"Lift: {lift:.1f}%\n"
-            f"Statistical significance: p={significance:.3f}\n"
+            f"Control ({control.variant_name}): {control.engagement_rate:.2%} engagement rate\n"
+            f"{variant_lines}"
+            f"Best challenger vs control: {best.challenger}, p={significance:.3f} (Holm-adjusted)\n"
             f"Sample size: {avg_sample_size}\n\n"
             f"Provide 3 key insights about these results."
         )
@@ -266,7 +266,12 @@ class ABTestingAgent(BaseAgent):
         ][:3]
 
         # Generate recommendation
-        if conclusive and winner:
+        if conclusive and winner == control.variant_name:
+            recommendation = (
+                f"Keep Variant {winner} (control) - Variant {best.challenger} is "
+                f"significantly worse ({lift:.1f}%)"
+            )
+        elif conclusive and winner:
             recommendation = f"Implement Variant {winner} - statistically significant improvement of {lift:.1f}%"
         elif not conclusive:
             recommendation = f"Continue test - need {experiment.target_sample_size - avg_sample_size} more samples"
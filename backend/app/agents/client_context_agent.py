@@ -8,6 +8,7 @@ from typing import Optional
 import json
 
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.data_loader import loader, loader_scope
 from app.infrastructure.repositories.client_context_repository import ClientContextRepository
 from app.domain.agents.context_entity import ClientContext
 from app.services.llm_router import LLMRouter
@@ -37,20 +38,22 @@ class ClientContextAgent:
             dict with complete client context
         """
         try:
-            # 1. Gather client data
-            client_data = await self._gather_client_data(client_id)
+            # One loader scope per run: client_context is read once for find + upsert
+            with loader_scope():
+                # 1. Gather client data
+                client_data = await self._gather_client_data(client_id)
 
-            if not client_data["client"]:
-                return {
-                    "error": "Client not found",
-                    "client_id": client_id
-                }
+                if not client_data["client"]:
+                    return {
+                        "error": "Client not found",
+                        "client_id": client_id
+                    }
 
-            # 2. Analyze with GPT-4o
-            analysis = await self._analyze_with_llm(client_data)
+                # 2. Analyze with GPT-4o
+                analysis = await self._analyze_with_llm(client_data)
 
-            # 3. Save to client_context
-            context = await self._save_context(client_id, analysis)
+                # 3. Save to client_context
+                context = await self._save_context(client_id, analysis)
 
             logger.info(f"ClientContextAgent: Context built for client {client_id}")
 
@@ -76,19 +79,9 @@ class ClientContextAgent:
 
     async def _gather_client_data(self, client_id: str) -> dict:
         """Gather all available client data"""
-        # Get client info
-        client_resp = self.supabase.client.table("clients")\
-            .select("*")\
-            .eq("id", client_id)\
-            .limit(1)\
-            .execute()
-
-        # Get social accounts
-        accounts_resp = self.supabase.client.table("social_accounts")\
-            .select("*")\
-            .eq("client_id", client_id)\
-            .eq("is_active", True)\
-            .execute()
+        # Get client info and social accounts (memoized for the request/run)
+        client = loader("clients", supabase=self.supabase).get(client_id)
+        accounts = loader("social_accounts", "client_id", many=True, supabase=self.supabase).get(client_id)
 
         # Get recent generated content
         content_resp = self.supabase.client.table("content_lab_generated")\
@@ -108,8 +101,8 @@ class ClientContextAgent:
             .execute()
 
         return {
-            "client": client_resp.data[0] if client_resp.data else None,
-            "social_accounts": accounts_resp.data or [],
+            "client": client,
+            "social_accounts": [account for account in accounts if account.get("is_active")],
             "recent_content": content_resp.data or [],
             "scheduled_posts": posts_resp.data or []
         }
@@ -6,7 +6,6 @@ import os
 import logging
 import asyncio
 from typing import Optional
-import fal_client
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +77,7 @@ class FalVideoAgent:
                 arguments["guidance_scale"] = 7.5
 
             # Subscribe to Fal model (async with timeout for Hunyuan)
+            import fal_client  # deferred: SDK import is only paid by video requests
             if model == "hunyuan":
                 try:
                     result = await asyncio.wait_for(
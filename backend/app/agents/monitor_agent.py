@@ -14,6 +14,7 @@ from app.services.health_checker import (
     SystemAnomaly,
     AlertNotification
 )
+from app.services.metrics import metrics_engine
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +67,10 @@ class MonitorAgent(BaseAgent):
                 result = await self.detect_system_anomalies(
                     task.get("metrics_history", [])
                 )
+            elif task_type == "live_anomalies":
+                result = await self.detect_live_anomalies(
+                    task.get("z_threshold", 3.0)
+                )
             elif task_type == "generate_alert":
                 result = await self.generate_alert(task["anomaly"])
             else:
@@ -157,11 +162,15 @@ class MonitorAgent(BaseAgent):
         self,
         metrics_history: List[Dict[str, Any]]
     ) -> List[SystemAnomaly]:
-        """Detect anomalies in system metrics"""
+        """
+        Detect anomalies in caller-supplied system metrics
+        
+        Without a history, falls back to the live streaming baselines.
+        """
         anomalies = []
         
         if not metrics_history:
-            return anomalies
+            return await self.detect_live_anomalies()
         
         # Analyze error rate trend
         recent_errors = [m.get("error_count", 0) for m in metrics_history[-10:]]
@@ -197,6 +206,18 @@ class MonitorAgent(BaseAgent):
         
         return anomalies
     
+    async def detect_live_anomalies(
+        self,
+        z_threshold: float = 3.0
+    ) -> List[SystemAnomaly]:
+        """Detect anomalies from the metrics engine's running baselines (O(series))"""
+        anomalies = []
+        for summary in metrics_engine.anomalies(z_threshold):
+            anomaly = health_checker.detect_baseline_anomaly(summary, z_threshold)
+            if anomaly:
+                anomalies.append(anomaly)
+        return anomalies
+    
     async def generate_alert(
         self,
         anomaly: SystemAnomaly
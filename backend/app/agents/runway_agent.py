@@ -6,7 +6,8 @@ import os
 import logging
 import asyncio
 from typing import Optional
-from runwayml import RunwayML
+
+from app.infrastructure.ai.clients import get_runway_client
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +17,13 @@ class RunwayAgent:
 
     def __init__(self):
         self.api_key = os.getenv("RUNWAY_API_KEY", "")
-        self.client = RunwayML(api_key=self.api_key) if self.api_key else None
         self.model = "gen3a_turbo"
 
+    @property
+    def client(self):
+        """RunwayML client, created on first call (None without an API key)"""
+        return get_runway_client(self.api_key) if self.api_key else None
+
     async def execute(
         self,
         prompt: str,
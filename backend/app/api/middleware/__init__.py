@@ -0,0 +1,10 @@
+"""
+ASGI middleware
+"""
+from app.api.middleware.data_loader import DataLoaderMiddleware
+from app.api.middleware.lazy_routes import LazyRouteMiddleware, LazyRoutes
+from app.api.middleware.query_tracer import QueryBudgetExceeded, QueryTracerMiddleware
+from app.api.middleware.request_metrics import RequestMetricsMiddleware
+
+__all__ = ["DataLoaderMiddleware", "LazyRouteMiddleware", "LazyRoutes", "QueryBudgetExceeded",
+           "QueryTracerMiddleware", "RequestMetricsMiddleware"]
@@ -0,0 +1,34 @@
+"""
+Data Loader Middleware
+Opens one row-loader scope per HTTP request
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Awaitable, Callable, MutableMapping
+import logging
+
+from app.infrastructure.data_loader import loader_scope
+
+logger = logging.getLogger(__name__)
+
+# ASGI scope/message are untyped mappings by spec
+Scope = MutableMapping[str, object]
+Message = MutableMapping[str, object]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class DataLoaderMiddleware:
+    """
+    Pure ASGI middleware: repositories reading through app.infrastructure.data_loader
+    share memoized rows for the lifetime of the request, then the cache is dropped.
+    """
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with loader_scope():
+            await self.app(scope, receive, send)
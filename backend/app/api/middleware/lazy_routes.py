@@ -0,0 +1,98 @@
+"""
+Lazy Route Groups
+Rarely used route packages are imported and mounted on their first request
+Filosofía: No velocity, only precision 🐢💎
+"""
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, MutableMapping, Tuple
+import importlib
+import logging
+import time
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+# ASGI scope/message are untyped mappings by spec
+Scope = MutableMapping[str, object]
+Message = MutableMapping[str, object]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+# Paths that describe every route (schema, docs), so every group is mounted first
+SCHEMA_PATHS = ("/openapi.json", "/docs", "/redoc")
+
+
+@dataclass
+class LazyRouteGroup:
+    """Route packages sharing one URL prefix, mounted together in order."""
+    path: str
+    # (module, include_router kwargs) pairs
+    routers: List[Tuple[str, Dict[str, Any]]] = field(default_factory=list)
+    mounted: bool = False
+
+    def matches(self, path: str) -> bool:
+        return path == self.path or path.startswith(self.path + "/")
+
+
+class LazyRoutes:
+    """
+    Registry of deferred route groups for one app.
+
+    With enabled=False (the default, LAZY_ROUTE_GROUPS=false) every group
+    is mounted immediately and app.routes is complete from startup.
+    """
+
+    def __init__(self, app: FastAPI, enabled: bool = False, full_paths: Tuple[str, ...] = ()):
+        self.app = app
+        self.enabled = enabled
+        # Extra exact paths that need every route mounted (endpoint counters)
+        self.full_paths = SCHEMA_PATHS + full_paths
+        self.groups: List[LazyRouteGroup] = []
+
+    def add(self, path: str, *routers: Tuple[str, Dict[str, Any]]) -> None:
+        """Declare a group: URL prefix plus (module, include_router kwargs) pairs."""
+        group = LazyRouteGroup(path, list(routers))
+        self.groups.append(group)
+        if not self.enabled:
+            self.mount(group)
+
+    def mount(self, group: LazyRouteGroup) -> None:
+        if group.mounted:
+            return
+        start = time.perf_counter()
+        for module, kwargs in group.routers:
+            self.app.include_router(importlib.import_module(module).router, **kwargs)
+        group.mounted = True
+        self.app.openapi_schema = None  # regenerate docs with the new routes
+        logger.info(f"Route group {group.path} mounted in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    def mount_all(self) -> None:
+        for group in self.groups:
+            self.mount(group)
+
+    def mount_for(self, path: str) -> None:
+        """Mount whatever a request path needs (all groups for schema/docs/counters)."""
+        if path in self.full_paths:
+            self.mount_all()
+            return
+        for group in self.groups:
+            if not group.mounted and group.matches(path):
+                self.mount(group)
+
+    @property
+    def pending(self) -> int:
+        return sum(not group.mounted for group in self.groups)
+
+
+class LazyRouteMiddleware:
+    """Pure ASGI middleware: mounts a pending group before routing its request."""
+
+    def __init__(self, app: Callable, routes: LazyRoutes):
+        self.app = app
+        self.routes = routes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.routes.pending:
+            self.routes.mount_for(str(scope["path"]))
+        await self.app(scope, receive, send)
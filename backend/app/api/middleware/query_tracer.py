@@ -0,0 +1,99 @@
+"""
+Query Tracer Middleware
+Per-request database round-trip summary: X-Query-* headers, structured log,
+N+1 warnings and per-route query budgets
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Awaitable, Callable, Dict, MutableMapping, Optional
+import json
+import logging
+
+from app.infrastructure.query_tracer import N_PLUS_ONE_THRESHOLD, QueryTrace, trace_queries
+
+logger = logging.getLogger(__name__)
+
+# ASGI scope/message are untyped mappings by spec
+Scope = MutableMapping[str, object]
+Message = MutableMapping[str, object]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A route issued more queries than its budget (QUERY_BUDGET_ENFORCE=true)."""
+
+
+class QueryTracerMiddleware:
+    """
+    Pure ASGI middleware, enabled with QUERY_TRACER=true (development/staging).
+
+    Budgets are keyed like request metrics, by method + route template
+    ("GET /api/v1/nova/briefing"). Over-budget requests are logged, or
+    raise QueryBudgetExceeded after the response when enforce=True, which
+    fails the calling TestClient test.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        budgets: Optional[Dict[str, int]] = None,
+        default_budget: int = 0,
+        enforce: bool = False,
+        n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD,
+    ):
+        self.app = app
+        self.budgets = budgets or {}
+        self.default_budget = default_budget
+        self.enforce = enforce
+        self.threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with trace_queries() as trace:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = list(message.get("headers", [])) + self._headers(scope, trace)
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
+            self._report(scope, trace)
+
+    def _route(self, scope: Scope) -> str:
+        path = getattr(scope.get("route"), "path", None) or str(scope["path"])
+        return f"{scope['method']} {path}"
+
+    def _budget(self, route: str) -> int:
+        return self.budgets.get(route, self.default_budget)
+
+    def _headers(self, scope: Scope, trace: QueryTrace) -> list:
+        headers = [
+            (b"x-query-count", str(trace.count).encode()),
+            (b"x-query-time-ms", f"{sum(r.duration_ms for r in trace.records):.1f}".encode()),
+            (b"x-query-repeated", str(sum(n - 1 for n in trace.repeated().values())).encode()),
+            (b"x-query-n-plus-one", str(len(trace.n_plus_one(self.threshold))).encode()),
+        ]
+        budget = self._budget(self._route(scope))
+        if budget:
+            headers.append((b"x-query-budget", str(budget).encode()))
+        return headers
+
+    def _report(self, scope: Scope, trace: QueryTrace) -> None:
+        route = self._route(scope)
+        summary = trace.summary(self.threshold)
+        records = summary.pop("records")
+        budget = self._budget(route)
+        over_budget = bool(budget) and trace.count > budget
+        flagged = over_budget or summary["repeated"] or summary["n_plus_one"]
+
+        payload = {"route": route, "budget": budget or None, **summary}
+        if flagged:
+            logger.warning(f"Query trace {json.dumps(payload)}")
+        else:
+            logger.info(f"Query trace {json.dumps(payload)}")
+        logger.debug(f"Query trace records {route}: {json.dumps(records)}")
+
+        if over_budget and self.enforce:
+            raise QueryBudgetExceeded(f"{route} issued {trace.count} queries (budget {budget})")
@@ -0,0 +1,62 @@
+"""
+Request Metrics Middleware
+Feeds per-endpoint latency and error outcomes into the metrics engine
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Awaitable, Callable, MutableMapping
+import time
+import logging
+
+from app.services.metrics import MetricsEngine, metrics_engine
+
+logger = logging.getLogger(__name__)
+
+# ASGI scope/message are untyped mappings by spec
+Scope = MutableMapping[str, object]
+Message = MutableMapping[str, object]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+UNMATCHED_ENDPOINT = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware body buffering).
+
+    Endpoints are keyed by method + route template ("GET /api/v1/clients/{client_id}"),
+    not the raw path, so series cardinality stays bounded.
+    """
+
+    def __init__(self, app: Callable, engine: MetricsEngine = metrics_engine):
+        self.app = app
+        self.engine = engine
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            latency_ms = (time.perf_counter() - start) * 1000
+            self.engine.observe_request(self._endpoint(scope), latency_ms, status_code >= 500)
+
+    @staticmethod
+    def _endpoint(scope: Scope) -> str:
+        """Route template set by FastAPI routing, or a shared bucket for 404s."""
+        route = scope.get("route")
+        path = getattr(route, "path", None)
+        if path is None:
+            return UNMATCHED_ENDPOINT
+        return f"{scope['method']} {path}"
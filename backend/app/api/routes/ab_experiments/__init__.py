@@ -0,0 +1,6 @@
+"""
+A/B Experiment Store API Routes
+"""
+from .router import router
+
+__all__ = ["router"]
@@ -0,0 +1,13 @@
+"""
+A/B Experiment Store Handlers — Business logic for stored experiments.
+DDD: Application layer handlers.
+"""
+from .experiments import handle_create_experiment, handle_get_experiment, handle_analyze_experiment
+from .events import handle_ingest_events
+
+__all__ = [
+    "handle_create_experiment",
+    "handle_get_experiment",
+    "handle_analyze_experiment",
+    "handle_ingest_events"
+]
@@ -0,0 +1,25 @@
+"""
+Event Handlers — Batched counter ingestion for stored experiments.
+DDD: Application layer - write path.
+Strict <200L per file.
+"""
+from fastapi import HTTPException
+from app.services.experiments import record_events
+from ..models import EventBatchRequest, EventBatchResponse
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def handle_ingest_events(request: EventBatchRequest) -> EventBatchResponse:
+    """
+    Acumula los incrementos en memoria; el volcado a la base es periódico
+    (o inmediato al superar FLUSH_THRESHOLD) y atómico por lote.
+    """
+    try:
+        pending = await record_events([e.model_dump() for e in request.events])
+        return EventBatchResponse(accepted=len(request.events), pending=pending)
+
+    except Exception as e:
+        logger.error(f"Error ingesting experiment events: {e}")
+        raise HTTPException(500, f"Error ingesting events: {str(e)}")
@@ -0,0 +1,88 @@
+"""
+Experiment Handlers — Create, read and analyze stored experiments.
+DDD: Application layer - experiment lifecycle.
+Strict <200L per file.
+"""
+from fastapi import HTTPException
+from datetime import datetime, timezone
+from app.services.experiment_engine import ABVariant, Experiment
+from app.services.experiments import analyze_experiment, create_experiment, load_experiment
+from app.services.significance_engine import SignificanceReport
+from ..models import ExperimentCreate
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+async def handle_create_experiment(request: ExperimentCreate) -> Experiment:
+    """
+    Persiste un experimento con contadores en cero por variante.
+    La primera variante es el control.
+    """
+    try:
+        experiment = Experiment(
+            experiment_id=request.experiment_id or str(uuid.uuid4()),
+            client_id=request.client_id,
+            hypothesis=request.hypothesis,
+            variable_tested=request.variable_tested,
+            platform=request.platform,
+            status="running",
+            started_at=datetime.now(timezone.utc).isoformat(),
+            completed_at=None,
+            target_sample_size=request.target_sample_size,
+            variants=[
+                ABVariant(
+                    variant_id=v.variant_id or str(uuid.uuid4()),
+                    variant_name=v.variant_name,
+                    description=v.description,
+                    content=v.content,
+                    impressions=0, engagements=0, clicks=0, conversions=0,
+                    engagement_rate=0.0
+                )
+                for v in request.variants
+            ]
+        )
+        return await create_experiment(experiment)
+
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except Exception as e:
+        logger.error(f"Error creating experiment: {e}")
+        raise HTTPException(500, f"Error creating experiment: {str(e)}")
+
+
+async def handle_get_experiment(experiment_id: str) -> Experiment:
+    """
+    Experimento con contadores agregados (incluye eventos aún no volcados).
+    """
+    try:
+        experiment = await load_experiment(experiment_id)
+        if experiment is None:
+            raise HTTPException(404, f"Experiment {experiment_id} not found")
+        return experiment
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error loading experiment {experiment_id}: {e}")
+        raise HTTPException(500, f"Error loading experiment: {str(e)}")
+
+
+async def handle_analyze_experiment(experiment_id: str, alpha: float) -> SignificanceReport:
+    """
+    Significancia N-variantes desde los agregados — O(variantes) filas leídas.
+    """
+    try:
+        report = await analyze_experiment(experiment_id, alpha)
+        if report is None:
+            raise HTTPException(404, f"Experiment {experiment_id} not found")
+        return report
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except Exception as e:
+        logger.error(f"Error analyzing experiment {experiment_id}: {e}")
+        raise HTTPException(500, f"Error analyzing experiment: {str(e)}")
@@ -0,0 +1,45 @@
+"""
+Pydantic models for the A/B Experiment Store API.
+"""
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class VariantCreate(BaseModel):
+    """Variant definition — counters start at zero"""
+    variant_name: str = Field(..., min_length=1, max_length=32, description="A | B | C ...")
+    description: str = Field(default="", description="What this variant changes")
+    content: dict[str, str] = Field(default_factory=dict, description="Content being tested")
+    variant_id: Optional[str] = Field(None, description="Generated when omitted")
+
+
+class ExperimentCreate(BaseModel):
+    """Request model for storing a new experiment (first variant is the control)"""
+    client_id: str = Field(..., description="Client ID")
+    hypothesis: str = Field(..., description="Test hypothesis")
+    variable_tested: str = Field(..., description="caption | image | posting_time | hashtags | cta | hook")
+    platform: str = Field(..., description="Target platform")
+    variants: List[VariantCreate] = Field(..., min_length=2, description="Control first")
+    target_sample_size: int = Field(default=1000, ge=1, description="Impressions per variant")
+    experiment_id: Optional[str] = Field(None, description="Generated when omitted")
+
+
+class VariantEvent(BaseModel):
+    """Counter increments for one variant"""
+    experiment_id: str
+    variant_name: str
+    impressions: int = Field(default=0, ge=0)
+    engagements: int = Field(default=0, ge=0)
+    clicks: int = Field(default=0, ge=0)
+    conversions: int = Field(default=0, ge=0)
+
+
+class EventBatchRequest(BaseModel):
+    """Batch of counter events — ingested into memory and flushed periodically"""
+    events: List[VariantEvent] = Field(..., min_length=1, max_length=10000)
+
+
+class EventBatchResponse(BaseModel):
+    """Ingestion acknowledgement"""
+    accepted: int
+    pending: int
@@ -0,0 +1,45 @@
+"""
+A/B Experiment Store Router — Thin delegation layer to handlers.
+Filosofía: No velocity, only precision 🐢💎
+DDD: API Interface layer - HTTP routing only.
+Strict <200L per file.
+"""
+from fastapi import APIRouter, Query
+from app.services.experiment_engine import Experiment
+from app.services.significance_engine import DEFAULT_ALPHA, SignificanceReport
+from .models import ExperimentCreate, EventBatchRequest, EventBatchResponse
+from .handlers import (
+    handle_create_experiment,
+    handle_get_experiment,
+    handle_analyze_experiment,
+    handle_ingest_events
+)
+
+router = APIRouter(prefix="/ab-testing/experiments", tags=["ab-testing"])
+
+
+@router.post("/", response_model=Experiment, status_code=201)
+async def create_experiment(request: ExperimentCreate):
+    """Crea un experimento persistente (primera variante = control)"""
+    return await handle_create_experiment(request)
+
+
+@router.post("/events", response_model=EventBatchResponse, status_code=202)
+async def ingest_events(request: EventBatchRequest):
+    """Ingesta por lotes de impresiones/engagements/clicks/conversiones"""
+    return await handle_ingest_events(request)
+
+
+@router.get("/{experiment_id}", response_model=Experiment)
+async def get_experiment(experiment_id: str):
+    """Obtiene el experimento con sus contadores agregados"""
+    return await handle_get_experiment(experiment_id)
+
+
+@router.get("/{experiment_id}/analysis", response_model=SignificanceReport)
+async def analyze_experiment(
+    experiment_id: str,
+    alpha: float = Query(DEFAULT_ALPHA, gt=0, lt=1, description="Significance level")
+):
+    """Analiza significancia desde los agregados, sin re-enviar payloads"""
+    return await handle_analyze_experiment(experiment_id, alpha)
@@ -11,6 +11,7 @@ from app.api.routes.agents.models import ExecuteAgentRequest, ExecutionResponse
 from app.domain.agents.entities import AgentExecution
 from app.infrastructure.supabase_service import get_supabase_service
 from app.infrastructure.repositories.agent_repository import AgentRepository
+from app.services.metrics import metrics_engine
 from .agent_helpers import save_to_client_context, execute_special_agent
 
 logger = logging.getLogger(__name__)
@@ -82,6 +83,7 @@ async def handle_execute_agent(
             output = await execute_special_agent(agent_id, request)
             execution.mark_as_completed(output)
             repo.update_execution(execution)
+            metrics_engine.observe_agent(agent_id, execution.execution_time_ms or 0, failed=False)
 
         # Dynamic agent execution
         else:
@@ -111,6 +113,7 @@ async def handle_execute_agent(
 
                 execution.mark_as_completed(output)
                 repo.update_execution(execution)
+                metrics_engine.observe_agent(agent_id, execution.execution_time_ms or 0, failed=False)
 
                 # Save to client_context if agent produces contextual learning
                 if agent_id in CONTEXT_AWARE_AGENTS and request.client_id:
@@ -127,6 +130,7 @@ async def handle_execute_agent(
                 error_msg = str(exec_error)
                 execution.mark_as_failed(error_msg)
                 repo.update_execution(execution)
+                metrics_engine.observe_agent(agent_id, execution.execution_time_ms or 0, failed=True)
                 logger.error(f"Agent execution failed: {error_msg}")
                 raise HTTPException(500, f"Agent execution failed: {error_msg}")
 
@@ -5,19 +5,12 @@ Extended authentication helpers for role-based access control
 from typing import Optional, Dict, Any
 from fastapi import HTTPException
 import jwt
-import os
 import logging
 
-logger = logging.getLogger(__name__)
+# JWT configuration (validated once, fail-fast, in jwt_utils)
+from app.api.routes.auth.jwt_utils import JWT_ALGORITHM, JWT_SECRET
 
-# JWT configuration
-JWT_SECRET = os.environ.get("JWT_SECRET_KEY", "")
-if not JWT_SECRET:
-    raise RuntimeError(
-        "JWT_SECRET_KEY environment variable is not set. "
-        "Configure it in Railway before deploying."
-    )
-JWT_ALGORITHM = "HS256"
+logger = logging.getLogger(__name__)
 
 
 async def get_current_user(authorization: Optional[str]) -> Dict[str, Any]:
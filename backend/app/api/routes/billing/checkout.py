@@ -8,8 +8,8 @@ from app.api.routes.billing.models import (
     CreateCheckoutSessionRequest,
     CheckoutSessionResponse,
 )
+from app.services.billing import get_stripe
 from app.api.routes.billing.stripe_config import (
-    stripe,
     get_price_id,
     TRIAL_PERIOD_DAYS,
 )
@@ -52,6 +52,7 @@ async def create_checkout_session(
         2. Create checkout session with trial if requested (7 days)
         3. Return checkout URL for client to complete payment
     """
+    stripe = get_stripe()
     try:
         # Get price ID for plan (validates and raises ValueError if invalid)
         try:
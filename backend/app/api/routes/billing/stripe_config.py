@@ -1,9 +1,9 @@
 """
 Stripe Configuration and Helpers
-Fail-fast initialization and price ID management
+Fail-fast validation and price ID management
+(the SDK itself is imported and keyed lazily, see app.services.billing.get_stripe)
 """
 import os
-import stripe
 from typing import Final, List
 import logging
 
@@ -37,10 +37,6 @@ if missing_prices:
         "Configure them in Railway before deploying."
     )
 
-# Initialize Stripe SDK
-stripe.api_key = STRIPE_SECRET_KEY
-logger.info("Stripe SDK initialized successfully")
-
 # Constants
 VALID_PLANS: Final[List[str]] = ["basic", "pro", "enterprise"]
 TRIAL_PERIOD_DAYS: Final[int] = 7
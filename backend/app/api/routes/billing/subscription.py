@@ -5,7 +5,7 @@ Get and cancel subscription for authenticated clients
 from fastapi import APIRouter, HTTPException, Header
 from typing import Optional
 from app.api.routes.auth.jwt_utils import get_current_user_id
-from app.api.routes.billing.stripe_config import stripe
+from app.services.billing import get_stripe
 from app.api.routes.billing.models import (
     CancelSubscriptionRequest,
     SubscriptionStatusResponse,
@@ -43,6 +43,7 @@ async def get_subscription_status(
         Verifies that authenticated client_id matches path parameter
         to prevent unauthorized access to other clients' subscriptions
     """
+    stripe = get_stripe()
     try:
         # Extract and verify client_id from JWT token
         authenticated_client_id = await get_current_user_id(authorization)
@@ -139,6 +140,7 @@ async def cancel_subscription(
         3. Cancel in Stripe (cancel_at_period_end=True)
         4. Return cancellation confirmation (DB update happens via webhook)
     """
+    stripe = get_stripe()
     try:
         # Extract and verify client_id from JWT token
         authenticated_client_id = await get_current_user_id(authorization)
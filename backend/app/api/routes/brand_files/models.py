@@ -3,7 +3,7 @@ Brand Files Domain Models
 Pydantic schemas for brand file management.
 """
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 
@@ -16,6 +16,8 @@ class BrandFileProfile(BaseModel):
     file_size: int
     mime_type: str
     storage_url: Optional[str] = None
+    content_hash: Optional[str] = None
+    derivatives: Optional[Dict[str, str]] = None  # variant name -> public URL
     created_at: Optional[datetime] = None
 
 
@@ -13,6 +13,13 @@ from datetime import datetime, timezone
 
 from app.api.routes.auth.auth_utils import get_current_user
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.storage_streamer import stream_upload
+from app.services.media import (
+    UploadRejected,
+    inspect_upload,
+    iter_upload,
+    schedule_brand_file_derivatives,
+)
 from .models import BrandFileProfile, BrandFileResponse, BrandFileListResponse
 
 logger = logging.getLogger(__name__)
@@ -86,12 +93,15 @@ async def upload_brand_file(
     """
     Upload brand file to Supabase Storage.
     Validates plan limits and file types.
+    Streams the file in chunks (size enforced while reading, type sniffed
+    from its first bytes); identical content for the same client returns
+    the existing file without re-uploading.
     """
     try:
         user = await get_current_user(authorization)
         supabase = get_supabase_service()
 
-        # Validate mime type
+        # Validate declared mime type (the real one is sniffed below)
         if file.content_type not in ALLOWED_MIME_TYPES:
             raise HTTPException(
                 status_code=400,
@@ -111,15 +121,43 @@ async def upload_brand_file(
         plan = client_result.data.get("plan", "basic")
         limits = PLAN_LIMITS.get(plan, PLAN_LIMITS["basic"])
 
-        # Check existing files
+        # Check existing files (only what the limits need)
         existing = supabase.client.table("brand_files")\
-            .select("file_size")\
+            .select("id,file_size")\
             .eq("client_id", client_id)\
             .execute()
 
         existing_files = existing.data or []
         existing_count = len(existing_files)
-        existing_total_mb = sum(f.get("file_size", 0) for f in existing_files) / (1024 * 1024)
+        existing_total_mb = sum(f.get("file_size") or 0 for f in existing_files) / (1024 * 1024)
+
+        # Read in chunks: size, sniffed type and hash in one bounded pass
+        try:
+            info = await inspect_upload(
+                file, limits["max_size_mb"] * 1024 * 1024, ALLOWED_MIME_TYPES
+            )
+        except UploadRejected as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{e} (plan {plan.capitalize()})"
+            )
+
+        # Dedup: same bytes already stored for this client
+        duplicate_result = supabase.client.table("brand_files")\
+            .select("*")\
+            .eq("client_id", client_id)\
+            .eq("content_hash", info.sha256)\
+            .limit(1)\
+            .execute()
+
+        if duplicate_result.data:
+            duplicate = duplicate_result.data[0]
+            logger.info(f"Brand file dedup hit for client {client_id}: {duplicate['id']}")
+            return BrandFileResponse(
+                success=True,
+                data=BrandFileProfile(**duplicate),
+                message=f"Archivo {duplicate['file_name']} ya existe"
+            )
 
         # Validate file count limit
         if existing_count >= limits["max_files"]:
@@ -131,21 +169,8 @@ async def upload_brand_file(
                 )
             )
 
-        # Read file content and check size
-        file_content = await file.read()
-        file_size_mb = len(file_content) / (1024 * 1024)
-
-        if file_size_mb > limits["max_size_mb"]:
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    f"Archivo muy grande ({file_size_mb:.1f}MB). "
-                    f"Máximo {limits['max_size_mb']}MB por archivo en plan {plan.capitalize()}."
-                )
-            )
-
         # Validate total storage limit
-        if existing_total_mb + file_size_mb > limits["total_mb"]:
+        if existing_total_mb + info.size_mb > limits["total_mb"]:
             raise HTTPException(
                 status_code=403,
                 detail=(
@@ -155,14 +180,19 @@ async def upload_brand_file(
                 )
             )
 
-        # Upload to Supabase Storage
+        # Stream to Supabase Storage
         file_id = str(uuid.uuid4())
-        file_ext = file.filename.split(".")[-1] if "." in file.filename else "bin"
+        filename = file.filename or "upload"
+        file_ext = filename.split(".")[-1] if "." in filename else "bin"
         storage_path = f"{client_id}/{file_id}.{file_ext}"
 
-        storage_result = supabase.client.storage\
-            .from_("brand-guides")\
-            .upload(storage_path, file_content, {"content-type": file.content_type})
+        await stream_upload(
+            bucket="brand-guides",
+            path=storage_path,
+            chunks=iter_upload(file),
+            size=info.size,
+            content_type=info.mime_type
+        )
 
         # Get public URL
         url_result = supabase.client.storage\
@@ -172,11 +202,12 @@ async def upload_brand_file(
         # Save to brand_files table
         db_result = supabase.client.table("brand_files").insert({
             "client_id": client_id,
-            "file_name": file.filename,
+            "file_name": filename,
             "file_path": storage_path,
-            "file_size": len(file_content),
-            "mime_type": file.content_type,
+            "file_size": info.size,
+            "mime_type": info.mime_type,
             "storage_url": url_result,
+            "content_hash": info.sha256,
             "created_at": datetime.now(timezone.utc).isoformat(),
         }).execute()
 
@@ -186,15 +217,20 @@ async def upload_brand_file(
                 detail="Error guardando referencia del archivo"
             )
 
+        # Thumbnails/WebP/AVIF for images, generated off the request path
+        schedule_brand_file_derivatives(
+            db_result.data[0]["id"], storage_path, url_result, info.mime_type
+        )
+
         logger.info(
-            f"Brand file uploaded: {file.filename} for client {client_id} "
-            f"({file_size_mb:.1f}MB)"
+            f"Brand file uploaded: {filename} for client {client_id} "
+            f"({info.size_mb:.1f}MB)"
         )
 
         return BrandFileResponse(
             success=True,
             data=BrandFileProfile(**db_result.data[0]),
-            message=f"Archivo {file.filename} subido exitosamente"
+            message=f"Archivo {filename} subido exitosamente"
         )
 
     except HTTPException:
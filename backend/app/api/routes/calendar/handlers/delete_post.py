@@ -9,6 +9,7 @@ import logging
 from app.api.routes.calendar.models import DeleteResponse
 from app.infrastructure.supabase_service import get_supabase_service
 from app.infrastructure.repositories.scheduled_post_repository import ScheduledPostRepository
+from app.infrastructure.projections import SCHEDULED_POST_STATE
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,7 @@ async def handle_delete_post(post_id: str) -> DeleteResponse:
         repo = ScheduledPostRepository(supabase)
 
         # 1. Find existing post
-        post = await repo.find_by_id(post_id)
+        post = await repo.find_by_id(post_id, SCHEDULED_POST_STATE)
         if not post:
             raise HTTPException(404, f"Scheduled post {post_id} not found")
 
@@ -3,12 +3,14 @@ Handler: List Posts
 Retrieves scheduled posts for an account
 Filosofía: No velocity, only precision 🐢💎
 """
+from typing import Optional
 from fastapi import HTTPException
 import logging
 
 from app.api.routes.calendar.models import ScheduledPostListResponse, ScheduledPostResponse
 from app.infrastructure.supabase_service import get_supabase_service
 from app.infrastructure.repositories.scheduled_post_repository import ScheduledPostRepository
+from app.infrastructure.pagination import CountMode
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +21,9 @@ async def handle_list_posts(
     user_id: str = None,
     limit: int = 20,
     offset: int = 0,
-    status: str = None
+    status: str = None,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact"
 ) -> ScheduledPostListResponse:
     """
     List scheduled posts for an account, client, or user
@@ -29,14 +33,16 @@ async def handle_list_posts(
         client_id: Client UUID
         user_id: User UUID (auto-discovers all clients owned by user)
         limit: Max results per page
-        offset: Pagination offset
+        offset: Legacy pagination offset (ignored when cursor is given)
         status: Optional status filter (draft, scheduled, published, etc.)
+        cursor: next_cursor from the previous page
+        count: Total mode (exact, planned, estimated, none)
 
     Returns:
-        ScheduledPostListResponse with paginated results
+        ScheduledPostListResponse keyset page
 
     Raises:
-        HTTPException 400: If no ID provided
+        HTTPException 400: If no ID provided or the cursor is invalid
         HTTPException 404: If user_id has no clients
         HTTPException 500: If query fails
     """
@@ -70,50 +76,16 @@ async def handle_list_posts(
             client_ids = [c["id"] for c in clients_response.data]
             logger.info(f"Found {len(client_ids)} clients for user {user_id}")
 
-        # Build base query
-        query = supabase.client.table("scheduled_posts")\
-            .select("*")\
-            .eq("is_active", True)
-
-        # Filter by account_id, client_id, OR client_ids (from user_id)
-        if account_id:
-            query = query.eq("account_id", account_id)
-        elif client_id:
-            query = query.eq("client_id", client_id)
-        elif client_ids:
-            query = query.in_("client_id", client_ids)
-
-        # Add status filter if provided
-        if status:
-            query = query.eq("status", status)
-
-        # Order and paginate
-        query = query.order("scheduled_date", desc=False)\
-            .order("scheduled_time", desc=False)\
-            .range(offset, offset + limit - 1)
-
-        # Execute query
-        response = query.execute()
-        posts = [repo._map_to_entity(row) for row in response.data]
-
-        # Count total (for pagination)
-        count_query = supabase.client.table("scheduled_posts")\
-            .select("id", count="exact")\
-            .eq("is_active", True)
-
-        if account_id:
-            count_query = count_query.eq("account_id", account_id)
-        elif client_id:
-            count_query = count_query.eq("client_id", client_id)
-        elif client_ids:
-            count_query = count_query.in_("client_id", client_ids)
-
-        if status:
-            count_query = count_query.eq("status", status)
-
-        count_response = count_query.execute()
-
-        total = count_response.count if hasattr(count_response, 'count') else len(posts)
+        # Keyset page: filters are applied once for rows and count
+        posts, page = await repo.list_page(
+            account_id=account_id,
+            client_ids=[client_id] if client_id else client_ids,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+            offset=offset
+        )
 
         # Map to response DTOs
         items = [
@@ -142,11 +114,14 @@ async def handle_list_posts(
 
         return ScheduledPostListResponse(
             items=items,
-            total=total,
-            limit=limit,
-            offset=offset
+            offset=0 if cursor else offset,
+            **page.envelope(limit)
         )
 
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     except Exception as e:
         logger.error(f"Error listing posts for account {account_id}: {e}")
         raise HTTPException(500, f"Failed to list posts: {str(e)}")
@@ -8,6 +8,7 @@ from datetime import date, time
 from pydantic import BaseModel, Field
 
 from app.domain.calendar.types import Status
+from app.models.shared_models import PageEnvelope
 
 
 class ScheduledPostCreate(BaseModel):
@@ -95,18 +96,19 @@ class ScheduledPostResponse(BaseModel):
         }
 
 
-class ScheduledPostListResponse(BaseModel):
-    """DTO for list of scheduled posts"""
+class ScheduledPostListResponse(PageEnvelope):
+    """DTO for list of scheduled posts (keyset page)"""
     items: List[ScheduledPostResponse]
-    total: int
-    limit: int
-    offset: int
+    offset: int = 0
 
     class Config:
         json_schema_extra = {
             "example": {
                 "items": [],
-                "total": 0,
+                "next_cursor": "WyIyMDI2LTAyLTIwIiwiMTQ6MzA6MDAiLCI5YjEuLi4iXQ",
+                "has_more": True,
+                "total": 42,
+                "total_is_estimate": False,
                 "limit": 20,
                 "offset": 0
             }
@@ -3,8 +3,10 @@ Calendar Router
 FastAPI REST endpoints for scheduled posts
 Filosofía: No velocity, only precision 🐢💎
 """
+from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.infrastructure.pagination import CountMode
 from .models import (
     ScheduledPostCreate,
     ScheduledPostUpdate,
@@ -44,8 +46,10 @@ async def list_posts(
     client_id: str = Query(None, description="Client UUID"),
     user_id: str = Query(None, description="User UUID - returns posts from all user's clients"),
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-    status: str = Query(None, description="Filter by status: draft, scheduled, published, failed")
+    offset: int = Query(0, ge=0, description="Legacy offset; prefer cursor"),
+    status: str = Query(None, description="Filter by status: draft, scheduled, published, failed"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count: CountMode = Query("exact", description="Total: exact, planned, estimated or none")
 ) -> ScheduledPostListResponse:
     """
     List scheduled posts - provide ONE of: account_id, client_id, or user_id
@@ -54,10 +58,11 @@ async def list_posts(
     **client_id**: Posts from all accounts of this client
     **user_id**: Posts from all clients owned by this user (auto-discovers clients)
 
-    Returns paginated list ordered by scheduled date/time.
+    Returns a keyset page ordered by scheduled date/time; pass next_cursor
+    back as cursor for the next one.
     Optional status filter to show only posts in a specific state.
     """
-    return await handle_list_posts(account_id, client_id, user_id, limit, offset, status)
+    return await handle_list_posts(account_id, client_id, user_id, limit, offset, status, cursor, count)
 
 
 @router.patch("/{post_id}/", response_model=ScheduledPostResponse)
@@ -11,6 +11,7 @@ from app.api.routes.clients.models import ClientCreate, ClientResponse, ClientPr
 from app.api.routes.auth.auth_utils import get_current_user
 from app.api.routes.auth.jwt_utils import hash_password
 from app.infrastructure.repositories.client_repository import client_repository
+from app.services.nova_briefing import mark_briefing_stale
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -76,6 +77,7 @@ async def create_client(
 
         # 7. Create client in database
         created_client = await client_repository.create_client(client_data)
+        mark_briefing_stale("system_status")
 
         logger.info(
             f"Client created by {user_role} {user_id}: "
@@ -8,6 +8,7 @@ import logging
 
 from app.api.routes.auth.auth_utils import get_current_user
 from app.infrastructure.repositories.client_repository import client_repository
+from app.services.nova_briefing import mark_briefing_stale
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -51,6 +52,7 @@ async def delete_client(
                 detail="Failed to delete client"
             )
 
+        mark_briefing_stale("system_status")
         logger.info(f"Client {client_id} deleted by owner {user_id}")
 
         return Response(status_code=204)
@@ -9,6 +9,7 @@ import logging
 from app.api.routes.clients.models import ClientUpdate, ClientResponse, ClientProfile
 from app.api.routes.auth.auth_utils import get_current_user
 from app.infrastructure.repositories.client_repository import client_repository
+from app.services.nova_briefing import mark_briefing_stale
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -57,6 +58,7 @@ async def update_client_profile(
 
         # 6. Update client
         updated_client = await client_repository.update_client(client_id, update_data)
+        mark_briefing_stale("system_status")
 
         logger.info(f"Client {client_id} updated by {role} {user_id}")
 
@@ -8,9 +8,10 @@ from typing import Dict, Any, List, Optional
 from fastapi import HTTPException
 import logging
 import os
-import fal_client
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.social_account_repository import social_account_repository
 from app.infrastructure.ai.openai_service import openai_service
+from app.services.media import schedule_generated_derivatives
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +26,12 @@ async def handle_generate_image(
     try:
         supabase = get_supabase_service()
         # 1. Obtener client info
-        account_response = supabase.client.table("social_accounts")\
-            .select("client_id, platform, clients!inner(name, plan)")\
-            .eq("id", account_id)\
-            .execute()
-        if not account_response.data:
+        account_with_client = await social_account_repository.get_account_with_client(account_id, active_only=False)
+        if not account_with_client:
             raise HTTPException(404, f"Social account {account_id} not found")
-        account = account_response.data[0]
+        account, client = account_with_client
         client_id = account["client_id"]
-        client_name = account["clients"]["name"]
+        client_name = client["name"]
 
         # 2. Detectar si es edición o generación
         image_attachments = [a for a in (attachments or []) if a.get("type") == "image" or "base64" in a]
@@ -46,7 +44,7 @@ async def handle_generate_image(
 
         # 3. Guardar en DB
         try:
-            supabase.client.table("content_lab_generated").insert({
+            saved = supabase.client.table("content_lab_generated").insert({
                 "client_id": client_id,
                 "social_account_id": account_id,
                 "content_type": "image",
@@ -55,6 +53,9 @@ async def handle_generate_image(
                 "model": result["model"],
                 "tokens_used": 0,
             }).execute()
+            # WebP/AVIF variants del PNG generado, en segundo plano
+            if saved.data:
+                schedule_generated_derivatives(saved.data[0]["id"], client_id, result["image_url"], "image")
         except Exception as db_error:
             logger.warning(f"Failed to save image to DB: {db_error}")
 
@@ -108,6 +109,7 @@ async def _edit_with_fal_kontext(prompt: str, images: List[Dict[str, Any]], styl
     enhanced_prompt = _enhance_prompt(prompt, style)
 
     # Llamar FAL.ai Flux Kontext Pro
+    import fal_client  # import diferido: solo lo pagan las generaciones con FAL
     try:
         result = await fal_client.run_async(
             "fal-ai/flux-pro/kontext",
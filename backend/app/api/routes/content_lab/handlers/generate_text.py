@@ -10,6 +10,7 @@ import logging
 
 from app.services.ai_providers import AIProviders
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.data_loader import load_with_parent, loader
 from app.services.content_lab_context_service import ContentLabContextService
 from app.services.content_lab_prompt_service import ContentLabPromptService
 
@@ -176,49 +177,36 @@ async def handle_generate_text(
 
 def _lookup_client_and_account(supabase, account_id: str) -> tuple:
     """Lookup client data. Tries social_accounts first, then clients table."""
-    # Try social_accounts first
-    account_response = supabase.client.table("social_accounts")\
-        .select("client_id, platform, clients!inner(name, plan)")\
-        .eq("id", account_id)\
-        .execute()
-
-    if account_response.data:
-        account = account_response.data[0]
+    accounts = loader("social_accounts", supabase=supabase)
+    clients = loader("clients", supabase=supabase)
+
+    # Try social_accounts first (account + client in one embedded select)
+    account, client = load_with_parent(accounts, account_id, clients, "client_id")
+    if account and client:
         return (
             account["client_id"],
-            account["clients"]["name"],
-            account["clients"].get("plan") or "pro_197",
+            client["name"],
+            client.get("plan") or "pro_197",
             account["platform"],
             account_id
         )
 
     # Fallback: try as client_id
-    client_response = supabase.client.table("clients")\
-        .select("id, name, plan")\
-        .eq("id", account_id)\
-        .execute()
-
-    if not client_response.data:
+    client = clients.get(account_id)
+    if not client:
         raise HTTPException(404, f"Account or client {account_id} not found")
 
-    client = client_response.data[0]
-
     # Find first social account for this client
-    social_resp = supabase.client.table("social_accounts")\
-        .select("id, platform")\
-        .eq("client_id", client["id"])\
-        .limit(1)\
-        .execute()
-
-    if not social_resp.data:
+    client_accounts = loader("social_accounts", "client_id", many=True, supabase=supabase).get(client["id"])
+    if not client_accounts:
         raise HTTPException(400, f"Client {client['id']} has no social accounts")
 
     return (
         client["id"],
         client["name"],
         client.get("plan") or "pro_197",
-        social_resp.data[0]["platform"],
-        social_resp.data[0]["id"]
+        client_accounts[0]["platform"],
+        client_accounts[0]["id"]
     )
 
 
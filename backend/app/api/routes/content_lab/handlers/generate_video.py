@@ -8,6 +8,8 @@ import logging
 
 from app.infrastructure.supabase_service import get_supabase_service
 from app.infrastructure.repositories.client_context_repository import ClientContextRepository
+from app.infrastructure.projections import CLIENT_CONTEXT_GENERATION
+from app.infrastructure.repositories.social_account_repository import social_account_repository
 from app.agents.runway_agent import RunwayAgent
 
 logger = logging.getLogger(__name__)
@@ -47,28 +49,23 @@ async def handle_generate_video_runway(
         supabase = get_supabase_service()
 
         # 1. Get client info from account_id
-        account_resp = supabase.client.table("social_accounts")\
-            .select("client_id, platform, clients!inner(name, plan)")\
-            .eq("id", account_id)\
-            .eq("is_active", True)\
-            .limit(1)\
-            .execute()
+        account_with_client = await social_account_repository.get_account_with_client(account_id)
 
-        if not account_resp.data or len(account_resp.data) == 0:
+        if not account_with_client:
             raise HTTPException(
                 status_code=404,
                 detail=f"Social account {account_id} not found or inactive"
             )
 
-        account = account_resp.data[0]
+        account, client = account_with_client
         client_id = account["client_id"]
-        plan = account["clients"]["plan"] if account.get("clients") else "basico_97"
+        plan = client.get("plan") or "basico_97"
 
         logger.info(f"Generating video for client {client_id}, plan: {plan}")
 
         # 2. Load client context for enrichment
         context_repo = ClientContextRepository(supabase)
-        client_context = context_repo.find_by_client_id(client_id)
+        client_context = context_repo.find_by_client_id(client_id, CLIENT_CONTEXT_GENERATION)
 
         # 3. Enrich prompt with context
         enriched_prompt = prompt
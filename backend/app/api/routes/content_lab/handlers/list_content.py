@@ -2,10 +2,12 @@
 Handler para listar contenido generado.
 Filosofía: No velocity, only precision 🐢💎
 """
+from typing import Optional
 from fastapi import HTTPException
 import logging
 
 from app.api.routes.content_lab.models import ContentListResponse
+from app.infrastructure.pagination import CountMode
 from app.infrastructure.repositories.content_lab_repository import (
     ContentLabRepository
 )
@@ -17,7 +19,9 @@ async def handle_list_content(
     client_id: str,
     content_type: str | None,
     limit: int,
-    offset: int
+    offset: int,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact"
 ) -> ContentListResponse:
     """
     Handler para listar contenido generado de un cliente.
@@ -26,23 +30,28 @@ async def handle_list_content(
         client_id: UUID del cliente
         content_type: Filtro opcional por tipo
         limit: Máximo de resultados
-        offset: Offset para paginación
+        offset: Offset legacy (ignorado con cursor)
+        cursor: next_cursor de la página anterior
+        count: Modo de total (exact, planned, estimated, none)
 
     Returns:
-        ContentListResponse con items y total
+        ContentListResponse con items y campos de página
 
     Raises:
+        HTTPException 400: Cursor inválido
         HTTPException 500: Error en consulta
     """
     try:
         repo = ContentLabRepository()
 
         # Obtener contenido desde repository
-        entities, total = repo.list_by_client(
+        entities, page = repo.list_by_client(
             client_id=client_id,
             content_type=content_type,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            count=count
         )
 
         # Convertir entidades a dicts
@@ -52,8 +61,10 @@ async def handle_list_content(
             f"Listed {len(items)} content items for client {client_id}"
         )
 
-        return ContentListResponse(items=items, total=total)
+        return ContentListResponse(items=items, **page.envelope(limit))
 
+    except ValueError as e:
+        raise HTTPException(400, str(e))
     except Exception as e:
         logger.error(f"List content failed: {e}")
         raise HTTPException(500, f"Error listando contenido: {str(e)}")
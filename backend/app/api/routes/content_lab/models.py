@@ -6,6 +6,7 @@ from typing import Optional, Any
 from pydantic import BaseModel, Field
 
 from app.domain.llm.types import ContentType
+from app.models.shared_models import PageEnvelope
 
 
 class GenerateTextRequest(BaseModel):
@@ -99,13 +100,12 @@ class GenerateImageResponse(BaseModel):
         }
 
 
-class ContentListResponse(BaseModel):
-    """Response de listado de contenido."""
+class ContentListResponse(PageEnvelope):
+    """Response de listado de contenido (página keyset)."""
     items: list[dict[str, Any]] = Field(
         ...,
         description="Lista de contenido generado"
     )
-    total: int = Field(..., description="Total de items")
 
     class Config:
         json_schema_extra = {
@@ -118,7 +118,11 @@ class ContentListResponse(BaseModel):
                         "created_at": "2026-02-17T20:00:00Z"
                     }
                 ],
-                "total": 1
+                "next_cursor": None,
+                "has_more": False,
+                "total": 1,
+                "total_is_estimate": False,
+                "limit": 20
             }
         }
 
@@ -2,8 +2,10 @@
 Router principal de Content Lab.
 Filosofía: No velocity, only precision 🐢💎
 """
+from typing import Optional
 from fastapi import APIRouter, Query
 
+from app.infrastructure.pagination import CountMode
 from .models import (
     ContentListResponse, DeleteContentResponse, GenerateImageRequest
 )
@@ -124,7 +126,9 @@ async def list_content(
     client_id: str,
     content_type: str = None,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact"
 ) -> ContentListResponse:
     """
     Lista contenido generado para un cliente.
@@ -132,11 +136,13 @@ async def list_content(
     - **client_id**: ID del cliente (UUID)
     - **content_type**: Filtrar por tipo (opcional)
     - **limit**: Máximo de resultados (default: 20)
-    - **offset**: Offset para paginación (default: 0)
+    - **offset**: Offset legacy (default: 0, ignorado con cursor)
+    - **cursor**: next_cursor de la página anterior
+    - **count**: exact | planned | estimated | none
 
-    Returns lista de contenido + total.
+    Returns página keyset de contenido + total.
     """
-    return await handle_list_content(client_id, content_type, limit, offset)
+    return await handle_list_content(client_id, content_type, limit, offset, cursor, count)
 
 
 @router.delete("/{content_id}/", response_model=DeleteContentResponse)
@@ -1,76 +1,77 @@
 """Handler: Extract text from uploaded file (PDF, TXT, MD)"""
 import logging
-import io
 from typing import Dict, Any
 from fastapi import UploadFile, HTTPException
-from pypdf import PdfReader
-from .extract_url import clean_text
+
+from app.services.extraction import (
+    ExtractionDeadline,
+    ExtractionTimeout,
+    SourceTooLarge,
+    extract_cached_source,
+    spool_upload,
+)
 
 logger = logging.getLogger(__name__)
 
+
 async def handle_extract_file(file: UploadFile) -> Dict[str, Any]:
-    """Extract text from uploaded file (PDF, TXT, MD)."""
+    """
+    Extract text from uploaded file (PDF, TXT, MD).
+    Copia el upload por chunks con límite de bytes; el parseo corre en el pool de procesos.
+    Archivos con el mismo hash reutilizan la extracción guardada.
+    """
     try:
-        content_type = file.content_type or ""
         filename = file.filename or "unknown"
+        lower_name = filename.lower()
+        is_text = lower_name.endswith((".txt", ".md"))
+        is_pdf = "pdf" in (file.content_type or "").lower() or lower_name.endswith(".pdf")
 
-        # Read file content
-        content = await file.read()
+        if not is_pdf and not is_text:
+            raise HTTPException(422, "Formato no soportado. Usa PDF, TXT o MD")
 
-        # PDF extraction
-        if "pdf" in content_type.lower() or filename.lower().endswith(".pdf"):
-            try:
-                pdf = PdfReader(io.BytesIO(content))
-                text = ""
-                for page in pdf.pages:
-                    extracted = page.extract_text()
-                    if extracted:
-                        text += extracted + "\n"
+        kind = "pdf" if is_pdf else "text"
+        try:
+            async with spool_upload(file) as source:
+                extraction = await extract_cached_source(source, kind)
+        except SourceTooLarge as e:
+            raise HTTPException(413, str(e))
+        except (ExtractionTimeout, ExtractionDeadline):
+            raise HTTPException(422, "El archivo tardó demasiado en procesarse")
+        except Exception as e:
+            label = "PDF" if is_pdf else "archivo de texto"
+            logger.error(f"{kind.upper()} extraction error: {e}")
+            raise HTTPException(500, f"Error procesando {label}: {str(e)}")
 
-                if not text.strip():
-                    raise HTTPException(422, "No se pudo extraer texto del PDF")
+        text = extraction.text
 
-                # Clean text (remove null chars, control chars)
-                text = clean_text(text)
-                text = text[:50000]  # Limit to 50K chars
+        # PDF extraction
+        if is_pdf:
+            if not text:
+                raise HTTPException(422, "No se pudo extraer texto del PDF")
 
-                title = filename.replace(".pdf", "").replace(".PDF", "")
+            title = filename.replace(".pdf", "").replace(".PDF", "")
 
-                return {
-                    "title": title,
-                    "content": text,
-                    "type": "pdf",
-                    "char_count": len(text)
-                }
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"PDF extraction error: {e}")
-                raise HTTPException(500, f"Error procesando PDF: {str(e)}")
+            return {
+                "title": title,
+                "content": text,
+                "type": "pdf",
+                "char_count": len(text),
+                "page_count": extraction.metadata.get("page_count"),
+                "pages_read": extraction.metadata.get("pages_read"),
+                "cached": extraction.cached
+            }
 
         # TXT / MD extraction
-        elif filename.lower().endswith((".txt", ".md")):
-            try:
-                text = content.decode("utf-8", errors="ignore")
-                text = clean_text(text)
-                text = text[:50000]  # Limit to 50K chars
-
-                # Extract title from filename
-                title = filename.rsplit(".", 1)[0]
-                file_type = "markdown" if filename.lower().endswith(".md") else "text"
+        title = filename.rsplit(".", 1)[0]
+        file_type = "markdown" if lower_name.endswith(".md") else "text"
 
-                return {
-                    "title": title,
-                    "content": text,
-                    "type": file_type,
-                    "char_count": len(text)
-                }
-            except Exception as e:
-                logger.error(f"Text file extraction error: {e}")
-                raise HTTPException(500, f"Error procesando archivo de texto: {str(e)}")
-
-        else:
-            raise HTTPException(422, "Formato no soportado. Usa PDF, TXT o MD")
+        return {
+            "title": title,
+            "content": text,
+            "type": file_type,
+            "char_count": len(text),
+            "cached": extraction.cached
+        }
 
     except HTTPException:
         raise
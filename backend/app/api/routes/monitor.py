@@ -2,11 +2,12 @@
 Monitor API Routes
 Endpoints for system monitoring and health checks
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from app.agents.monitor_agent import monitor_agent
 from app.services.health_checker import SystemAnomaly
+from app.services.metrics import metrics_engine
 
 router = APIRouter(prefix="/monitor", tags=["monitor"])
 
@@ -134,6 +135,58 @@ async def detect_anomalies(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/live-anomalies", response_model=MonitorAPIResponse)
+async def get_live_anomalies(
+    z_threshold: float = Query(default=3.0, gt=0, description="Baseline std deviations")
+) -> MonitorAPIResponse:
+    """
+    Detect anomalies from streaming agent and endpoint baselines
+    
+    - **z_threshold**: How far above the EWMA baseline counts as anomalous
+    
+    Returns anomalies without requiring a metrics history payload
+    """
+    try:
+        result = await monitor_agent.execute({
+            "type": "live_anomalies",
+            "z_threshold": z_threshold
+        })
+        
+        return MonitorAPIResponse(
+            success=True,
+            data={
+                "anomalies": [a.model_dump() for a in result],
+                "count": len(result)
+            },
+            message=f"Detected {len(result)} anomalies"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/metrics", response_model=MonitorAPIResponse)
+async def get_metrics(
+    scope: Optional[str] = Query(default=None, description="agent | endpoint | prompt")
+) -> MonitorAPIResponse:
+    """
+    Get streaming metric summaries (mean, EWMA baseline, p50/p95/p99)
+    
+    - **scope**: Optional filter by series scope
+    """
+    try:
+        summaries = metrics_engine.summaries(scope)
+        return MonitorAPIResponse(
+            success=True,
+            data={
+                "series": [s.model_dump() for s in summaries],
+                "count": len(summaries)
+            },
+            message=f"{len(summaries)} metric series"
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/alerts", response_model=MonitorAPIResponse)
 async def get_alerts() -> MonitorAPIResponse:
     """
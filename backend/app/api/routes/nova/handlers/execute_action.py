@@ -11,6 +11,7 @@ from fastapi import HTTPException
 from datetime import datetime
 from app.infrastructure.supabase_service import get_supabase_service
 from app.services.handoff_service import HandoffService
+from app.services.nova_briefing import mark_briefing_stale
 from .get_briefing import handle_get_briefing
 from .save_nova_memory import handle_save_nova_memory, SaveNovaMemoryRequest
 import logging
@@ -73,6 +74,7 @@ async def handle_execute_action(request: ExecuteActionRequest) -> Dict[str, Any]
                     "created_at": datetime.utcnow().isoformat()
                 }
                 supabase.client.table("omega_agent_memory").insert(memory_entry).execute()
+                mark_briefing_stale("nova_memory")
                 memory_saved = True
             except Exception as e:
                 logger.warning(f"Failed to save handoff memory: {e}")
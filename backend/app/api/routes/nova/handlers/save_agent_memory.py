@@ -10,6 +10,7 @@ import logging
 from datetime import datetime
 
 from app.infrastructure.supabase_service import get_supabase_service
+from app.services.nova_briefing import mark_briefing_stale
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,8 @@ async def handle_save_agent_memory(request: SaveAgentMemoryRequest) -> Dict[str,
             raise Exception("Insert returned no data")
 
         record = resp.data[0]
+        if agent_code == "NOVA":
+            mark_briefing_stale("nova_memory")
         logger.info(f"Saved agent memory: agent={agent_code}, type={request.memory_type}")
 
         return {
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from datetime import datetime
 from app.infrastructure.supabase_service import get_supabase_service
+from app.services.nova_briefing import mark_briefing_stale
 import logging
 
 logger = logging.getLogger(__name__)
@@ -55,6 +56,7 @@ async def handle_save_nova_memory(request: SaveNovaMemoryRequest) -> Dict[str, A
             raise ValueError("Failed to save NOVA memory")
 
         memory_id = resp.data[0]["id"]
+        mark_briefing_stale("nova_memory")
 
         logger.info(f"NOVA memory saved: {memory_id} (type={request.memory_type}, priority={request.priority})")
 
@@ -7,6 +7,7 @@ from fastapi import HTTPException
 import logging
 
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.pagination import CountMode, SortKey, fetch_page
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,9 @@ async def handle_get_clients(
     reseller_id: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact"
 ) -> Dict[str, Any]:
     """
     Get all clients with pagination and filtering
@@ -24,52 +27,41 @@ async def handle_get_clients(
         reseller_id: Filter by reseller UUID
         status: Filter by status
         limit: Results per page
-        offset: Pagination offset
+        offset: Legacy pagination offset (ignored when cursor is given)
+        cursor: next_cursor from the previous page
+        count: Total mode (exact, planned, estimated, none)
 
     Returns:
-        Dict with clients list and total count
+        Dict with clients list and the shared page fields
     """
     try:
         supabase = get_supabase_service()
 
-        # Build query
-        query = supabase.client.table("clients")\
-            .select("*")\
-            .neq("status", "deleted")
-
-        if reseller_id:
-            query = query.eq("reseller_id", reseller_id)
-        if status:
-            query = query.eq("status", status)
-
-        query = query.order("created_at", desc=True)\
-            .range(offset, offset + limit - 1)
-
-        resp = query.execute()
-        clients_data = resp.data or []
-
-        # Get total count
-        count_query = supabase.client.table("clients")\
-            .select("id", count="exact")\
-            .neq("status", "deleted")
-
-        if reseller_id:
-            count_query = count_query.eq("reseller_id", reseller_id)
-        if status:
-            count_query = count_query.eq("status", status)
-
-        count_resp = count_query.execute()
-        total = count_resp.count if count_resp.count else 0
+        def build(columns: str, count_method: Optional[str]):
+            query = supabase.client.table("clients")\
+                .select(columns, count=count_method)\
+                .neq("status", "deleted")
+            if reseller_id:
+                query = query.eq("reseller_id", reseller_id)
+            if status:
+                query = query.eq("status", status)
+            return query
+
+        # Keyset page on (created_at DESC, id); rows and total share the filters
+        page = fetch_page(build, (SortKey("created_at", desc=True),), limit, cursor, count, offset=offset)
+        clients_data = page.rows
+        total = page.total
 
         logger.info(f"Retrieved {len(clients_data)} clients (total: {total})")
 
         return {
             "clients": clients_data,
-            "total": total,
-            "limit": limit,
-            "offset": offset
+            "offset": 0 if cursor else offset,
+            **page.envelope(limit)
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting clients: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get clients: {str(e)}")
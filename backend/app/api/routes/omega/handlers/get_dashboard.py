@@ -1,22 +1,18 @@
 """
 Handler: OMEGA Company Dashboard - Super Admin Executive View
-Real Stripe + Supabase data
+Real Stripe (local mirror) + Supabase data
 Filosofía: No velocity, only precision 🐢💎
 """
 from typing import Dict, Any
 from fastapi import HTTPException
 import logging
-import os
 from datetime import date, timedelta
-import stripe
 
 from app.infrastructure.supabase_service import get_supabase_service
+from app.services.billing import get_revenue_summary
 
 logger = logging.getLogger(__name__)
 
-# Initialize Stripe
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
-
 
 async def handle_get_omega_dashboard() -> Dict[str, Any]:
     """
@@ -33,15 +29,13 @@ async def handle_get_omega_dashboard() -> Dict[str, Any]:
         today = date.today()
         first_of_month = today.replace(day=1).isoformat()
 
-        # 1. Stripe Revenue Data
+        # 1. Stripe Revenue Data (local mirror aggregates)
         mrr, total_revenue = 0, 0
         try:
-            subs = stripe.Subscription.list(status='active', limit=100)
-            mrr = sum(s.plan.amount / 100 for s in subs.data if s.plan.interval == 'month')
-            charges = stripe.Charge.list(limit=100)
-            total_revenue = sum(c.amount / 100 for c in charges.data if c.paid)
+            revenue = get_revenue_summary(recent=0)
+            mrr, total_revenue = revenue["mrr"], revenue["total_revenue"]
         except Exception as e:
-            logger.warning(f"Stripe data unavailable: {e}")
+            logger.warning(f"Stripe mirror unavailable: {e}")
         # 2. Resellers Stats
         resellers_data = (supabase.client.table("resellers").select("*").execute()).data or []
         active_resellers = [r for r in resellers_data if r.get("status") == "active"]
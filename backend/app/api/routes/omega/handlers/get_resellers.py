@@ -7,6 +7,7 @@ from fastapi import HTTPException
 import logging
 
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.pagination import CountMode, SortKey, fetch_page
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +15,9 @@ logger = logging.getLogger(__name__)
 async def handle_get_resellers(
     status: Optional[str] = None,
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact"
 ) -> Dict[str, Any]:
     """
     Get resellers list with client counts and metrics
@@ -22,33 +25,37 @@ async def handle_get_resellers(
     Args:
         status: Filter by status (active, trial, inactive)
         limit: Results per page
-        offset: Pagination offset
+        offset: Legacy pagination offset (ignored when cursor is given)
+        cursor: next_cursor from the previous page
+        count: Total mode (exact, planned, estimated, none)
 
     Returns:
-        Dict with resellers list and total count
+        Dict with resellers list and the shared page fields
     """
     try:
         supabase = get_supabase_service()
 
-        # Build query
-        query = supabase.client.table("resellers")\
-            .select("*")
-
-        if status:
-            query = query.eq("status", status)
-
-        query = query.order("created_at", desc=True)\
-            .range(offset, offset + limit - 1)
-
-        resp = query.execute()
-        resellers_data = resp.data or []
-
-        # Get client counts for each reseller
-        clients_resp = supabase.client.table("clients")\
-            .select("reseller_id")\
-            .neq("status", "deleted")\
-            .execute()
-        clients_data = clients_resp.data or []
+        def build(columns: str, count_method: Optional[str]):
+            query = supabase.client.table("resellers").select(columns, count=count_method)
+            if status:
+                query = query.eq("status", status)
+            return query
+
+        # Keyset page on (created_at DESC, id)
+        page = fetch_page(build, (SortKey("created_at", desc=True),), limit, cursor, count, offset=offset)
+        resellers_data = page.rows
+        total = page.total
+
+        # Client counts for this page's resellers only
+        reseller_ids = [r["id"] for r in resellers_data]
+        clients_data = []
+        if reseller_ids:
+            clients_resp = supabase.client.table("clients")\
+                .select("reseller_id")\
+                .neq("status", "deleted")\
+                .in_("reseller_id", reseller_ids)\
+                .execute()
+            clients_data = clients_resp.data or []
 
         # Count clients per reseller
         client_counts = {}
@@ -61,21 +68,16 @@ async def handle_get_resellers(
         for r in resellers_data:
             r["clients_count"] = client_counts.get(r["id"], 0)
 
-        # Get total count
-        count_resp = supabase.client.table("resellers")\
-            .select("id", count="exact")\
-            .execute()
-        total = count_resp.count if count_resp.count else 0
-
         logger.info(f"Retrieved {len(resellers_data)} resellers (total: {total})")
 
         return {
             "resellers": resellers_data,
-            "total": total,
-            "limit": limit,
-            "offset": offset
+            "offset": 0 if cursor else offset,
+            **page.envelope(limit)
         }
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting resellers: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get resellers: {str(e)}")
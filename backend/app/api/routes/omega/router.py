@@ -5,6 +5,7 @@ Filosofía: No velocity, only precision 🐢💎
 from fastapi import APIRouter, Query
 from typing import Optional
 
+from app.infrastructure.pagination import CountMode
 from .handlers import (
     handle_get_omega_dashboard,
     handle_get_resellers,
@@ -28,10 +29,12 @@ async def get_omega_dashboard():
 async def get_resellers(
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(default=50, description="Results per page"),
-    offset: int = Query(default=0, description="Pagination offset")
+    offset: int = Query(default=0, description="Legacy pagination offset; prefer cursor"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count: CountMode = Query("exact", description="Total: exact, planned, estimated or none")
 ):
     """Get resellers list with metrics"""
-    return await handle_get_resellers(status, limit, offset)
+    return await handle_get_resellers(status, limit, offset, cursor, count)
 
 
 @router.get("/clients/")
@@ -39,10 +42,12 @@ async def get_clients(
     reseller_id: Optional[str] = Query(None, description="Filter by reseller UUID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(default=50, description="Results per page"),
-    offset: int = Query(default=0, description="Pagination offset")
+    offset: int = Query(default=0, description="Legacy pagination offset; prefer cursor"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count: CountMode = Query("exact", description="Total: exact, planned, estimated or none")
 ):
     """Get all clients with pagination"""
-    return await handle_get_clients(reseller_id, status, limit, offset)
+    return await handle_get_clients(reseller_id, status, limit, offset, cursor, count)
 
 
 @router.get("/revenue/")
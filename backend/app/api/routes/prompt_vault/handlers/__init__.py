@@ -4,7 +4,7 @@ DDD: Application layer handlers.
 """
 from .list_and_get import handle_list_prompts, handle_get_prompt
 from .create_update_delete import handle_create_prompt, handle_update_prompt, handle_delete_prompt
-from .performance import handle_update_performance
+from .performance import handle_update_performance, handle_update_performance_batch
 from .stats import handle_get_top_prompts, handle_get_stats
 
 __all__ = [
@@ -14,6 +14,7 @@ __all__ = [
     "handle_update_prompt",
     "handle_delete_prompt",
     "handle_update_performance",
+    "handle_update_performance_batch",
     "handle_get_top_prompts",
     "handle_get_stats"
 ]
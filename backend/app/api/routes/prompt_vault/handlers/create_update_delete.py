@@ -5,18 +5,31 @@ Strict <200L per file.
 """
 from fastapi import HTTPException
 from app.infrastructure.supabase_service import get_supabase_service
+from app.services.prompt_vault import (
+    TemplateError, compile_template, invalidate_vault_stats, prompt_vault_index
+)
+from app.services.nova_briefing import mark_briefing_stale
 from ..models import PromptVaultCreate, PromptVaultUpdate
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _validate_template(prompt_text: str) -> None:
+    """Rechaza plantillas que no compilan (placeholders desconocidos o mal formados)."""
+    try:
+        compile_template(prompt_text)
+    except TemplateError as e:
+        raise HTTPException(400, f"Invalid prompt_text: {e}")
+
+
 async def handle_create_prompt(request: PromptVaultCreate) -> dict:
     """
     Crea un nuevo prompt en el vault.
-    Requiere permisos de admin.
+    Requiere permisos de admin. La plantilla se compila antes de insertar.
     """
     try:
+        _validate_template(request.prompt_text)
         supabase = get_supabase_service()
 
         response = supabase.client.table("prompt_vault").insert(
@@ -26,6 +39,9 @@ async def handle_create_prompt(request: PromptVaultCreate) -> dict:
         if not response.data:
             raise HTTPException(500, "Failed to create prompt")
 
+        prompt_vault_index.invalidate()
+        invalidate_vault_stats()
+        mark_briefing_stale("prompt_vault_stats")
         logger.info(
             f"Created new prompt: {request.name} "
             f"({request.vertical}/{request.category}/{request.platform})"
@@ -33,6 +49,8 @@ async def handle_create_prompt(request: PromptVaultCreate) -> dict:
 
         return response.data[0]
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error creating prompt: {e}")
         raise HTTPException(500, f"Error creating prompt: {str(e)}")
@@ -51,6 +69,8 @@ async def handle_update_prompt(prompt_id: str, request: PromptVaultUpdate) -> di
 
         if not update_data:
             raise HTTPException(400, "No fields to update")
+        if update_data.get("prompt_text") is not None:
+            _validate_template(update_data["prompt_text"])
 
         # Always update last_updated
         update_data["last_updated"] = "now()"
@@ -62,6 +82,9 @@ async def handle_update_prompt(prompt_id: str, request: PromptVaultUpdate) -> di
         if not response.data:
             raise HTTPException(404, f"Prompt {prompt_id} not found")
 
+        prompt_vault_index.invalidate()
+        invalidate_vault_stats()
+        mark_briefing_stale("prompt_vault_stats")
         logger.info(f"Updated prompt {prompt_id}: {list(update_data.keys())}")
 
         return response.data[0]
@@ -89,6 +112,9 @@ async def handle_delete_prompt(prompt_id: str) -> dict:
         if not response.data:
             raise HTTPException(404, f"Prompt {prompt_id} not found")
 
+        prompt_vault_index.invalidate()
+        invalidate_vault_stats()
+        mark_briefing_stale("prompt_vault_stats")
         logger.info(f"Soft deleted prompt {prompt_id}")
 
         return {
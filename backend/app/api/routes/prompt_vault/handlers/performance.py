@@ -4,9 +4,11 @@ DDD: Application layer - performance tracking.
 Strict <200L per file.
 """
 from fastapi import HTTPException
-from app.infrastructure.supabase_service import get_supabase_service
-from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
-from ..models import PerformanceUpdateRequest
+from app.services.prompt_vault import (
+    apply_performance_signals, invalidate_vault_stats, prompt_vault_index
+)
+from app.services.nova_briefing import mark_briefing_stale
+from ..models import PerformanceUpdateRequest, PerformanceBatchRequest
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,31 +22,28 @@ async def handle_update_performance(
     Actualiza el performance_score de un prompt basado en engagement real.
 
     Formula: new_score = (old_score * 0.7) + (engagement_rate * 10 * 0.3)
+    Aplicada en un solo UPDATE atómico (sin leer el score actual).
 
     Args:
         prompt_id: UUID del prompt
         engagement_rate: Tasa de engagement real (0.0 a 1.0, ej: 0.045 = 4.5%)
     """
     try:
-        supabase = get_supabase_service()
-        vault_repo = PromptVaultRepository(supabase)
+        updated = await apply_performance_signals([prompt_id], [request.engagement_rate])
 
-        # Update performance score
-        await vault_repo.update_performance_score(
-            prompt_id=prompt_id,
-            engagement_rate=request.engagement_rate
-        )
-
-        # Get updated prompt
-        updated_prompt = await vault_repo.get_prompt_by_id(prompt_id)
+        if not updated:
+            raise HTTPException(404, f"Prompt {prompt_id} not found")
 
-        if not updated_prompt:
-            raise HTTPException(404, f"Prompt {prompt_id} not found after update")
+        # Score changes reorder the index buckets and move the stats
+        prompt_vault_index.invalidate()
+        invalidate_vault_stats()
+        mark_briefing_stale("prompt_vault_stats")
 
+        updated_prompt = updated[0]
         logger.info(
             f"Updated performance for prompt {prompt_id}: "
             f"engagement={request.engagement_rate:.4f}, "
-            f"new_score={updated_prompt['performance_score']:.2f}"
+            f"new_score={float(updated_prompt['performance_score']):.2f}"
         )
 
         return {
@@ -61,3 +60,35 @@ async def handle_update_performance(
     except Exception as e:
         logger.error(f"Error updating performance for {prompt_id}: {e}")
         raise HTTPException(500, f"Error updating performance: {str(e)}")
+
+
+async def handle_update_performance_batch(request: PerformanceBatchRequest) -> dict:
+    """
+    Ingesta masiva de señales de engagement (backfills desde plataformas).
+
+    Las señales se pliegan en memoria a un delta EWMA por prompt y se
+    aplican en una sola sentencia; lotes concurrentes siguen siendo exactos.
+    """
+    try:
+        updated = await apply_performance_signals(
+            [str(s.prompt_id) for s in request.signals],
+            [s.engagement_rate for s in request.signals]
+        )
+        if updated:
+            prompt_vault_index.invalidate()
+            invalidate_vault_stats()
+            mark_briefing_stale("prompt_vault_stats")
+
+        requested = {str(s.prompt_id) for s in request.signals}
+        found = {str(row["id"]) for row in updated}
+
+        return {
+            "signals": len(request.signals),
+            "prompts_updated": len(updated),
+            "unknown_prompts": sorted(requested - found),
+            "prompts": updated
+        }
+
+    except Exception as e:
+        logger.error(f"Error applying performance batch: {e}")
+        raise HTTPException(500, f"Error applying performance batch: {str(e)}")
@@ -6,6 +6,7 @@ Strict <200L per file.
 from fastapi import HTTPException
 from app.infrastructure.supabase_service import get_supabase_service
 from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
+from app.services.prompt_vault import get_vault_stats
 import logging
 
 logger = logging.getLogger(__name__)
@@ -38,45 +39,17 @@ async def handle_get_top_prompts(vertical: str, limit: int) -> dict:
 async def handle_get_stats() -> dict:
     """
     Obtiene estadísticas generales del Prompt Vault.
+    Una sola RPC agregada (cacheada unos segundos, compartida con NOVA).
     """
     try:
-        supabase = get_supabase_service()
-
-        # Total prompts
-        total_response = supabase.client.table("prompt_vault").select(
-            "*", count="exact"
-        ).execute()
-
-        # Active prompts
-        active_response = supabase.client.table("prompt_vault").select(
-            "*", count="exact"
-        ).eq("is_active", True).execute()
-
-        # Average score
-        avg_response = supabase.client.table("prompt_vault").select(
-            "performance_score"
-        ).eq("is_active", True).execute()
-
-        avg_score = 0
-        if avg_response.data:
-            scores = [p["performance_score"] for p in avg_response.data]
-            avg_score = sum(scores) / len(scores) if scores else 0
-
-        # By vertical
-        vertical_response = supabase.client.table("prompt_vault").select(
-            "vertical"
-        ).eq("is_active", True).execute()
-
-        verticals = {}
-        for item in vertical_response.data:
-            v = item["vertical"]
-            verticals[v] = verticals.get(v, 0) + 1
+        stats = await get_vault_stats()
 
         return {
-            "total_prompts": total_response.count if hasattr(total_response, 'count') else len(total_response.data),
-            "active_prompts": active_response.count if hasattr(active_response, 'count') else len(active_response.data),
-            "average_performance_score": round(avg_score, 2),
-            "by_vertical": verticals
+            "total_prompts": stats.get("total", 0),
+            "active_prompts": stats.get("active", 0),
+            "average_performance_score": stats.get("avg_score", 0),
+            "score_percentiles": stats.get("percentiles", {}),
+            "by_vertical": stats.get("by_vertical", {})
         }
 
     except Exception as e:
@@ -4,6 +4,7 @@ Pydantic models for Prompt Vault API.
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
+from uuid import UUID
 
 
 class PromptVaultCreate(BaseModel):
@@ -114,6 +115,27 @@ class PerformanceUpdateRequest(BaseModel):
         }
 
 
+class PerformanceSignal(BaseModel):
+    """One engagement observation for a prompt"""
+    prompt_id: UUID = Field(..., description="Prompt UUID")
+    engagement_rate: float = Field(..., ge=0, le=1, description="Engagement rate (0.0 to 1.0)")
+
+
+class PerformanceBatchRequest(BaseModel):
+    """Request model for bulk performance updates (signals in arrival order)"""
+    signals: list[PerformanceSignal] = Field(..., min_length=1, max_length=100000)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "signals": [
+                    {"prompt_id": "550e8400-e29b-41d4-a716-446655440000", "engagement_rate": 0.045},
+                    {"prompt_id": "550e8400-e29b-41d4-a716-446655440000", "engagement_rate": 0.051}
+                ]
+            }
+        }
+
+
 class PromptVaultListResponse(BaseModel):
     """Response model for list of prompts"""
     prompts: list[PromptVaultResponse]
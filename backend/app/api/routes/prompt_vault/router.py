@@ -11,6 +11,7 @@ from .models import (
     PromptVaultUpdate,
     PromptVaultResponse,
     PerformanceUpdateRequest,
+    PerformanceBatchRequest,
     PromptVaultListResponse
 )
 from .handlers import (
@@ -20,6 +21,7 @@ from .handlers import (
     handle_update_prompt,
     handle_delete_prompt,
     handle_update_performance,
+    handle_update_performance_batch,
     handle_get_top_prompts,
     handle_get_stats
 )
@@ -74,6 +76,12 @@ async def update_performance(prompt_id: str, request: PerformanceUpdateRequest):
     return await handle_update_performance(prompt_id, request)
 
 
+@router.post("/performance/batch")
+async def update_performance_batch(request: PerformanceBatchRequest):
+    """Aplica muchas señales de engagement en una sola sentencia"""
+    return await handle_update_performance_batch(request)
+
+
 @router.get("/top/{vertical}")
 async def get_top_prompts(
     vertical: str,
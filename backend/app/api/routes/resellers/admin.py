@@ -10,6 +10,8 @@ from app.models.reseller_models import (
     CreateResellerRequest,
     UpdateResellerStatusRequest,
 )
+from app.services.branding_cache import branding_cache
+from app.infrastructure.projections import RESELLER_REF
 import logging
 import bcrypt
 
@@ -201,7 +203,7 @@ async def update_reseller_status(
         service = get_supabase_service()
 
         # Get current reseller
-        reseller = await service.get_reseller(reseller_id)
+        reseller = await service.get_reseller(reseller_id, RESELLER_REF)
         if not reseller:
             raise HTTPException(status_code=404, detail="Reseller not found")
 
@@ -214,6 +216,7 @@ async def update_reseller_status(
 
         # Update reseller
         updated_reseller = await service.update_reseller(reseller_id, update_data)
+        branding_cache.invalidate_reseller(reseller_id)
 
         return APIResponse(
             success=True,
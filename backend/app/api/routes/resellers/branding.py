@@ -10,11 +10,24 @@ from app.models.reseller_models import (
     BrandingRequest,
     sanitize_json_field,
 )
+from app.services.branding_cache import branding_cache
+from app.services.media import (
+    UploadRejected,
+    inspect_upload,
+    iter_upload,
+    schedule_hero_derivatives,
+)
+from app.infrastructure.storage_streamer import IMMUTABLE_CACHE_SECONDS, object_exists, stream_upload
+from app.infrastructure.projections import RESELLER_REF
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+HERO_BUCKET = "reseller-media"
+HERO_MAX_BYTES = 15 * 1024 * 1024
+HERO_MEDIA_TYPES = ("video/mp4", "video/webm", "image/jpeg", "image/png", "image/webp")
+
 
 @router.post("/{reseller_id}/branding", response_model=APIResponse)
 async def update_branding(
@@ -46,13 +59,14 @@ async def update_branding(
         service = get_supabase_service()
 
         # Verify reseller exists
-        reseller = await service.get_reseller(reseller_id)
+        reseller = await service.get_reseller(reseller_id, RESELLER_REF)
         if not reseller:
             raise HTTPException(status_code=404, detail="Reseller not found")
 
         # Update branding
         branding_data = request.model_dump(exclude_none=True)
         branding = await service.update_branding(reseller_id, branding_data)
+        branding_cache.invalidate_reseller(reseller_id)
 
         return APIResponse(
             success=True,
@@ -117,6 +131,7 @@ async def get_branding(reseller_id: str) -> APIResponse:
                 "logo_url": None,
                 "hero_type": None,
                 "hero_media_url": None,
+                "hero_media_derivatives": None,
                 "hero_title": None,
                 "hero_subtitle": None,
                 "hero_cta_url": None,
@@ -198,59 +213,58 @@ async def upload_hero_media(
         HTTPException 400: Invalid file type or size
         HTTPException 500: Server error
 
-    Uploads to Supabase Storage bucket 'reseller-media' at:
-        {slug}/hero.{extension}
+    The file is inspected in chunks (size enforced while reading, type
+    sniffed from its first bytes, SHA-256 built incrementally) and then
+    streamed to Supabase Storage bucket 'reseller-media' at:
+        {slug}/hero-{sha256[:16]}.{extension}
 
-    Updates branding with hero_media_url and hero_media_type
+    Identical content maps to the same object, so re-uploads skip Storage.
+    Updates branding with hero_media_url and hero_media_type; image variants
+    or a video poster are generated in the background into
+    hero_media_derivatives.
     """
     try:
         service = get_supabase_service()
 
         # Verify reseller exists
-        reseller = await service.get_reseller(reseller_id)
+        reseller = await service.get_reseller(reseller_id, RESELLER_REF)
         if not reseller:
             raise HTTPException(status_code=404, detail="Reseller not found")
 
-        # Validate file type
-        allowed_types = [
-            "video/mp4", "video/webm",
-            "image/jpeg", "image/png", "image/webp"
-        ]
-        if file.content_type not in allowed_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid file type. Allowed: {', '.join(allowed_types)}"
-            )
-
-        # Validate file size (15MB max)
-        file_data = await file.read()
-        file_size_mb = len(file_data) / (1024 * 1024)
-        if file_size_mb > 15:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File too large ({file_size_mb:.2f}MB). Max 15MB allowed."
-            )
+        try:
+            info = await inspect_upload(file, HERO_MAX_BYTES, HERO_MEDIA_TYPES)
+        except UploadRejected as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         # Determine media type
-        media_type = "video" if file.content_type.startswith("video/") else "image"
-
-        # Generate file path
-        file_extension = file.filename.split(".")[-1] if "." in file.filename else "mp4"
-        file_path = f"{reseller['slug']}/hero.{file_extension}"
-
-        # Upload to Supabase Storage
-        public_url = await service.upload_media(
-            bucket="reseller-media",
-            file_path=file_path,
-            file_data=file_data,
-            content_type=file.content_type
-        )
+        media_type = "video" if info.mime_type.startswith("video/") else "image"
+
+        # Content-addressed path: same bytes -> same object
+        filename = file.filename or ""
+        file_extension = filename.split(".")[-1] if "." in filename else "mp4"
+        file_path = f"{reseller['slug']}/hero-{info.sha256[:16]}.{file_extension}"
+
+        if await object_exists(HERO_BUCKET, file_path):
+            logger.info(f"Hero media unchanged for {reseller['slug']}, skipping upload")
+        else:
+            await stream_upload(
+                bucket=HERO_BUCKET,
+                path=file_path,
+                chunks=iter_upload(file),
+                size=info.size,
+                content_type=info.mime_type,
+                cache_seconds=IMMUTABLE_CACHE_SECONDS
+            )
+        public_url = service.client.storage.from_(HERO_BUCKET).get_public_url(file_path)
 
-        # Update branding with new media URL
+        # Update branding with new media URL (derivatives follow in background)
         await service.update_branding(reseller_id, {
             "hero_media_url": public_url,
-            "hero_media_type": media_type
+            "hero_media_type": media_type,
+            "hero_media_derivatives": None
         })
+        branding_cache.invalidate_reseller(reseller_id)
+        schedule_hero_derivatives(reseller_id, HERO_BUCKET, file_path, public_url, media_type)
 
         return APIResponse(
             success=True,
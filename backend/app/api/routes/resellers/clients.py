@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException
 from app.infrastructure.supabase_service import get_supabase_service
 from app.models.shared_models import APIResponse
 from app.models.reseller_models import AddClientRequest
+from app.infrastructure.projections import RESELLER_REF
 import logging
 
 router = APIRouter()
@@ -73,7 +74,7 @@ async def add_client_to_reseller(
         service = get_supabase_service()
 
         # Verify reseller exists
-        reseller = await service.get_reseller(reseller_id)
+        reseller = await service.get_reseller(reseller_id, RESELLER_REF)
         if not reseller:
             raise HTTPException(status_code=404, detail="Reseller not found")
 
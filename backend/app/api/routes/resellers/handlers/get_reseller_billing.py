@@ -5,11 +5,11 @@ Filosofía: No velocity, only precision 🐢💎
 """
 from typing import Dict, Any
 from fastapi import HTTPException
-import logging, stripe, os
+import logging
 from app.infrastructure.supabase_service import get_supabase_service
+from app.services.billing import get_stripe
 
 logger = logging.getLogger(__name__)
-stripe.api_key = os.getenv("STRIPE_API_KEY")
 
 async def handle_get_reseller_billing(reseller_id: str) -> Dict[str, Any]:
     """Get billing information from Stripe or Supabase fallback"""
@@ -27,6 +27,7 @@ async def handle_get_reseller_billing(reseller_id: str) -> Dict[str, Any]:
         mrr = reseller.get("monthly_revenue_reported", 0)
         # Try Stripe API if customer exists
         if stripe_id:
+            stripe = get_stripe()
             try:
                 subs = stripe.Subscription.list(customer=stripe_id, limit=1)
                 invoices = stripe.Invoice.list(customer=stripe_id, limit=10)
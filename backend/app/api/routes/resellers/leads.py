@@ -5,6 +5,8 @@ Endpoints for managing leads generated from landing pages
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any, Optional
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.pagination import CountMode
+from app.infrastructure.projections import RESELLER_REF
 from app.models.shared_models import APIResponse
 from app.models.reseller_models import (
     CreateLeadRequest,
@@ -41,7 +43,7 @@ async def create_lead(
         service = get_supabase_service()
 
         # Verify reseller exists
-        reseller = await service.get_reseller(reseller_id)
+        reseller = await service.get_reseller(reseller_id, RESELLER_REF)
         if not reseller:
             raise HTTPException(status_code=404, detail="Reseller not found")
 
@@ -73,7 +75,9 @@ async def get_reseller_leads(
     reseller_id: str,
     status: Optional[str] = None,
     page: int = 1,
-    limit: int = 20
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact"
 ) -> APIResponse:
     """
     Get all leads for a reseller with optional filters and pagination
@@ -81,13 +85,16 @@ async def get_reseller_leads(
     Args:
         reseller_id: Reseller UUID
         status: Optional filter (new|contacted|converted|lost)
-        page: Page number (default: 1)
+        page: Legacy page number (default: 1, ignored when cursor is given)
         limit: Results per page (default: 20, max: 100)
+        cursor: next_cursor from the previous page
+        count: Total mode (exact, planned, estimated, none)
 
     Returns:
-        APIResponse with paginated leads and counts by status
+        APIResponse with a keyset page of leads and counts by status
 
     Raises:
+        HTTPException 400: Invalid cursor
         HTTPException 404: Reseller not found
         HTTPException 500: Server error
     """
@@ -95,7 +102,7 @@ async def get_reseller_leads(
         service = get_supabase_service()
 
         # Verify reseller exists
-        reseller = await service.get_reseller(reseller_id)
+        reseller = await service.get_reseller(reseller_id, RESELLER_REF)
         if not reseller:
             raise HTTPException(status_code=404, detail="Reseller not found")
 
@@ -104,11 +111,13 @@ async def get_reseller_leads(
             limit = 100
 
         # Get leads with pagination
-        leads, total = await service.get_reseller_leads(
+        leads, keyset = await service.get_reseller_leads(
             reseller_id,
             status,
             page,
-            limit
+            limit,
+            cursor,
+            count
         )
 
         # Get counts by status
@@ -118,15 +127,16 @@ async def get_reseller_leads(
             success=True,
             data={
                 "leads": leads,
-                "total": total,
                 "page": page,
-                "limit": limit,
-                "counts": counts
+                "counts": counts,
+                **keyset.envelope(limit)
             },
-            message=f"Found {total} leads"
+            message=f"Found {keyset.total if keyset.total is not None else len(leads)} leads"
         )
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting reseller leads: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,14 +2,13 @@
 Reseller Public Routes
 Public endpoints for white-label landing pages (no authentication required)
 """
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Header, Response
+from fastapi.responses import JSONResponse
+from typing import Dict, Any, Optional
 from app.infrastructure.supabase_service import get_supabase_service
 from app.models.shared_models import APIResponse
-from app.models.reseller_models import (
-    CreateLeadBySlugRequest,
-    sanitize_json_field,
-)
+from app.models.reseller_models import CreateLeadBySlugRequest
+from app.services.branding_cache import BRANDING_CACHE_CONTROL, branding_cache, etag_matches
 import logging
 
 router = APIRouter()
@@ -17,20 +16,26 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/slug/{slug}", response_model=APIResponse)
-async def get_branding_by_slug(slug: str) -> APIResponse:
+async def get_branding_by_slug(
+    slug: str,
+    if_none_match: Optional[str] = Header(None)
+) -> Response:
     """
     Get reseller + branding by slug (PUBLIC endpoint)
 
     Args:
         slug: Reseller URL slug
+        if_none_match: ETag from a previous response
 
     Returns:
-        APIResponse with reseller and branding data
+        APIResponse with reseller and branding data, or 304 when unchanged
 
     Raises:
         No HTTPException - returns error in response
 
-    Used by white-label landing pages to load all branding data
+    Used by white-label landing pages to load all branding data.
+    Served from the branding cache (one joined query per miss) with a
+    strong ETag and Cache-Control so browsers/CDNs can revalidate cheaply.
 
     Response codes:
         - success=True: Reseller found and active
@@ -38,99 +43,22 @@ async def get_branding_by_slug(slug: str) -> APIResponse:
         - success=False, error="agency_suspended": Agency suspended
     """
     try:
-        service = get_supabase_service()
-
-        # Get reseller by slug
-        reseller = await service.get_reseller_by_slug(slug)
-        if not reseller:
-            return APIResponse(
-                success=False,
-                data={"error": "not_found"},
-                message="Agency not found"
+        cached = await branding_cache.get(slug)
+        if not cached:
+            return JSONResponse(
+                content=APIResponse(
+                    success=False,
+                    data={"error": "not_found"},
+                    message="Agency not found"
+                ).model_dump(),
+                headers={"Cache-Control": "no-store"}
             )
 
-        # Check if suspended
-        if reseller.get("status") == "suspended":
-            return APIResponse(
-                success=False,
-                data={"error": "agency_suspended"},
-                message="This agency is not available"
-            )
+        headers = {"ETag": cached.etag, "Cache-Control": BRANDING_CACHE_CONTROL}
+        if etag_matches(if_none_match, cached.etag):
+            return Response(status_code=304, headers=headers)
 
-        # Get branding (or return defaults)
-        branding = await service.get_branding(reseller["id"])
-        if not branding:
-            # Return default branding
-            branding = {
-                "reseller_id": reseller["id"],
-                "primary_color": "38 85% 55%",
-                "secondary_color": "225 12% 14%",
-                "hero_cta_text": "Comenzar",
-                "logo_url": None,
-                "hero_type": None,
-                "hero_media_url": None,
-                "hero_title": None,
-                "hero_subtitle": None,
-                "hero_cta_url": None,
-                "pain_section": {},
-                "solutions_section": {},
-                "services_section": {},
-                "metrics_section": {},
-                "process_section": {},
-                "testimonials_section": {},
-                "client_logos_section": {},
-                "contact_email": None,
-                "contact_phone": None,
-                "footer_text": None,
-                "social_links": {},
-                "pricing_plans": []
-            }
-        else:
-            # Sanitize JSONB fields to ensure they're always dicts, never lists
-            branding["pain_section"] = sanitize_json_field(
-                branding.get("pain_section")
-            )
-            branding["solutions_section"] = sanitize_json_field(
-                branding.get("solutions_section")
-            )
-            branding["services_section"] = sanitize_json_field(
-                branding.get("services_section")
-            )
-            branding["metrics_section"] = sanitize_json_field(
-                branding.get("metrics_section")
-            )
-            branding["process_section"] = sanitize_json_field(
-                branding.get("process_section")
-            )
-            branding["testimonials_section"] = sanitize_json_field(
-                branding.get("testimonials_section")
-            )
-            branding["client_logos_section"] = sanitize_json_field(
-                branding.get("client_logos_section")
-            )
-            branding["social_links"] = sanitize_json_field(
-                branding.get("social_links")
-            )
-
-            # Ensure pricing_plans is always an array
-            branding["pricing_plans"] = branding.get("pricing_plans") or []
-
-        # Combine reseller + branding
-        public_data: Dict[str, Any] = {
-            "reseller": {
-                "id": reseller["id"],
-                "slug": reseller["slug"],
-                "agency_name": reseller["agency_name"],
-                "status": reseller["status"]
-            },
-            "branding": branding
-        }
-
-        return APIResponse(
-            success=True,
-            data=public_data,
-            message="Reseller found"
-        )
+        return Response(content=cached.body, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
@@ -9,6 +9,7 @@ from pydantic import BaseModel
 import logging
 
 from app.services.sentinel_service import SentinelService
+from app.services.nova_briefing import mark_briefing_stale
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,7 @@ async def handle_run_scan(request: ScanRequest) -> Dict[str, Any]:
             insert_data = {k: v for k, v in result.items() if k in valid_cols}
             insert_data["triggered_by"] = "manual"
             supabase.client.table("sentinel_scans").insert(insert_data).execute()
+            mark_briefing_stale("system_status")
 
         logger.info(f"{request.scan_type} scan completed: score={result.get('security_score', 0)}")
 
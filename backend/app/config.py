@@ -2,7 +2,7 @@
 Application Configuration
 Manages all environment variables and settings
 """
-from typing import List
+from typing import Dict, List
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 
@@ -19,6 +19,10 @@ class Settings(BaseSettings):
     
     # API
     api_v1_prefix: str = Field(default="/api/v1", env="API_V1_PREFIX")
+    # Opt-in: mount the legacy single-agent route groups on first request (faster cold start, e.g. Railway)
+    lazy_route_groups: bool = Field(default=False, env="LAZY_ROUTE_GROUPS")
+    # NOVA briefing snapshot: full refresh interval (writes refresh their own section right away)
+    nova_briefing_refresh_minutes: int = Field(default=5, env="NOVA_BRIEFING_REFRESH_MINUTES")
     backend_cors_origins: List[str] = Field(
         default=["http://localhost:5173"],
         env="BACKEND_CORS_ORIGINS"
@@ -31,6 +35,20 @@ class Settings(BaseSettings):
     postgres_db: str = Field(..., env="POSTGRES_DB")
     postgres_host: str = Field(default="localhost", env="POSTGRES_HOST")
     postgres_port: int = Field(default=5432, env="POSTGRES_PORT")
+    # Hot read paths query Postgres directly over a pooled connection; PostgREST stays the fallback
+    direct_db_reads: bool = Field(default=False, env="DIRECT_DB_READS")
+    db_pool_size: int = Field(default=5, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=5, env="DB_MAX_OVERFLOW")
+    db_statement_timeout_ms: int = Field(default=5000, env="DB_STATEMENT_TIMEOUT_MS")
+    # Dev only: log query results whose columns are never read (see app.infrastructure.projections)
+    projection_audit: bool = Field(default=False, env="PROJECTION_AUDIT")
+    # Dev/staging: trace every database round-trip per request (X-Query-* headers, N+1 warnings)
+    query_tracer: bool = Field(default=False, env="QUERY_TRACER")
+    # Per-route query budgets, e.g. {"GET /api/v1/nova/briefing": 6}; 0 = no default budget
+    query_budgets: Dict[str, int] = Field(default={}, env="QUERY_BUDGETS")
+    query_budget_default: int = Field(default=0, env="QUERY_BUDGET_DEFAULT")
+    # Raise QueryBudgetExceeded instead of logging (test runs)
+    query_budget_enforce: bool = Field(default=False, env="QUERY_BUDGET_ENFORCE")
 
     # Supabase
     supabase_url: str = Field(..., env="SUPABASE_URL")
@@ -84,6 +102,8 @@ class Settings(BaseSettings):
     stripe_price_basic: str = Field(default="", env="STRIPE_PRICE_BASIC")
     stripe_price_pro: str = Field(default="", env="STRIPE_PRICE_PRO")
     stripe_price_enterprise: str = Field(default="", env="STRIPE_PRICE_ENTERPRISE")
+    # Run the Stripe mirror backfill at startup too (first deploy only; every replica would page all of Stripe)
+    stripe_backfill_on_startup: bool = Field(default=False, env="STRIPE_BACKFILL_ON_STARTUP")
 
     # Celery
     celery_broker_url: str = Field(
@@ -4,8 +4,8 @@ Handles all interactions with Claude API
 """
 from typing import List, Optional, Dict, Any
 import logging
-from anthropic import AsyncAnthropic
 from app.config import settings
+from app.infrastructure.ai.clients import get_anthropic_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +14,12 @@ class ClaudeService:
     """Service for Anthropic Claude API interactions"""
     
     def __init__(self):
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
         self.model = "claude-sonnet-4-5-20250929"
+
+    @property
+    def client(self):
+        """AsyncAnthropic client, created on first call"""
+        return get_anthropic_client(settings.anthropic_api_key)
     
     async def generate_text(
         self,
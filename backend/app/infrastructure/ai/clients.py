@@ -0,0 +1,55 @@
+"""
+AI Client Accessors
+Provider SDK clients built on first use instead of at import time
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+import logging
+import threading
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from openai import AsyncOpenAI
+    from runwayml import RunwayML
+
+logger = logging.getLogger(__name__)
+
+# Clients keyed by (provider, api_key, base_url); SDK types are imported lazily
+_clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+_lock = threading.Lock()
+
+
+def _cached(provider: str, api_key: Optional[str], base_url: Optional[str], build) -> Any:
+    key = (provider, api_key, base_url)
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = build()
+                logger.debug(f"{provider} client created" + (f" ({base_url})" if base_url else ""))
+    return client
+
+
+def get_openai_client(api_key: Optional[str], base_url: Optional[str] = None) -> "AsyncOpenAI":
+    """Shared AsyncOpenAI client (also OpenAI-compatible APIs via base_url)."""
+    def build():
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=api_key, base_url=base_url)
+    return _cached("openai", api_key, base_url, build)
+
+
+def get_anthropic_client(api_key: Optional[str]) -> "AsyncAnthropic":
+    """Shared AsyncAnthropic client."""
+    def build():
+        from anthropic import AsyncAnthropic
+        return AsyncAnthropic(api_key=api_key)
+    return _cached("anthropic", api_key, None, build)
+
+
+def get_runway_client(api_key: str) -> "RunwayML":
+    """Shared RunwayML client."""
+    def build():
+        from runwayml import RunwayML
+        return RunwayML(api_key=api_key)
+    return _cached("runway", api_key, None, build)
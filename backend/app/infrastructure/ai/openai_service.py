@@ -4,8 +4,8 @@ Handles all interactions with OpenAI API
 """
 from typing import List, Optional, Dict, Any
 import logging
-from openai import AsyncOpenAI
 from app.config import settings
+from app.infrastructure.ai.clients import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +14,13 @@ class OpenAIService:
     """Service for OpenAI API interactions"""
     
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
         self.model = "gpt-4o"
         self.image_model = "dall-e-3"
+
+    @property
+    def client(self):
+        """AsyncOpenAI client, created on first call"""
+        return get_openai_client(settings.openai_api_key)
     
     async def generate_text(
         self,
@@ -0,0 +1,237 @@
+"""
+Request-Scoped Data Loader
+Batches and memoizes row lookups by key within one request or agent run
+Filosofía: No velocity, only precision 🐢💎
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import asyncio
+import copy
+import logging
+
+from app.infrastructure.supabase_service import SupabaseService, get_supabase_service
+from app.infrastructure.postgres import direct_reads_enabled, fetch_all, read, statement
+from app.infrastructure.projections import Projection, all_columns, audit, column_usage, is_missing_column
+
+logger = logging.getLogger(__name__)
+
+# Rows are PostgREST JSON dicts
+Row = Dict[str, Any]
+
+
+class RowLoader:
+    """
+    Rows of one table keyed by one column.
+
+    many=False maps key -> row or None (unique column such as id);
+    many=True maps key -> list of rows (foreign key such as client_id).
+    Uncached keys are fetched together in one IN query, and callers always
+    get copies, so mutating a result never corrupts the cache. Only the
+    projection's columns (plus the key column) are selected.
+    """
+
+    def __init__(self, table: str, column: str = "id", many: bool = False,
+                 supabase: Optional[SupabaseService] = None, projection: Optional[Projection] = None):
+        self.table = table
+        self.column = column
+        self.many = many
+        self.supabase = supabase
+        self._requested = (projection or all_columns(table)).resolved()
+        self.projection = self._requested.including(column)
+        self._usage = column_usage(self.label)
+        self.fetches = 0
+        # Cached row, None (no row) or list of rows per str(key)
+        self._cache: Dict[str, Any] = {}
+        self._batch: Optional[Dict[str, asyncio.Future]] = None
+
+    def has(self, key: Any) -> bool:
+        return str(key) in self._cache
+
+    def get(self, key: Any) -> Any:
+        """Row (or rows with many=True) for one key, fetched on first use."""
+        return self.get_many([key])[str(key)]
+
+    def get_many(self, keys: Iterable[Any]) -> Dict[str, Any]:
+        """Rows for several keys; every uncached key comes from a single query."""
+        wanted = [str(key) for key in keys]
+        self._fetch(wanted)
+        return {key: self._copy(self._cache[key]) for key in wanted}
+
+    async def load(self, key: Any) -> Any:
+        """
+        Like get(), but loads awaited in the same event-loop tick
+        (asyncio.gather) share one query.
+        """
+        key = str(key)
+        if key not in self._cache:
+            loop = asyncio.get_running_loop()
+            if self._batch is None:
+                self._batch = {}
+                loop.call_soon(self._dispatch)
+            future = self._batch.get(key)
+            if future is None:
+                future = self._batch[key] = loop.create_future()
+            await asyncio.shield(future)
+        return self._copy(self._cache[key])
+
+    def prime(self, key: Any, value: Any) -> None:
+        """Store a row already read or written elsewhere (None = known missing)."""
+        self._cache[str(key)] = copy.deepcopy(value)
+
+    def clear(self, key: Any = None) -> None:
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(str(key), None)
+
+    @property
+    def label(self) -> str:
+        return f"{self.table}.{self.column}[{self.projection.name}]"
+
+    def _copy(self, value: Any) -> Any:
+        return audit(self.label, copy.deepcopy(value), self._usage)
+
+    def _dispatch(self) -> None:
+        batch, self._batch = self._batch or {}, None
+        try:
+            self._fetch(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future in batch.values():
+            if not future.done():
+                future.set_result(None)
+
+    def _client(self):
+        return (self.supabase or get_supabase_service()).client
+
+    def _direct(self, keys: List[str]) -> List[Row]:
+        sql = statement(f'SELECT {self.projection.sql} FROM "{self.table}" WHERE "{self.column}" IN :keys', "keys")
+        return fetch_all(sql, {"keys": keys})
+
+    def _postgrest(self, keys: List[str]) -> List[Row]:
+        query = self._client().table(self.table).select(self.projection.select)
+        if len(keys) == 1:
+            query = query.eq(self.column, keys[0])
+        else:
+            query = query.in_(self.column, keys)
+        return query.execute().data or []
+
+    def _read(self, keys: List[str]) -> List[Row]:
+        return read(self.label, lambda: self._direct(keys), lambda: self._postgrest(keys))
+
+    def _fetch(self, keys: List[str]) -> None:
+        missing = list(dict.fromkeys(key for key in keys if key not in self._cache))
+        if not missing:
+            return
+        while True:
+            try:
+                rows = self._read(missing)
+                break
+            except Exception as e:
+                # Older schema without an optional column: retry (and remember) without it
+                reduced = self._requested.drop_missing(e) if is_missing_column(e) else None
+                if reduced is None:
+                    raise
+                self._requested = reduced
+                self.projection = reduced.including(self.column)
+        self.fetches += 1
+
+        found: Dict[str, Any] = {key: [] if self.many else None for key in missing}
+        for row in rows:
+            key = str(row.get(self.column))
+            if self.many:
+                found.setdefault(key, []).append(row)
+            elif found.get(key) is None:
+                found[key] = row
+        self._cache.update(found)
+
+
+def load_with_parent(
+    child: RowLoader, key: Any, parent: RowLoader, foreign_key: str
+) -> Tuple[Optional[Row], Optional[Row]]:
+    """
+    A row and the row it references, e.g. a social account and its client.
+
+    When the child is not cached yet both come from one embedded PostgREST
+    select (`<child columns>, <parent table>(<parent columns>)`) and are
+    primed into their loaders; with
+    direct Postgres reads they are two keyed lookups on the pool instead.
+    """
+    if not child.has(key) and not direct_reads_enabled():
+        rows = child._client().table(child.table)\
+            .select(f"{child.projection.including(foreign_key).select}, {parent.table}({parent.projection.select})")\
+            .eq(child.column, str(key))\
+            .limit(1)\
+            .execute().data or []
+        child.fetches += 1
+        row = rows[0] if rows else None
+        if row is not None:
+            embedded = row.pop(parent.table, None)
+            if row.get(foreign_key) is not None:
+                parent.prime(row[foreign_key], embedded)
+        child.prime(key, row)
+
+    row = child.get(key)
+    if row is None or row.get(foreign_key) is None:
+        return row, None
+    return row, parent.get(row[foreign_key])
+
+
+class _Scope:
+    """Loaders shared by one request or agent run, keyed by (table, column, many, projection)."""
+
+    def __init__(self):
+        self.loaders: Dict[Tuple[str, str, bool, str], RowLoader] = {}
+        self.open = True
+
+
+_scope: ContextVar[Optional[_Scope]] = ContextVar("data_loader_scope", default=None)
+
+
+def loader(table: str, column: str = "id", many: bool = False,
+           supabase: Optional[SupabaseService] = None, projection: Optional[Projection] = None) -> RowLoader:
+    """
+    The active scope's loader for table.column (one per projection).
+
+    Outside a scope (scheduler jobs, scripts, or background tasks that
+    outlive their request) every call gets a fresh loader, i.e. no caching.
+    """
+    scope = _scope.get()
+    if scope is None or not scope.open:
+        return RowLoader(table, column, many, supabase, projection)
+    key = (table, column, many, projection.name if projection else "all")
+    if key not in scope.loaders:
+        scope.loaders[key] = RowLoader(table, column, many, supabase, projection)
+    return scope.loaders[key]
+
+
+def invalidate(table: str) -> None:
+    """Drop every cached row of a table in the active scope (after a write)."""
+    scope = _scope.get()
+    if scope is not None:
+        for (loaded_table, _, _, _), row_loader in scope.loaders.items():
+            if loaded_table == table:
+                row_loader.clear()
+
+
+@contextmanager
+def loader_scope() -> Iterator[None]:
+    """Open a loader scope; nested scopes reuse the one already active."""
+    if _scope.get() is not None and _scope.get().open:
+        yield
+        return
+    scope = _Scope()
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        scope.open = False
+        fetches = {row_loader.label: row_loader.fetches for row_loader in scope.loaders.values() if row_loader.fetches}
+        if fetches:
+            logger.debug(f"Data loader queries this scope: {fetches}")
+        scope.loaders.clear()
+        _scope.reset(token)
@@ -0,0 +1,150 @@
+"""
+Keyset Pagination
+Cursor pages keyed on (sort columns, id) for PostgREST list queries
+Filosofía: No velocity, only precision 🐢💎
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Literal, Optional, Sequence
+import base64
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# exact: COUNT(*) scan; planned: planner statistics only;
+# estimated: exact under PostgREST's max-rows, planned above; none: skip
+CountMode = Literal["exact", "planned", "estimated", "none"]
+ESTIMATED_COUNTS = ("planned", "estimated")
+TIEBREAK_COLUMN = "id"
+
+# Rows are PostgREST JSON dicts
+Row = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One ORDER BY column; keyset columns must be NOT NULL."""
+    column: str
+    desc: bool = False
+
+
+@dataclass
+class KeysetPage:
+    """One page of rows plus the envelope fields shared by every list endpoint"""
+    rows: List[Row] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def envelope(self, limit: int) -> Dict[str, Any]:
+        """next_cursor / has_more / total / total_is_estimate / limit"""
+        return {
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+            "total": self.total,
+            "total_is_estimate": self.total_is_estimate,
+            "limit": limit,
+        }
+
+
+def _keys(sort: Sequence[SortKey]) -> List[SortKey]:
+    """Sort keys with the id tiebreaker (same direction as the last key) appended."""
+    keys = list(sort)
+    if not keys or keys[-1].column != TIEBREAK_COLUMN:
+        keys.append(SortKey(TIEBREAK_COLUMN, keys[-1].desc if keys else False))
+    return keys
+
+
+def encode_cursor(row: Row, sort: Sequence[SortKey]) -> str:
+    """Opaque cursor: the row's sort values, url-safe base64 JSON."""
+    values = [row[key.column] for key in _keys(sort)]
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: Sequence[SortKey]) -> List[Any]:
+    """
+    Sort values from a cursor.
+
+    Raises:
+        ValueError: Malformed cursor or one issued for a different sort
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(_keys(sort)) or None in values:
+        raise ValueError("Invalid cursor for this listing")
+    return values
+
+
+def _literal(value: Any) -> str:
+    """Double-quoted PostgREST literal (commas, colons and parens are safe inside)."""
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def keyset_filter(sort: Sequence[SortKey], values: List[Any]) -> str:
+    """
+    or=(...) expression for rows strictly after the cursor.
+
+    (a, b, id) after (va, vb, vid) ->
+    a>va OR (a=va AND b>vb) OR (a=va AND b=vb AND id>vid), with < for DESC keys.
+    """
+    keys = _keys(sort)
+    branches = []
+    for i, key in enumerate(keys):
+        equals = [f"{k.column}.eq.{_literal(v)}" for k, v in zip(keys[:i], values[:i])]
+        after = f"{key.column}.{'lt' if key.desc else 'gt'}.{_literal(values[i])}"
+        branches.append(f"and({','.join(equals + [after])})" if equals else after)
+    return ",".join(branches)
+
+
+# build(columns, count) returns a filtered PostgREST query on one table
+QueryBuilder = Callable[[str, Optional[str]], Any]
+
+
+def fetch_page(
+    build: QueryBuilder,
+    sort: Sequence[SortKey],
+    limit: int,
+    cursor: Optional[str] = None,
+    count: CountMode = "exact",
+    columns: str = "*",
+    offset: int = 0,
+) -> KeysetPage:
+    """
+    Fetch one page ordered by sort + id.
+
+    With a cursor the page starts strictly after it (index range scan, cost
+    independent of depth); without one it starts at offset, which is only
+    kept for clients that still send offset. The total is read on the same
+    request for the first page and by a separate count query after that.
+
+    Raises:
+        ValueError: Invalid cursor
+    """
+    keys = _keys(sort)
+    count_method = None if count == "none" else count
+    query = build(columns, count_method if cursor is None else None)
+    for key in keys:
+        query = query.order(key.column, desc=key.desc)
+    if cursor:
+        query = query.or_(keyset_filter(keys, decode_cursor(cursor, keys)))
+        query = query.limit(limit + 1)
+    else:
+        query = query.range(offset, offset + limit)
+    response = query.execute()
+
+    rows = response.data or []
+    page = KeysetPage(rows=rows[:limit], total_is_estimate=count in ESTIMATED_COUNTS)
+    if len(rows) > limit:
+        page.next_cursor = encode_cursor(rows[limit - 1], keys)
+    if count_method:
+        page.total = response.count if cursor is None else build(TIEBREAK_COLUMN, count_method).limit(1).execute().count
+    return page
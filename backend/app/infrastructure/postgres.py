@@ -0,0 +1,141 @@
+"""
+Direct Postgres Reads
+Pooled SQLAlchemy/psycopg2 connection for hot read paths, PostgREST as fallback
+Filosofía: No velocity, only precision 🐢💎
+"""
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
+from uuid import UUID
+import logging
+import threading
+import time
+
+from app.config import settings
+from app.infrastructure.query_tracer import record_sql
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.sql.elements import TextClause
+
+logger = logging.getLogger(__name__)
+
+# After a connection failure every read goes through PostgREST for this long
+FALLBACK_COOLDOWN_SECONDS = 30.0
+
+# Rows are shaped like PostgREST JSON (str UUIDs, ISO timestamps)
+Row = Dict[str, Any]
+T = TypeVar("T")
+
+_engine: Optional["Engine"] = None
+_lock = threading.Lock()
+_disabled_until = 0.0
+
+
+def direct_reads_enabled() -> bool:
+    """DIRECT_DB_READS is on and the pool is not cooling down after a failure."""
+    return settings.direct_db_reads and time.monotonic() >= _disabled_until
+
+
+def _url(database_url: str) -> str:
+    if database_url.startswith("postgres://"):
+        database_url = "postgresql://" + database_url[len("postgres://"):]
+    if database_url.startswith("postgresql://"):
+        database_url = "postgresql+psycopg2://" + database_url[len("postgresql://"):]
+    return database_url
+
+
+def get_engine() -> "Engine":
+    """Shared pooled engine, created on first direct read (SQLAlchemy imported lazily)."""
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                from sqlalchemy import create_engine
+                _engine = create_engine(
+                    _url(settings.database_url),
+                    pool_size=settings.db_pool_size,
+                    max_overflow=settings.db_max_overflow,
+                    pool_pre_ping=True,
+                    pool_recycle=1800,
+                    connect_args={
+                        "connect_timeout": 5,
+                        "options": f"-c statement_timeout={settings.db_statement_timeout_ms}",
+                    },
+                )
+                logger.info(f"Direct Postgres pool created (size={settings.db_pool_size})")
+    return _engine
+
+
+def dispose_engine() -> None:
+    """Close pooled connections (shutdown)."""
+    global _engine
+    with _lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+
+
+@lru_cache(maxsize=None)
+def statement(sql: str, *expanding: str) -> "TextClause":
+    """
+    text() construct built once per SQL string, so SQLAlchemy's compiled cache
+    reuses it. expanding names list parameters used as `IN :name`.
+    """
+    from sqlalchemy import bindparam, text
+    clause = text(sql)
+    if expanding:
+        clause = clause.bindparams(*(bindparam(name, expanding=True) for name in expanding))
+    return clause
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _traced(sql: "TextClause", params: Optional[Dict[str, Any]], start: float, rows: Optional[int]) -> None:
+    record_sql(" ".join(sql.text.split())[:120], params, (time.perf_counter() - start) * 1000, rows)
+
+
+def fetch_all(sql: "TextClause", params: Optional[Dict[str, Any]] = None) -> List[Row]:
+    start = time.perf_counter()
+    with get_engine().connect() as connection:
+        result = connection.execute(sql, params or {})
+        rows = [{key: _jsonable(value) for key, value in row.items()} for row in result.mappings()]
+    _traced(sql, params, start, len(rows))
+    return rows
+
+
+def fetch_value(sql: "TextClause", params: Optional[Dict[str, Any]] = None) -> Any:
+    start = time.perf_counter()
+    with get_engine().connect() as connection:
+        value = _jsonable(connection.execute(sql, params or {}).scalar())
+    _traced(sql, params, start, 1)
+    return value
+
+
+def read(label: str, direct: Callable[[], T], postgrest: Callable[[], T]) -> T:
+    """
+    Run a read directly on Postgres when enabled, otherwise (or on error)
+    through PostgREST. Connection failures pause direct reads for
+    FALLBACK_COOLDOWN_SECONDS so a down pool does not add latency to every call.
+    """
+    global _disabled_until
+    if direct_reads_enabled():
+        try:
+            return direct()
+        except Exception as e:
+            from sqlalchemy.exc import DBAPIError, OperationalError
+            if isinstance(e, OperationalError) or (isinstance(e, DBAPIError) and e.connection_invalidated):
+                _disabled_until = time.monotonic() + FALLBACK_COOLDOWN_SECONDS
+                logger.warning(f"Direct Postgres unavailable ({label}), using PostgREST for {FALLBACK_COOLDOWN_SECONDS:.0f}s: {e}")
+            else:
+                logger.warning(f"Direct Postgres read {label} failed, falling back to PostgREST: {e}")
+    return postgrest()
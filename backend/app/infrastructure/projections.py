@@ -0,0 +1,225 @@
+"""
+Column Projections
+Named select() column lists per use case, plus a dev-mode unused-column audit
+Filosofía: No velocity, only precision 🐢💎
+"""
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+import logging
+import threading
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+# table -> optional columns this database turned out not to have
+_missing_columns: Dict[str, Set[str]] = {}
+
+
+@dataclass(frozen=True)
+class Projection:
+    """The columns one use case reads from one table."""
+    table: str
+    name: str
+    columns: Tuple[str, ...]
+    # Columns some deployed schemas lack: readers retry without them on 42703
+    optional: Tuple[str, ...] = ()
+
+    @property
+    def select(self) -> str:
+        """PostgREST select= list"""
+        return ",".join(self.columns)
+
+    @property
+    def sql(self) -> str:
+        """Quoted SQL column list for direct Postgres reads"""
+        if self.columns == ("*",):
+            return "*"
+        return ", ".join(f'"{column}"' for column in self.columns)
+
+    def including(self, *columns: str) -> "Projection":
+        """Same projection plus key columns the caller needs to group rows."""
+        if self.columns == ("*",):
+            return self
+        extra = tuple(column for column in columns if column not in self.columns)
+        if not extra:
+            return self
+        # Own name: loaders and audit labels are keyed by it
+        return Projection(self.table, f"{self.name}+{'+'.join(extra)}", self.columns + extra, self.optional)
+
+    def resolved(self) -> "Projection":
+        """This projection minus the optional columns this database is known to lack."""
+        with _lock:
+            missing = _missing_columns.get(self.table, set()) & set(self.optional)
+        dropped = tuple(column for column in self.columns if column in missing)
+        if not dropped:
+            return self
+        columns = tuple(column for column in self.columns if column not in missing)
+        return Projection(self.table, f"{self.name}-{'-'.join(dropped)}", columns, self.optional)
+
+    def drop_missing(self, error: Exception) -> Optional["Projection"]:
+        """
+        After a 42703, record the optional column(s) the error names as missing
+        and return the reduced projection; None if no optional column is named.
+        """
+        message = str(error)
+        missing = [column for column in self.optional if column in self.columns and column in message]
+        if not missing:
+            return None
+        with _lock:
+            _missing_columns.setdefault(self.table, set()).update(missing)
+        logger.warning(f"{self.table} has no {', '.join(missing)}; projection {self.name} reads without it")
+        return self.resolved()
+
+
+def is_missing_column(error: Exception) -> bool:
+    """PostgREST / Postgres "column does not exist" (SQLSTATE 42703)"""
+    return "42703" in str(error)
+
+
+def all_columns(table: str) -> Projection:
+    return Projection(table, "all", ("*",))
+
+
+# client_context — every field of the ClientContext entity (read-modify-write paths)
+CLIENT_CONTEXT_ENTITY = Projection("client_context", "entity", (
+    "id", "client_id", "niche", "tone", "brand_voice", "target_audience", "competitors",
+    "best_performing_content", "posting_patterns", "avg_engagement_rate", "peak_posting_hours",
+    "top_hashtags", "audience_demographics", "content_themes", "avoided_topics",
+    "preferred_formats", "last_updated_by", "created_at", "updated_at",
+))
+# Content Lab generation: prompt fields, has_context() inputs and the brand voice JSONB.
+# custom_instructions / brand_file / vertical are not in create_client_context_table.sql
+# and are missing on some deployments, so they are optional
+CLIENT_CONTEXT_GENERATION = Projection("client_context", "generation", (
+    "id", "client_id", "niche", "tone", "brand_voice", "target_audience",
+    "best_performing_content", "content_themes", "preferred_formats",
+    "custom_instructions", "brand_file", "vertical",
+), optional=("custom_instructions", "brand_file", "vertical"))
+
+# prompt_vault — what the in-process index matches, ranks and renders
+PROMPT_VAULT_INDEX = Projection("prompt_vault", "index", (
+    "id", "name", "category", "vertical", "platform", "agent_code", "technique",
+    "prompt_text", "performance_score", "times_used", "is_active",
+))
+
+# resellers — full row for the dashboard; existence/ownership checks need only the ref
+RESELLER_ALL = all_columns("resellers")
+RESELLER_REF = Projection("resellers", "ref", ("id", "slug", "status"))
+
+# scheduled_posts — every field of the ScheduledPost entity (update writes them back).
+# published_at is never written by the backend and missing on some deployments
+SCHEDULED_POST_ENTITY = Projection("scheduled_posts", "entity", (
+    "id", "client_id", "account_id", "content_lab_id", "content_type", "text_content",
+    "image_url", "hashtags", "scheduled_date", "scheduled_time", "timezone", "status",
+    "agent_assigned", "is_active", "published_at", "error_message", "created_at", "updated_at",
+), optional=("published_at",))
+
+# Status checks before a soft delete
+SCHEDULED_POST_STATE = Projection("scheduled_posts", "state", ("id", "status", "is_active"))
+
+# context_library — the concatenated agent context only needs name, scope and body
+CONTEXT_DOC_BODY = Projection("context_library", "body", ("name", "scope", "content"))
+
+
+# ── Dev-mode audit ─────────────────────────────────────────────────────────────
+
+# label -> [results seen, Counter of columns returned but never read]
+_stats: Dict[str, List[Any]] = {}
+_reported: Set[Tuple[str, FrozenSet[str]]] = set()
+
+
+
+def _report(label: str, unused: FrozenSet[str]) -> None:
+    with _lock:
+        stats = _stats.setdefault(label, [0, Counter()])
+        stats[0] += 1
+        stats[1].update(unused)
+        if not unused or (label, unused) in _reported:
+            return
+        _reported.add((label, unused))
+    logger.warning(f"Projection audit: {label} returned columns never read: {', '.join(sorted(unused))}")
+
+
+class ColumnUsage:
+    """
+    Columns returned vs columns read across every row of one query result
+    (or every copy a request-scoped loader hands out); reported when the
+    last of those rows is garbage-collected.
+    """
+    __slots__ = ("label", "returned", "read")
+
+    def __init__(self, label: str):
+        self.label = label
+        self.returned: Set[str] = set()
+        self.read: Set[str] = set()
+
+    def __del__(self):
+        try:
+            _report(self.label, frozenset(self.returned - self.read))
+        except Exception:
+            pass
+
+
+class AuditedRow(dict):
+    """
+    Row that records which columns were read into its ColumnUsage. Iteration,
+    items() and values() count as reading every column (serialisation,
+    ** unpacking, deepcopy).
+    """
+    __slots__ = ("_usage",)
+
+    def __init__(self, usage: ColumnUsage, row: Dict[str, Any]):
+        super().__init__(row)
+        self._usage = usage
+        usage.returned.update(row.keys())
+
+    def __getitem__(self, key):
+        self._usage.read.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self._usage.read.add(key)
+        return super().get(key, default)
+
+    def pop(self, key, *default):
+        self._usage.read.add(key)
+        return super().pop(key, *default)
+
+    def __iter__(self):
+        self._usage.read.update(self.keys())
+        return super().__iter__()
+
+    def items(self):
+        self._usage.read.update(self.keys())
+        return super().items()
+
+    def values(self):
+        self._usage.read.update(self.keys())
+        return super().values()
+
+
+def column_usage(label: str) -> Optional[ColumnUsage]:
+    """Shared usage record for rows audited together, or None when the audit is off."""
+    return ColumnUsage(label) if settings.projection_audit else None
+
+
+def audit(label: str, rows: Any, usage: Optional[ColumnUsage] = None) -> Any:
+    """
+    Wrap a row or list of rows for the unused-column audit (PROJECTION_AUDIT=true);
+    returns rows untouched when the audit is off.
+    """
+    if not settings.projection_audit or rows is None:
+        return rows
+    usage = usage or ColumnUsage(label)
+    if isinstance(rows, list):
+        return [AuditedRow(usage, row) if isinstance(row, dict) else row for row in rows]
+    return AuditedRow(usage, rows) if isinstance(rows, dict) else rows
+
+
+def audit_summary() -> Dict[str, Dict[str, Any]]:
+    """Per query label: results seen and how often each column went unread"""
+    with _lock:
+        return {label: {"results": seen, "unused": dict(unused)} for label, (seen, unused) in _stats.items()}
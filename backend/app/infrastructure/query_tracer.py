@@ -0,0 +1,181 @@
+"""
+Query Tracer
+Request-scoped record of every PostgREST / direct Postgres round-trip, with
+repeated-query and N+1 detection (development and staging)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl
+import hashlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Same query shape with different values this many times in one request = N+1
+N_PLUS_ONE_THRESHOLD = 3
+_START_KEY = "omega_trace_start"
+
+
+@dataclass
+class QueryRecord:
+    """One database round-trip."""
+    kind: str          # postgrest | postgres
+    method: str        # GET/POST/PATCH/DELETE, or SQL for direct reads
+    target: str        # table, rpc/<fn>, or SQL label
+    filters: str       # filter columns and operators, values stripped ("client_id=eq")
+    signature: str     # shape plus values: identical signatures are repeated queries
+    duration_ms: float
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+    status: Optional[int] = None
+
+    @property
+    def shape(self) -> Tuple[str, str, str, str]:
+        return self.kind, self.method, self.target, self.filters
+
+
+@dataclass
+class QueryTrace:
+    """Queries issued while handling one request."""
+    records: List[QueryRecord] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, record: QueryRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    @property
+    def count(self) -> int:
+        return len(self.records)
+
+    def repeated(self) -> Dict[str, int]:
+        """Identical queries (same filters and values) issued more than once"""
+        counts = Counter(record.signature for record in self.records)
+        labels = {record.signature: f"{record.method} {record.target}?{record.filters}" for record in self.records}
+        return {labels[signature]: n for signature, n in counts.items() if n > 1}
+
+    def n_plus_one(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> Dict[str, int]:
+        """Query shapes repeated with different values at least threshold times"""
+        shapes: Dict[Tuple[str, str, str, str], set] = {}
+        for record in self.records:
+            shapes.setdefault(record.shape, set()).add(record.signature)
+        return {
+            f"{method} {target}?{filters}": len(signatures)
+            for (_, method, target, filters), signatures in shapes.items()
+            if len(signatures) >= threshold
+        }
+
+    def summary(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> Dict[str, Any]:
+        return {
+            "queries": self.count,
+            "duration_ms": round(sum(record.duration_ms for record in self.records), 1),
+            "bytes": sum(record.bytes or 0 for record in self.records),
+            "rows": sum(record.rows or 0 for record in self.records),
+            "repeated": self.repeated(),
+            "n_plus_one": self.n_plus_one(threshold),
+            "records": [asdict(record) for record in self.records],
+        }
+
+
+_trace: ContextVar[Optional[QueryTrace]] = ContextVar("query_trace", default=None)
+
+
+def current_trace() -> Optional[QueryTrace]:
+    return _trace.get()
+
+
+@contextmanager
+def trace_queries() -> Iterator[QueryTrace]:
+    """Record every query issued inside the block (nested blocks share the outer trace)."""
+    active = _trace.get()
+    if active is not None:
+        yield active
+        return
+    trace = QueryTrace()
+    token = _trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _trace.reset(token)
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+def record_sql(label: str, params: Optional[Dict[str, Any]], duration_ms: float, rows: Optional[int]) -> None:
+    """Direct Postgres read (see app.infrastructure.postgres)."""
+    trace = _trace.get()
+    if trace is None:
+        return
+    names = ",".join(sorted(params or {}))
+    trace.add(QueryRecord(
+        kind="postgres", method="SQL", target=label, filters=names,
+        signature=_digest(label, sorted((params or {}).items(), key=lambda item: item[0])),
+        duration_ms=duration_ms, rows=rows,
+    ))
+
+
+def _filters(params: List[Tuple[str, str]]) -> str:
+    """select/order/limit kept whole; filters reduced to column=operator"""
+    shape = []
+    for key, value in params:
+        if key in ("select", "order", "limit", "offset", "on_conflict", "columns"):
+            shape.append(f"{key}={value}")
+        else:
+            shape.append(f"{key}={value.split('.', 1)[0]}")
+    return "&".join(sorted(shape))
+
+
+def _rows(response) -> Optional[int]:
+    """From Content-Range ("0-24/*" or "*/0"); None when PostgREST does not send it"""
+    content_range = response.headers.get("content-range")
+    if not content_range:
+        return None
+    span = content_range.split("/", 1)[0]
+    if span == "*":
+        return 0
+    first, _, last = span.partition("-")
+    try:
+        return int(last) - int(first) + 1
+    except ValueError:
+        return None
+
+
+def _on_request(request) -> None:
+    if _trace.get() is not None:
+        request.extensions[_START_KEY] = time.perf_counter()
+
+
+def _on_response(response) -> None:
+    trace = _trace.get()
+    request = response.request
+    start = request.extensions.get(_START_KEY)
+    if trace is None or start is None:
+        return
+    response.read()
+    path = request.url.path.split("/rest/v1/", 1)[-1]
+    params = parse_qsl(request.url.query.decode() if isinstance(request.url.query, bytes) else request.url.query)
+    body = request.content or b""
+    trace.add(QueryRecord(
+        kind="postgrest", method=request.method, target=path, filters=_filters(params),
+        signature=_digest(request.method, path, sorted(params), body),
+        duration_ms=(time.perf_counter() - start) * 1000,
+        rows=_rows(response), bytes=len(response.content), status=response.status_code,
+    ))
+
+
+def install_postgrest_tracing(client) -> None:
+    """Attach the tracer to a supabase Client's PostgREST HTTP session (idempotent)."""
+    hooks = client.postgrest.session.event_hooks
+    if _on_request not in hooks["request"]:
+        hooks["request"].append(_on_request)
+        hooks["response"].append(_on_response)
+        client.postgrest.session.event_hooks = hooks
+        logger.info("PostgREST query tracing enabled")
@@ -3,11 +3,15 @@ Agent Repository
 Data access layer for agents system
 Filosofía: No velocity, only precision 🐢💎
 """
+from datetime import datetime
 from typing import Optional
 import logging
+import uuid
 
 from app.domain.agents.entities import Agent, AgentExecution, AgentLog
 from app.infrastructure.supabase_service import SupabaseService
+from app.infrastructure.postgres import fetch_all, fetch_value, read, statement
+from app.infrastructure.write_behind import agent_execution_writes
 from .agent_mapper import map_agent_to_entity, map_execution_to_entity, map_log_to_entity
 
 logger = logging.getLogger(__name__)
@@ -44,37 +48,42 @@ class AgentRepository:
 
         return map_agent_to_entity(response.data) if response.data else None
 
-    def create_execution(self, execution: AgentExecution) -> AgentExecution:
-        """Create new agent execution"""
-        data = {
+    @staticmethod
+    def _execution_row(execution: AgentExecution) -> dict:
+        """Full row so every buffered upsert carries the same columns"""
+        return {
+            "id": execution.id,
             "agent_id": execution.agent_id,
             "client_id": execution.client_id,
             "user_id": execution.user_id,
             "triggered_by": execution.triggered_by,
             "input_data": execution.input_data,
-            "status": execution.status,
-            "metadata": execution.metadata,
-        }
-
-        response = self.supabase.client.table("agent_executions").insert(data).execute()
-        return map_execution_to_entity(response.data[0])
-
-    def update_execution(self, execution: AgentExecution) -> AgentExecution:
-        """Update execution status and data"""
-        data = {
-            "status": execution.status,
             "output_data": execution.output_data,
             "error_message": execution.error_message,
+            "status": execution.status,
+            "started_at": (execution.started_at or execution.created_at).isoformat(),
             "completed_at": execution.completed_at.isoformat() if execution.completed_at else None,
             "execution_time_ms": execution.execution_time_ms,
+            "metadata": execution.metadata,
+            "created_at": execution.created_at.isoformat(),
         }
 
-        response = self.supabase.client.table("agent_executions")\
-            .update(data)\
-            .eq("id", execution.id)\
-            .execute()
+    def create_execution(self, execution: AgentExecution) -> AgentExecution:
+        """
+        Create new agent execution (write-behind).
+
+        The id and timestamps are assigned here so the row can be buffered;
+        later state changes merge into the same pending upsert.
+        """
+        execution.id = execution.id or str(uuid.uuid4())
+        execution.created_at = execution.created_at or datetime.utcnow()
+        agent_execution_writes.put([self._execution_row(execution)])
+        return execution
 
-        return map_execution_to_entity(response.data[0])
+    def update_execution(self, execution: AgentExecution) -> AgentExecution:
+        """Update execution status and data (coalesced with pending writes)"""
+        agent_execution_writes.put([self._execution_row(execution)])
+        return execution
 
     def find_executions_by_agent(
         self,
@@ -84,34 +93,54 @@ class AgentRepository:
         status: Optional[str] = None
     ) -> list[AgentExecution]:
         """Find executions for an agent"""
-        query = self.supabase.client.table("agent_executions")\
-            .select("*")\
-            .eq("agent_id", agent_id)\
-            .eq("is_active", True)
-
-        if status:
-            query = query.eq("status", status)
-
-        query = query.order("started_at", desc=True).range(offset, offset + limit - 1)
-        response = query.execute()
-
-        return [map_execution_to_entity(row) for row in response.data]
+        agent_execution_writes.flush()  # read-your-writes
+
+        def direct() -> list:
+            sql = statement(
+                "SELECT * FROM agent_executions WHERE agent_id = :agent_id AND is_active"
+                " AND (CAST(:status AS text) IS NULL OR status = :status)"
+                " ORDER BY started_at DESC LIMIT :limit OFFSET :offset"
+            )
+            return fetch_all(sql, {"agent_id": agent_id, "status": status, "limit": limit, "offset": offset})
+
+        def postgrest() -> list:
+            query = self.supabase.client.table("agent_executions")\
+                .select("*")\
+                .eq("agent_id", agent_id)\
+                .eq("is_active", True)
+            if status:
+                query = query.eq("status", status)
+            return query.order("started_at", desc=True).range(offset, offset + limit - 1).execute().data
+
+        rows = read("agent_executions.by_agent", direct, postgrest)
+        return [map_execution_to_entity(row) for row in rows]
 
     def count_executions(self, agent_id: str, status: Optional[str] = None) -> int:
         """Count total executions for an agent"""
-        query = self.supabase.client.table("agent_executions")\
-            .select("id", count="exact")\
-            .eq("agent_id", agent_id)\
-            .eq("is_active", True)
-
-        if status:
-            query = query.eq("status", status)
-
-        response = query.execute()
-        return response.count if hasattr(response, 'count') else 0
+        agent_execution_writes.flush()
+
+        def direct() -> int:
+            sql = statement(
+                "SELECT count(*) FROM agent_executions WHERE agent_id = :agent_id AND is_active"
+                " AND (CAST(:status AS text) IS NULL OR status = :status)"
+            )
+            return fetch_value(sql, {"agent_id": agent_id, "status": status})
+
+        def postgrest() -> int:
+            query = self.supabase.client.table("agent_executions")\
+                .select("id", count="exact")\
+                .eq("agent_id", agent_id)\
+                .eq("is_active", True)
+            if status:
+                query = query.eq("status", status)
+            response = query.execute()
+            return response.count if hasattr(response, 'count') else 0
+
+        return read("agent_executions.count", direct, postgrest)
 
     def create_log(self, log: AgentLog) -> AgentLog:
         """Create log entry"""
+        agent_execution_writes.flush()  # agent_logs.execution_id FK needs the row
         data = {
             "execution_id": log.execution_id,
             "agent_id": log.agent_id,
@@ -9,6 +9,8 @@ import logging
 
 from app.domain.agents.context_entity import ClientContext
 from app.infrastructure.supabase_service import SupabaseService
+from app.infrastructure.data_loader import RowLoader, invalidate, loader
+from app.infrastructure.projections import CLIENT_CONTEXT_ENTITY, Projection
 
 logger = logging.getLogger(__name__)
 
@@ -19,18 +21,30 @@ class ClientContextRepository:
     def __init__(self, supabase: SupabaseService):
         self.supabase = supabase
 
-    def find_by_client_id(self, client_id: str) -> Optional[ClientContext]:
-        """Find context for a client"""
-        response = self.supabase.client.table("client_context")\
-            .select("*")\
-            .eq("client_id", client_id)\
-            .limit(1)\
-            .execute()
-
-        if not response.data or len(response.data) == 0:
+    def _loader(self, projection: Projection = CLIENT_CONTEXT_ENTITY) -> RowLoader:
+        return loader("client_context", "client_id", supabase=self.supabase, projection=projection)
+
+    def find_row_by_client_id(
+        self, client_id: str, projection: Projection = CLIENT_CONTEXT_ENTITY
+    ) -> Optional[dict]:
+        """Raw client_context row with the projection's columns (memoized per request)"""
+        return self._loader(projection).get(client_id)
+
+    def find_by_client_id(
+        self, client_id: str, projection: Projection = CLIENT_CONTEXT_ENTITY
+    ) -> Optional[ClientContext]:
+        """
+        Find context for a client.
+
+        Read-only callers may pass a narrower projection; fields outside it
+        keep their entity defaults, so only CLIENT_CONTEXT_ENTITY results may
+        be written back.
+        """
+        row = self.find_row_by_client_id(client_id, projection)
+        if not row:
             return None
 
-        return self._map_to_entity(response.data[0])
+        return self._map_to_entity(row)
 
     def create(self, context: ClientContext) -> ClientContext:
         """Create new client context"""
@@ -54,6 +68,8 @@ class ClientContextRepository:
         }
 
         response = self.supabase.client.table("client_context").insert(data).execute()
+        invalidate("client_context")
+        self._loader().prime(context.client_id, response.data[0])
         return self._map_to_entity(response.data[0])
 
     def update(self, context: ClientContext) -> ClientContext:
@@ -81,6 +97,8 @@ class ClientContextRepository:
             .eq("client_id", context.client_id)\
             .execute()
 
+        invalidate("client_context")
+        self._loader().prime(context.client_id, response.data[0])
         return self._map_to_entity(response.data[0])
 
     def upsert(self, context: ClientContext) -> ClientContext:
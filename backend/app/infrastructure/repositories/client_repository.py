@@ -6,6 +6,7 @@ from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 import logging
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.data_loader import invalidate, loader
 
 logger = logging.getLogger(__name__)
 
@@ -80,16 +81,10 @@ class ClientRepository:
     async def get_client(self, client_id: str) -> Optional[Dict[str, Any]]:
         """Get client by ID (excludes deleted)."""
         try:
-            response = self.service.client.table("clients")\
-                .select("*")\
-                .eq("id", client_id)\
-                .neq("status", "deleted")\
-                .execute()
-
-            if not response.data:
+            client = loader("clients", supabase=self.service).get(client_id)
+            if not client or client.get("status") == "deleted":
                 return None
 
-            client = response.data[0]
             client.pop("password_hash", None)
             client.pop("refresh_token", None)
 
@@ -133,6 +128,7 @@ class ClientRepository:
                 .eq("id", client_id)\
                 .execute()
 
+            invalidate("clients")
             if not response.data or len(response.data) == 0:
                 raise Exception("Client not found or update failed")
 
@@ -158,6 +154,7 @@ class ClientRepository:
                 .eq("id", client_id)\
                 .execute()
 
+            invalidate("clients")
             if not response.data or len(response.data) == 0:
                 return False
 
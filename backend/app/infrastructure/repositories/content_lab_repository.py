@@ -8,6 +8,8 @@ from datetime import datetime
 import logging
 
 from app.domain.content_lab.entities import ContentLabGenerated
+from app.infrastructure.pagination import CountMode, KeysetPage, SortKey, fetch_page
+from app.infrastructure.data_loader import loader
 from app.infrastructure.supabase_service import get_supabase_service
 
 logger = logging.getLogger(__name__)
@@ -29,50 +31,54 @@ class ContentLabRepository:
         client_id: str,
         content_type: Optional[str] = None,
         limit: int = 20,
-        offset: int = 0
-    ) -> tuple[List[ContentLabGenerated], int]:
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        count: CountMode = "exact"
+    ) -> tuple[List[ContentLabGenerated], KeysetPage]:
         """
-        Lista contenido generado para un cliente con paginación.
+        Lista contenido generado para un cliente, más reciente primero.
+
+        Página keyset sobre (created_at, id); offset solo aplica sin cursor.
 
         Args:
             client_id: UUID del cliente
             content_type: Filtro opcional por tipo
             limit: Máximo de resultados
-            offset: Offset para paginación
+            offset: Offset legacy (ignorado con cursor)
+            cursor: next_cursor de la página anterior
+            count: Modo de total (exact, planned, estimated, none)
 
         Returns:
-            Tuple de (lista de entidades, total count)
+            Tuple de (lista de entidades, página con cursor y total)
+
+        Raises:
+            ValueError: Cursor inválido
         """
-        try:
-            # Build query
+        def build(columns: str, count_method: Optional[str]):
             query = self.supabase.client.table(self.table)\
-                .select("*", count="exact")\
-                .eq("client_id", client_id)\
-                .order("created_at", desc=True)
-
-            # Apply content_type filter if provided
+                .select(columns, count=count_method)\
+                .eq("client_id", client_id)
             if content_type:
                 query = query.eq("content_type", content_type)
+            return query
 
-            # Apply pagination
-            query = query.range(offset, offset + limit - 1)
-
-            response = query.execute()
+        try:
+            page = fetch_page(build, (SortKey("created_at", desc=True),), limit, cursor, count, offset=offset)
 
             # Convert to entities
             entities = [
-                self._row_to_entity(row) for row in response.data
+                self._row_to_entity(row) for row in page.rows
             ]
 
-            total = response.count or 0
-
             logger.info(
                 f"Listed {len(entities)} content items for client {client_id} "
-                f"(total: {total})"
+                f"(total: {page.total})"
             )
 
-            return entities, total
+            return entities, page
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error listing content: {e}")
             raise
@@ -88,15 +94,8 @@ class ContentLabRepository:
             Entidad o None si no existe
         """
         try:
-            response = self.supabase.client.table(self.table)\
-                .select("*")\
-                .eq("id", content_id)\
-                .execute()
-
-            if not response.data:
-                return None
-
-            return self._row_to_entity(response.data[0])
+            row = loader(self.table, supabase=self.supabase).get(content_id)
+            return self._row_to_entity(row) if row else None
 
         except Exception as e:
             logger.error(f"Error getting content {content_id}: {e}")
@@ -129,6 +128,7 @@ class ContentLabRepository:
             if not response.data:
                 return None
 
+            loader(self.table, supabase=self.supabase).prime(content_id, response.data[0])
             logger.info(
                 f"Updated saved status for content {content_id}: {is_saved}"
             )
@@ -156,6 +156,7 @@ class ContentLabRepository:
                 .execute()
 
             success = len(response.data) > 0
+            loader(self.table, supabase=self.supabase).prime(content_id, None)
 
             if success:
                 logger.info(f"Deleted content {content_id}")
@@ -0,0 +1,105 @@
+"""
+Experiment Repository
+Persists A/B experiments and their per-variant counters
+(ab_experiments, ab_variant_counters, ab_variant_events tables)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.infrastructure.supabase_service import SupabaseService
+
+logger = logging.getLogger(__name__)
+
+EXPERIMENT_COLUMNS = (
+    "experiment_id, client_id, hypothesis, variable_tested, platform, "
+    "status, target_sample_size, started_at, completed_at"
+)
+COUNTER_COLUMNS = (
+    "variant_name, position, variant_id, description, content, "
+    "impressions, engagements, clicks, conversions, always_valid_p"
+)
+
+
+class ExperimentRepository:
+    """Repository for persisted experiments and materialized variant aggregates"""
+
+    def __init__(self, supabase: SupabaseService):
+        self.supabase = supabase
+
+    # Rows mirror the ab_experiments / ab_variant_counters columns
+    def create(self, experiment: Dict[str, Any], variants: List[Dict[str, Any]]) -> None:
+        """Insert the experiment row and one zeroed counter row per variant (one transaction)"""
+        self.supabase.client.rpc(
+            "ab_create_experiment",
+            {"p_experiment": experiment, "p_variants": variants}
+        ).execute()
+
+    def find_experiment(self, experiment_id: str) -> Optional[Dict[str, Any]]:
+        """Experiment header row, or None"""
+        response = self.supabase.client.table("ab_experiments")\
+            .select(EXPERIMENT_COLUMNS)\
+            .eq("experiment_id", experiment_id)\
+            .limit(1)\
+            .execute()
+        return response.data[0] if response.data else None
+
+    def find_counters(self, experiment_id: str) -> List[Dict[str, Any]]:
+        """Aggregate rows for an experiment — one per variant, control first"""
+        response = self.supabase.client.table("ab_variant_counters")\
+            .select(COUNTER_COLUMNS)\
+            .eq("experiment_id", experiment_id)\
+            .order("position")\
+            .execute()
+        return response.data or []
+
+    def apply_increments(self, increments: List[Dict[str, Any]]) -> int:
+        """
+        Add coalesced increments to the aggregates in one atomic RPC
+
+        Args:
+            increments: Rows with experiment_id, variant_name and counter deltas
+
+        Returns:
+            Number of variant rows updated
+        """
+        if not increments:
+            return 0
+        response = self.supabase.client.rpc(
+            "ab_apply_variant_increments",
+            {"p_increments": increments}
+        ).execute()
+        return response.data or 0
+
+    def find_counters_for(self, experiment_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Aggregate rows for several experiments in one query, control first"""
+        if not experiment_ids:
+            return {}
+        response = self.supabase.client.table("ab_variant_counters")\
+            .select(f"experiment_id, {COUNTER_COLUMNS}")\
+            .in_("experiment_id", experiment_ids)\
+            .order("experiment_id")\
+            .order("position")\
+            .execute()
+        counters: Dict[str, List[Dict[str, Any]]] = {}
+        for row in response.data or []:
+            counters.setdefault(row["experiment_id"], []).append(row)
+        return counters
+
+    def save_always_valid(self, values: List[Dict[str, Any]]) -> int:
+        """
+        Lower the stored always-valid p-values in one RPC (never raises them)
+
+        Args:
+            values: Rows with experiment_id, variant_name and always_valid_p
+
+        Returns:
+            Number of variant rows updated
+        """
+        if not values:
+            return 0
+        response = self.supabase.client.rpc(
+            "ab_save_always_valid",
+            {"p_values": values}
+        ).execute()
+        return response.data or 0
@@ -0,0 +1,66 @@
+"""
+Extraction Cache Repository
+Cleaned document text keyed by content hash, plus per-URL validators
+(extraction_cache, extraction_urls tables)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import logging
+
+from app.infrastructure.supabase_service import SupabaseService
+
+logger = logging.getLogger(__name__)
+
+CACHE_COLUMNS = "content_hash, kind, content, metadata"
+URL_COLUMNS = "url, content_hash, kind, etag, last_modified"
+
+
+class ExtractionCacheRepository:
+    """Repository for the content-addressed extraction cache"""
+
+    def __init__(self, supabase: SupabaseService):
+        self.supabase = supabase
+
+    # Rows mirror the extraction_cache / extraction_urls columns
+    def find_by_hash(self, content_hash: str, kind: str) -> Optional[Dict[str, Any]]:
+        """Cached extraction for identical source bytes, or None"""
+        response = self.supabase.client.table("extraction_cache")\
+            .select(CACHE_COLUMNS)\
+            .eq("content_hash", content_hash)\
+            .eq("kind", kind)\
+            .limit(1)\
+            .execute()
+        return response.data[0] if response.data else None
+
+    def find_url(self, url: str) -> Optional[Dict[str, Any]]:
+        """Last fetch of a URL (hash + validators), or None"""
+        response = self.supabase.client.table("extraction_urls")\
+            .select(URL_COLUMNS)\
+            .eq("url", url)\
+            .limit(1)\
+            .execute()
+        return response.data[0] if response.data else None
+
+    def save_extraction(self, content_hash: str, kind: str, content: str,
+                        metadata: Dict[str, Any], source_bytes: int) -> None:
+        """Store an extraction; identical bytes always yield identical text"""
+        self.supabase.client.table("extraction_cache").upsert({
+            "content_hash": content_hash,
+            "kind": kind,
+            "content": content,
+            "metadata": metadata,
+            "source_bytes": source_bytes,
+        }, on_conflict="content_hash,kind").execute()
+
+    def save_url(self, url: str, content_hash: str, kind: str,
+                 etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Point a URL at its current content hash and remember its validators"""
+        self.supabase.client.table("extraction_urls").upsert({
+            "url": url,
+            "content_hash": content_hash,
+            "kind": kind,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+        }, on_conflict="url").execute()
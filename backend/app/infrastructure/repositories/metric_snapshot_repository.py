@@ -0,0 +1,37 @@
+"""
+Metric Snapshot Repository
+Persists streaming metrics state (metric_snapshots table)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List
+import logging
+
+from app.infrastructure.supabase_service import SupabaseService
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMNS = "scope, name, metric, stats, sketch"
+
+
+class MetricSnapshotRepository:
+    """Repository for metrics engine snapshots"""
+
+    def __init__(self, supabase: SupabaseService):
+        self.supabase = supabase
+
+    # Rows carry JSONB state blobs owned by the metrics engine
+    def upsert_many(self, rows: List[Dict[str, Any]]) -> int:
+        """Upsert snapshot rows in a single request keyed by (scope, name, metric)"""
+        if not rows:
+            return 0
+        self.supabase.client.table("metric_snapshots")\
+            .upsert(rows, on_conflict="scope,name,metric")\
+            .execute()
+        return len(rows)
+
+    def find_all(self) -> List[Dict[str, Any]]:
+        """Load every persisted series"""
+        response = self.supabase.client.table("metric_snapshots")\
+            .select(SNAPSHOT_COLUMNS)\
+            .execute()
+        return response.data or []
@@ -5,6 +5,8 @@ Strict <200L per file.
 """
 from typing import Optional, Dict, Any, List
 from app.infrastructure.supabase_service import SupabaseService
+from app.infrastructure.postgres import fetch_all, fetch_value, read, statement
+from app.infrastructure.projections import PROMPT_VAULT_INDEX, audit
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,123 +18,69 @@ class PromptVaultRepository:
     def __init__(self, supabase: SupabaseService):
         self.supabase = supabase
 
-    async def select_optimal_prompt(
-        self, category: str, vertical: str, platform: str, agent_code: str
-    ) -> Optional[Dict[str, Any]]:
-        """
-        3-tier fallback: exact → vertical → generic.
-        Returns best prompt by performance_score.
-        """
-        try:
-            # Tier 1: Exact match (category + vertical + platform + agent)
-            prompt = await self._try_match({
-                "category": category,
-                "vertical": vertical,
-                "platform": platform,
-                "agent_code": agent_code,
-                "is_active": True
-            })
-            if prompt:
-                logger.info(f"Exact match: {prompt['name']} (score={prompt['performance_score']})")
-                await self._increment_usage(prompt["id"], prompt["times_used"])
-                return prompt
-
-            # Tier 2: Fallback without platform
-            prompt = await self._try_match({
-                "category": category,
-                "vertical": vertical,
-                "agent_code": agent_code,
-                "is_active": True
-            })
-            if prompt:
-                logger.info(f"Vertical match: {prompt['name']}")
-                await self._increment_usage(prompt["id"], prompt["times_used"])
-                return prompt
-
-            # Tier 3: Generic vertical
-            prompt = await self._try_match({
-                "category": category,
-                "vertical": "generic",
-                "agent_code": agent_code,
-                "is_active": True
-            })
-            if prompt:
-                logger.info(f"Generic match: {prompt['name']}")
-                await self._increment_usage(prompt["id"], prompt["times_used"])
-                return prompt
-
-            logger.warning(f"No vault prompt for {category}/{vertical}, using default")
-            return None
+    def find_active(self) -> List[Dict[str, Any]]:
+        """Every active prompt — the source rows of the in-process index"""
+        rows = read(
+            "prompt_vault.active",
+            lambda: fetch_all(statement(f"SELECT {PROMPT_VAULT_INDEX.sql} FROM prompt_vault WHERE is_active")),
+            lambda: self.supabase.client.table("prompt_vault").select(PROMPT_VAULT_INDEX.select).eq(
+                "is_active", True
+            ).execute().data or []
+        )
+        return audit("prompt_vault[index]", rows)
 
-        except Exception as e:
-            logger.error(f"Error selecting prompt: {e}")
-            return None
+    def get_version(self) -> Optional[int]:
+        """Version stamp bumped by trigger whenever selectable prompt data changes"""
+        def postgrest() -> Optional[int]:
+            response = self.supabase.client.table("prompt_vault_version").select(
+                "version"
+            ).eq("id", 1).limit(1).execute()
+            return int(response.data[0]["version"]) if response.data else None
 
-    async def _try_match(self, filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Try to find a prompt matching the given filters"""
-        response = self.supabase.client.table("prompt_vault").select("*").match(
-            filters
-        ).order("performance_score", desc=True).limit(1).execute()
-        return response.data[0] if response.data else None
+        def direct() -> Optional[int]:
+            version = fetch_value(statement("SELECT version FROM prompt_vault_version WHERE id = 1"))
+            return int(version) if version is not None else None
 
-    async def _increment_usage(self, prompt_id: str, current_count: int) -> None:
-        """Increment times_used counter"""
-        try:
-            self.supabase.client.table("prompt_vault").update({
-                "times_used": current_count + 1,
-                "last_updated": "now()"
-            }).eq("id", prompt_id).execute()
-        except Exception as e:
-            logger.error(f"Failed to increment usage: {e}")
+        return read("prompt_vault_version", direct, postgrest)
 
-    async def update_performance_score(
-        self, prompt_id: str, engagement_rate: float
-    ) -> None:
+    def increment_usage_many(self, counts: Dict[str, int]) -> int:
         """
-        Updates performance_score based on engagement.
-        Formula: new_score = (old * 0.7) + (engagement * 10 * 0.3)
+        Atomically add accumulated selections to times_used in one RPC
+
+        Args:
+            counts: prompt_id -> selections since the last flush
+
+        Returns:
+            Number of prompts updated
         """
-        try:
-            # Get current data
-            response = self.supabase.client.table("prompt_vault").select(
-                "performance_score, engagement_avg, times_used"
-            ).eq("id", prompt_id).execute()
-
-            if not response.data:
-                logger.warning(f"Prompt {prompt_id} not found")
-                return
-
-            current = response.data[0]
-            old_score = current["performance_score"]
-            times_used = current["times_used"]
-
-            # Calculate new engagement average (running average)
-            if current["engagement_avg"] is None:
-                new_engagement_avg = engagement_rate
-            else:
-                old_avg = current["engagement_avg"]
-                new_engagement_avg = (
-                    (old_avg * (times_used - 1)) + engagement_rate
-                ) / times_used
-
-            # Calculate new score (weighted 70% old, 30% new)
-            new_score = (old_score * 0.7) + (engagement_rate * 10 * 0.3)
-            new_score = max(0.0, min(10.0, new_score))  # Clamp 0-10
-
-            # Update database
-            self.supabase.client.table("prompt_vault").update({
-                "performance_score": round(new_score, 2),
-                "engagement_avg": round(new_engagement_avg, 4),
-                "last_updated": "now()"
-            }).eq("id", prompt_id).execute()
-
-            logger.info(
-                f"Updated {prompt_id}: {old_score:.2f} → {new_score:.2f}, "
-                f"engagement={new_engagement_avg:.4f}"
-            )
+        if not counts:
+            return 0
+        response = self.supabase.client.rpc(
+            "increment_prompt_usage", {"p_counts": counts}
+        ).execute()
+        return response.data or 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Totals, average, percentiles and per-vertical counts in one RPC"""
+        response = self.supabase.client.rpc("prompt_vault_stats", {}).execute()
+        return response.data or {}
+
+    def apply_performance_deltas(self, deltas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply folded (decay, increment) score deltas in one UPDATE via RPC
 
-        except Exception as e:
-            logger.error(f"Error updating performance: {e}")
+        Args:
+            deltas: Rows with prompt_id, decay, increment, rate_sum, signals
+
+        Returns:
+            Updated rows: id, performance_score, engagement_avg, engagement_count, times_used
+        """
+        if not deltas:
+            return []
+        response = self.supabase.client.rpc(
+            "apply_prompt_performance", {"p_deltas": deltas}
+        ).execute()
+        return response.data or []
 
     async def get_top_prompts(
         self, vertical: Optional[str] = None, limit: int = 10
@@ -3,15 +3,22 @@ Scheduled Post Repository
 Data access layer for scheduled posts using Repository Pattern
 Filosofía: No velocity, only precision 🐢💎
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import date
 import logging
 
 from app.infrastructure.supabase_service import SupabaseService
+from app.infrastructure.pagination import CountMode, KeysetPage, SortKey, fetch_page
+from app.infrastructure.data_loader import invalidate, loader
+from app.infrastructure.postgres import fetch_value, read, statement
+from app.infrastructure.projections import SCHEDULED_POST_ENTITY, Projection
 from app.domain.calendar.entities import ScheduledPost
 
 logger = logging.getLogger(__name__)
 
+# Calendar order; id is appended as the keyset tiebreaker
+SCHEDULE_ORDER = (SortKey("scheduled_date"), SortKey("scheduled_time"))
+
 
 class ScheduledPostRepository:
     """Repository for scheduled posts data access"""
@@ -68,27 +75,25 @@ class ScheduledPostRepository:
             logger.error(f"Error creating scheduled post: {e}")
             raise
 
-    async def find_by_id(self, post_id: str) -> Optional[ScheduledPost]:
+    async def find_by_id(
+        self, post_id: str, projection: Projection = SCHEDULED_POST_ENTITY
+    ) -> Optional[ScheduledPost]:
         """
         Find scheduled post by ID
 
         Args:
             post_id: Post UUID
+            projection: Columns to load; narrower ones are for read-only checks
 
         Returns:
             ScheduledPost if found, None otherwise
         """
         try:
-            response = self.supabase.client.table("scheduled_posts")\
-                .select("*")\
-                .eq("id", post_id)\
-                .eq("is_active", True)\
-                .execute()
-
-            if not response.data:
+            row = loader("scheduled_posts", supabase=self.supabase, projection=projection.including("is_active")).get(post_id)
+            if not row or not row.get("is_active"):
                 return None
 
-            return self._map_to_entity(response.data[0])
+            return self._map_to_entity(row)
 
         except Exception as e:
             logger.error(f"Error finding scheduled post {post_id}: {e}")
@@ -98,37 +103,65 @@ class ScheduledPostRepository:
         self,
         account_id: str,
         limit: int = 20,
-        offset: int = 0
-    ) -> List[ScheduledPost]:
+        cursor: Optional[str] = None
+    ) -> Tuple[List[ScheduledPost], Optional[str]]:
         """
         Find scheduled posts by account
 
         Args:
             account_id: Social account UUID
             limit: Max results
-            offset: Pagination offset
+            cursor: next_cursor from the previous page
 
         Returns:
-            List of ScheduledPost entities
+            (ScheduledPost entities, next cursor or None)
+
+        Raises:
+            ValueError: Invalid cursor
         """
         try:
-            response = self.supabase.client.table("scheduled_posts")\
-                .select("*")\
-                .eq("account_id", account_id)\
-                .eq("is_active", True)\
-                .order("scheduled_date", desc=False)\
-                .order("scheduled_time", desc=False)\
-                .range(offset, offset + limit - 1)\
-                .execute()
-
-            if not response.data:
-                return []
-
-            return [self._map_to_entity(row) for row in response.data]
+            posts, page = await self.list_page(account_id=account_id, limit=limit, cursor=cursor, count="none")
+            return posts, page.next_cursor
 
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error finding posts for account {account_id}: {e}")
-            return []
+            return [], None
+
+    async def list_page(
+        self,
+        account_id: Optional[str] = None,
+        client_ids: Optional[List[str]] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count: CountMode = "exact",
+        offset: int = 0
+    ) -> Tuple[List[ScheduledPost], KeysetPage]:
+        """
+        Active posts for an account or a set of clients, in calendar order
+
+        Keyset page on (scheduled_date, scheduled_time, id); offset is only
+        used when no cursor is given (legacy clients).
+
+        Raises:
+            ValueError: Invalid cursor
+        """
+        def build(columns: str, count_method: Optional[str]):
+            query = self.supabase.client.table("scheduled_posts")\
+                .select(columns, count=count_method)\
+                .eq("is_active", True)
+            if account_id:
+                query = query.eq("account_id", account_id)
+            elif client_ids:
+                query = query.in_("client_id", client_ids)
+            if status:
+                query = query.eq("status", status)
+            return query
+
+        page = fetch_page(build, SCHEDULE_ORDER, limit, cursor, count, offset=offset)
+        return [self._map_to_entity(row) for row in page.rows], page
 
     async def count_by_date(
         self,
@@ -147,15 +180,14 @@ class ScheduledPostRepository:
             Number of active posts
         """
         try:
-            response = self.supabase.client.rpc(
+            params = {"p_account_id": account_id, "p_date": str(scheduled_date)}
+            count = read(
                 "count_posts_for_day",
-                {
-                    "p_account_id": account_id,
-                    "p_date": str(scheduled_date)
-                }
-            ).execute()
+                lambda: fetch_value(statement("SELECT count_posts_for_day(:p_account_id, :p_date)"), params),
+                lambda: self.supabase.client.rpc("count_posts_for_day", params).execute().data
+            )
 
-            return response.data or 0
+            return count or 0
 
         except Exception as e:
             logger.error(f"Error counting posts: {e}")
@@ -195,6 +227,8 @@ class ScheduledPostRepository:
             if not response.data:
                 raise Exception("Failed to update scheduled post")
 
+            invalidate("scheduled_posts")
+            loader("scheduled_posts", supabase=self.supabase, projection=SCHEDULED_POST_ENTITY).prime(post.id, response.data[0])
             return self._map_to_entity(response.data[0])
 
         except Exception as e:
@@ -220,6 +254,7 @@ class ScheduledPostRepository:
                 .eq("id", post_id)\
                 .execute()
 
+            invalidate("scheduled_posts")
             return bool(response.data)
 
         except Exception as e:
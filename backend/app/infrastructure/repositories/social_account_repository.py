@@ -2,10 +2,11 @@
 Social Account Repository
 Database operations for social account management
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 import logging
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.data_loader import invalidate, load_with_parent, loader
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +70,7 @@ class SocialAccountRepository:
             if not response.data or len(response.data) == 0:
                 raise Exception("Failed to create social account")
 
+            invalidate("social_accounts")
             account = response.data[0]
             logger.info(
                 f"Social account created: {account.get('platform')} - "
@@ -91,21 +93,45 @@ class SocialAccountRepository:
             Account dict or None if not found
         """
         try:
-            response = self.service.client.table("social_accounts")\
-                .select("*")\
-                .eq("id", account_id)\
-                .eq("is_active", True)\
-                .execute()
-
-            if not response.data:
+            account = loader("social_accounts", supabase=self.service).get(account_id)
+            if not account or not account.get("is_active"):
                 return None
 
-            return response.data[0]
+            return account
 
         except Exception as e:
             logger.error(f"Error getting social account: {e}")
             raise
 
+    async def get_account_with_client(
+        self,
+        account_id: str,
+        active_only: bool = True
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Get social account plus its client (one embedded select, memoized per request).
+
+        Args:
+            account_id: Account UUID
+            active_only: Treat inactive accounts as missing
+
+        Returns:
+            (account, client) or None if either is not found
+        """
+        try:
+            account, client = load_with_parent(
+                loader("social_accounts", supabase=self.service), account_id,
+                loader("clients", supabase=self.service), "client_id"
+            )
+            if not account or not client or (active_only and not account.get("is_active")):
+                return None
+
+            return account, client
+
+        except Exception as e:
+            logger.error(f"Error getting social account with client: {e}")
+            raise
+
     async def update_account(
         self,
         account_id: str,
@@ -129,6 +155,7 @@ class SocialAccountRepository:
                 .eq("id", account_id)\
                 .execute()
 
+            invalidate("social_accounts")
             if not response.data or len(response.data) == 0:
                 raise Exception("Social account not found or update failed")
 
@@ -159,6 +186,7 @@ class SocialAccountRepository:
                 .eq("id", account_id)\
                 .execute()
 
+            invalidate("social_accounts")
             if not response.data or len(response.data) == 0:
                 return False
 
@@ -0,0 +1,51 @@
+"""
+Stripe Mirror Repository
+Local copies of Stripe objects and their revenue aggregates
+(stripe_customers, stripe_subscriptions, stripe_charges, stripe_invoices)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List
+import logging
+
+from app.infrastructure.supabase_service import SupabaseService
+
+logger = logging.getLogger(__name__)
+
+MIRROR_TABLES = {
+    "customer": "stripe_customers",
+    "subscription": "stripe_subscriptions",
+    "charge": "stripe_charges",
+    "invoice": "stripe_invoices",
+}
+
+
+class StripeMirrorRepository:
+    """Repository for the webhook/backfill-maintained Stripe mirror"""
+
+    def __init__(self, supabase: SupabaseService):
+        self.supabase = supabase
+
+    # Rows are already mapped to mirror columns by the sync service
+    def upsert(self, object_type: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert or replace mirrored objects by Stripe id, skipping rows whose
+        event_created is older than the stored one (upsert_stripe_mirror RPC)
+
+        Returns:
+            Rows written
+        """
+        if not rows:
+            return 0
+        response = self.supabase.client.rpc(
+            "upsert_stripe_mirror",
+            {"p_table": MIRROR_TABLES[object_type], "p_rows": rows}
+        ).execute()
+        return response.data or 0
+
+    def revenue_summary(self, recent: int = 10) -> Dict[str, Any]:
+        """MRR, by-plan, totals and recent charges in one RPC (amounts in cents)"""
+        response = self.supabase.client.rpc(
+            "stripe_revenue_summary",
+            {"p_recent": recent}
+        ).execute()
+        return response.data or {}
@@ -0,0 +1,99 @@
+"""
+Stripe Webhook Event Repository
+Deduplicated inbox of verified Stripe events (stripe_webhook_events table)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+import logging
+
+from app.infrastructure.supabase_service import SupabaseService
+
+logger = logging.getLogger(__name__)
+
+EVENT_COLUMNS = "id, type, customer_id, stripe_created, payload, status, attempts"
+
+
+class StripeWebhookEventRepository:
+    """Repository for the webhook inbox: insert-once, claim, settle"""
+
+    def __init__(self, supabase: SupabaseService):
+        self.supabase = supabase
+
+    # Rows mirror the stripe_webhook_events columns
+    def insert_if_new(self, event: Dict[str, Any]) -> bool:
+        """Insert a received event; False when the id was already stored"""
+        response = self.supabase.client.table("stripe_webhook_events")\
+            .upsert(event, on_conflict="id", ignore_duplicates=True)\
+            .execute()
+        return bool(response.data)
+
+    def claim(self, event_id: str) -> bool:
+        """Move pending/failed -> processing; False if someone else has it or it is done"""
+        response = self.supabase.client.table("stripe_webhook_events")\
+            .update({"status": "processing", "claimed_at": datetime.now(timezone.utc).isoformat()})\
+            .eq("id", event_id)\
+            .in_("status", ["pending", "failed"])\
+            .execute()
+        return bool(response.data)
+
+    def mark_processed(self, event_id: str) -> None:
+        self.supabase.client.table("stripe_webhook_events")\
+            .update({
+                "status": "processed",
+                "last_error": None,
+                "processed_at": datetime.now(timezone.utc).isoformat(),
+            })\
+            .eq("id", event_id)\
+            .execute()
+
+    def mark_failed(self, event_id: str, attempts: int, error: str) -> None:
+        self.supabase.client.table("stripe_webhook_events")\
+            .update({"status": "failed", "attempts": attempts, "last_error": error[:1000]})\
+            .eq("id", event_id)\
+            .execute()
+
+    def has_unfinished_before(self, customer_id: str, stripe_created: int, event_id: str, max_attempts: int) -> bool:
+        """
+        Whether an earlier event of the customer is still pending, processing
+        or failed under the attempt cap (it must settle before this one runs).
+        Earlier = (stripe_created, id) order, the same order the sweep uses.
+        """
+        unfinished = f"or(status.in.(pending,processing),and(status.eq.failed,attempts.lt.{max_attempts}))"
+        response = self.supabase.client.table("stripe_webhook_events")\
+            .select("id")\
+            .eq("customer_id", customer_id)\
+            .or_(
+                f"and(stripe_created.lt.{stripe_created},{unfinished}),"
+                f"and(stripe_created.eq.{stripe_created},id.lt.{event_id},{unfinished})"
+            )\
+            .limit(1)\
+            .execute()
+        return bool(response.data)
+
+    def find_unprocessed(self, max_attempts: int, stale_after_seconds: int, limit: int = 200) -> List[Dict[str, Any]]:
+        """
+        Events to (re)queue, oldest first: pending, failed under the attempt
+        cap, and processing rows abandoned by a crashed worker
+        """
+        stale = (datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        response = self.supabase.client.table("stripe_webhook_events")\
+            .select(EVENT_COLUMNS)\
+            .or_(
+                f"status.eq.pending,"
+                f"and(status.eq.failed,attempts.lt.{max_attempts}),"
+                f"and(status.eq.processing,claimed_at.lt.{stale})"
+            )\
+            .order("stripe_created")\
+            .order("id")\
+            .limit(limit)\
+            .execute()
+        return response.data or []
+
+    def release_stale(self, event_id: str) -> None:
+        """Return an abandoned processing row to pending so it can be claimed"""
+        self.supabase.client.table("stripe_webhook_events")\
+            .update({"status": "pending"})\
+            .eq("id", event_id)\
+            .eq("status", "processing")\
+            .execute()
@@ -0,0 +1,70 @@
+"""
+Storage Streamer
+Chunked uploads to Supabase Storage over its REST API
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import AsyncIterator
+import logging
+
+import httpx
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+STORAGE_UPLOAD_TIMEOUT_SECONDS = 120.0
+# Content-addressed objects never change, so they can be cached for a year
+IMMUTABLE_CACHE_SECONDS = 31536000
+
+
+def _object_url(bucket: str, path: str) -> str:
+    return f"{settings.supabase_url.rstrip('/')}/storage/v1/object/{bucket}/{path}"
+
+
+def _auth_headers() -> dict[str, str]:
+    key = settings.supabase_service_role_key
+    return {"Authorization": f"Bearer {key}", "apikey": key}
+
+
+async def object_exists(bucket: str, path: str) -> bool:
+    """HEAD the object; any non-2xx counts as missing."""
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        response = await client.head(_object_url(bucket, path), headers=_auth_headers())
+    return response.is_success
+
+
+async def stream_upload(
+    bucket: str,
+    path: str,
+    chunks: bytes | AsyncIterator[bytes],
+    size: int,
+    content_type: str,
+    upsert: bool = True,
+    cache_seconds: int = 3600,
+) -> None:
+    """
+    Send chunks to Storage as the raw request body (no multipart buffering).
+
+    Args:
+        bucket: Storage bucket
+        path: Object path within the bucket
+        chunks: Async byte chunks (already validated) or a small in-memory body
+        size: Total bytes (sent as Content-Length)
+        content_type: Stored MIME type
+        upsert: Overwrite an existing object at path
+        cache_seconds: Cache-Control max-age stored with the object
+
+    Raises:
+        httpx.HTTPStatusError: If Storage rejects the upload
+    """
+    headers = {
+        **_auth_headers(),
+        "Content-Type": content_type,
+        "Content-Length": str(size),
+        "Cache-Control": f"max-age={cache_seconds}",
+        "x-upsert": "true" if upsert else "false",
+    }
+    async with httpx.AsyncClient(timeout=STORAGE_UPLOAD_TIMEOUT_SECONDS) as client:
+        response = await client.post(_object_url(bucket, path), content=chunks, headers=headers)
+        response.raise_for_status()
+    logger.info(f"Streamed {size} bytes to {bucket}/{path}")
@@ -6,6 +6,9 @@ import logging
 from typing import Optional, List, Dict, Any
 from supabase import create_client, Client
 from app.config import settings
+from app.infrastructure.pagination import CountMode, KeysetPage, SortKey, fetch_page
+from app.infrastructure.projections import RESELLER_ALL, Projection, audit
+from app.infrastructure.query_tracer import install_postgrest_tracing
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,8 @@ class SupabaseService:
                 supabase_url=settings.supabase_url,
                 supabase_key=settings.supabase_service_role_key  # Admin access
             )
+            if settings.query_tracer:
+                install_postgrest_tracing(self.client)
             logger.info("Supabase client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {e}")
@@ -38,11 +43,13 @@ class SupabaseService:
             logger.error(f"Error creating reseller: {e}")
             raise
 
-    async def get_reseller(self, reseller_id: str) -> Optional[Dict[str, Any]]:
-        """Get reseller by ID"""
+    async def get_reseller(
+        self, reseller_id: str, projection: Projection = RESELLER_ALL
+    ) -> Optional[Dict[str, Any]]:
+        """Get reseller by ID (RESELLER_REF is enough for existence checks)"""
         try:
-            response = self.client.table('resellers').select('*').eq('id', reseller_id).execute()
-            return response.data[0] if response.data else None
+            response = self.client.table('resellers').select(projection.select).eq('id', reseller_id).execute()
+            return audit(f"resellers[{projection.name}]", response.data[0]) if response.data else None
         except Exception as e:
             logger.error(f"Error getting reseller: {e}")
             raise
@@ -96,6 +103,19 @@ class SupabaseService:
             logger.error(f"Error getting branding: {e}")
             raise
 
+    async def get_public_branding_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Get public reseller fields with branding embedded (one joined query)"""
+        try:
+            response = self.client.table('resellers')\
+                .select('id, slug, agency_name, status, reseller_branding(*)')\
+                .eq('slug', slug)\
+                .limit(1)\
+                .execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            logger.error(f"Error getting public branding by slug: {e}")
+            raise
+
     async def update_branding(self, reseller_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update reseller branding"""
         try:
@@ -222,37 +242,43 @@ class SupabaseService:
         reseller_id: str,
         status: Optional[str] = None,
         page: int = 1,
-        limit: int = 20
-    ) -> tuple[List[Dict[str, Any]], int]:
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count: CountMode = "exact"
+    ) -> tuple[List[Dict[str, Any]], KeysetPage]:
         """
-        Get leads for a reseller with optional status filter and pagination
+        Get leads for a reseller with optional status filter, newest first
+
+        Keyset page on (created_at, id); page is only used without a cursor.
 
         Args:
             reseller_id: Reseller UUID
             status: Optional status filter
-            page: Page number (1-indexed)
+            page: Legacy page number (1-indexed)
             limit: Results per page
+            cursor: next_cursor from the previous page
+            count: Total mode (exact, planned, estimated, none)
 
         Returns:
-            Tuple of (leads list, total count)
-        """
-        try:
-            # Build query
-            query = self.client.table("leads").select("*", count="exact").eq("reseller_id", reseller_id)
+            Tuple of (leads list, keyset page with cursor and total)
 
+        Raises:
+            ValueError: Invalid cursor
+        """
+        def build(columns: str, count_method: Optional[str]):
+            query = self.client.table("leads").select(columns, count=count_method).eq("reseller_id", reseller_id)
             if status:
                 query = query.eq("status", status)
+            return query
 
-            # Calculate offset
-            offset = (page - 1) * limit
-
-            # Execute with pagination
-            response = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
-
-            leads = response.data if response.data else []
-            total = response.count if hasattr(response, 'count') else 0
-
-            return leads, total
+        try:
+            keyset = fetch_page(
+                build, (SortKey("created_at", desc=True),), limit, cursor, count,
+                offset=(page - 1) * limit
+            )
+            return keyset.rows, keyset
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error getting reseller leads: {e}")
             raise
@@ -0,0 +1,197 @@
+"""
+Write-Behind Buffers
+Coalesce high-frequency row writes into multi-row inserts/upserts
+Filosofía: No velocity, only precision 🐢💎
+"""
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import threading
+import time
+
+from app.infrastructure.supabase_service import get_supabase_service
+
+logger = logging.getLogger(__name__)
+
+# Pending rows that make the writer flush inline instead of waiting for the job
+WRITE_BEHIND_FLUSH_ROWS = 200
+# Hard cap while the database is unreachable; oldest rows are dropped past it
+WRITE_BEHIND_MAX_PENDING = 5000
+WRITE_BEHIND_INTERVAL_SECONDS = 2
+# After a failed flush, writers stop flushing inline for this long (the job keeps retrying)
+WRITE_BEHIND_RETRY_SECONDS = 10
+# Rejected rows kept in memory for inspection (they are also logged)
+WRITE_BEHIND_DEAD_LETTERS = 100
+# Errors a retry cannot fix: SQLSTATE data (22), integrity (23) and
+# schema/syntax (42) classes, PostgREST request/schema-cache (PGRST1xx/2xx)
+PERMANENT_ERROR_PREFIXES = ("22", "23", "42", "PGRST1", "PGRST2")
+
+# Rows are table-shaped JSON dicts
+Row = Dict[str, Any]
+
+
+def is_permanent(error: Exception) -> bool:
+    """True when the database rejected the rows themselves (not a transport/availability failure)."""
+    code = getattr(error, "code", None)
+    return isinstance(code, str) and code.startswith(PERMANENT_ERROR_PREFIXES)
+
+
+class WriteBehindBuffer:
+    """
+    Thread-safe pending rows for one table.
+
+    With a key, rows for the same key merge (last write wins per column) and
+    flush as one upsert, so create -> running -> completed between two
+    flushes costs a single write. Without a key, rows are appended and flush
+    as one multi-row insert.
+
+    Back-pressure: the put() that reaches WRITE_BEHIND_FLUSH_ROWS flushes
+    inline; if the flush fails, writers stop flushing inline for
+    WRITE_BEHIND_RETRY_SECONDS and rows are kept up to max_pending, the
+    oldest beyond it dropped (logged) so memory stays bounded.
+
+    A batch rejected for its content (see is_permanent) is bisected until
+    the offending rows are isolated; those are dead-lettered and the rest
+    written, so one bad row never blocks the table. Only rows that failed
+    transiently are re-queued.
+    """
+
+    def __init__(self, table: str, key: Optional[str] = None,
+                 flush_rows: int = WRITE_BEHIND_FLUSH_ROWS,
+                 max_pending: int = WRITE_BEHIND_MAX_PENDING):
+        self.table = table
+        self.key = key
+        self.flush_rows = flush_rows
+        self.max_pending = max_pending
+        self._keyed: Dict[str, Row] = {}
+        self._appended: List[Row] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._retry_at = 0.0
+        self.dead_letters: Deque[Row] = deque(maxlen=WRITE_BEHIND_DEAD_LETTERS)
+
+    def put(self, rows: List[Row]) -> int:
+        """Queue rows; returns rows pending after any inline flush."""
+        with self._lock:
+            self._add(rows)
+            pending = self._pending()
+        if pending >= self.flush_rows and time.monotonic() >= self._retry_at:
+            self.flush()
+            pending = self.pending
+        return pending
+
+    def _add(self, rows: List[Row]) -> None:
+        for row in rows:
+            if self.key:
+                ident = str(row[self.key])
+                self._keyed[ident] = {**self._keyed.get(ident, {}), **row}
+            else:
+                self._appended.append(row)
+        overflow = self._pending() - self.max_pending
+        if overflow > 0:
+            self._drop_oldest(overflow)
+
+    def _drop_oldest(self, count: int) -> None:
+        if self.key:
+            for ident in list(self._keyed)[:count]:
+                del self._keyed[ident]
+        else:
+            del self._appended[:count]
+        logger.error(f"Write-behind {self.table}: dropped {count} rows over the {self.max_pending} cap")
+
+    def _pending(self) -> int:
+        return len(self._keyed) + len(self._appended)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending()
+
+    def _drain(self) -> List[Row]:
+        with self._lock:
+            rows = list(self._keyed.values()) if self.key else self._appended
+            self._keyed, self._appended = {}, []
+        return rows
+
+    def _requeue(self, rows: List[Row]) -> None:
+        """Put failed rows back without overwriting newer state for the same key."""
+        with self._lock:
+            if self.key:
+                newer = self._keyed
+                self._keyed = {str(r[self.key]): r for r in rows}
+                for ident, row in newer.items():
+                    self._keyed[ident] = {**self._keyed.get(ident, {}), **row}
+            else:
+                self._appended = rows + self._appended
+            overflow = self._pending() - self.max_pending
+            if overflow > 0:
+                self._drop_oldest(overflow)
+
+    def _write(self, rows: List[Row]) -> None:
+        table = get_supabase_service().client.table(self.table)
+        if self.key:
+            table.upsert(rows, on_conflict=self.key).execute()
+        else:
+            table.insert(rows).execute()
+
+    def _write_isolating(self, rows: List[Row]) -> Tuple[int, List[Row]]:
+        """
+        Write rows, bisecting batches the database rejects.
+
+        Returns:
+            (rows written, rows to retry after a transient failure)
+        """
+        try:
+            self._write(rows)
+            return len(rows), []
+        except Exception as e:
+            if not is_permanent(e):
+                logger.error(f"Write-behind {self.table} flush failed ({len(rows)} rows re-queued): {e}")
+                return 0, rows
+            if len(rows) == 1:
+                self.dead_letters.append(rows[0])
+                logger.error(f"Write-behind {self.table}: row dead-lettered: {e} | {str(rows[0])[:300]}")
+                return 0, []
+        middle = len(rows) // 2
+        written, retry = self._write_isolating(rows[:middle])
+        if retry:
+            return written, retry + rows[middle:]
+        rest_written, retry = self._write_isolating(rows[middle:])
+        return written + rest_written, retry
+
+    def flush(self) -> int:
+        """
+        Write every pending row in one statement (split only on rejection).
+
+        Returns:
+            Rows written
+        """
+        with self._flush_lock:
+            rows = self._drain()
+            if not rows:
+                return 0
+            written, retry = self._write_isolating(rows)
+            if retry:
+                self._requeue(retry)
+                self._retry_at = time.monotonic() + WRITE_BEHIND_RETRY_SECONDS
+            else:
+                self._retry_at = 0.0
+            if written:
+                logger.debug(f"Write-behind {self.table}: {written} rows flushed")
+            return written
+
+
+# Global instances
+agent_execution_writes = WriteBehindBuffer("agent_executions", key="id")
+agent_memory_writes = WriteBehindBuffer("omega_agent_memory")
+
+_BUFFERS = (agent_execution_writes, agent_memory_writes)
+
+
+async def flush_write_behind() -> int:
+    """Flush every buffer (scheduler job and shutdown) off the event loop."""
+    written = 0
+    for buffer in _BUFFERS:
+        written += await asyncio.to_thread(buffer.flush)
+    return written
@@ -3,6 +3,7 @@ OmegaRaisen FastAPI Application
 Main entry point for the backend API
 37 AI Agents | 101 Endpoints | Enterprise Social Media Automation
 """
+from datetime import datetime
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -10,6 +11,18 @@ from app.config import settings
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from app.services.sentinel_service import SentinelService
 from app.services.oracle_service import OracleService
+from app.services.metrics.snapshots import flush_metric_snapshots, restore_metric_snapshots
+from app.services.experiments import flush_experiment_counters
+from app.services.prompt_vault import flush_prompt_usage, refresh_prompt_index
+from app.services.nova_briefing import refresh_nova_briefing
+from app.services.media import shutdown_media_pipeline
+from app.services.extraction import extraction_pool
+from app.infrastructure.write_behind import WRITE_BEHIND_INTERVAL_SECONDS, flush_write_behind
+from app.infrastructure.postgres import dispose_engine
+from app.services.billing import STRIPE_EVENT_SWEEP_SECONDS, backfill_stripe_mirror, stripe_event_worker, sweep_stripe_events
+from app.api.middleware import (
+    DataLoaderMiddleware, LazyRouteMiddleware, LazyRoutes, QueryTracerMiddleware, RequestMetricsMiddleware,
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,10 +36,8 @@ except ImportError:
     logging.warning("Qdrant dependencies not installed yet")
 
 from app.api.routes import (
-    content, strategy, analytics, engagement, monitor, brand_voice, competitive, trends, crisis,
-    reports, growth, video_production, scheduling, ab_testing, orchestrator, resellers, auth,
-    billing, context, clients, social_accounts, brand_files, content_lab, calendar, agents,
-    system, omega, nova, sentinel, oracle, prompt_vault, handoff
+    content, ab_testing, resellers, auth, billing, context, clients, social_accounts, brand_files,
+    content_lab, calendar, agents, system, omega, nova, sentinel, oracle, prompt_vault, handoff, ab_experiments
 )
 
 # Services & scheduler
@@ -46,6 +57,15 @@ app.add_middleware(
     CORSMiddleware, allow_origins=["*"], allow_credentials=True,
     allow_methods=["*"], allow_headers=["*"],
 )
+app.add_middleware(RequestMetricsMiddleware)
+app.add_middleware(DataLoaderMiddleware)
+if settings.query_tracer:
+    app.add_middleware(
+        QueryTracerMiddleware, budgets=settings.query_budgets, default_budget=settings.query_budget_default,
+        enforce=settings.query_budget_enforce,
+    )
+lazy_routes = LazyRoutes(app, enabled=settings.lazy_route_groups, full_paths=("/", f"{settings.api_v1_prefix}/system/stats"))
+app.add_middleware(LazyRouteMiddleware, routes=lazy_routes)
 
 # Startup event
 @app.on_event("startup")
@@ -55,6 +75,7 @@ async def startup_event():
         await initialize_qdrant()
     else:
         logging.warning("Skipping Qdrant initialization")
+    await restore_metric_snapshots()
     # SENTINEL cron jobs
     scheduler.add_job(sentinel_service.run_vault_scan, 'cron', hour=2, minute=0, id='vault_scan')
     scheduler.add_job(sentinel_service.run_db_guardian, 'cron', hour=5, minute=0, id='db_guardian')
@@ -62,37 +83,63 @@ async def startup_event():
     scheduler.add_job(sentinel_service.run_pulse_monitor, 'interval', minutes=5, id='pulse_monitor')
     # ORACLE cron jobs
     scheduler.add_job(oracle_service.generate_intelligence_brief, 'cron', day_of_week='mon', hour=7, minute=0, id='oracle_weekly_brief')
+    # Streaming metrics snapshots
+    scheduler.add_job(flush_metric_snapshots, 'interval', minutes=5, id='metric_snapshots')
+    # A/B experiment counter increments
+    scheduler.add_job(flush_experiment_counters, 'interval', seconds=30, id='experiment_counters')
+    # Prompt Vault index version check + usage increments
+    scheduler.add_job(refresh_prompt_index, 'interval', seconds=30, id='prompt_vault_index')
+    scheduler.add_job(flush_prompt_usage, 'interval', minutes=1, id='prompt_vault_usage')
+    # NOVA briefing snapshot: warmed at startup, full refresh every N minutes
+    scheduler.add_job(refresh_nova_briefing, 'interval', minutes=settings.nova_briefing_refresh_minutes, id='nova_briefing', next_run_time=datetime.now())
+    # Write-behind agent executions + memory
+    scheduler.add_job(flush_write_behind, 'interval', seconds=WRITE_BEHIND_INTERVAL_SECONDS, id='write_behind')
+    # Stripe mirror repair backfill: nightly (at startup only when STRIPE_BACKFILL_ON_STARTUP is set)
+    scheduler.add_job(
+        backfill_stripe_mirror, 'cron', hour=4, minute=30, id='stripe_mirror_backfill',
+        **({'next_run_time': datetime.now()} if settings.stripe_backfill_on_startup else {})
+    )
+    # Stripe webhook inbox: retries + events left behind by a restart
+    scheduler.add_job(sweep_stripe_events, 'interval', seconds=STRIPE_EVENT_SWEEP_SECONDS, id='stripe_event_sweep', next_run_time=datetime.now())
     scheduler.start()
-    logger.info("✅ SENTINEL + ORACLE schedulers activos — 5 jobs registrados")
+    logger.info("✅ SENTINEL + ORACLE schedulers activos — 13 jobs registrados")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     scheduler.shutdown()
+    await flush_metric_snapshots()
+    await flush_experiment_counters()
+    await flush_prompt_usage()
+    await flush_write_behind()
+    await stripe_event_worker.drain()
+    await shutdown_media_pipeline()
+    extraction_pool.shutdown()
+    dispose_engine()
     logger.info("SENTINEL schedulers detenidos")
 
 # Core Agents (1-5)
 app.include_router(content.router, prefix=settings.api_v1_prefix, tags=["Content Creator"])
-app.include_router(strategy.router, prefix=settings.api_v1_prefix, tags=["Strategy"])
-app.include_router(analytics.router, prefix=settings.api_v1_prefix, tags=["Analytics"])
-app.include_router(engagement.router, prefix=settings.api_v1_prefix, tags=["Engagement"])
-app.include_router(monitor.router, prefix=settings.api_v1_prefix, tags=["Monitor"])
-
-# Intelligence Agents (6-9)
-app.include_router(brand_voice.router, prefix=settings.api_v1_prefix, tags=["Brand Voice"])
-app.include_router(competitive.router, prefix=settings.api_v1_prefix, tags=["Competitive Intel"])
-app.include_router(trends.router, prefix=settings.api_v1_prefix, tags=["Trend Hunter"])
-app.include_router(crisis.router, prefix=settings.api_v1_prefix, tags=["Crisis Manager"])
-
-# Production Agents (10-14)
-app.include_router(reports.router, prefix=settings.api_v1_prefix, tags=["Report Generator"])
-app.include_router(growth.router, prefix=settings.api_v1_prefix, tags=["Growth Hacker"])
-app.include_router(video_production.router, prefix=settings.api_v1_prefix, tags=["Video Production"])
-app.include_router(scheduling.router, prefix=settings.api_v1_prefix, tags=["Scheduling"])
-app.include_router(ab_testing.router, prefix=settings.api_v1_prefix, tags=["A/B Testing"])
 
-# Master Orchestrator (15)
-app.include_router(orchestrator.router, prefix=settings.api_v1_prefix, tags=["Orchestrator ⭐"])
+# Single-agent groups (2-15): mounted on first request to their prefix
+def _lazy(path: str, module: str, tag: str) -> None:
+    lazy_routes.add(settings.api_v1_prefix + path, (f"app.api.routes.{module}", {"prefix": settings.api_v1_prefix, "tags": [tag]}))
+
+_lazy("/strategy", "strategy", "Strategy")
+_lazy("/analytics", "analytics", "Analytics")
+_lazy("/engagement", "engagement", "Engagement")
+_lazy("/monitor", "monitor", "Monitor")
+_lazy("/brand-voice", "brand_voice", "Brand Voice")
+_lazy("/competitive", "competitive", "Competitive Intel")
+_lazy("/trends", "trends", "Trend Hunter")
+_lazy("/crisis", "crisis", "Crisis Manager")
+_lazy("/reports", "reports", "Report Generator")
+_lazy("/growth", "growth", "Growth Hacker")
+_lazy("/video", "video_production", "Video Production")
+_lazy("/scheduling", "scheduling", "Scheduling")
+_lazy("/orchestrator", "orchestrator", "Orchestrator ⭐")
+app.include_router(ab_testing.router, prefix=settings.api_v1_prefix, tags=["A/B Testing"])
+app.include_router(ab_experiments.router, prefix=settings.api_v1_prefix, tags=["A/B Testing"])
 
 # Multi-Tenant Infrastructure
 app.include_router(resellers.router, prefix=settings.api_v1_prefix, tags=["Resellers 🏢"])
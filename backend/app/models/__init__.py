@@ -2,7 +2,7 @@
 Domain Models Package
 Pydantic models for API requests/responses
 """
-from app.models.shared_models import APIResponse
+from app.models.shared_models import APIResponse, PageEnvelope
 from app.models.reseller_models import (
     # Helper
     sanitize_json_field,
@@ -28,6 +28,7 @@ from app.models.reseller_models import (
 __all__ = [
     # Shared
     "APIResponse",
+    "PageEnvelope",
     # Helper
     "sanitize_json_field",
     # Reseller
@@ -26,3 +26,18 @@ class APIResponse(BaseModel):
     token: Optional[str] = None
     refresh_token: Optional[str] = None
     error: Optional[str] = None
+
+
+class PageEnvelope(BaseModel):
+    """
+    Pagination fields shared by list endpoints (keyset cursors)
+
+    Pass next_cursor back as ?cursor= for the following page. total is
+    None with count=none and approximate when total_is_estimate is set
+    (count=planned|estimated).
+    """
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total: Optional[int] = None
+    total_is_estimate: bool = False
+    limit: int
@@ -8,6 +8,7 @@ from datetime import datetime
 import logging
 
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.write_behind import agent_memory_writes
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,8 @@ class AgentMemoryService:
         recent_context: List[Dict[str, Any]]
     ) -> None:
         """
-        Guarda memoria de conversación para cada agente mencionado
+        Guarda memoria de conversación para cada agente mencionado.
+        Las filas van al buffer write-behind: un insert multi-fila por flush.
 
         Args:
             agent_codes: Lista de códigos de agentes
@@ -66,35 +68,30 @@ class AgentMemoryService:
             return
 
         try:
-            supabase = get_supabase_service()
-            session_id = f"session_{datetime.utcnow().strftime('%Y%m%d_%H%M')}"
-
-            for agent_code in agent_codes:
-                memory_content = {
-                    "user_message": user_message[:500],  # Limitar longitud
-                    "nova_response": nova_response[:500],
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "context": [
-                        {
-                            "role": msg.get("role"),
-                            "content": msg.get("content", "")[:200]
-                        }
-                        for msg in recent_context[-3:]
-                    ] if recent_context else [],
-                    "session_id": session_id
+            now = datetime.utcnow()
+            memory_content = {
+                "user_message": user_message[:500],  # Limitar longitud
+                "nova_response": nova_response[:500],
+                "timestamp": now.isoformat(),
+                "context": [
+                    {
+                        "role": msg.get("role"),
+                        "content": msg.get("content", "")[:200]
+                    }
+                    for msg in recent_context[-3:]
+                ] if recent_context else [],
+                "session_id": f"session_{now.strftime('%Y%m%d_%H%M')}"
+            }
+
+            agent_memory_writes.put([
+                {
+                    "agent_code": agent_code,
+                    "memory_type": "conversation",
+                    "content": memory_content
                 }
-
-                try:
-                    supabase.client.table("omega_agent_memory").insert({
-                        "agent_code": agent_code,
-                        "memory_type": "conversation",
-                        "content": memory_content
-                    }).execute()
-
-                    logger.info(f"Memory saved for agent: {agent_code}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to save memory for {agent_code}: {e}")
+                for agent_code in agent_codes
+            ])
+            logger.info(f"Memory queued for agents: {', '.join(agent_codes)}")
 
         except Exception as e:
             logger.error(f"Error in save_conversation_memory: {e}")
@@ -112,6 +109,7 @@ class AgentMemoryService:
         """
         try:
             supabase = get_supabase_service()
+            agent_memory_writes.flush()  # incluir memorias aún en buffer
 
             result = supabase.client.table("omega_agent_memory")\
                 .select("*")\
@@ -5,10 +5,10 @@ Filosofía: No velocity, only precision 🐢💎
 import logging
 import os
 from typing import Optional, Dict, Any
-from anthropic import AsyncAnthropic
-from openai import AsyncOpenAI
 import httpx
 
+from app.infrastructure.ai.clients import get_anthropic_client, get_openai_client
+
 logger = logging.getLogger(__name__)
 
 class AIProviders:
@@ -25,12 +25,24 @@ class AIProviders:
     }
 
     def __init__(self):
-        """Initialize all AI clients."""
-        self.anthropic = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        self.openai = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.deepseek = AsyncOpenAI(api_key=os.getenv("DEEPSEEK_API_KEY"), base_url="https://api.deepseek.com")
+        """Clients are shared process-wide and created on first use per engine."""
         self.gemini_api_key = os.getenv("GEMINI_API_KEY")
-        self.groq = AsyncOpenAI(api_key=os.getenv("GROQ_API_KEY"), base_url="https://api.groq.com/openai/v1")
+
+    @property
+    def anthropic(self):
+        return get_anthropic_client(os.getenv("ANTHROPIC_API_KEY"))
+
+    @property
+    def openai(self):
+        return get_openai_client(os.getenv("OPENAI_API_KEY"))
+
+    @property
+    def deepseek(self):
+        return get_openai_client(os.getenv("DEEPSEEK_API_KEY"), base_url="https://api.deepseek.com")
+
+    @property
+    def groq(self):
+        return get_openai_client(os.getenv("GROQ_API_KEY"), base_url="https://api.groq.com/openai/v1")
 
     def get_default_director(self) -> str:
         return "REX"
@@ -0,0 +1,184 @@
+"""
+Analytics Arrays
+Vectorized O(n) kernels over NumPy arrays backing AnalyticsProcessor
+"""
+from typing import Any, Dict, Hashable, List, Sequence, Tuple
+import numpy as np
+
+# Largest factor (1 - alpha)^-k allowed inside one EWMA block before
+# rescaling; keeps the closed-form recurrence well inside float64 precision.
+EWMA_MAX_RESCALE = 1e12
+# Consistency constant turning MAD into a standard-deviation estimate
+MAD_SCALE = 0.6745
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing moving average via cumulative sums: O(n) regardless of window.
+
+    Positions before the first full window keep their raw value, matching
+    AnalyticsProcessor.calculate_moving_average.
+
+    Args:
+        values: 1-D float array
+        window: Window length (>= 1)
+
+    Returns:
+        Array of the same length as values
+    """
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    result = values.astype(np.float64, copy=True)
+    if values.size < window:
+        return result
+
+    csum = np.cumsum(values, dtype=np.float64)
+    window_sums = csum[window - 1:].copy()
+    window_sums[1:] -= csum[:-window]
+    result[window - 1:] = window_sums / window
+    return result
+
+
+def zscore(values: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Absolute population z-scores.
+
+    Returns:
+        (|z| per point, mean); all zeros when the series is constant
+    """
+    mean = float(values.mean())
+    std = float(values.std())
+    if std == 0:
+        return np.zeros(values.size), mean
+    return np.abs(values - mean) / std, mean
+
+
+def robust_zscore(values: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Absolute modified z-scores based on the median absolute deviation.
+
+    Unlike zscore, a single extreme outlier cannot inflate the spread
+    estimate and hide itself.
+
+    Returns:
+        (|modified z| per point, median); all zeros when MAD is zero
+    """
+    median = float(np.median(values))
+    deviations = np.abs(values - median)
+    mad = float(np.median(deviations))
+    if mad == 0:
+        return np.zeros(values.size), median
+    return MAD_SCALE * deviations / mad, median
+
+
+def anomaly_records(
+    data_points: Sequence[float],
+    scores: np.ndarray,
+    center: float,
+    threshold: float,
+) -> List[Dict[str, Any]]:
+    """
+    Build anomaly dicts only for the points whose score exceeds threshold.
+
+    Returns:
+        [{"index", "value", "z_score", "deviation"}] with deviation from center
+    """
+    return [
+        {
+            "index": int(i),
+            "value": data_points[i],
+            "z_score": round(float(scores[i]), 2),
+            "deviation": round(float(data_points[i]) - center, 2),
+        }
+        for i in np.flatnonzero(scores > threshold)
+    ]
+
+
+def ewma(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponentially weighted moving average, seeded with the first value.
+
+    y[0] = x[0];  y[t] = alpha * x[t] + (1 - alpha) * y[t-1]
+
+    The recurrence is evaluated in closed form per block with a cumulative
+    sum, so the Python loop runs once per block (thousands of points)
+    instead of once per point.
+
+    Args:
+        values: 1-D float array
+        alpha: Smoothing factor in (0, 1]
+
+    Returns:
+        Smoothed array of the same length
+    """
+    if not 0 < alpha <= 1:
+        raise ValueError("alpha must be in (0, 1]")
+    n = values.size
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    if alpha == 1:
+        out[:] = values
+        return out
+
+    decay = 1.0 - alpha
+    block = max(1, int(np.log(EWMA_MAX_RESCALE) / -np.log(decay)))
+    powers = decay ** np.arange(1, block + 1, dtype=np.float64)
+
+    previous = float(values[0])
+    out[0] = previous
+    start = 1
+    while start < n:
+        chunk = values[start:start + block]
+        k = chunk.size
+        p = powers[:k]
+        # y[j] = p[j] * (prev + alpha * sum_{i<=j} x[i] / p[i])
+        out[start:start + k] = p * (previous + alpha * np.cumsum(chunk / p))
+        previous = float(out[start + k - 1])
+        start += k
+    return out
+
+
+def factorize(keys: Sequence[Hashable]) -> Tuple[np.ndarray, List[Hashable]]:
+    """
+    Encode keys as dense integer codes in first-seen order.
+
+    Keys are kept as-is (no string coercion), so mixed or None keys work.
+
+    Returns:
+        (codes array, unique keys in first-seen order)
+    """
+    index: Dict[Hashable, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(key, len(index)) for key in keys),
+        dtype=np.int64,
+        count=len(keys),
+    )
+    return codes, list(index)
+
+
+def group_sums(
+    keys: Sequence[Hashable],
+    columns: Dict[str, np.ndarray],
+) -> Tuple[List[Hashable], np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Grouped count and per-column sums over columnar input.
+
+    Args:
+        keys: Group key per row
+        columns: Column name -> 1-D numeric array aligned with keys
+
+    Returns:
+        (unique keys, counts per group, column name -> sums per group);
+        integer columns keep an integer dtype
+    """
+    codes, uniques = factorize(keys)
+    groups = len(uniques)
+    counts = np.bincount(codes, minlength=groups)
+    sums: Dict[str, np.ndarray] = {}
+    for name, column in columns.items():
+        totals = np.bincount(codes, weights=column, minlength=groups)
+        if np.issubdtype(column.dtype, np.integer):
+            totals = totals.astype(np.int64)
+        sums[name] = totals
+    return uniques, counts, sums
@@ -2,13 +2,19 @@
 Analytics Service
 Data processing and analysis utilities
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Hashable, Optional, Sequence
 import logging
 from datetime import datetime, timedelta
 import json
+import numpy as np
+
+from app.services import analytics_arrays
 
 logger = logging.getLogger(__name__)
 
+# Metric fields summed by aggregate_metrics (output keys are "total_<field>")
+AGGREGATED_FIELDS = ("likes", "comments", "shares", "impressions")
+
 
 class AnalyticsProcessor:
     """Service for processing analytics data"""
@@ -66,44 +72,49 @@ class AnalyticsProcessor:
         if len(data_points) < 3:
             return []
         
-        # Calculate mean and std
-        mean = sum(data_points) / len(data_points)
-        variance = sum((x - mean) ** 2 for x in data_points) / len(data_points)
-        std_dev = variance ** 0.5
-        
-        anomalies = []
-        for i, value in enumerate(data_points):
-            z_score = abs((value - mean) / std_dev) if std_dev > 0 else 0
-            
-            if z_score > threshold:
-                anomalies.append({
-                    "index": i,
-                    "value": value,
-                    "z_score": round(z_score, 2),
-                    "deviation": round(value - mean, 2)
-                })
+        values = np.asarray(data_points, dtype=np.float64)
+        scores, mean = analytics_arrays.zscore(values)
+        return analytics_arrays.anomaly_records(data_points, scores, mean, threshold)
+    
+    def detect_anomalies_robust(
+        self,
+        data_points: List[float],
+        threshold: float = 3.5
+    ) -> List[Dict[str, Any]]:
+        """Outlier-resistant anomaly detection (MAD modified z-score, deviation from median)"""
+        if len(data_points) < 3:
+            return []
         
-        return anomalies
+        values = np.asarray(data_points, dtype=np.float64)
+        scores, median = analytics_arrays.robust_zscore(values)
+        return analytics_arrays.anomaly_records(data_points, scores, median, threshold)
     
     def calculate_moving_average(
         self,
         data_points: List[float],
         window_size: int = 7
     ) -> List[float]:
-        """Calculate moving average"""
+        """Calculate moving average (O(n) cumulative-sum implementation)"""
         if len(data_points) < window_size:
             return data_points
         
-        moving_avg = []
-        for i in range(len(data_points)):
-            if i < window_size - 1:
-                moving_avg.append(data_points[i])
-            else:
-                window = data_points[i - window_size + 1:i + 1]
-                avg = sum(window) / window_size
-                moving_avg.append(round(avg, 2))
+        averages = analytics_arrays.moving_average(
+            np.asarray(data_points, dtype=np.float64), window_size
+        )
+        head = list(data_points[:window_size - 1])
+        return head + np.round(averages[window_size - 1:], 2).tolist()
+    
+    def calculate_ewma(
+        self,
+        data_points: List[float],
+        alpha: float = 0.3
+    ) -> List[float]:
+        """Calculate exponentially weighted moving average (alpha in (0, 1])"""
+        if not data_points:
+            return []
         
-        return moving_avg
+        smoothed = analytics_arrays.ewma(np.asarray(data_points, dtype=np.float64), alpha)
+        return np.round(smoothed, 2).tolist()
     
     def aggregate_metrics(
         self,
@@ -111,27 +122,33 @@ class AnalyticsProcessor:
         group_by: str = "date"
     ) -> Dict[str, Any]:
         """Aggregate metrics by specified field"""
-        aggregated = {}
+        keys = [metric.get(group_by, "unknown") for metric in metrics_list]
+        columns = {
+            field: np.asarray([metric.get(field, 0) for metric in metrics_list])
+            for field in AGGREGATED_FIELDS
+        }
+        return self.aggregate_columns(keys, columns)
+    
+    def aggregate_columns(
+        self,
+        keys: Sequence[Hashable],
+        columns: Dict[str, np.ndarray]
+    ) -> Dict[Hashable, Dict[str, int | float]]:
+        """Aggregate columnar metrics in one vectorized pass; same shape as aggregate_metrics"""
+        if not keys:
+            return {}
         
-        for metric in metrics_list:
-            key = metric.get(group_by, "unknown")
-            
-            if key not in aggregated:
-                aggregated[key] = {
-                    "count": 0,
-                    "total_likes": 0,
-                    "total_comments": 0,
-                    "total_shares": 0,
-                    "total_impressions": 0
-                }
-            
-            aggregated[key]["count"] += 1
-            aggregated[key]["total_likes"] += metric.get("likes", 0)
-            aggregated[key]["total_comments"] += metric.get("comments", 0)
-            aggregated[key]["total_shares"] += metric.get("shares", 0)
-            aggregated[key]["total_impressions"] += metric.get("impressions", 0)
+        uniques, counts, sums = analytics_arrays.group_sums(keys, columns)
+        totals = {name: values.tolist() for name, values in sums.items()}
+        counts_list = counts.tolist()
         
-        return aggregated
+        return {
+            key: {
+                "count": counts_list[idx],
+                **{f"total_{name}": values[idx] for name, values in totals.items()}
+            }
+            for idx, key in enumerate(uniques)
+        }
     
     def generate_time_series(
         self,
@@ -0,0 +1,29 @@
+"""
+Billing services: local Stripe mirror, revenue aggregates and the
+queued Stripe webhook worker
+"""
+from app.services.billing.stripe_client import get_stripe
+from app.services.billing.stripe_events import process_stripe_event
+from app.services.billing.stripe_mirror import (
+    apply_stripe_event,
+    backfill_stripe_mirror,
+    get_revenue_summary,
+)
+from app.services.billing.webhook_worker import (
+    STRIPE_EVENT_SWEEP_SECONDS,
+    inbox_row,
+    stripe_event_worker,
+    sweep_stripe_events,
+)
+
+__all__ = [
+    "STRIPE_EVENT_SWEEP_SECONDS",
+    "apply_stripe_event",
+    "backfill_stripe_mirror",
+    "get_revenue_summary",
+    "get_stripe",
+    "inbox_row",
+    "process_stripe_event",
+    "stripe_event_worker",
+    "sweep_stripe_events",
+]
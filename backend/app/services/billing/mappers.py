@@ -0,0 +1,109 @@
+"""
+Stripe Mirror Mappers
+Stripe API objects -> mirror table rows
+Filosofía: No velocity, only precision 🐢💎
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Months per billing interval unit, to normalize recurring amounts to MRR
+MONTHS_PER_INTERVAL = {"day": 12 / 365, "week": 12 / 52, "month": 1.0, "year": 12.0}
+
+# Stripe objects are dict subclasses (or plain dicts inside webhook events)
+StripeObject = Dict[str, Any]
+
+
+def _timestamp(value: Optional[int]) -> Optional[str]:
+    return datetime.fromtimestamp(value, timezone.utc).isoformat() if value else None
+
+
+def _id(value: Any) -> Optional[str]:
+    """Expandable fields arrive either as an id or as the expanded object."""
+    if isinstance(value, dict):
+        return value.get("id")
+    return value
+
+
+def monthly_amount(unit_amount: int, quantity: int, interval: str, interval_count: int) -> int:
+    """Recurring amount in cents per month (yearly plans count 1/12)."""
+    months = MONTHS_PER_INTERVAL.get(interval, 1.0) * max(interval_count, 1)
+    return round(unit_amount * quantity / months)
+
+
+def subscription_row(sub: StripeObject) -> Dict[str, Any]:
+    """One row per subscription; MRR sums every item, plan fields come from the first."""
+    items = (sub.get("items") or {}).get("data") or []
+    mrr = 0
+    first_price: StripeObject = {}
+    for item in items:
+        price = item.get("price") or item.get("plan") or {}
+        recurring = price.get("recurring") or {}
+        interval = recurring.get("interval") or price.get("interval") or "month"
+        count = recurring.get("interval_count") or price.get("interval_count") or 1
+        mrr += monthly_amount(price.get("unit_amount") or price.get("amount") or 0,
+                              item.get("quantity") or 1, interval, count)
+        first_price = first_price or price
+    recurring = first_price.get("recurring") or {}
+    return {
+        "id": sub["id"],
+        "customer_id": _id(sub.get("customer")),
+        "status": sub.get("status"),
+        "price_id": first_price.get("id"),
+        "plan_name": first_price.get("nickname") or first_price.get("id"),
+        "billing_interval": recurring.get("interval") or first_price.get("interval"),
+        "interval_count": recurring.get("interval_count") or first_price.get("interval_count") or 1,
+        "unit_amount": first_price.get("unit_amount") or first_price.get("amount") or 0,
+        "quantity": (items[0].get("quantity") or 1) if items else 1,
+        "currency": first_price.get("currency"),
+        "mrr_amount": mrr,
+        "cancel_at_period_end": bool(sub.get("cancel_at_period_end")),
+        "current_period_end": _timestamp(sub.get("current_period_end")),
+        "created": _timestamp(sub.get("created")),
+    }
+
+
+def charge_row(charge: StripeObject) -> Dict[str, Any]:
+    return {
+        "id": charge["id"],
+        "customer_id": _id(charge.get("customer")),
+        "invoice_id": _id(charge.get("invoice")),
+        "amount": charge.get("amount") or 0,
+        "amount_refunded": charge.get("amount_refunded") or 0,
+        "currency": charge.get("currency"),
+        "paid": bool(charge.get("paid")),
+        "status": charge.get("status"),
+        "created": _timestamp(charge.get("created")),
+    }
+
+
+def invoice_row(invoice: StripeObject) -> Dict[str, Any]:
+    return {
+        "id": invoice["id"],
+        "customer_id": _id(invoice.get("customer")),
+        "subscription_id": _id(invoice.get("subscription")),
+        "status": invoice.get("status"),
+        "amount_due": invoice.get("amount_due") or 0,
+        "amount_paid": invoice.get("amount_paid") or 0,
+        "currency": invoice.get("currency"),
+        "period_start": _timestamp(invoice.get("period_start")),
+        "period_end": _timestamp(invoice.get("period_end")),
+        "created": _timestamp(invoice.get("created")),
+    }
+
+
+def customer_row(customer: StripeObject) -> Dict[str, Any]:
+    return {
+        "id": customer["id"],
+        "email": customer.get("email"),
+        "name": customer.get("name"),
+        "deleted": bool(customer.get("deleted")),
+        "created": _timestamp(customer.get("created")),
+    }
+
+
+ROW_MAPPERS = {
+    "customer": customer_row,
+    "subscription": subscription_row,
+    "charge": charge_row,
+    "invoice": invoice_row,
+}
@@ -0,0 +1,30 @@
+"""
+Stripe Client
+The stripe SDK, imported and keyed on first use instead of at import time
+Filosofía: No velocity, only precision 🐢💎
+"""
+from types import ModuleType
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+
+
+def get_stripe() -> ModuleType:
+    """
+    stripe module with api_key set.
+
+    STRIPE_SECRET_KEY is the billing key; STRIPE_API_KEY is still accepted
+    for deployments that only set the name the client/reseller handlers used.
+    """
+    import stripe
+    if not stripe.api_key:
+        with _lock:
+            if not stripe.api_key:
+                stripe.api_key = os.getenv("STRIPE_SECRET_KEY") or os.getenv("STRIPE_API_KEY")
+                if stripe.api_key:
+                    logger.info("Stripe SDK initialized")
+    return stripe
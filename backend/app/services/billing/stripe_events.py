@@ -0,0 +1,143 @@
+"""
+Stripe Event Processing
+Business effects of Stripe webhook events (run by the webhook worker)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.services.billing.stripe_mirror import apply_stripe_event
+
+logger = logging.getLogger(__name__)
+
+
+async def process_stripe_event(event: Dict[str, Any]) -> None:
+    """
+    Apply one verified event: subscription lifecycle in clients, then the
+    local Stripe mirror. Must be safe to re-run (the worker retries failures).
+
+    Handles:
+        - checkout.session.completed: Activates subscription in DB
+        - customer.subscription.updated: Updates subscription status (TODO)
+        - customer.subscription.deleted: Cancels subscription in DB
+        - customer.*, customer.subscription.*, charge.*, invoice.*: Stripe mirror upsert
+    """
+    event_type = event["type"]
+
+    if event_type == "checkout.session.completed":
+        await handle_checkout_completed(event)
+
+    elif event_type == "customer.subscription.updated":
+        await handle_subscription_updated(event)
+
+    elif event_type == "customer.subscription.deleted":
+        await handle_subscription_deleted(event)
+
+    # Keep the local Stripe mirror (revenue dashboards) current
+    if not apply_stripe_event(event) and event_type != "checkout.session.completed":
+        logger.info(f"Unhandled event type: {event_type}")
+
+
+async def handle_checkout_completed(event: Dict[str, Any]) -> None:
+    """
+    Handle checkout.session.completed event
+
+    Activates client subscription in database
+
+    Args:
+        event: Stripe event object with session data
+
+    Extracts client_id and plan from session.metadata and calls
+    update_client_subscription() to mark subscription as active
+    """
+    session = event["data"]["object"]
+    client_id = session.get("metadata", {}).get("client_id")
+    plan = session.get("metadata", {}).get("plan")
+    subscription_id = session.get("subscription")
+    customer_id = session.get("customer")
+
+    logger.info(
+        f"Checkout completed - Client: {client_id}, Plan: {plan}, "
+        f"Subscription: {subscription_id}"
+    )
+
+    if client_id and plan and subscription_id:
+        supabase = get_supabase_service()
+        await supabase.update_client_subscription(
+            client_id=client_id,
+            stripe_customer_id=customer_id,
+            stripe_subscription_id=subscription_id,
+            plan=plan,
+            subscription_status="active"
+        )
+        logger.info(f"Client {client_id} subscription activated in database")
+    else:
+        logger.warning(
+            f"Missing required data in checkout.session.completed: "
+            f"client_id={client_id}, plan={plan}, subscription_id={subscription_id}"
+        )
+
+
+async def handle_subscription_updated(event: Dict[str, Any]) -> None:
+    """
+    Handle customer.subscription.updated event
+
+    TODO CRÍTICO: Sin este handler, el estado "cancelling" de
+    cancel_at_period_end=True no se refleja en DB hasta que
+    expire el período.
+
+    Arquitectura:
+    - POST /cancel-subscription llama stripe.Subscription.modify(cancel_at_period_end=True)
+    - Stripe dispara customer.subscription.updated inmediatamente con status="active"
+      pero cancel_at_period_end=True
+    - customer.subscription.deleted NO se dispara hasta el fin del período
+    - Por lo tanto, este handler es necesario para reflejar el estado
+      "cancelling" en la UI del cliente
+
+    Args:
+        event: Stripe event object with subscription data
+
+    Need to implement update_subscription_status() in supabase_service
+    to handle status changes (active, past_due, canceling, canceled, etc.)
+
+    Technical Debt: This event should sync Stripe subscription status
+    to clients.subscription_status in database for real-time accuracy.
+    """
+    subscription = event["data"]["object"]
+    subscription_id = subscription["id"]
+    status = subscription["status"]
+
+    logger.info(f"Subscription updated - ID: {subscription_id}, Status: {status}")
+
+    # TODO: Implement database update
+    # supabase = get_supabase_service()
+    # await supabase.update_subscription_status(subscription_id, status)
+
+    logger.warning("Subscription update not yet implemented - logged only")
+
+
+async def handle_subscription_deleted(event: Dict[str, Any]) -> None:
+    """
+    Handle customer.subscription.deleted event
+
+    Cancels client subscription in database
+
+    Args:
+        event: Stripe event object with subscription data
+
+    Calls cancel_client_subscription() to mark subscription as
+    cancelled and clear plan in database
+    """
+    subscription = event["data"]["object"]
+    subscription_id = subscription["id"]
+
+    logger.info(f"Subscription deleted - ID: {subscription_id}")
+
+    supabase = get_supabase_service()
+    result = await supabase.cancel_client_subscription(subscription_id)
+
+    if result:
+        logger.info(f"Subscription {subscription_id} cancelled in database")
+    else:
+        logger.warning(f"No client found with subscription {subscription_id}")
@@ -0,0 +1,143 @@
+"""
+Stripe Mirror
+Paginated backfill + webhook upserts into local tables, and revenue from them
+Filosofía: No velocity, only precision 🐢💎
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List
+import asyncio
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.stripe_mirror_repository import StripeMirrorRepository
+from app.services.billing.mappers import ROW_MAPPERS, StripeObject
+from app.services.billing.stripe_client import get_stripe
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_PAGE_SIZE = 100
+# Upsert batch while paging; each Stripe page is 100 objects
+BACKFILL_UPSERT_ROWS = 500
+RECENT_CHARGES = 10
+
+# Stripe list endpoints per mirrored object type (extra params: pagination cursor)
+_LISTS = {
+    "customer": lambda stripe, **params: stripe.Customer.list(limit=BACKFILL_PAGE_SIZE, **params),
+    "subscription": lambda stripe, **params: stripe.Subscription.list(status="all", limit=BACKFILL_PAGE_SIZE, **params),
+    "charge": lambda stripe, **params: stripe.Charge.list(limit=BACKFILL_PAGE_SIZE, **params),
+    "invoice": lambda stripe, **params: stripe.Invoice.list(limit=BACKFILL_PAGE_SIZE, **params),
+}
+
+
+def _repository() -> StripeMirrorRepository:
+    return StripeMirrorRepository(get_supabase_service())
+
+
+def _rows(object_type: str, objects: Iterable[StripeObject], event_created: int) -> List[Dict[str, Any]]:
+    """
+    Mirror rows stamped with the Stripe time of their state: an older
+    event_created never overwrites a newer one.
+    """
+    synced_at = datetime.now(timezone.utc)
+    mapper = ROW_MAPPERS[object_type]
+    return [
+        {**mapper(obj), "synced_at": synced_at.isoformat(), "event_created": event_created}
+        for obj in objects
+    ]
+
+
+def _now_epoch() -> int:
+    return int(datetime.now(timezone.utc).timestamp())
+
+
+def _backfill_type(repository: StripeMirrorRepository, object_type: str) -> int:
+    """
+    Page through every object of one type (blocking SDK calls; run in a thread).
+
+    Each page is stamped with the time taken *before* it was requested, so
+    a webhook created while the page was in flight or waiting in the batch
+    is newer and still wins.
+    """
+    stripe = get_stripe()
+    synced, rows = 0, []
+    listed_at = _now_epoch()
+    page = _LISTS[object_type](stripe)
+    while True:
+        rows.extend(_rows(object_type, page.data, listed_at))
+        if len(rows) >= BACKFILL_UPSERT_ROWS:
+            synced += repository.upsert(object_type, rows)
+            rows = []
+        if not page.has_more or not page.data:
+            break
+        listed_at = _now_epoch()
+        page = _LISTS[object_type](stripe, starting_after=page.data[-1]["id"])
+    synced += repository.upsert(object_type, rows)
+    return synced
+
+
+async def backfill_stripe_mirror() -> Dict[str, int]:
+    """
+    Full paginated sync of customers, subscriptions, charges and invoices.
+
+    Scheduler job: webhooks keep the mirror current; this repairs anything
+    missed (deploy gaps, events before the mirror existed).
+    """
+    if not get_stripe().api_key:
+        logger.warning("Stripe mirror backfill skipped: STRIPE_SECRET_KEY not set")
+        return {}
+    repository = _repository()
+    counts: Dict[str, int] = {}
+    for object_type in _LISTS:
+        try:
+            counts[object_type] = await asyncio.to_thread(_backfill_type, repository, object_type)
+        except Exception as e:
+            logger.error(f"Stripe mirror backfill failed for {object_type}: {e}")
+    logger.info(f"Stripe mirror backfill: {counts}")
+    return counts
+
+
+def apply_stripe_event(event: StripeObject) -> bool:
+    """
+    Upsert the object carried by a webhook event into the mirror (skipped
+    when the mirror already holds state from a newer event or backfill).
+
+    Returns:
+        True if the event's object type is mirrored
+    """
+    obj = event["data"]["object"]
+    object_type = obj.get("object")
+    if object_type not in ROW_MAPPERS:
+        return False
+    if event["type"] == "customer.deleted":
+        obj = {**obj, "deleted": True}
+    written = _repository().upsert(object_type, _rows(object_type, [obj], event["created"]))
+    if written:
+        logger.info(f"Stripe mirror: {event['type']} -> {object_type} {obj.get('id')}")
+    else:
+        logger.info(f"Stripe mirror: {event['type']} for {obj.get('id')} skipped, mirror holds newer state")
+    return True
+
+
+def get_revenue_summary(recent: int = RECENT_CHARGES) -> Dict[str, Any]:
+    """
+    MRR / ARR / by-plan / totals from local aggregates (one RPC, amounts in units).
+    """
+    summary = _repository().revenue_summary(recent)
+    mrr = (summary.get("mrr_amount") or 0) / 100
+    by_plan = {
+        plan: {"count": values["count"], "revenue": round(values["revenue"] / 100, 2)}
+        for plan, values in (summary.get("by_plan") or {}).items()
+    }
+    recent_charges = [
+        {**charge, "amount": charge["amount"] / 100}
+        for charge in summary.get("recent_charges") or []
+    ]
+    return {
+        "mrr": round(mrr, 2),
+        "arr": round(mrr * 12, 2),
+        "total_revenue": round((summary.get("total_revenue") or 0) / 100, 2),
+        "total_customers": summary.get("total_customers") or 0,
+        "active_subscriptions": summary.get("active_subscriptions") or 0,
+        "subscriptions_by_plan": by_plan,
+        "recent_charges": recent_charges,
+    }
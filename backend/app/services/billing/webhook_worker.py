@@ -0,0 +1,169 @@
+"""
+Stripe Webhook Worker
+Processes stored webhook events asynchronously, in order per customer
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, Optional
+import asyncio
+import json
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.stripe_webhook_event_repository import StripeWebhookEventRepository
+from app.services.billing.stripe_events import process_stripe_event
+
+logger = logging.getLogger(__name__)
+
+STRIPE_EVENT_MAX_ATTEMPTS = 5
+# A processing row untouched this long belongs to a crashed worker
+STRIPE_EVENT_STALE_SECONDS = 300
+STRIPE_EVENT_SWEEP_SECONDS = 60
+# Lane for events that carry no customer (processed serially among themselves)
+NO_CUSTOMER_LANE = "_"
+
+
+def _repository() -> StripeWebhookEventRepository:
+    return StripeWebhookEventRepository(get_supabase_service())
+
+
+# Verified Stripe events are nested JSON dicts
+def event_customer(event: Dict[str, Any]) -> Optional[str]:
+    """Customer an event belongs to: its object's customer, or the customer itself."""
+    obj = event["data"]["object"]
+    customer = obj.get("customer")
+    if isinstance(customer, dict):
+        customer = customer.get("id")
+    if customer is None and obj.get("object") == "customer":
+        customer = obj.get("id")
+    return customer
+
+
+def inbox_row(event: Dict[str, Any]) -> Dict[str, Any]:
+    """stripe_webhook_events row for a verified event"""
+    payload = json.loads(json.dumps(event))  # StripeObject -> plain JSON
+    return {
+        "id": payload["id"],
+        "type": payload["type"],
+        "customer_id": event_customer(payload),
+        "stripe_created": payload["created"],
+        "payload": payload,
+    }
+
+
+class StripeEventWorker:
+    """
+    One asyncio lane per customer.
+
+    Events for the same customer run strictly one after another in arrival
+    order (Stripe `created` for recovered rows); different customers run
+    concurrently. Each event is claimed in the database first, so the
+    in-process queue and the recovery sweep can never process it twice.
+
+    An event never runs while an earlier event of its customer is unsettled
+    (pending, processing or failed under the attempt cap) — checked in the
+    inbox, so it holds across restarts and replicas. When an event fails,
+    its lane stops: the customer's later events stay pending until the
+    sweep retries the failed one first and it succeeds or is dead-lettered
+    (failed STRIPE_EVENT_MAX_ATTEMPTS times).
+    """
+
+    def __init__(self):
+        self._lanes: Dict[str, asyncio.Queue] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, row: Dict[str, Any]) -> None:
+        """Queue a stored event row on its customer's lane."""
+        lane = row.get("customer_id") or NO_CUSTOMER_LANE
+        queue = self._lanes.get(lane)
+        if queue is None:
+            queue = self._lanes[lane] = asyncio.Queue()
+        queue.put_nowait(row)
+        if lane not in self._tasks:
+            self._tasks[lane] = asyncio.get_running_loop().create_task(self._drain(lane, queue))
+
+    async def _drain(self, lane: str, queue: asyncio.Queue) -> None:
+        try:
+            while not queue.empty():
+                if not await self._process(queue.get_nowait()):
+                    held = queue.qsize()
+                    while not queue.empty():
+                        queue.get_nowait()
+                    if held:
+                        logger.warning(f"Stripe lane {lane}: {held} later events held until the failed one settles")
+        finally:
+            self._tasks.pop(lane, None)
+            if queue.empty():
+                self._lanes.pop(lane, None)
+            else:  # events arrived while finishing up
+                self._tasks[lane] = asyncio.get_running_loop().create_task(self._drain(lane, queue))
+
+    async def _process(self, row: Dict[str, Any]) -> bool:
+        """
+        Run one event.
+
+        Returns:
+            False when the lane must stop (the event failed and will be
+            retried, or its state could not be read)
+        """
+        repository = _repository()
+        event_id = row["id"]
+        try:
+            customer = row.get("customer_id")
+            if customer and repository.has_unfinished_before(
+                customer, row["stripe_created"], event_id, STRIPE_EVENT_MAX_ATTEMPTS
+            ):
+                logger.info(f"Stripe event {event_id} held: an earlier event of {customer} is unsettled")
+                return True  # stays pending; the sweep re-queues it in order
+            if not repository.claim(event_id):
+                logger.info(f"Stripe event {event_id} already processed or in progress, skipping")
+                return True
+        except Exception as e:
+            logger.error(f"Could not claim Stripe event {event_id}: {e}")
+            return False
+        try:
+            await process_stripe_event(row["payload"])
+            repository.mark_processed(event_id)
+            logger.info(f"Stripe event {event_id} ({row['type']}) processed")
+            return True
+        except Exception as e:
+            attempts = (row.get("attempts") or 0) + 1
+            logger.error(f"Stripe event {event_id} failed (attempt {attempts}): {e}", exc_info=True)
+            repository.mark_failed(event_id, attempts, str(e))
+            if attempts >= STRIPE_EVENT_MAX_ATTEMPTS:
+                logger.error(f"Stripe event {event_id} dead-lettered after {attempts} attempts")
+                return True
+            return False
+
+    @property
+    def active_lanes(self) -> int:
+        return len(self._tasks)
+
+    async def drain(self) -> None:
+        """Wait for queued events (shutdown); anything left is recovered by the sweep."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks.values()), return_exceptions=True)
+
+
+# Global instance
+stripe_event_worker = StripeEventWorker()
+
+
+async def sweep_stripe_events() -> int:
+    """
+    Re-queue pending, failed (under the attempt cap) and abandoned events.
+
+    Scheduler job: covers restarts between ack and processing, and retries.
+    """
+    repository = _repository()
+    try:
+        rows = repository.find_unprocessed(STRIPE_EVENT_MAX_ATTEMPTS, STRIPE_EVENT_STALE_SECONDS)
+    except Exception as e:
+        logger.error(f"Stripe event sweep failed: {e}")
+        return 0
+    for row in rows:
+        if row["status"] == "processing":
+            repository.release_stale(row["id"])
+        stripe_event_worker.submit(row)
+    if rows:
+        logger.info(f"Stripe event sweep re-queued {len(rows)} events")
+    return len(rows)
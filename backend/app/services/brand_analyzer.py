@@ -6,6 +6,8 @@ from typing import List
 from pydantic import BaseModel
 import re
 
+from app.services.lexicons import LanguageDetector, language_detector
+
 
 class BrandProfile(BaseModel):
     """Brand voice profile for a client"""
@@ -48,16 +50,9 @@ class PlatformAdaptation(BaseModel):
 class BrandAnalyzer:
     """Service for brand voice analysis and validation"""
     
-    def __init__(self):
-        self.formal_words = {
-            'furthermore', 'moreover', 'nevertheless', 'consequently',
-            'therefore', 'accordingly', 'subsequently', 'henceforth'
-        }
-        
-        self.casual_words = {
-            'yeah', 'nope', 'gonna', 'wanna', 'kinda', 'sorta',
-            'cool', 'awesome', 'super', 'totally', 'literally'
-        }
+    def __init__(self, detector: LanguageDetector = language_detector):
+        # Formal/casual word lists come from the content's lexicon pack
+        self.detector = detector
     
     def check_forbidden_words(
         self,
@@ -93,10 +88,12 @@ class BrandAnalyzer:
         Returns:
             Formality score from 0.0 (very casual) to 1.0 (very formal)
         """
-        words = set(content.lower().split())
+        content_lower = content.lower()
+        pack = self.detector.detect_pack(content_lower)
+        words = set(content_lower.split())
         
-        formal_count = len(words & self.formal_words)
-        casual_count = len(words & self.casual_words)
+        formal_count = len(words & pack.formal)
+        casual_count = len(words & pack.casual)
         
         # Check for other formality indicators
         has_contractions = "'" in content or "'" in content
@@ -0,0 +1,152 @@
+"""
+Branding Cache
+Read-through cache of public reseller landing payloads keyed by slug
+Filosofía: No velocity, only precision 🐢💎
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import threading
+import time
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.models.reseller_models import sanitize_json_field
+from app.models.shared_models import APIResponse
+
+logger = logging.getLogger(__name__)
+
+BRANDING_CACHE_TTL_SECONDS = 60
+# Browsers/CDN may serve a stale copy while revalidating in the background
+BRANDING_CACHE_CONTROL = f"public, max-age={BRANDING_CACHE_TTL_SECONDS}, stale-while-revalidate=300"
+
+JSON_SECTIONS = (
+    "pain_section", "solutions_section", "services_section", "metrics_section",
+    "process_section", "testimonials_section", "client_logos_section", "social_links",
+)
+DEFAULT_BRANDING: Dict[str, Any] = {
+    "primary_color": "38 85% 55%",
+    "secondary_color": "225 12% 14%",
+    "hero_cta_text": "Comenzar",
+    "logo_url": None,
+    "hero_type": None,
+    "hero_media_url": None,
+    "hero_media_derivatives": None,
+    "hero_title": None,
+    "hero_subtitle": None,
+    "hero_cta_url": None,
+    **{section: {} for section in JSON_SECTIONS},
+    "contact_email": None,
+    "contact_phone": None,
+    "footer_text": None,
+    "pricing_plans": [],
+}
+
+
+@dataclass(frozen=True)
+class CachedBranding:
+    """Serialized public payload plus its strong validator"""
+    reseller_id: str
+    body: bytes
+    etag: str
+    expires_at: float
+
+
+# Branding rows are free-form JSONB sections edited by resellers
+def _public_branding(reseller_id: str, branding: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Defaults when unconfigured; JSONB sections always dicts, plans always a list."""
+    if not branding:
+        return {"reseller_id": reseller_id, **DEFAULT_BRANDING}
+    for section in JSON_SECTIONS:
+        branding[section] = sanitize_json_field(branding.get(section))
+    branding["pricing_plans"] = branding.get("pricing_plans") or []
+    return branding
+
+
+def _serialize(payload: Dict[str, Any]) -> tuple[bytes, str]:
+    """Canonical JSON body and a strong ETag derived from it."""
+    body = json.dumps(payload, separators=(",", ":"), sort_keys=True, default=str).encode()
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+class BrandingCache:
+    """
+    Slug -> serialized APIResponse for white-label landing pages.
+
+    A miss costs one joined query (reseller + embedded branding); hits cost
+    nothing but a dict lookup, and the body is already serialized so the
+    ETag is stable and 304s are free. Entries expire after the TTL and are
+    dropped explicitly whenever branding or reseller status changes.
+    """
+
+    def __init__(self, ttl_seconds: int = BRANDING_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, CachedBranding] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, slug: str) -> Optional[CachedBranding]:
+        """Cached payload for slug, loading it on miss; None if the slug is unknown."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(slug)
+        if entry and entry.expires_at > now:
+            return entry
+
+        row = await get_supabase_service().get_public_branding_by_slug(slug)
+        if not row:
+            return None
+        entry = self._build(row, now)
+        with self._lock:
+            self._entries[slug] = entry
+        return entry
+
+    def _build(self, row: Dict[str, Any], now: float) -> CachedBranding:
+        """APIResponse-shaped payload for an active or suspended reseller."""
+        branding = row.get("reseller_branding")
+        if isinstance(branding, list):  # one-to-many embed shape
+            branding = branding[0] if branding else None
+
+        if row.get("status") == "suspended":
+            response = APIResponse(
+                success=False,
+                data={"error": "agency_suspended"},
+                message="This agency is not available",
+            )
+        else:
+            response = APIResponse(
+                success=True,
+                data={
+                    "reseller": {
+                        "id": row["id"],
+                        "slug": row["slug"],
+                        "agency_name": row["agency_name"],
+                        "status": row["status"],
+                    },
+                    "branding": _public_branding(row["id"], branding),
+                },
+                message="Reseller found",
+            )
+        body, etag = _serialize(response.model_dump(mode="json"))
+        return CachedBranding(str(row["id"]), body, etag, now + self.ttl_seconds)
+
+    def invalidate_reseller(self, reseller_id: str) -> None:
+        """Drop every cached slug that belongs to reseller_id."""
+        with self._lock:
+            stale = [slug for slug, e in self._entries.items() if e.reseller_id == str(reseller_id)]
+            for slug in stale:
+                del self._entries[slug]
+        if stale:
+            logger.info(f"Branding cache invalidated for reseller {reseller_id}: {stale}")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for GET)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+# Global instance
+branding_cache = BrandingCache()
@@ -6,6 +6,7 @@ Strict <200L per file.
 from typing import Dict, Any, Optional, Tuple
 from app.infrastructure.supabase_service import SupabaseService
 from app.infrastructure.repositories.client_context_repository import ClientContextRepository
+from app.infrastructure.projections import CLIENT_CONTEXT_GENERATION
 import logging
 
 logger = logging.getLogger(__name__)
@@ -33,55 +34,20 @@ class ContentLabContextService:
         Returns:
             Tuple of (context_data, audience, tone, keywords, brand_voice)
         """
-        # Load client context
-        client_context = self.context_repo.find_by_client_id(client_id)
-
-        # Load brand voice from client_context table (custom_instructions JSONB)
-        # Defensive: fallback to brand_file if custom_instructions doesn't exist
-        brand_file = {}
-        brand_file_response = None
-        vertical = None
-
-        try:
-            # Try with custom_instructions column first
-            brand_file_response = self.supabase.client.table("client_context")\
-                .select("custom_instructions, brand_file, vertical")\
-                .eq("client_id", client_id)\
-                .execute()
-
-            if brand_file_response.data:
-                # Prefer custom_instructions over brand_file
-                brand_file = (
-                    brand_file_response.data[0].get("custom_instructions") or
-                    brand_file_response.data[0].get("brand_file") or
-                    {}
-                )
-                vertical = brand_file_response.data[0].get("vertical")
-                logger.info(f"Loaded brand voice (custom_instructions) for client {client_id}")
-
-        except Exception as e:
-            # Check if error is "column does not exist"
-            if "42703" in str(e) or "custom_instructions" in str(e):
-                logger.warning(f"custom_instructions column missing, falling back to brand_file only")
-                try:
-                    # Fallback: use only brand_file and vertical
-                    brand_file_response = self.supabase.client.table("client_context")\
-                        .select("brand_file, vertical")\
-                        .eq("client_id", client_id)\
-                        .execute()
-
-                    if brand_file_response.data:
-                        brand_file = brand_file_response.data[0].get("brand_file") or {}
-                        vertical = brand_file_response.data[0].get("vertical")
-                        logger.info(f"Loaded brand voice (brand_file fallback) for client {client_id}")
-                except Exception as fallback_error:
-                    logger.error(f"Failed to load brand voice (fallback): {fallback_error}")
-                    brand_file = {}
-                    vertical = None
-            else:
-                logger.error(f"Error loading brand voice: {e}")
-                brand_file = {}
-                vertical = None
+        # Load client context (one memoized client_context row serves both reads)
+        client_context = self.context_repo.find_by_client_id(client_id, CLIENT_CONTEXT_GENERATION)
+        context_row = self.context_repo.find_row_by_client_id(client_id, CLIENT_CONTEXT_GENERATION) or {}
+
+        # Brand voice: prefer custom_instructions JSONB, fall back to brand_file
+        # (the projection drops these optional columns where the schema lacks them)
+        brand_file = (
+            context_row.get("custom_instructions") or
+            context_row.get("brand_file") or
+            {}
+        )
+        vertical = context_row.get("vertical")
+        if brand_file:
+            logger.info(f"Loaded brand voice for client {client_id}")
 
         # Extract brand voice rules
         brand_voice_rules = self._extract_brand_voice_rules(brand_file)
@@ -5,11 +5,13 @@ Strict <200L per file.
 """
 from typing import Dict, Any, Optional, Tuple
 from app.infrastructure.supabase_service import SupabaseService
-from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
+from app.services.prompt_vault import TemplateError, get_render_plan, select_optimal_prompt
+from app.services.metrics import metrics_engine
 from app.api.routes.content_lab.builders.prompt_builder import (
     build_user_prompt, build_system_prompt
 )
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +25,6 @@ class ContentLabPromptService:
 
     def __init__(self, supabase: SupabaseService):
         self.supabase = supabase
-        self.vault_repo = PromptVaultRepository(supabase)
 
     async def select_and_build_prompts(
         self,
@@ -46,8 +47,8 @@ class ContentLabPromptService:
         Returns:
             Tuple of (user_prompt, system_prompt, vault_metadata)
         """
-        # Query Prompt Vault
-        vault_prompt = await self.vault_repo.select_optimal_prompt(
+        # Prompt Vault (in-process index, no DB round-trip)
+        vault_prompt = await select_optimal_prompt(
             category=content_type,
             vertical=vertical,
             platform=platform,
@@ -103,19 +104,25 @@ class ContentLabPromptService:
         content_type: str
     ) -> Tuple[str, Dict[str, Any]]:
         """
-        Builds prompt from vault template with placeholders.
+        Renders the vault template through its pre-compiled plan.
 
-        Falls back to default if placeholder missing.
+        Templates are validated on write and when indexed; the fallback to
+        default only guards rows that bypassed both.
         """
         try:
-            user_prompt = vault_prompt["prompt_text"].format(
-                brief=brief,
-                platform=platform,
-                audience=audience,
-                tone=tone,
-                client_name=client_name,
-                language=language,
-                goal=goal
+            plan = get_render_plan(vault_prompt["prompt_text"])
+            started = time.perf_counter()
+            user_prompt = plan.render({
+                "brief": brief,
+                "platform": platform,
+                "audience": audience,
+                "tone": tone,
+                "client_name": client_name,
+                "language": language,
+                "goal": goal
+            })
+            metrics_engine.observe_render(
+                vault_prompt["id"], (time.perf_counter() - started) * 1_000_000
             )
 
             vault_used = {
@@ -133,9 +140,9 @@ class ContentLabPromptService:
 
             return user_prompt, vault_used
 
-        except KeyError as e:
+        except TemplateError as e:
             logger.warning(
-                f"Vault prompt missing placeholder {e}, falling back to default"
+                f"Vault prompt {vault_prompt['id']} invalid ({e}), falling back to default"
             )
             user_prompt = self._build_default_prompt(
                 content_type=content_type,
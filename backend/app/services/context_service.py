@@ -6,6 +6,7 @@ import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.projections import CONTEXT_DOC_BODY
 
 logger = logging.getLogger(__name__)
 
@@ -101,10 +102,9 @@ class ContextService:
     ) -> Dict[str, Any]:
         """Get all relevant context for an agent (global + client + department)."""
         try:
-            conditions = [("scope", "eq", "global"), ("is_active", "eq", True)]
             # Query global
             global_docs = self.supabase.client.table(self.table)\
-                .select("*")\
+                .select(CONTEXT_DOC_BODY.select)\
                 .eq("scope", "global")\
                 .eq("is_active", True)\
                 .execute()
@@ -112,7 +112,7 @@ class ContextService:
             client_docs = []
             if client_id:
                 client_resp = self.supabase.client.table(self.table)\
-                    .select("*")\
+                    .select(CONTEXT_DOC_BODY.select)\
                     .eq("scope", "client")\
                     .eq("scope_id", client_id)\
                     .eq("is_active", True)\
@@ -122,7 +122,7 @@ class ContextService:
             dept_docs = []
             if department:
                 dept_resp = self.supabase.client.table(self.table)\
-                    .select("*")\
+                    .select(CONTEXT_DOC_BODY.select)\
                     .eq("scope", "department")\
                     .eq("scope_id", department)\
                     .eq("is_active", True)\
@@ -0,0 +1,126 @@
+"""
+DB Guardian Probes
+Concurrent per-table reachability probes with timeouts and latency, plus the
+sentinel_db_health RPC (row estimates, index bloat, slow queries)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List, Optional, Sequence
+import asyncio
+import logging
+import time
+
+from app.infrastructure.supabase_service import get_supabase_service
+
+logger = logging.getLogger(__name__)
+
+GUARDIAN_TABLES = ("omega_agents", "omega_agent_memory", "nova_data", "sentinel_scans", "resellers", "clients")
+PROBE_TIMEOUT_SECONDS = 5.0
+HEALTH_RPC_TIMEOUT_SECONDS = 15.0
+SLOW_PROBE_MS = 1000
+MIN_OMEGA_AGENTS = 44
+# Health thresholds (reported as MEDIUM: visible in the scan, no effect on the score)
+DEAD_ROW_RATIO = 0.2
+MIN_ROWS_FOR_DEAD_RATIO = 1000
+INDEX_BLOAT_RATIO = 0.5
+MIN_INDEX_BLOAT_BYTES = 10 * 1024 * 1024
+SLOW_QUERY_MEAN_MS = 500
+
+
+def _probe_query(table: str):
+    """Count-only request: no rows come back; omega_agents also returns its exact count."""
+    count = "exact" if table == "omega_agents" else None
+    return get_supabase_service().client.table(table).select("id", count=count).limit(0)
+
+
+async def probe_table(table: str, timeout: float = PROBE_TIMEOUT_SECONDS) -> Dict[str, Any]:
+    """
+    One table probe, run in a worker thread and bounded by timeout.
+
+    Returns:
+        Dict with table, ok, latency_ms, count (omega_agents) and error
+    """
+    start = time.perf_counter()
+    probe: Dict[str, Any] = {"table": table, "ok": False, "latency_ms": None, "count": None, "error": None}
+    try:
+        response = await asyncio.wait_for(asyncio.to_thread(_probe_query(table).execute), timeout)
+        probe["ok"], probe["count"] = True, response.count
+    except asyncio.TimeoutError:
+        probe["error"] = f"timeout after {timeout:g}s"
+    except Exception as e:
+        probe["error"] = str(e)[:160]
+    probe["latency_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return probe
+
+
+async def probe_tables(tables: Sequence[str] = GUARDIAN_TABLES) -> List[Dict[str, Any]]:
+    """Every table probed concurrently."""
+    return list(await asyncio.gather(*(probe_table(table) for table in tables)))
+
+
+def probe_issues(probes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    issues = []
+    for probe in probes:
+        table = probe["table"]
+        if not probe["ok"]:
+            issue_type = "PROBE_TIMEOUT" if probe["error"].startswith("timeout") else "MISSING_TABLE"
+            issues.append({"severity": "CRITICAL", "type": issue_type, "message": f"{table} no accesible: {probe['error']}"})
+            continue
+        if probe["latency_ms"] > SLOW_PROBE_MS:
+            issues.append({"severity": "HIGH", "type": "SLOW_TABLE", "message": f"{table} → {probe['latency_ms']:.0f}ms"})
+        if table == "omega_agents" and probe["count"] and probe["count"] < MIN_OMEGA_AGENTS:
+            issues.append({
+                "severity": "HIGH", "type": "DATA_INTEGRITY",
+                "message": f"omega_agents: {probe['count']} (esperados {MIN_OMEGA_AGENTS}+)"
+            })
+    return issues
+
+
+async def fetch_db_health(
+    tables: Sequence[str] = GUARDIAN_TABLES, timeout: float = HEALTH_RPC_TIMEOUT_SECONDS
+) -> Optional[Dict[str, Any]]:
+    """
+    sentinel_db_health RPC (migrations/create_sentinel_db_health_rpc.sql).
+
+    Returns:
+        Health JSON, or None if the RPC is missing, fails or times out
+    """
+    rpc = get_supabase_service().client.rpc("sentinel_db_health", {"p_tables": list(tables)})
+    try:
+        response = await asyncio.wait_for(asyncio.to_thread(rpc.execute), timeout)
+        return response.data
+    except asyncio.TimeoutError:
+        logger.warning(f"sentinel_db_health timed out after {timeout:g}s")
+    except Exception as e:
+        logger.warning(f"sentinel_db_health unavailable: {e}")
+    return None
+
+
+def health_issues(health: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Dead-row buildup, bloated or unused indexes and slow statements"""
+    if not health:
+        return []
+    issues = []
+    for table in health.get("tables") or []:
+        if (table.get("live_rows") or 0) >= MIN_ROWS_FOR_DEAD_RATIO and (table.get("dead_ratio") or 0) > DEAD_ROW_RATIO:
+            issues.append({
+                "severity": "MEDIUM", "type": "DEAD_ROWS",
+                "message": f"{table['table']}: {table['dead_ratio']:.0%} filas muertas ({table['dead_rows']})"
+            })
+    for index in health.get("indexes") or []:
+        if (index.get("bloat_bytes") or 0) >= MIN_INDEX_BLOAT_BYTES and (index.get("bloat_ratio") or 0) > INDEX_BLOAT_RATIO:
+            issues.append({
+                "severity": "MEDIUM", "type": "INDEX_BLOAT",
+                "message": f"{index['index']}: ~{index['bloat_bytes'] // (1024 * 1024)}MB bloat ({index['bloat_ratio']:.0%})"
+            })
+        elif index.get("unused") and (index.get("bytes") or 0) >= MIN_INDEX_BLOAT_BYTES:
+            issues.append({
+                "severity": "LOW", "type": "UNUSED_INDEX",
+                "message": f"{index['index']} ({index['table']}): {index['bytes'] // (1024 * 1024)}MB, 0 scans"
+            })
+    for query in health.get("slow_queries") or []:
+        if (query.get("mean_ms") or 0) > SLOW_QUERY_MEAN_MS:
+            issues.append({
+                "severity": "MEDIUM", "type": "SLOW_QUERY",
+                "message": f"{query['mean_ms']:.0f}ms avg × {query['calls']}: {query['query'][:80]}"
+            })
+    return issues
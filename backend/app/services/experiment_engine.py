@@ -5,7 +5,8 @@ Pure A/B testing and statistical analysis logic
 from pydantic import BaseModel
 from typing import List
 import uuid
-import math
+
+from app.services.significance_engine import SignificanceReport, compare_variants
 
 
 class ABVariant(BaseModel):
@@ -71,50 +72,45 @@ def calculate_statistical_significance(
 ) -> float:
     """
     Calculate statistical significance using Z-test for proportions
-    Simplified implementation
 
     Args:
         control: Control variant
         test: Test variant
 
     Returns:
-        P-value (0.0 to 1.0, lower = more significant)
+        Exact two-sided p-value (0.0 to 1.0, lower = more significant)
     """
-    # Calculate pooled proportion
-    total_engagements = control.engagements + test.engagements
-    total_impressions = control.impressions + test.impressions
-
-    if total_impressions == 0:
-        return 1.0  # No significance
-
-    pooled_proportion = total_engagements / total_impressions
-
-    # Calculate standard error
-    se_control = math.sqrt(
-        pooled_proportion * (1 - pooled_proportion) / max(control.impressions, 1)
-    )
-    se_test = math.sqrt(
-        pooled_proportion * (1 - pooled_proportion) / max(test.impressions, 1)
+    report = compare_variants(
+        [control.variant_name, test.variant_name],
+        [control.impressions, test.impressions],
+        [control.engagements, test.engagements]
     )
+    return report.versus_control[0].p_value
 
-    se_diff = math.sqrt(se_control**2 + se_test**2)
 
-    if se_diff == 0:
-        return 1.0
+def analyze_variants(
+    variants: List[ABVariant],
+    alpha: float = 0.05
+) -> SignificanceReport:
+    """
+    Fill engagement rates and test every variant against the first (control)
 
-    # Calculate Z-score
-    z_score = abs(control.engagement_rate - test.engagement_rate) / se_diff
+    Args:
+        variants: Experiment variants, control first
+        alpha: Significance level
 
-    # Convert to p-value (simplified)
-    # For z > 1.96 (p < 0.05), z > 2.58 (p < 0.01)
-    if z_score > 2.58:
-        return 0.01
-    elif z_score > 1.96:
-        return 0.05
-    elif z_score > 1.64:
-        return 0.10
-    else:
-        return 1.0 - (z_score / 3.0)  # Approximate
+    Returns:
+        SignificanceReport with control-vs-all and pairwise comparisons
+    """
+    report = compare_variants(
+        [v.variant_name for v in variants],
+        [v.impressions for v in variants],
+        [v.engagements for v in variants],
+        alpha=alpha
+    )
+    for variant in variants:
+        variant.engagement_rate = report.rates[variant.variant_name]
+    return report
 
 
 def determine_minimum_sample_size(
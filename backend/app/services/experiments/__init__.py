@@ -0,0 +1,28 @@
+"""
+Persistent A/B experiments with incremental variant counters
+"""
+from app.services.experiments.counter_buffer import (
+    COUNTER_FIELDS,
+    FLUSH_THRESHOLD,
+    ExperimentCounterBuffer,
+    experiment_counter_buffer,
+)
+from app.services.experiments.store import (
+    analyze_experiment,
+    create_experiment,
+    flush_experiment_counters,
+    load_experiment,
+    record_events,
+)
+
+__all__ = [
+    "COUNTER_FIELDS",
+    "FLUSH_THRESHOLD",
+    "ExperimentCounterBuffer",
+    "analyze_experiment",
+    "create_experiment",
+    "experiment_counter_buffer",
+    "flush_experiment_counters",
+    "load_experiment",
+    "record_events",
+]
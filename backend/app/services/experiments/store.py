@@ -0,0 +1,179 @@
+"""
+Experiment Store
+Persistent experiments fed by incremental counters instead of full payloads
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.experiment_repository import ExperimentRepository
+from app.services.experiment_engine import ABVariant, Experiment, calculate_engagement_rate
+from app.services.experiments.counter_buffer import (
+    COUNTER_FIELDS,
+    FLUSH_THRESHOLD,
+    experiment_counter_buffer,
+)
+from app.services.significance_engine import DEFAULT_ALPHA, SignificanceReport, compare_variants
+
+logger = logging.getLogger(__name__)
+
+
+def _repository() -> ExperimentRepository:
+    return ExperimentRepository(get_supabase_service())
+
+
+async def create_experiment(experiment: Experiment) -> Experiment:
+    """
+    Persist an experiment and zeroed counters for each variant (control first)
+
+    Raises:
+        ValueError: If fewer than 2 variants or duplicate variant names
+    """
+    names = [v.variant_name for v in experiment.variants]
+    if len(names) < 2:
+        raise ValueError("Need at least 2 variants to run an experiment")
+    if len(set(names)) != len(names):
+        raise ValueError("Variant names must be unique")
+
+    header = experiment.model_dump(exclude={"variants"})
+    counters = [
+        {
+            "experiment_id": experiment.experiment_id,
+            "variant_name": v.variant_name,
+            "position": position,
+            "variant_id": v.variant_id,
+            "description": v.description,
+            "content": v.content,
+        }
+        for position, v in enumerate(experiment.variants)
+    ]
+    _repository().create(header, counters)
+    logger.info(f"Experiment {experiment.experiment_id} stored with {len(names)} variants")
+    return experiment
+
+
+async def record_events(events: List[Dict[str, int | str]]) -> int:
+    """
+    Buffer a batch of counter events; flush early once the buffer is large
+
+    Returns:
+        Events still pending after this call
+    """
+    pending = experiment_counter_buffer.add(events)
+    if pending >= FLUSH_THRESHOLD:
+        await flush_experiment_counters()
+        return experiment_counter_buffer.pending_events
+    return pending
+
+
+async def flush_experiment_counters() -> int:
+    """
+    Apply every pending delta in one atomic RPC; failed rows are re-queued.
+    Each flush is one look of the sequential test, so the always-valid
+    running minimum advances here (reads stay side-effect free).
+
+    Returns:
+        Number of variant aggregates updated
+    """
+    rows = experiment_counter_buffer.drain()
+    if not rows:
+        return 0
+    try:
+        repository = _repository()
+        updated = repository.apply_increments(rows)
+        logger.info(f"Experiment counters flushed: {updated} variants")
+    except Exception as e:
+        experiment_counter_buffer.requeue(rows)
+        logger.error(f"Error flushing experiment counters: {e}")
+        return 0
+    _advance_always_valid(repository, sorted({str(row["experiment_id"]) for row in rows}))
+    return updated
+
+
+def _prior_always_valid(rows: List[Dict[str, Any]]) -> List[float]:
+    """Stored running minimum per challenger; challengers without one start at 1.0"""
+    return [
+        row["always_valid_p"] if row.get("always_valid_p") is not None else 1.0
+        for row in rows[1:]
+    ]
+
+
+def _advance_always_valid(repository: ExperimentRepository, experiment_ids: List[str]) -> None:
+    """Recompute always-valid p-values from the flushed aggregates (one read, one RPC)"""
+    try:
+        values = []
+        for experiment_id, rows in repository.find_counters_for(experiment_ids).items():
+            if len(rows) < 2:
+                continue
+            report = compare_variants(
+                [row["variant_name"] for row in rows],
+                [int(row.get("impressions") or 0) for row in rows],
+                [int(row.get("engagements") or 0) for row in rows],
+                previous_always_valid=_prior_always_valid(rows)
+            )
+            values.extend(
+                {"experiment_id": experiment_id, "variant_name": c.challenger, "always_valid_p": c.always_valid_p_value}
+                for c in report.versus_control
+            )
+        repository.save_always_valid(values)
+    except Exception as e:
+        # Counters are already applied; the next flush recomputes from them
+        logger.error(f"Error updating always-valid p-values: {e}")
+
+
+# Rows come straight from ExperimentRepository (column-typed JSON)
+def _build_experiment(header: Dict[str, Any], rows: List[Dict[str, Any]]) -> Experiment:
+    """Experiment model from its header, aggregate rows and unflushed deltas"""
+    pending = experiment_counter_buffer.pending(header["experiment_id"])
+    variants = []
+    for row in rows:
+        delta = pending.get(row["variant_name"], {})
+        counts = {f: int(row.get(f) or 0) + delta.get(f, 0) for f in COUNTER_FIELDS}
+        variants.append(ABVariant(
+            variant_id=row["variant_id"],
+            variant_name=row["variant_name"],
+            description=row.get("description") or "",
+            content=row.get("content") or {},
+            engagement_rate=calculate_engagement_rate(counts["engagements"], counts["impressions"]),
+            **counts
+        ))
+    return Experiment(variants=variants, **header)
+
+
+async def load_experiment(experiment_id: str) -> Optional[Experiment]:
+    """
+    Rebuild an experiment from its aggregate rows plus unflushed deltas
+
+    Reads one row per variant; the event log is never scanned.
+    """
+    repository = _repository()
+    header = repository.find_experiment(experiment_id)
+    if header is None:
+        return None
+    return _build_experiment(header, repository.find_counters(experiment_id))
+
+
+async def analyze_experiment(experiment_id: str, alpha: float = DEFAULT_ALPHA) -> Optional[SignificanceReport]:
+    """
+    Significance report from stored counters plus unflushed deltas (read-only).
+
+    The always-valid p continues the running minimum stored at the last
+    counter flush; it is persisted only by flush_experiment_counters.
+
+    Returns:
+        SignificanceReport, or None if the experiment does not exist
+    """
+    repository = _repository()
+    header = repository.find_experiment(experiment_id)
+    if header is None:
+        return None
+    rows = repository.find_counters(experiment_id)
+    experiment = _build_experiment(header, rows)
+    return compare_variants(
+        [v.variant_name for v in experiment.variants],
+        [v.impressions for v in experiment.variants],
+        [v.engagements for v in experiment.variants],
+        alpha=alpha,
+        previous_always_valid=_prior_always_valid(rows)
+    )
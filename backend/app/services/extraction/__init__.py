@@ -0,0 +1,34 @@
+"""
+Document extraction: streamed, size-bounded sources parsed in a process pool,
+behind a content-addressed cache with conditional GET revalidation
+"""
+from app.services.extraction.download import (
+    MAX_HTML_BYTES,
+    MAX_PDF_BYTES,
+    SourceFile,
+    SourceTooLarge,
+    download_source,
+    spool_upload,
+)
+from app.services.extraction.cache import Extraction, extract_cached_source, extract_url_cached
+from app.services.extraction.extractors import MAX_CHARS, ExtractionDeadline, clean_text
+from app.services.extraction.pool import ExtractionTimeout, extraction_pool
+from app.services.extraction.service import extract_source
+
+__all__ = [
+    "MAX_CHARS",
+    "MAX_HTML_BYTES",
+    "MAX_PDF_BYTES",
+    "Extraction",
+    "ExtractionDeadline",
+    "ExtractionTimeout",
+    "SourceFile",
+    "SourceTooLarge",
+    "clean_text",
+    "download_source",
+    "extract_cached_source",
+    "extract_source",
+    "extract_url_cached",
+    "extraction_pool",
+    "spool_upload",
+]
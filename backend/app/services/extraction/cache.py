@@ -0,0 +1,94 @@
+"""
+Extraction Cache
+Skip downloads and parsing for URLs and files we have already extracted
+Filosofía: No velocity, only precision 🐢💎
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.extraction_cache_repository import ExtractionCacheRepository
+from app.services.extraction.download import SourceFile, download_source
+from app.services.extraction.service import extract_source
+
+logger = logging.getLogger(__name__)
+
+
+def _repository() -> ExtractionCacheRepository:
+    return ExtractionCacheRepository(get_supabase_service())
+
+
+@dataclass
+class Extraction:
+    """Cleaned text plus extractor metadata; `cached` says how we got it."""
+    kind: str
+    text: str
+    # Extractor metadata: title, page_count, pages_read, truncated
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    cached: Optional[str] = None  # None | "not_modified" | "content_hash"
+
+
+def _from_row(row: Dict[str, Any], cached: str) -> Extraction:
+    return Extraction(kind=row["kind"], text=row["content"], metadata=row.get("metadata") or {}, cached=cached)
+
+
+def _safe(action: str, fn, *args) -> Any:
+    """Cache I/O never fails an extraction; it just degrades to a miss."""
+    try:
+        return fn(*args)
+    except Exception as e:
+        logger.warning(f"Extraction cache {action} failed: {e}")
+        return None
+
+
+async def extract_cached_source(source: SourceFile, kind: str) -> Extraction:
+    """
+    Extraction for a spooled source, reusing any previous parse of identical bytes.
+    """
+    repository = _repository()
+    row = _safe("lookup", repository.find_by_hash, source.sha256, kind)
+    if row:
+        logger.info(f"Extraction cache hit for {source.sha256[:12]} ({kind})")
+        return _from_row(row, "content_hash")
+
+    result = await extract_source(source, kind)
+    text = str(result.pop("text"))
+    _safe("store", repository.save_extraction, source.sha256, kind, text, result, source.size)
+    return Extraction(kind=kind, text=text, metadata=result)
+
+
+async def extract_url_cached(url: str) -> Extraction:
+    """
+    URL extraction with revalidation.
+
+    A known URL is fetched conditionally (If-None-Match / If-Modified-Since):
+    304 -> stored text, no body read; 200 with identical bytes -> stored text,
+    no parsing; anything else -> parse and store under the new hash.
+
+    Raises:
+        Whatever download_source / extract_source raise
+    """
+    repository = _repository()
+    known = _safe("lookup", repository.find_url, url)
+    etag = known.get("etag") if known else None
+    last_modified = known.get("last_modified") if known else None
+
+    async with download_source(url, etag, last_modified) as source:
+        if source.not_modified and known:
+            row = _safe("lookup", repository.find_by_hash, known["content_hash"], known["kind"])
+            if row:
+                logger.info(f"Extraction revalidated (304) for {url}")
+                return _from_row(row, "not_modified")
+        if source.not_modified:
+            # Cache row vanished after a 304: refetch unconditionally
+            async with download_source(url) as fresh:
+                return await _extract_and_link(repository, url, fresh)
+        return await _extract_and_link(repository, url, source)
+
+
+async def _extract_and_link(repository: ExtractionCacheRepository, url: str, source: SourceFile) -> Extraction:
+    kind = "pdf" if source.is_pdf else "html"
+    extraction = await extract_cached_source(source, kind)
+    _safe("link", repository.save_url, url, source.sha256, kind, source.etag, source.last_modified)
+    return extraction
@@ -0,0 +1,151 @@
+"""
+Extraction Sources
+Streams URLs and uploads into temp files under a byte budget
+Filosofía: No velocity, only precision 🐢💎
+"""
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+import hashlib
+import logging
+import os
+import tempfile
+
+import httpx
+from fastapi import UploadFile
+
+logger = logging.getLogger(__name__)
+
+MAX_PDF_BYTES = 25 * 1024 * 1024
+MAX_HTML_BYTES = 5 * 1024 * 1024
+DOWNLOAD_TIMEOUT_SECONDS = 30.0
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+USER_AGENT = "Mozilla/5.0 (compatible; OmegaBot/1.0)"
+
+
+class SourceTooLarge(ValueError):
+    """The source exceeded its byte budget before it was fully read."""
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """
+    A spooled source: workers read it by path, so no bytes are pickled.
+
+    sha256 is computed while streaming. When a conditional GET returns 304,
+    not_modified is set and nothing is spooled (path is empty).
+    """
+    path: str
+    size: int
+    is_pdf: bool
+    content_type: str = ""
+    encoding: Optional[str] = None
+    sha256: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
+def _temp_path() -> tuple[int, str]:
+    return tempfile.mkstemp(prefix="omega-extract-")
+
+
+def _discard(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _conditional_headers(etag: Optional[str], last_modified: Optional[str]) -> dict[str, str]:
+    headers = {"User-Agent": USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+@asynccontextmanager
+async def download_source(
+    url: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> AsyncIterator[SourceFile]:
+    """
+    Stream a URL to a temp file, aborting as soon as it passes its budget
+    (PDFs MAX_PDF_BYTES, pages MAX_HTML_BYTES). The file is removed on exit.
+
+    Passing the validators from a previous fetch makes it a conditional
+    GET; a 304 yields a not_modified source without reading a body.
+
+    Raises:
+        SourceTooLarge: Declared or streamed size over budget
+        httpx.HTTPError: Network failures and non-2xx responses
+    """
+    fd, path = _temp_path()
+    try:
+        async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT_SECONDS, follow_redirects=True) as client:
+            async with client.stream("GET", url, headers=_conditional_headers(etag, last_modified)) as response:
+                if response.status_code == 304:
+                    yield SourceFile(
+                        path="", size=0, is_pdf=False, etag=etag,
+                        last_modified=last_modified, not_modified=True
+                    )
+                    return
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "").lower()
+                is_pdf = url.lower().endswith(".pdf") or "application/pdf" in content_type
+                budget = MAX_PDF_BYTES if is_pdf else MAX_HTML_BYTES
+
+                declared = int(response.headers.get("content-length") or 0)
+                if declared > budget:
+                    raise SourceTooLarge(f"Documento demasiado grande ({declared // 1024 // 1024}MB)")
+
+                size = 0
+                digest = hashlib.sha256()
+                with os.fdopen(fd, "wb") as handle:
+                    fd = -1
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                        size += len(chunk)
+                        if size > budget:
+                            raise SourceTooLarge(f"Documento supera el límite de {budget // 1024 // 1024}MB")
+                        digest.update(chunk)
+                        handle.write(chunk)
+                source = SourceFile(
+                    path=path, size=size, is_pdf=is_pdf, content_type=content_type,
+                    encoding=response.charset_encoding, sha256=digest.hexdigest(),
+                    etag=response.headers.get("etag"),
+                    last_modified=response.headers.get("last-modified")
+                )
+        yield source
+    finally:
+        if fd >= 0:
+            os.close(fd)
+        _discard(path)
+
+
+@asynccontextmanager
+async def spool_upload(file: UploadFile, max_bytes: int = MAX_PDF_BYTES) -> AsyncIterator[SourceFile]:
+    """Copy an upload to a temp file in chunks under max_bytes; removed on exit."""
+    if file.size is not None and file.size > max_bytes:
+        raise SourceTooLarge(f"Archivo demasiado grande (máximo {max_bytes // 1024 // 1024}MB)")
+    fd, path = _temp_path()
+    try:
+        size = 0
+        digest = hashlib.sha256()
+        with os.fdopen(fd, "wb") as handle:
+            while chunk := await file.read(DOWNLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise SourceTooLarge(f"Archivo demasiado grande (máximo {max_bytes // 1024 // 1024}MB)")
+                digest.update(chunk)
+                handle.write(chunk)
+        filename = (file.filename or "").lower()
+        content_type = (file.content_type or "").lower()
+        yield SourceFile(
+            path=path, size=size, content_type=content_type, sha256=digest.hexdigest(),
+            is_pdf="pdf" in content_type or filename.endswith(".pdf")
+        )
+    finally:
+        _discard(path)
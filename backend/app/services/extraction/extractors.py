@@ -0,0 +1,94 @@
+"""
+Document Extractors
+PDF / HTML / text extraction executed inside the extraction process pool
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Dict, List
+import re
+import time
+
+MAX_CHARS = 50000
+HTML_STRIP_TAGS = ['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript']
+
+
+class ExtractionDeadline(Exception):
+    """The job ran past its soft deadline between pages."""
+
+
+def clean_text(text: str) -> str:
+    """Remove null characters and control characters that break PostgreSQL."""
+    # Remove null characters
+    text = text.replace('\u0000', '')
+    text = text.replace('\x00', '')
+    # Remove other control characters (except newline, tab, carriage return)
+    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
+    # Clean multiple newlines
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+# Results cross the process boundary as plain dicts (picklable, JSON-ready)
+def extract_pdf(path: str, max_chars: int = MAX_CHARS, deadline_seconds: float = 20.0) -> Dict[str, int | str | bool]:
+    """
+    Page-at-a-time PDF text, stopping as soon as the char budget is met.
+
+    Pages are cleaned individually so the budget counts final characters;
+    a 200-page PDF whose first pages fill the budget never parses the rest.
+
+    Raises:
+        ExtractionDeadline: If the soft deadline passes between pages
+    """
+    from pypdf import PdfReader
+
+    started = time.monotonic()
+    reader = PdfReader(path)
+    page_count = len(reader.pages)
+    parts: List[str] = []
+    collected = 0
+    pages_read = 0
+    for page in reader.pages:
+        if time.monotonic() - started > deadline_seconds:
+            raise ExtractionDeadline(f"PDF extraction exceeded {deadline_seconds:.0f}s after {pages_read} pages")
+        pages_read += 1
+        extracted = clean_text(page.extract_text() or "")
+        if not extracted:
+            continue
+        parts.append(extracted)
+        collected += len(extracted) + 1
+        if collected >= max_chars:
+            break
+    text = clean_text("\n".join(parts))[:max_chars]
+    return {
+        "text": text,
+        "page_count": page_count,
+        "pages_read": pages_read,
+        "truncated": pages_read < page_count or collected > max_chars,
+    }
+
+
+def extract_html(path: str, encoding: str = "utf-8", max_chars: int = MAX_CHARS) -> Dict[str, int | str | bool]:
+    """Title and visible text of an HTML document (chrome tags removed)."""
+    from bs4 import BeautifulSoup
+
+    with open(path, "rb") as handle:
+        markup = handle.read().decode(encoding or "utf-8", errors="replace")
+    soup = BeautifulSoup(markup, 'html.parser')
+
+    title_tag = soup.find('title')
+    title = title_tag.text.strip() if title_tag else ""
+
+    for tag in soup(HTML_STRIP_TAGS):
+        tag.decompose()
+
+    text = clean_text(soup.get_text(separator='\n', strip=True))
+    return {"title": title, "text": text[:max_chars], "truncated": len(text) > max_chars}
+
+
+def extract_plain(path: str, max_chars: int = MAX_CHARS) -> Dict[str, int | str | bool]:
+    """UTF-8 text/markdown; reads only enough bytes to fill the budget."""
+    # 4 bytes per char upper bound for UTF-8, plus slack for stripped control chars
+    with open(path, "rb") as handle:
+        raw = handle.read(max_chars * 4 + 1024)
+        truncated = bool(handle.read(1))
+    text = clean_text(raw.decode("utf-8", errors="ignore"))
+    return {"text": text[:max_chars], "truncated": truncated or len(text) > max_chars}
@@ -0,0 +1,127 @@
+"""
+Extraction Pool
+Bounded process pool with per-job timeouts for document parsing
+Filosofía: No velocity, only precision 🐢💎
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, Set
+import asyncio
+import logging
+import os
+import signal
+import threading
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+EXTRACTION_TIMEOUT_SECONDS = 30.0
+
+
+class ExtractionTimeout(Exception):
+    """A job exceeded its hard timeout and its worker was killed."""
+
+
+class _Worker:
+    """One single-process executor, so a runaway job can be killed on its own."""
+
+    def __init__(self):
+        self.executor = ProcessPoolExecutor(max_workers=1)
+        self.pid: Optional[int] = None
+
+    async def start(self) -> None:
+        """Spawn the process and learn its pid (needed to kill it later)."""
+        if self.pid is None:
+            self.pid = await asyncio.wrap_future(self.executor.submit(os.getpid))
+
+    def kill(self) -> None:
+        if self.pid is not None:
+            try:
+                os.kill(self.pid, signal.SIGTERM)
+            except OSError:
+                pass
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ExtractionPool:
+    """
+    Parsing off the event loop.
+
+    PdfReader/BeautifulSoup are CPU-bound and hold the GIL, so they run in
+    worker processes. Each worker runs one job at a time and a job only
+    starts its timeout once it has a worker, so time spent waiting for a
+    free worker never counts against it. A job that blows its timeout
+    cannot be cancelled inside a process, so that one worker is killed and
+    replaced — other in-flight jobs keep running. Jobs also check a soft
+    deadline between pages to exit cleanly.
+    """
+
+    def __init__(self, workers: int = EXTRACTION_WORKERS):
+        self._workers = workers
+        # Idle workers; None is a slot whose worker is spawned on first use
+        self._idle: Optional[asyncio.Queue] = None
+        self._alive: Set[_Worker] = set()
+        self._lock = threading.Lock()
+
+    def _queue(self) -> asyncio.Queue:
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for _ in range(self._workers):
+                self._idle.put_nowait(None)
+        return self._idle
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker()
+        with self._lock:
+            self._alive.add(worker)
+        return worker
+
+    def _discard(self, worker: _Worker) -> None:
+        with self._lock:
+            self._alive.discard(worker)
+        worker.kill()
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: float = EXTRACTION_TIMEOUT_SECONDS) -> Any:
+        """
+        Run fn(*args) in a worker with a hard timeout (measured from the
+        moment the job gets a worker).
+
+        Raises:
+            ExtractionTimeout: If the job does not finish in time
+        """
+        idle = self._queue()
+        worker: Optional[_Worker] = await idle.get()
+        future: Optional[asyncio.Future] = None
+        try:
+            if worker is None:
+                worker = self._spawn()
+            await worker.start()
+            future = asyncio.wrap_future(worker.executor.submit(fn, *args))
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Extraction worker {worker.pid} killed after {timeout:.0f}s, replacing it")
+                raise ExtractionTimeout(f"Extraction exceeded {timeout:.0f}s")
+        except BrokenProcessPool:
+            # The process died (OOM, crash); its slot gets a fresh worker
+            future = None
+            raise
+        finally:
+            # A worker still busy (timeout, caller cancelled) or dead is replaced
+            if worker is not None and (future is None or not future.done()):
+                if future is not None:
+                    # Killing the process fails the abandoned future; nobody awaits it
+                    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+                self._discard(worker)
+                worker = None
+            idle.put_nowait(worker)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers, self._alive = list(self._alive), set()
+        for worker in workers:
+            worker.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global instance
+extraction_pool = ExtractionPool()
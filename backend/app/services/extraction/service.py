@@ -0,0 +1,50 @@
+"""
+Extraction Service
+Async entry point: spooled source in, cleaned text out (parsed in the pool)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Dict
+import logging
+import time
+
+from app.services.extraction.download import SourceFile
+from app.services.extraction.extractors import MAX_CHARS, extract_html, extract_pdf, extract_plain
+from app.services.extraction.pool import EXTRACTION_TIMEOUT_SECONDS, extraction_pool
+
+logger = logging.getLogger(__name__)
+
+# Workers stop between pages at this point, before the hard timeout kills them
+SOFT_DEADLINE_SECONDS = EXTRACTION_TIMEOUT_SECONDS * 2 / 3
+
+EXTRACTION_KINDS = ("pdf", "html", "text")
+
+
+# Extractor results are plain dicts: text plus per-kind metadata
+async def extract_source(source: SourceFile, kind: str, max_chars: int = MAX_CHARS) -> Dict[str, int | str | bool]:
+    """
+    Parse a spooled source in the extraction pool.
+
+    Args:
+        source: Temp file from download_source / spool_upload
+        kind: "pdf", "html" or "text"
+        max_chars: Char budget; PDFs stop reading pages once it is met
+
+    Raises:
+        ExtractionTimeout: Hard timeout (worker recycled)
+        ExtractionDeadline: Soft deadline hit between PDF pages
+        ValueError: Unknown kind
+    """
+    started = time.perf_counter()
+    if kind == "pdf":
+        result = await extraction_pool.run(extract_pdf, source.path, max_chars, SOFT_DEADLINE_SECONDS)
+    elif kind == "html":
+        result = await extraction_pool.run(extract_html, source.path, source.encoding or "utf-8", max_chars)
+    elif kind == "text":
+        result = await extraction_pool.run(extract_plain, source.path, max_chars)
+    else:
+        raise ValueError(f"Unknown extraction kind: {kind}")
+    logger.info(
+        f"Extracted {kind} ({source.size} bytes -> {len(result['text'])} chars"
+        f"{', truncated' if result.get('truncated') else ''}) in {time.perf_counter() - started:.2f}s"
+    )
+    return result
@@ -15,6 +15,7 @@ from app.domain.handoff.entities import (
     HandoffCompletion
 )
 from app.infrastructure.supabase_service import SupabaseService
+from app.services.nova_briefing import mark_briefing_stale
 
 logger = logging.getLogger(__name__)
 
@@ -167,6 +168,8 @@ class HandoffService:
             "priority": handoff.priority.value,
             "expires_at": handoff.deadline
         }).execute()
+        if handoff.to_agent == "NOVA":
+            mark_briefing_stale("nova_memory")
 
     def _update_handoff(self, handoff: Handoff) -> None:
         """Update handoff status"""
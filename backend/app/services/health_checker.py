@@ -7,6 +7,8 @@ from pydantic import BaseModel
 import time
 import logging
 
+from app.services.metrics import METRIC_ERROR, MetricSummary
+
 logger = logging.getLogger(__name__)
 
 
@@ -207,6 +209,53 @@ class HealthChecker:
         
         return None
     
+    def detect_baseline_anomaly(
+        self,
+        summary: MetricSummary,
+        z_threshold: float = 3.0
+    ) -> Optional[SystemAnomaly]:
+        """
+        Detect anomaly from a streaming series' latest z-score
+        
+        The baseline (EWMA mean/std) is maintained by the metrics engine,
+        so no history is scanned here.
+        
+        Args:
+            summary: Metric series summary from the metrics engine
+            z_threshold: Baseline standard deviations considered anomalous
+            
+        Returns:
+            SystemAnomaly if detected, None otherwise
+        """
+        from datetime import datetime
+        
+        if summary.last_z is None or summary.last_z < z_threshold:
+            return None
+        
+        is_error = summary.metric == METRIC_ERROR
+        severity = "critical" if summary.last_z >= z_threshold * 2 else "warning"
+        component = f"{summary.scope}:{summary.name}"
+        # last_baseline is the baseline before the spiking value was folded in
+        baseline = summary.last_baseline if summary.last_baseline is not None else summary.baseline
+        if is_error:
+            description = (
+                f"{component} error rate spiking: {summary.baseline:.1%} recent "
+                f"vs baseline {baseline:.1%}"
+            )
+        else:
+            description = (
+                f"{component} {summary.metric}={summary.last:.0f} is {summary.last_z:.1f}σ "
+                f"above baseline {baseline:.0f} (p95 {summary.p95:.0f})"
+            )
+        
+        return SystemAnomaly(
+            anomaly_type="error_spike" if is_error else "slow_response",
+            severity=severity,
+            affected_component=component,
+            description=description,
+            detected_at=datetime.now().isoformat()
+        )
+    
     def generate_alert_id(self) -> str:
         """Generate unique alert ID"""
         import uuid
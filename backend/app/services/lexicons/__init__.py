@@ -0,0 +1,24 @@
+"""
+Lexicon packs and language detection for rule-based text analysis
+"""
+from app.services.lexicons.pack import (
+    DEFAULT_LANGUAGE,
+    LexiconPack,
+    available_languages,
+    get_lexicon_pack,
+    register_lexicon_pack,
+)
+from app.services.lexicons.language_detector import (
+    LanguageDetector,
+    language_detector,
+)
+
+__all__ = [
+    "DEFAULT_LANGUAGE",
+    "LexiconPack",
+    "LanguageDetector",
+    "available_languages",
+    "get_lexicon_pack",
+    "language_detector",
+    "register_lexicon_pack",
+]
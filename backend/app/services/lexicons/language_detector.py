@@ -0,0 +1,112 @@
+"""
+Language Detector
+Character trigram scoring against the registered lexicon pack profiles
+"""
+from typing import Dict, List, Optional, Tuple
+import logging
+
+from app.services.lexicons.pack import (
+    DEFAULT_LANGUAGE,
+    LexiconPack,
+    available_languages,
+    get_lexicon_pack,
+    registry_version,
+)
+
+logger = logging.getLogger(__name__)
+
+# Comments longer than this are classified from their prefix only
+MAX_SCAN_CHARS = 400
+# A language-exclusive character (ñ, ¿, ...) counts as this many trigram hits
+MARKER_WEIGHT = 2.0
+
+
+class LanguageDetector:
+    """
+    Trigram language detector (Cavnar-Trenkle style ranked profiles).
+
+    Every pack's profile is merged into a single lookup table mapping a
+    trigram to a per-language weight tuple, so detection is one pass over
+    the text with one dict lookup per position and no intermediate
+    token lists or sets.
+    """
+
+    def __init__(self):
+        self._version = -1
+        self._languages: Tuple[str, ...] = ()
+        self._table: Dict[str, Tuple[float, ...]] = {}
+        self._markers: Dict[str, int] = {}
+
+    def detect(self, text_lower: str) -> str:
+        """
+        Detect the language of already-lowercased text.
+
+        Args:
+            text_lower: Lowercased comment text
+
+        Returns:
+            ISO 639-1 code of the best-scoring pack, DEFAULT_LANGUAGE on ties
+        """
+        if self._version != registry_version():
+            self._build()
+
+        scores = [0.0] * len(self._languages)
+        table_get = self._table.get
+        marker_get = self._markers.get
+        end = min(len(text_lower), MAX_SCAN_CHARS)
+
+        for i in range(end):
+            marker_idx = marker_get(text_lower[i])
+            if marker_idx is not None:
+                scores[marker_idx] += MARKER_WEIGHT
+            if i + 3 <= end:
+                weights = table_get(text_lower[i:i + 3])
+                if weights is not None:
+                    for idx in range(len(weights)):
+                        scores[idx] += weights[idx]
+
+        return self._best(scores)
+
+    def detect_pack(self, text_lower: str) -> LexiconPack:
+        """Detect the language and return its (cached) lexicon pack."""
+        return get_lexicon_pack(self.detect(text_lower))
+
+    def _best(self, scores: List[float]) -> str:
+        """Pick the top-scoring language; ties and no signal go to the default."""
+        best_idx: Optional[int] = None
+        best_score = 0.0
+        tie = False
+        for idx, score in enumerate(scores):
+            if score > best_score:
+                best_idx, best_score, tie = idx, score, False
+            elif score == best_score and score > 0:
+                tie = True
+
+        if best_idx is None or tie:
+            return DEFAULT_LANGUAGE
+        return self._languages[best_idx]
+
+    def _build(self) -> None:
+        """(Re)build the merged trigram table from the registered packs."""
+        languages = available_languages()
+        merged: Dict[str, List[float]] = {}
+        markers: Dict[str, int] = {}
+
+        for idx, language in enumerate(languages):
+            pack = get_lexicon_pack(language)
+            size = len(pack.profile)
+            for rank, gram in enumerate(pack.profile):
+                weights = merged.setdefault(gram, [0.0] * len(languages))
+                weights[idx] += (size - rank) / size
+            for char in pack.markers:
+                markers[char] = idx
+
+        self._languages = languages
+        self._table = {gram: tuple(w) for gram, w in merged.items()}
+        self._markers = markers
+        self._version = registry_version()
+        logger.info(f"Language detector built for: {', '.join(languages)}")
+
+
+# Global instance
+language_detector = LanguageDetector()
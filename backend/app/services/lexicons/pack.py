@@ -0,0 +1,111 @@
+"""
+Lexicon Packs
+Per-language word lists for sentiment, intent and brand analysis
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Tuple
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+PACKS_DIR = Path(__file__).parent / "packs"
+DEFAULT_LANGUAGE = "es"
+
+# language code -> JSON file; extended at runtime via register_lexicon_pack()
+_PACK_PATHS: Dict[str, Path] = {
+    path.stem: path for path in sorted(PACKS_DIR.glob("*.json"))
+}
+_registry_version = 0
+
+
+@dataclass(frozen=True)
+class LexiconPack:
+    """
+    Immutable word lists for one language.
+
+    Single-word entries are matched against the comment's token set;
+    multi-word entries (e.g. "no funciona") only match via substring
+    checks, exactly like the original English-only lists.
+    """
+
+    language: str
+    positive: FrozenSet[str]
+    negative: FrozenSet[str]
+    question: FrozenSet[str]
+    complaint: FrozenSet[str]
+    praise: FrozenSet[str]
+    spam: Tuple[str, ...]
+    urgent: FrozenSet[str]
+    stop_words: FrozenSet[str]
+    formal: FrozenSet[str]
+    casual: FrozenSet[str]
+    profile: Tuple[str, ...]  # character trigrams ranked by frequency
+    markers: str  # characters that only occur in this language
+
+
+def register_lexicon_pack(language: str, path: Path) -> None:
+    """
+    Register (or replace) the pack file for a language.
+
+    Args:
+        language: ISO 639-1 code, e.g. "pt"
+        path: JSON file with the same keys as packs/es.json
+    """
+    global _registry_version
+    _PACK_PATHS[language] = path
+    _registry_version += 1
+    get_lexicon_pack.cache_clear()
+    logger.info(f"Lexicon pack registered: {language} -> {path}")
+
+
+def available_languages() -> Tuple[str, ...]:
+    """Languages with a registered pack, in registration order."""
+    return tuple(_PACK_PATHS)
+
+
+def registry_version() -> int:
+    """Counter bumped on every registration; lets caches detect changes."""
+    return _registry_version
+
+
+@lru_cache(maxsize=None)
+def get_lexicon_pack(language: str) -> LexiconPack:
+    """
+    Load a language pack on first use and keep it for the process lifetime.
+
+    Unknown languages resolve to the DEFAULT_LANGUAGE pack.
+
+    Args:
+        language: ISO 639-1 code
+
+    Returns:
+        LexiconPack for the language
+    """
+    path = _PACK_PATHS.get(language)
+    if path is None:
+        if language == DEFAULT_LANGUAGE:
+            raise ValueError(f"No lexicon pack for default language '{DEFAULT_LANGUAGE}'")
+        return get_lexicon_pack(DEFAULT_LANGUAGE)
+
+    with path.open(encoding="utf-8") as fh:
+        raw = json.load(fh)
+
+    logger.info(f"Lexicon pack loaded: {language} ({path.name})")
+    return LexiconPack(
+        language=language,
+        positive=frozenset(raw["positive"]),
+        negative=frozenset(raw["negative"]),
+        question=frozenset(raw["question"]),
+        complaint=frozenset(raw["complaint"]),
+        praise=frozenset(raw["praise"]),
+        spam=tuple(raw["spam"]),
+        urgent=frozenset(raw["urgent"]),
+        stop_words=frozenset(raw["stop_words"]),
+        formal=frozenset(raw["formal"]),
+        casual=frozenset(raw["casual"]),
+        profile=tuple(raw["profile"]),
+        markers=raw.get("markers", ""),
+    )
@@ -5,17 +5,15 @@ Filosofía: No velocity, only precision 🐢💎
 from typing import Optional
 import logging
 import os
-from openai import AsyncOpenAI
 
 from app.domain.llm.types import (
     ContentType, UserTier, LLMResponse
 )
 from app.domain.llm.config import LLM_TIERS
+from app.infrastructure.ai.clients import get_openai_client
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client
-_openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 async def generate_content(
     content_type: ContentType,
@@ -83,7 +81,7 @@ async def generate_content(
             "gpt-4o-mini"
         )
 
-        response = await _openai_client.chat.completions.create(
+        response = await get_openai_client(os.getenv("OPENAI_API_KEY")).chat.completions.create(
             model=openai_model,
             messages=messages,
             **kwargs
@@ -0,0 +1,37 @@
+"""
+Media helpers: streaming upload inspection, MIME sniffing and
+background derivative generation
+"""
+from app.services.media.jobs import (
+    schedule_brand_file_derivatives,
+    schedule_generated_derivatives,
+    schedule_hero_derivatives,
+)
+from app.services.media.pipeline import (
+    DerivativeJob,
+    media_pipeline,
+    shutdown_media_pipeline,
+)
+from app.services.media.sniffing import sniff_mime
+from app.services.media.upload_inspector import (
+    UPLOAD_CHUNK_BYTES,
+    UploadInfo,
+    UploadRejected,
+    inspect_upload,
+    iter_upload,
+)
+
+__all__ = [
+    "DerivativeJob",
+    "UPLOAD_CHUNK_BYTES",
+    "UploadInfo",
+    "UploadRejected",
+    "inspect_upload",
+    "iter_upload",
+    "media_pipeline",
+    "schedule_brand_file_derivatives",
+    "schedule_generated_derivatives",
+    "schedule_hero_derivatives",
+    "shutdown_media_pipeline",
+    "sniff_mime",
+]
@@ -0,0 +1,76 @@
+"""
+Media Derivatives
+CPU-bound renderers executed inside the media process pool
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Dict, Tuple
+import io
+import shutil
+import subprocess
+
+# name -> (max edge in px, format); AVIF is skipped when Pillow lacks the codec
+IMAGE_VARIANTS: Dict[str, Tuple[int, str]] = {
+    "thumb_webp": (320, "WEBP"),
+    "display_webp": (1280, "WEBP"),
+    "display_avif": (1280, "AVIF"),
+}
+FORMAT_TYPES = {"WEBP": ("webp", "image/webp"), "AVIF": ("avif", "image/avif")}
+IMAGE_QUALITY = 80
+POSTER_AT_SECONDS = 1.0
+POSTER_TIMEOUT_SECONDS = 60
+
+# name -> (bytes, file extension, content type)
+Rendered = Dict[str, Tuple[bytes, str, str]]
+
+
+def render_image_derivatives(data: bytes) -> Rendered:
+    """
+    Downscaled WebP/AVIF variants of an image (never upscaled).
+
+    Runs in a worker process: Pillow is imported there so the API process
+    does not pay for it.
+
+    Raises:
+        ImportError: If Pillow is not installed
+    """
+    from PIL import Image, features
+
+    rendered: Rendered = {}
+    with Image.open(io.BytesIO(data)) as source:
+        source.load()
+        image = source.convert("RGBA" if source.mode in ("RGBA", "LA", "P") else "RGB")
+    for name, (edge, fmt) in IMAGE_VARIANTS.items():
+        if fmt == "AVIF" and not features.check("avif"):
+            continue
+        variant = image.copy()
+        variant.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        variant.save(buffer, format=fmt, quality=IMAGE_QUALITY)
+        extension, content_type = FORMAT_TYPES[fmt]
+        rendered[name] = (buffer.getvalue(), extension, content_type)
+    return rendered
+
+
+def extract_video_poster(source_url: str, at_seconds: float = POSTER_AT_SECONDS) -> Rendered:
+    """
+    Poster frame via ffmpeg (reads only the bytes it needs from the URL),
+    plus the same downscaled variants as an image.
+
+    Raises:
+        RuntimeError: If ffmpeg is missing or fails
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg not available for video posters")
+    result = subprocess.run(
+        [
+            ffmpeg, "-v", "error", "-ss", str(at_seconds), "-i", source_url,
+            "-frames:v", "1", "-f", "image2", "-c:v", "mjpeg", "pipe:1",
+        ],
+        capture_output=True,
+        timeout=POSTER_TIMEOUT_SECONDS,
+    )
+    if result.returncode != 0 or not result.stdout:
+        raise RuntimeError(f"ffmpeg poster failed: {result.stderr.decode(errors='ignore')[:200]}")
+    poster = result.stdout
+    return {"poster_jpg": (poster, "jpg", "image/jpeg"), **render_image_derivatives(poster)}
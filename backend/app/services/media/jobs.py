@@ -0,0 +1,94 @@
+"""
+Media Derivative Jobs
+Where each kind of original lives and where its derivative URLs are stored
+Filosofía: No velocity, only precision 🐢💎
+"""
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.services.branding_cache import branding_cache
+from app.services.media.pipeline import (
+    GENERATED_BUCKET,
+    DerivativeJob,
+    DerivativeUrls,
+    media_pipeline,
+)
+
+logger = logging.getLogger(__name__)
+
+DERIVABLE_IMAGE_TYPES = {"image/png", "image/jpeg", "image/webp"}
+
+
+def _stem(path: str) -> str:
+    """Object path without its extension: derivatives sit in a folder beside it."""
+    return path.rsplit(".", 1)[0]
+
+
+def schedule_brand_file_derivatives(file_id: str, storage_path: str, storage_url: str, mime_type: str) -> None:
+    """Image brand files -> brand_files.derivatives (documents are skipped)."""
+    if mime_type not in DERIVABLE_IMAGE_TYPES:
+        return
+
+    async def persist(urls: DerivativeUrls) -> None:
+        get_supabase_service().client.table("brand_files")\
+            .update({"derivatives": urls})\
+            .eq("id", file_id)\
+            .execute()
+
+    media_pipeline.submit(DerivativeJob(
+        source_url=storage_url,
+        media_kind="image",
+        bucket="brand-guides",
+        base_path=_stem(storage_path),
+        persist=persist
+    ))
+
+
+def schedule_hero_derivatives(reseller_id: str, bucket: str, file_path: str, public_url: str, media_type: str) -> None:
+    """
+    Hero image variants or video poster -> reseller_branding.hero_media_derivatives.
+
+    Only written while hero_media_url is still this source: a newer upload
+    may land before the job finishes and must not get stale derivatives.
+    """
+
+    async def persist(urls: DerivativeUrls) -> None:
+        response = get_supabase_service().client.table("reseller_branding")\
+            .update({"hero_media_derivatives": urls})\
+            .eq("reseller_id", reseller_id)\
+            .eq("hero_media_url", public_url)\
+            .execute()
+        if not response.data:
+            logger.info(f"Hero derivatives for {reseller_id} skipped: hero media replaced since {file_path}")
+            return
+        branding_cache.invalidate_reseller(reseller_id)
+
+    media_pipeline.submit(DerivativeJob(
+        source_url=public_url,
+        media_kind=media_type,
+        bucket=bucket,
+        base_path=_stem(file_path),
+        persist=persist
+    ))
+
+
+def schedule_generated_derivatives(content_id: str, client_id: str, source_url: str, media_type: str) -> None:
+    """
+    DALL·E / Fal outputs -> content_lab_generated.derivatives.
+
+    Provider URLs are short-lived, so variants are kept in our own bucket.
+    """
+
+    async def persist(urls: DerivativeUrls) -> None:
+        get_supabase_service().client.table("content_lab_generated")\
+            .update({"derivatives": urls})\
+            .eq("id", content_id)\
+            .execute()
+
+    media_pipeline.submit(DerivativeJob(
+        source_url=source_url,
+        media_kind=media_type,
+        bucket=GENERATED_BUCKET,
+        base_path=f"{client_id}/{content_id}",
+        persist=persist
+    ))
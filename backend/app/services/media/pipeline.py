@@ -0,0 +1,169 @@
+"""
+Media Derivative Pipeline
+Background thumbnails, WebP/AVIF variants and video posters in a process pool
+Filosofía: No velocity, only precision 🐢💎
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Set
+import asyncio
+import logging
+import os
+import threading
+
+import httpx
+
+from app.infrastructure.storage_streamer import IMMUTABLE_CACHE_SECONDS, stream_upload
+from app.infrastructure.supabase_service import get_supabase_service
+from app.services.media.derivatives import extract_video_poster, render_image_derivatives
+
+logger = logging.getLogger(__name__)
+
+MEDIA_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+# Generated/remote sources are downloaded once into memory before rendering
+MAX_SOURCE_BYTES = 25 * 1024 * 1024
+SOURCE_TIMEOUT_SECONDS = 60.0
+# Back-pressure: jobs downloading/rendering at once, and jobs accepted at all
+# (running + waiting); past the cap new jobs are dropped, derivatives are optional
+MEDIA_MAX_ACTIVE = MEDIA_WORKERS * 2
+MEDIA_MAX_PENDING = 32
+# Bucket for derivatives of AI-generated images (provider URLs expire)
+GENERATED_BUCKET = "generated-media"
+
+DerivativeUrls = Dict[str, str]
+
+
+@dataclass(frozen=True)
+class DerivativeJob:
+    """
+    One source to derive from.
+
+    Derivatives land in `bucket` at `{base_path}/{name}.{ext}`, next to the
+    original; `persist` receives name -> public URL once all are uploaded.
+    """
+    source_url: str
+    media_kind: str  # "image" | "video"
+    bucket: str
+    base_path: str
+    persist: Callable[[DerivativeUrls], Awaitable[None]]
+
+
+async def _download(url: str) -> bytes:
+    """Fetch a source image, refusing anything over MAX_SOURCE_BYTES."""
+    buffer = bytearray()
+    async with httpx.AsyncClient(timeout=SOURCE_TIMEOUT_SECONDS, follow_redirects=True) as client:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                buffer.extend(chunk)
+                if len(buffer) > MAX_SOURCE_BYTES:
+                    raise ValueError(f"Source larger than {MAX_SOURCE_BYTES} bytes: {url}")
+    return bytes(buffer)
+
+
+class MediaDerivativePipeline:
+    """
+    Fire-and-forget derivative generation.
+
+    Uploads and generations call submit() and return immediately; decoding
+    and encoding run in a small process pool so they never hold the event
+    loop or the GIL, and network I/O stays on the loop. At most max_active
+    jobs hold a source in memory at once; beyond max_pending accepted jobs,
+    submit() drops new ones (the original media is served as-is).
+    """
+
+    def __init__(
+        self,
+        workers: int = MEDIA_WORKERS,
+        max_active: int = MEDIA_MAX_ACTIVE,
+        max_pending: int = MEDIA_MAX_PENDING
+    ):
+        self._workers = workers
+        self._active = asyncio.Semaphore(max_active)
+        self._max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            return self._executor
+
+    def submit(self, job: DerivativeJob) -> bool:
+        """
+        Schedule a job on the running loop; failures are logged, never raised.
+
+        Returns:
+            False if the pipeline is full and the job was dropped
+        """
+        if len(self._tasks) >= self._max_pending:
+            logger.warning(
+                f"Media pipeline full ({len(self._tasks)} jobs), dropping derivatives for {job.bucket}/{job.base_path}"
+            )
+            return False
+        task = asyncio.get_running_loop().create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _run(self, job: DerivativeJob) -> Optional[DerivativeUrls]:
+        async with self._active:
+            return await self._derive(job)
+
+    async def _derive(self, job: DerivativeJob) -> Optional[DerivativeUrls]:
+        loop = asyncio.get_running_loop()
+        try:
+            if job.media_kind == "video":
+                rendered = await loop.run_in_executor(self._pool(), extract_video_poster, job.source_url)
+            else:
+                source = await _download(job.source_url)
+                rendered = await loop.run_in_executor(self._pool(), render_image_derivatives, source)
+
+            storage = get_supabase_service().client.storage.from_(job.bucket)
+            urls: DerivativeUrls = {}
+            for name, (data, extension, content_type) in rendered.items():
+                path = f"{job.base_path}/{name}.{extension}"
+                await stream_upload(
+                    bucket=job.bucket,
+                    path=path,
+                    chunks=data,
+                    size=len(data),
+                    content_type=content_type,
+                    cache_seconds=IMMUTABLE_CACHE_SECONDS
+                )
+                urls[name] = storage.get_public_url(path)
+
+            await job.persist(urls)
+            logger.info(f"Media derivatives ready for {job.bucket}/{job.base_path}: {sorted(urls)}")
+            return urls
+        except Exception as e:
+            logger.warning(f"Media derivatives failed for {job.source_url}: {e}")
+            return None
+
+    @property
+    def pending(self) -> int:
+        """Jobs accepted and not finished (running or waiting for a slot)."""
+        return len(self._tasks)
+
+    async def drain(self) -> None:
+        """Wait for in-flight jobs (shutdown)."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+# Global instance
+media_pipeline = MediaDerivativePipeline()
+
+
+async def shutdown_media_pipeline() -> None:
+    """Let in-flight derivatives finish, then stop the workers."""
+    await media_pipeline.drain()
+    media_pipeline.shutdown()
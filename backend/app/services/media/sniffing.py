@@ -0,0 +1,61 @@
+"""
+MIME Sniffing
+Content type detection from leading bytes (magic numbers)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Optional
+
+# Bytes needed to recognise every signature below
+SNIFF_BYTES = 16
+
+OLE2_TYPES = frozenset({"application/msword", "application/vnd.ms-powerpoint"})
+OOXML_TYPES = frozenset({
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+})
+# ISO-BMFF major brand (bytes 8-12, after "ftyp") -> type; other brands are unsupported
+FTYP_BRANDS = {
+    **dict.fromkeys((
+        b"isom", b"iso2", b"iso4", b"iso5", b"iso6", b"mp41", b"mp42", b"avc1", b"dash", b"M4V ", b"mmp4"
+    ), "video/mp4"),
+    b"qt  ": "video/quicktime",
+    b"M4A ": "audio/mp4",
+    b"avif": "image/avif",
+    b"avis": "image/avif",
+    **dict.fromkeys((b"heic", b"heix", b"heim", b"heis"), "image/heic"),
+    **dict.fromkeys((b"mif1", b"msf1"), "image/heif"),
+}
+
+
+def sniff_mime(head: bytes, declared: Optional[str] = None) -> Optional[str]:
+    """
+    Detect the real content type of an upload from its first bytes.
+
+    Container formats that several types share (OLE2 for .doc/.ppt, ZIP for
+    .docx/.pptx) only confirm the declared type when it belongs to that
+    family; they never invent a type on their own.
+
+    Args:
+        head: At least SNIFF_BYTES leading bytes (fewer for tiny files)
+        declared: Client-declared Content-Type
+
+    Returns:
+        Detected MIME type, or None if the bytes match no supported format
+    """
+    if head.startswith(b"%PDF-"):
+        return "application/pdf"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:8] == b"ftyp":
+        return FTYP_BRANDS.get(head[8:12])
+    if head.startswith(b"\x1a\x45\xdf\xa3"):
+        return "video/webm"
+    if head.startswith(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"):
+        return declared if declared in OLE2_TYPES else None
+    if head.startswith(b"PK\x03\x04"):
+        return declared if declared in OOXML_TYPES else None
+    return None
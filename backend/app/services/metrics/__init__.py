@@ -0,0 +1,30 @@
+"""
+Streaming metrics for agents, endpoints and prompt rendering
+"""
+from app.services.metrics.engine import (
+    METRIC_ERROR,
+    METRIC_LATENCY,
+    METRIC_RENDER,
+    SCOPE_AGENT,
+    SCOPE_ENDPOINT,
+    SCOPE_PROMPT,
+    MetricSummary,
+    MetricsEngine,
+    metrics_engine,
+)
+from app.services.metrics.running_stats import RunningStats
+from app.services.metrics.quantile_sketch import QuantileSketch
+
+__all__ = [
+    "METRIC_ERROR",
+    "METRIC_LATENCY",
+    "METRIC_RENDER",
+    "SCOPE_AGENT",
+    "SCOPE_ENDPOINT",
+    "SCOPE_PROMPT",
+    "MetricSummary",
+    "MetricsEngine",
+    "QuantileSketch",
+    "RunningStats",
+    "metrics_engine",
+]
@@ -0,0 +1,190 @@
+"""
+Metrics Engine
+In-process streaming statistics keyed by (scope, name, metric)
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple
+from pydantic import BaseModel
+import threading
+import logging
+import time
+
+from app.services.metrics.running_stats import RunningStats
+from app.services.metrics.quantile_sketch import QuantileSketch
+
+logger = logging.getLogger(__name__)
+
+SCOPE_AGENT = "agent"
+SCOPE_ENDPOINT = "endpoint"
+SCOPE_PROMPT = "prompt"
+METRIC_LATENCY = "latency_ms"
+METRIC_ERROR = "error"  # 1.0 per failure, 0.0 per success -> EWMA is the error rate
+METRIC_RENDER = "render_us"
+# A series' last z-score only counts as a current anomaly this long after its last observation
+ANOMALY_MAX_AGE_SECONDS = 300
+
+SeriesKey = Tuple[str, str, str]
+
+
+class MetricSummary(BaseModel):
+    """Point-in-time view of one metric series"""
+    scope: str
+    name: str
+    metric: str
+    count: int
+    mean: float
+    std: float
+    baseline: float
+    baseline_std: float
+    p50: float
+    p95: float
+    p99: float
+    last: float
+    last_z: Optional[float] = None
+    last_baseline: Optional[float] = None  # baseline last_z was scored against
+
+
+class MetricSeries:
+    """Running stats plus quantile sketch for one key"""
+
+    def __init__(self, stats: Optional[RunningStats] = None, sketch: Optional[QuantileSketch] = None):
+        self.stats = stats or RunningStats()
+        self.sketch = sketch or QuantileSketch()
+        # Restored series have no recent observation until updated
+        self.observed_at = 0.0
+
+    def update(self, value: float) -> None:
+        """O(1) update of both accumulators."""
+        self.stats.update(value)
+        self.sketch.add(value)
+        self.observed_at = time.monotonic()
+
+    def summarize(self, key: SeriesKey) -> MetricSummary:
+        """Build the read model for this series."""
+        scope, name, metric = key
+        last_z = self.stats.last_z
+        return MetricSummary(
+            scope=scope, name=name, metric=metric,
+            count=self.stats.count,
+            mean=round(self.stats.mean, 3),
+            std=round(self.stats.std, 3),
+            baseline=round(self.stats.ewma, 3),
+            baseline_std=round(self.stats.ewm_std, 3),
+            p50=round(self.sketch.quantile(0.50), 3),
+            p95=round(self.sketch.quantile(0.95), 3),
+            p99=round(self.sketch.quantile(0.99), 3),
+            last=self.stats.last,
+            last_z=round(last_z, 2) if last_z is not None else None,
+            last_baseline=round(self.stats.last_baseline, 3) if self.stats.last_baseline is not None else None,
+        )
+
+
+class MetricsEngine:
+    """
+    Thread-safe registry of MetricSeries.
+
+    observe() is O(1); queries read the running state directly, so the
+    monitor and Sentinel never have to scan metric history. Series touched
+    since the last snapshot are tracked so persistence only writes deltas.
+    """
+
+    def __init__(self):
+        self._series: Dict[SeriesKey, MetricSeries] = {}
+        self._dirty: Set[SeriesKey] = set()
+        self._lock = threading.Lock()
+
+    def observe(self, scope: str, name: str, metric: str, value: float) -> None:
+        """Record one observation for a series, creating it on first use."""
+        key = (scope, name, metric)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = MetricSeries(RunningStats(proportion=metric == METRIC_ERROR))
+            series.update(value)
+            self._dirty.add(key)
+
+    def observe_request(self, endpoint: str, latency_ms: float, failed: bool) -> None:
+        """Record latency and outcome of one HTTP request."""
+        self.observe(SCOPE_ENDPOINT, endpoint, METRIC_LATENCY, latency_ms)
+        self.observe(SCOPE_ENDPOINT, endpoint, METRIC_ERROR, 1.0 if failed else 0.0)
+
+    def observe_agent(self, agent_id: str, execution_time_ms: float, failed: bool) -> None:
+        """Record duration and outcome of one agent execution."""
+        self.observe(SCOPE_AGENT, agent_id, METRIC_LATENCY, execution_time_ms)
+        self.observe(SCOPE_AGENT, agent_id, METRIC_ERROR, 1.0 if failed else 0.0)
+
+    def observe_render(self, prompt_id: str, render_us: float) -> None:
+        """Record the cost of rendering one vault prompt template."""
+        self.observe(SCOPE_PROMPT, prompt_id, METRIC_RENDER, render_us)
+
+    def get(self, scope: str, name: str, metric: str) -> Optional[MetricSummary]:
+        """Summary of one series, or None if it has no observations yet."""
+        key = (scope, name, metric)
+        with self._lock:
+            series = self._series.get(key)
+            return series.summarize(key) if series else None
+
+    def summaries(self, scope: Optional[str] = None) -> List[MetricSummary]:
+        """Summaries of every series, optionally restricted to one scope."""
+        with self._lock:
+            return [
+                series.summarize(key)
+                for key, series in self._series.items()
+                if scope is None or key[0] == scope
+            ]
+
+    def anomalies(self, z_threshold: float = 3.0) -> List[MetricSummary]:
+        """
+        Series whose latest observation sits above z_threshold baseline std.
+
+        A series that went quiet after a spike stops being reported once
+        its last observation is older than ANOMALY_MAX_AGE_SECONDS.
+        """
+        recent = time.monotonic() - ANOMALY_MAX_AGE_SECONDS
+        with self._lock:
+            return [
+                series.summarize(key)
+                for key, series in self._series.items()
+                if series.observed_at >= recent
+                and series.stats.last_z is not None and series.stats.last_z >= z_threshold
+            ]
+
+    # Snapshot rows carry JSON state blobs — shape owned by RunningStats/QuantileSketch
+    def drain_snapshots(self) -> List[Dict[str, Any]]:
+        """Rows for every series changed since the last drain (clears the dirty set)."""
+        with self._lock:
+            rows = [
+                {
+                    "scope": key[0], "name": key[1], "metric": key[2],
+                    "stats": self._series[key].stats.to_dict(),
+                    "sketch": self._series[key].sketch.to_dict(),
+                }
+                for key in self._dirty
+            ]
+            self._dirty.clear()
+        return rows
+
+    def mark_dirty(self, rows: List[Dict[str, Any]]) -> None:
+        """Re-queue rows whose snapshot write failed."""
+        with self._lock:
+            self._dirty.update((r["scope"], r["name"], r["metric"]) for r in rows)
+
+    def restore(self, rows: List[Dict[str, Any]]) -> int:
+        """Load persisted state for series not yet observed in this process."""
+        restored = 0
+        with self._lock:
+            for row in rows:
+                key = (row["scope"], row["name"], row["metric"])
+                if key in self._series:
+                    continue
+                self._series[key] = MetricSeries(
+                    RunningStats.from_dict(row.get("stats") or {}, proportion=row["metric"] == METRIC_ERROR),
+                    QuantileSketch.from_dict(row.get("sketch") or {}),
+                )
+                restored += 1
+        logger.info(f"Metrics engine restored {restored} series")
+        return restored
+
+
+# Global instance
+metrics_engine = MetricsEngine()
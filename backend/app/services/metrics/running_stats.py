@@ -0,0 +1,146 @@
+"""
+Running Stats
+O(1) streaming mean/variance (Welford) plus an EWMA baseline
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Dict, Optional
+import math
+
+# Observations required before a baseline is trusted for anomaly scoring
+MIN_BASELINE_COUNT = 10
+# Floor on the baseline std used for z-scores: while the EWMA variance is
+# still building up (or the series has been constant) it is ~0 and the
+# first spike would otherwise be unscorable or infinitely far
+BASELINE_STD_FLOOR_RATIO = 0.1  # of |baseline|
+BASELINE_STD_FLOOR = 0.05  # absolute, for baselines near 0
+# Proportion (0/1 error) series: a spike needs this many failures in the
+# EWMA window and this rise over the baseline rate before it is scored
+MIN_SPIKE_FAILURES = 3
+MIN_SPIKE_RATE_DELTA = 0.05
+# Baseline rate used in the proportion test when the series has had no failures
+BASELINE_RATE_FLOOR = 0.01
+
+
+class RunningStats:
+    """
+    Streaming statistics for one metric series.
+
+    - Welford's algorithm for the all-time mean and variance
+    - EWMA mean/variance as a recency-weighted baseline that follows drift
+    - last value and its z-score against the baseline *before* it was
+      folded in, so anomaly checks are a field read, not a history scan
+
+    With proportion=True (0/1 error series) a single observation says
+    little, so the z-score is a one-proportion test of the recent (EWMA)
+    failure rate against the all-time rate, and only once the window
+    holds MIN_SPIKE_FAILURES failures and MIN_SPIKE_RATE_DELTA above it.
+    """
+
+    def __init__(self, alpha: float = 0.1, proportion: bool = False):
+        self.alpha = alpha
+        self.proportion = proportion
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.ewma = 0.0
+        self.ewm_var = 0.0
+        self.last = 0.0
+        self.last_z: Optional[float] = None
+        # Baseline last_z was scored against (before the last value was folded in)
+        self.last_baseline: Optional[float] = None
+
+    def update(self, value: float) -> None:
+        """Fold one observation into every accumulator (last_z is replaced every time)."""
+        scored = self.count >= MIN_BASELINE_COUNT
+        if self.proportion:
+            self.last_baseline = self.mean if scored else None
+        else:
+            self.last_baseline = self.ewma if scored else None
+            self.last_z = self.zscore(value)
+        self.last = value
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if self.count == 1:
+            self.ewma = value
+        else:
+            diff = value - self.ewma
+            increment = self.alpha * diff
+            self.ewma += increment
+            self.ewm_var = (1 - self.alpha) * (self.ewm_var + diff * increment)
+
+        if self.proportion:
+            self.last_z = self._proportion_z(self.last_baseline)
+
+    def _proportion_z(self, baseline: Optional[float]) -> Optional[float]:
+        """Recent (EWMA) rate vs the pre-update all-time rate, in binomial std units."""
+        if baseline is None:
+            return None
+        window = (2 - self.alpha) / self.alpha  # effective EWMA sample size
+        if self.ewma * window < MIN_SPIKE_FAILURES or self.ewma - baseline < MIN_SPIKE_RATE_DELTA:
+            return None
+        rate = min(max(baseline, BASELINE_RATE_FLOOR), 1 - BASELINE_RATE_FLOOR)
+        return (self.ewma - rate) / math.sqrt(rate * (1 - rate) / window)
+
+    @property
+    def variance(self) -> float:
+        """Population variance of all observations."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of all observations."""
+        return math.sqrt(self.variance)
+
+    @property
+    def ewm_std(self) -> float:
+        """Standard deviation around the EWMA baseline."""
+        return math.sqrt(self.ewm_var)
+
+    def zscore(self, value: float) -> Optional[float]:
+        """
+        Distance of value from the EWMA baseline in baseline std units
+        (std floored at BASELINE_STD_FLOOR_RATIO/BASELINE_STD_FLOOR).
+
+        Returns:
+            None until MIN_BASELINE_COUNT observations exist
+        """
+        if self.count < MIN_BASELINE_COUNT:
+            return None
+        floor = max(BASELINE_STD_FLOOR_RATIO * abs(self.ewma), BASELINE_STD_FLOOR)
+        return (value - self.ewma) / max(self.ewm_std, floor)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Serializable state for snapshots."""
+        return {
+            "alpha": self.alpha,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+            "ewma": self.ewma,
+            "ewm_var": self.ewm_var,
+            "last": self.last,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float], proportion: bool = False) -> "RunningStats":
+        """Rebuild state from a snapshot produced by to_dict()."""
+        stats = cls(alpha=float(data.get("alpha", 0.1)), proportion=proportion)
+        stats.count = int(data.get("count", 0))
+        stats.mean = float(data.get("mean", 0.0))
+        stats.m2 = float(data.get("m2", 0.0))
+        stats.min = float(data["min"]) if stats.count else math.inf
+        stats.max = float(data["max"]) if stats.count else -math.inf
+        stats.ewma = float(data.get("ewma", 0.0))
+        stats.ewm_var = float(data.get("ewm_var", 0.0))
+        stats.last = float(data.get("last", 0.0))
+        return stats
@@ -0,0 +1,49 @@
+"""
+Metrics Snapshots
+Periodic persistence and startup restore of the metrics engine
+Filosofía: No velocity, only precision 🐢💎
+"""
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.metric_snapshot_repository import MetricSnapshotRepository
+from app.services.metrics.engine import metrics_engine
+
+logger = logging.getLogger(__name__)
+
+
+async def flush_metric_snapshots() -> int:
+    """
+    Write every series changed since the last flush in one upsert.
+
+    Failed writes are re-queued so the next flush retries them.
+
+    Returns:
+        Number of series persisted
+    """
+    rows = metrics_engine.drain_snapshots()
+    if not rows:
+        return 0
+    try:
+        written = MetricSnapshotRepository(get_supabase_service()).upsert_many(rows)
+        logger.info(f"Metric snapshots flushed: {written} series")
+        return written
+    except Exception as e:
+        metrics_engine.mark_dirty(rows)
+        logger.error(f"Error flushing metric snapshots: {e}")
+        return 0
+
+
+async def restore_metric_snapshots() -> int:
+    """
+    Seed the engine with persisted baselines so a restart keeps its history.
+
+    Returns:
+        Number of series restored
+    """
+    try:
+        rows = MetricSnapshotRepository(get_supabase_service()).find_all()
+        return metrics_engine.restore(rows)
+    except Exception as e:
+        logger.warning(f"Metric snapshots not restored: {e}")
+        return 0
@@ -0,0 +1,19 @@
+"""
+NOVA briefing: concurrently loaded sections served from an in-memory snapshot
+"""
+from app.services.nova_briefing.sections import SECTIONS, client_health
+from app.services.nova_briefing.snapshot import (
+    BriefingSnapshot,
+    mark_briefing_stale,
+    nova_briefing,
+    refresh_nova_briefing,
+)
+
+__all__ = [
+    "SECTIONS",
+    "BriefingSnapshot",
+    "client_health",
+    "mark_briefing_stale",
+    "nova_briefing",
+    "refresh_nova_briefing",
+]
@@ -0,0 +1,140 @@
+"""
+NOVA Briefing Sections
+One loader per briefing section; sync Supabase calls run in worker threads
+so every section (and the queries inside system_status) run concurrently
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.services.prompt_vault import get_vault_stats
+
+logger = logging.getLogger(__name__)
+
+# Client health buckets (health_score)
+HEALTHY_SCORE = 80
+AT_RISK_SCORE = 50
+# SENTINEL score needed to deploy
+DEPLOY_MIN_SCORE = 70
+
+
+async def _execute(query) -> Any:
+    """Run a built PostgREST query off the event loop."""
+    return await asyncio.to_thread(query.execute)
+
+
+def _table(name: str):
+    return get_supabase_service().client.table(name)
+
+
+async def load_nova_memory() -> List[Dict[str, Any]]:
+    """NOVA memory, last 20 entries by priority"""
+    mem = await _execute(
+        _table("omega_agent_memory")
+        .select("memory_type,content,priority,related_agents,expires_at,created_at")
+        .eq("agent_code", "NOVA")
+        .order("priority", desc=True)
+        .order("created_at", desc=True)
+        .limit(20)
+    )
+    return mem.data or []
+
+
+def client_health(clients: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Health buckets and MRR in one pass over the clients"""
+    healthy = at_risk = churn_risk = 0
+    mrr = 0.0
+    for client in clients:
+        score = client.get("health_score") or 0
+        if score >= HEALTHY_SCORE:
+            healthy += 1
+        elif score >= AT_RISK_SCORE:
+            at_risk += 1
+        else:
+            churn_risk += 1
+        mrr += float(client.get("mrr") or 0)
+    return {
+        "total_clients": len(clients),
+        "healthy_clients": healthy,
+        "at_risk_clients": at_risk,
+        "churn_risk_clients": churn_risk,
+        "mrr_current": round(mrr, 2),
+    }
+
+
+async def load_system_status() -> Dict[str, Any]:
+    """Security (latest SENTINEL scan), client health, MRR and agents registered"""
+    scan, clients, agents_count = await asyncio.gather(
+        _execute(_table("sentinel_scans").select("security_score,status").order("created_at", desc=True).limit(1)),
+        _execute(_table("clients").select("id,health_score,mrr")),
+        _execute(_table("omega_agents").select("id", count="exact").limit(1)),
+    )
+    latest: Optional[Dict[str, Any]] = scan.data[0] if scan.data else None
+    return {
+        "security_score": latest.get("security_score") if latest else None,
+        "security_status": latest.get("status") if latest else "unknown",
+        "deploy_allowed": ((latest.get("security_score") or 0) >= DEPLOY_MIN_SCORE) if latest else True,
+        **client_health(clients.data or []),
+        "agents_registered": agents_count.count or 0,
+    }
+
+
+async def load_active_agents() -> List[Dict[str, Any]]:
+    agents = await _execute(
+        _table("omega_agents")
+        .select("code,name,title,status,seed_memory_loaded,department")
+        .eq("is_active", True)
+        .order("code")
+    )
+    return agents.data or []
+
+
+async def load_departments() -> List[Dict[str, Any]]:
+    depts = await _execute(_table("omega_departments").select("name,director_code,color,mission"))
+    return depts.data or []
+
+
+async def load_context_documents() -> List[Dict[str, Any]]:
+    """Metadata only, no full content"""
+    docs = await _execute(_table("context_documents").select("name,scope,department"))
+    return [
+        {"name": d.get("name"), "scope": d.get("scope"), "department": d.get("department")}
+        for d in (docs.data or [])
+    ]
+
+
+async def load_pending_alerts() -> List[Dict[str, Any]]:
+    alerts = await _execute(
+        _table("nova_data")
+        .select("data_type,content,created_at")
+        .eq("data_type", "alert")
+        .order("created_at", desc=True)
+        .limit(10)
+    )
+    return alerts.data or []
+
+
+async def load_prompt_vault_stats() -> Dict[str, Any]:
+    """From the shared prompt_vault_stats RPC + TTL cache"""
+    stats = await get_vault_stats()
+    by_vertical = stats.get("by_vertical") or {}
+    return {
+        "total_prompts": stats.get("active", 0),
+        "avg_score": stats.get("avg_score", 0),
+        "verticals_covered": list(by_vertical),
+        "top_vertical": max(by_vertical, key=by_vertical.get) if by_vertical else None,
+    }
+
+
+# Briefing section name -> loader, in response order
+SECTIONS: Dict[str, Callable[[], Awaitable[Any]]] = {
+    "nova_memory": load_nova_memory,
+    "system_status": load_system_status,
+    "active_agents": load_active_agents,
+    "departments": load_departments,
+    "context_documents": load_context_documents,
+    "pending_alerts": load_pending_alerts,
+    "prompt_vault_stats": load_prompt_vault_stats,
+}
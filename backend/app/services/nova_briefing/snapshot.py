@@ -0,0 +1,154 @@
+"""
+NOVA Briefing Snapshot
+Precomputed briefing kept in memory: sections refreshed concurrently, on a
+timer and right after the writes that change them
+Filosofía: No velocity, only precision 🐢💎
+"""
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+import asyncio
+import logging
+import threading
+import time
+
+from app.config import settings
+from app.services.nova_briefing.sections import SECTIONS
+
+logger = logging.getLogger(__name__)
+
+
+class BriefingSnapshot:
+    """
+    The NOVA briefing as a snapshot of independently refreshed sections.
+
+    get() serves the snapshot without touching the database, except for
+    sections marked stale by a write and on the very first call. Every
+    write bumps its sections' version; a section is fresh only once a load
+    that *started* after the write has finished, so a reader arriving after
+    mark_stale waits for such a load even if an older refresh is in flight.
+    Sections older than max_age are reloaded in the background while the
+    current values are served. A failed section keeps its last value (None
+    if it never loaded) until the next refresh.
+
+    The snapshot is per process: writes made by another process (a second
+    worker, a script) are only picked up by the max_age refresh, so their
+    staleness is bounded by NOVA_BRIEFING_REFRESH_MINUTES.
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Awaitable[Any]]], max_age_seconds: float):
+        self.loaders = loaders
+        self.max_age_seconds = max_age_seconds
+        # Sections are replaced, never mutated, so readers can share them
+        self._sections: Dict[str, Any] = {name: None for name in loaders}
+        self._loaded_at: Dict[str, float] = {}
+        self._refreshed_at: Optional[str] = None
+        # Writes seen per section vs. writes covered by its last finished load
+        self._written: Dict[str, int] = {name: 1 for name in loaders}
+        self._covered: Dict[str, int] = {name: 0 for name in loaders}
+        self._stale_lock = threading.Lock()
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._background: Optional[asyncio.Task] = None
+
+    def mark_stale(self, *sections: str) -> None:
+        """
+        Flag sections changed by a write (thread-safe). With an event loop
+        running they are reloaded right away in the background.
+        """
+        unknown = set(sections) - set(self.loaders)
+        if unknown:
+            raise ValueError(f"Unknown briefing sections: {', '.join(sorted(unknown))}")
+        with self._stale_lock:
+            for name in sections:
+                self._written[name] += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_in_background()
+
+    def stale(self) -> Set[str]:
+        """Sections with a write no finished load has covered yet."""
+        with self._stale_lock:
+            return {name for name in self.loaders if self._covered[name] < self._written[name]}
+
+    def expired(self) -> Set[str]:
+        now = time.monotonic()
+        return {name for name in self.loaders if now - self._loaded_at.get(name, 0.0) >= self.max_age_seconds}
+
+    async def get(self) -> Dict[str, Any]:
+        """Current briefing: timestamp, snapshot_at and one key per section."""
+        if self.stale():
+            # Waits out any in-flight refresh, then loads what it did not cover
+            await self.refresh()
+        elif self.expired():
+            self._refresh_in_background()
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "snapshot_at": self._refreshed_at,
+            **self._sections,
+        }
+
+    async def refresh(self, sections: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+        """
+        Reload sections concurrently (default: stale or expired ones).
+
+        Returns:
+            Section -> loaded successfully
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            names = set(sections) if sections is not None else self.stale() | self.expired()
+            with self._stale_lock:
+                # Writes landing while we load stay uncovered (the next get() reloads)
+                versions = {name: self._written[name] for name in names}
+            if not names:
+                return {}
+            ordered = [name for name in self.loaders if name in names]
+            start = time.perf_counter()
+            results = await asyncio.gather(*(self.loaders[name]() for name in ordered), return_exceptions=True)
+
+            loaded_at = time.monotonic()
+            outcome: Dict[str, bool] = {}
+            for name, value in zip(ordered, results):
+                self._loaded_at[name] = loaded_at
+                with self._stale_lock:
+                    self._covered[name] = max(self._covered[name], versions[name])
+                outcome[name] = not isinstance(value, BaseException)
+                if outcome[name]:
+                    self._sections[name] = value
+                else:
+                    logger.warning(f"Failed to refresh NOVA briefing section {name}: {value}")
+            self._refreshed_at = datetime.utcnow().isoformat()
+            logger.info(
+                f"NOVA briefing refreshed {sum(outcome.values())}/{len(ordered)} sections "
+                f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+            return outcome
+
+    def _refresh_in_background(self) -> None:
+        """One background refresh at a time; it picks up everything stale when it runs."""
+        loop = asyncio.get_running_loop()
+        if self._background is not None and not self._background.done() and self._background.get_loop() is loop:
+            return
+        self._background = loop.create_task(self._refresh_quietly())
+
+    async def _refresh_quietly(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.error(f"Error refreshing NOVA briefing: {e}")
+
+
+# Global instance
+nova_briefing = BriefingSnapshot(SECTIONS, settings.nova_briefing_refresh_minutes * 60)
+
+
+async def refresh_nova_briefing() -> None:
+    """Scheduler job: reload every section (first run warms the snapshot at startup)."""
+    await nova_briefing.refresh(nova_briefing.loaders)
+
+
+def mark_briefing_stale(*sections: str) -> None:
+    """Call after a write that changes what a briefing section shows."""
+    nova_briefing.mark_stale(*sections)
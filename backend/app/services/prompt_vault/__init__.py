@@ -0,0 +1,41 @@
+"""
+Prompt Vault services: selection index, templates, stats, performance and usage
+"""
+from app.services.prompt_vault.index import PromptVaultIndex, prompt_vault_index
+from app.services.prompt_vault.usage import (
+    PromptUsageCounter,
+    flush_prompt_usage,
+    prompt_usage_counter,
+)
+from app.services.prompt_vault.performance import (
+    apply_performance_signals,
+    fold_performance_signals,
+)
+from app.services.prompt_vault.selector import refresh_prompt_index, select_optimal_prompt
+from app.services.prompt_vault.stats import get_vault_stats, invalidate_vault_stats
+from app.services.prompt_vault.template import (
+    TEMPLATE_PLACEHOLDERS,
+    RenderPlan,
+    TemplateError,
+    compile_template,
+    get_render_plan,
+)
+
+__all__ = [
+    "TEMPLATE_PLACEHOLDERS",
+    "PromptUsageCounter",
+    "PromptVaultIndex",
+    "RenderPlan",
+    "TemplateError",
+    "apply_performance_signals",
+    "compile_template",
+    "flush_prompt_usage",
+    "fold_performance_signals",
+    "get_render_plan",
+    "get_vault_stats",
+    "invalidate_vault_stats",
+    "prompt_usage_counter",
+    "prompt_vault_index",
+    "refresh_prompt_index",
+    "select_optimal_prompt",
+]
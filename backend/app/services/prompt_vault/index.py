@@ -0,0 +1,107 @@
+"""
+Prompt Vault Index
+In-process, pre-sorted lookup tables for vault prompt selection
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+import logging
+
+from app.services.prompt_vault.template import TemplateError, get_render_plan
+
+logger = logging.getLogger(__name__)
+
+GENERIC_VERTICAL = "generic"
+
+ExactKey = Tuple[str, str, str, str]  # (category, vertical, platform, agent_code)
+VerticalKey = Tuple[str, str, str]  # (category, vertical, agent_code)
+
+
+class PromptVaultIndex:
+    """
+    Active prompts keyed for the 3-tier fallback (exact → vertical → generic).
+    Templates are compiled while indexing; rows that fail are left out.
+
+    Each bucket is sorted by performance_score once at load time, so a
+    selection is at most three dict lookups and never touches the DB.
+    The whole index is swapped atomically on reload; readers never see a
+    half-built table.
+    """
+
+    def __init__(self):
+        self._exact: Dict[ExactKey, List[Dict[str, Any]]] = {}
+        self._by_vertical: Dict[VerticalKey, List[Dict[str, Any]]] = {}
+        self._version: Optional[int] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    # Vault rows are passed through untouched to the prompt builders
+    def load(self, rows: List[Dict[str, Any]], version: Optional[int]) -> int:
+        """
+        Replace the index with a fresh set of active prompt rows.
+
+        Returns:
+            Number of prompts indexed
+        """
+        exact: Dict[ExactKey, List[Dict[str, Any]]] = {}
+        by_vertical: Dict[VerticalKey, List[Dict[str, Any]]] = {}
+        for row in rows:
+            if not row.get("is_active", True):
+                continue
+            try:
+                get_render_plan(row.get("prompt_text") or "")
+            except TemplateError as e:
+                logger.warning(f"Prompt {row.get('id')} not indexed: {e}")
+                continue
+            category, vertical, agent = row["category"], row["vertical"], row["agent_code"]
+            exact.setdefault((category, vertical, row.get("platform"), agent), []).append(row)
+            by_vertical.setdefault((category, vertical, agent), []).append(row)
+
+        for bucket in (*exact.values(), *by_vertical.values()):
+            bucket.sort(key=lambda r: r.get("performance_score") or 0.0, reverse=True)
+
+        with self._lock:
+            self._exact, self._by_vertical = exact, by_vertical
+            self._version, self._loaded = version, True
+        logger.info(f"Prompt vault index loaded: {len(rows)} prompts (version={version})")
+        return len(rows)
+
+    def select(
+        self, category: str, vertical: str, platform: str, agent_code: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Best prompt by performance_score with the vault's fallback order.
+
+        Returns:
+            (prompt copy, tier) where tier is "exact" | "vertical" | "generic",
+            or (None, None) when nothing matches
+        """
+        with self._lock:
+            candidates = (
+                ("exact", self._exact.get((category, vertical, platform, agent_code))),
+                ("vertical", self._by_vertical.get((category, vertical, agent_code))),
+                ("generic", self._by_vertical.get((category, GENERIC_VERTICAL, agent_code))),
+            )
+            for tier, bucket in candidates:
+                if bucket:
+                    prompt = bucket[0]
+                    prompt["times_used"] = (prompt.get("times_used") or 0) + 1
+                    return dict(prompt), tier
+        return None, None
+
+    def invalidate(self) -> None:
+        """Force a reload before the next selection (called after local writes)."""
+        with self._lock:
+            self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._version
+
+
+# Global instance
+prompt_vault_index = PromptVaultIndex()
@@ -0,0 +1,92 @@
+"""
+Prompt Vault Performance
+Folds engagement signals into per-prompt EWMA deltas applied in one statement
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, List, Sequence
+import logging
+
+import numpy as np
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
+from app.services.analytics_arrays import factorize
+
+logger = logging.getLogger(__name__)
+
+# new_score = old * SCORE_KEEP + engagement_rate * SCORE_SCALE * (1 - SCORE_KEEP)
+SCORE_KEEP = 0.7
+SCORE_SCALE = 10.0
+
+
+def fold_performance_signals(
+    prompt_ids: Sequence[str],
+    engagement_rates: Sequence[float],
+) -> List[Dict[str, Any]]:
+    """
+    Collapse an ordered signal stream into one affine delta per prompt.
+
+    Applying k signals r_1..r_k one by one gives
+        score_k = score_0 * KEEP^k + sum_i (1 - KEEP) * SCALE * r_i * KEEP^(k-i)
+    so each prompt reduces to (decay, increment) and the DB applies
+    score * decay + increment. Deltas compose, which keeps concurrent
+    batches exact without reading the current score.
+
+    Args:
+        prompt_ids: Prompt per signal, in arrival order
+        engagement_rates: Engagement rate per signal (0.0 to 1.0)
+
+    Returns:
+        Rows with prompt_id, decay, increment, rate_sum and signals
+    """
+    if not prompt_ids:
+        return []
+    codes, unique_ids = factorize(prompt_ids)
+    rates = np.asarray(engagement_rates, dtype=np.float64)
+    groups = len(unique_ids)
+
+    signals = np.bincount(codes, minlength=groups)
+    # Position of each signal within its prompt, counted from the newest
+    order = np.argsort(codes, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(signals)[:-1]))
+    position = np.empty(codes.size, dtype=np.int64)
+    position[order] = np.arange(codes.size) - starts[codes[order]]
+    age = signals[codes] - 1 - position
+
+    weights = (1 - SCORE_KEEP) * SCORE_SCALE * rates * np.power(SCORE_KEEP, age)
+    increment = np.bincount(codes, weights=weights, minlength=groups)
+    rate_sum = np.bincount(codes, weights=rates, minlength=groups)
+    decay = np.power(SCORE_KEEP, signals)
+
+    return [
+        {
+            "prompt_id": unique_ids[g],
+            "decay": float(decay[g]),
+            "increment": float(increment[g]),
+            "rate_sum": float(rate_sum[g]),
+            "signals": int(signals[g]),
+        }
+        for g in range(groups)
+    ]
+
+
+# RPC rows: id, performance_score, engagement_avg, engagement_count, times_used
+async def apply_performance_signals(
+    prompt_ids: Sequence[str],
+    engagement_rates: Sequence[float],
+) -> List[Dict[str, Any]]:
+    """
+    Fold signals in memory and apply them in one set-based RPC.
+
+    Returns:
+        Updated prompt rows (prompts that no longer exist are absent)
+    """
+    deltas = fold_performance_signals(prompt_ids, engagement_rates)
+    if not deltas:
+        return []
+    updated = PromptVaultRepository(get_supabase_service()).apply_performance_deltas(deltas)
+    logger.info(
+        f"Prompt performance applied: {len(prompt_ids)} signals -> "
+        f"{len(updated)}/{len(deltas)} prompts"
+    )
+    return updated
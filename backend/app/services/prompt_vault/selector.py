@@ -0,0 +1,67 @@
+"""
+Prompt Vault Selector
+Zero-round-trip prompt selection backed by the in-process index
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, Optional
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
+from app.services.prompt_vault.index import prompt_vault_index
+from app.services.prompt_vault.usage import prompt_usage_counter
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_prompt_index(force: bool = False) -> bool:
+    """
+    Reload the index when the vault version stamp moved (or when forced).
+
+    Checking costs one single-row read; the full reload only happens after
+    a selectable column changed somewhere (any worker, any writer).
+
+    Returns:
+        True if the index was reloaded
+    """
+    repository = PromptVaultRepository(get_supabase_service())
+    try:
+        version = repository.get_version()
+    except Exception as e:
+        # Without the version table every refresh is a reload
+        logger.warning(f"Prompt vault version unavailable: {e}")
+        version = None
+
+    if not force and prompt_vault_index.loaded and version is not None \
+            and version == prompt_vault_index.version:
+        return False
+    try:
+        prompt_vault_index.load(repository.find_active(), version)
+        return True
+    except Exception as e:
+        logger.error(f"Error loading prompt vault index: {e}")
+        return False
+
+
+# Vault rows are returned as stored; builders read prompt_text/id/name
+async def select_optimal_prompt(
+    category: str, vertical: str, platform: str, agent_code: str
+) -> Optional[Dict[str, Any]]:
+    """
+    3-tier fallback: exact → vertical → generic, best performance_score first.
+
+    O(1) dict lookups; the DB is only touched to build the index on first
+    use or after a local invalidation. Usage is counted in memory and
+    flushed by the scheduler.
+    """
+    if not prompt_vault_index.loaded:
+        await refresh_prompt_index(force=True)
+
+    prompt, tier = prompt_vault_index.select(category, vertical, platform, agent_code)
+    if prompt is None:
+        logger.warning(f"No vault prompt for {category}/{vertical}, using default")
+        return None
+
+    prompt_usage_counter.record(prompt["id"])
+    logger.info(f"{tier.capitalize()} match: {prompt['name']} (score={prompt['performance_score']})")
+    return prompt
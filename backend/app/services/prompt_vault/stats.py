@@ -0,0 +1,47 @@
+"""
+Prompt Vault Stats
+Aggregate vault statistics with a short TTL cache shared by every caller
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Any, Dict, Optional
+import time
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
+
+logger = logging.getLogger(__name__)
+
+# Cache for vault stats (prompt stats endpoint + NOVA briefing)
+_stats_cache: Optional[Dict[str, Any]] = None
+_stats_cache_time: Optional[float] = None
+STATS_CACHE_TTL_SECONDS = 30
+
+
+# RPC JSONB: total, active, avg_score, percentiles{p25..p90}, by_vertical{name: count}
+async def get_vault_stats() -> Dict[str, Any]:
+    """
+    Vault aggregates from the prompt_vault_stats RPC, cached for a few seconds.
+
+    Returns:
+        Dict with total, active, avg_score, percentiles and by_vertical
+
+    Raises:
+        Exception: If the RPC fails and nothing is cached yet
+    """
+    global _stats_cache, _stats_cache_time
+    now = time.monotonic()
+    if _stats_cache is not None and _stats_cache_time is not None \
+            and now - _stats_cache_time < STATS_CACHE_TTL_SECONDS:
+        return _stats_cache
+
+    stats = PromptVaultRepository(get_supabase_service()).get_stats()
+    _stats_cache, _stats_cache_time = stats, now
+    logger.info(f"Prompt vault stats refreshed: {stats.get('active', 0)} active prompts")
+    return stats
+
+
+def invalidate_vault_stats() -> None:
+    """Drop the cached stats so the next read hits the RPC."""
+    global _stats_cache, _stats_cache_time
+    _stats_cache, _stats_cache_time = None, None
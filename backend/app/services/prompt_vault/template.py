@@ -0,0 +1,91 @@
+"""
+Prompt Vault Templates
+Write-time validation and cached render plans for vault prompt_text
+Filosofía: No velocity, only precision 🐢💎
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, FrozenSet, Optional, Tuple
+
+# Values ContentLabPromptService supplies when rendering a vault prompt
+TEMPLATE_PLACEHOLDERS: FrozenSet[str] = frozenset({
+    "brief", "platform", "audience", "tone", "client_name", "language", "goal"
+})
+RENDER_PLAN_CACHE_SIZE = 1024
+
+_formatter = Formatter()
+
+
+class TemplateError(ValueError):
+    """Vault prompt_text that cannot be rendered with the supported placeholders"""
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """
+    Pre-parsed template: literal text interleaved with placeholder names.
+
+    Rendering is a single join over the segments — no parsing, no
+    format-spec handling, no KeyError path at request time.
+    """
+    segments: Tuple[Tuple[str, Optional[str]], ...]
+    placeholders: FrozenSet[str]
+
+    def render(self, values: Dict[str, str]) -> str:
+        """Fill every placeholder from values (all are guaranteed supported)."""
+        parts = []
+        for literal, field in self.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+
+def compile_template(prompt_text: str) -> RenderPlan:
+    """
+    Parse and validate a vault template.
+
+    Only bare named placeholders from TEMPLATE_PLACEHOLDERS are accepted;
+    positional fields, attribute/index access, conversions and format
+    specs are rejected so a stored prompt can never fail (or reach into
+    objects) when rendered.
+
+    Args:
+        prompt_text: Raw template with {placeholder} fields and {{ }} escapes
+
+    Returns:
+        RenderPlan for the template
+
+    Raises:
+        TemplateError: If the template is malformed or uses unsupported fields
+    """
+    try:
+        parsed = list(_formatter.parse(prompt_text))
+    except ValueError as e:
+        raise TemplateError(f"Malformed template: {e}")
+
+    segments = []
+    for literal, field, spec, conversion in parsed:
+        if field is None:
+            segments.append((literal, None))
+            continue
+        if not field.isidentifier():
+            raise TemplateError(f"Unsupported placeholder '{{{field}}}' (use a plain name)")
+        if spec or conversion:
+            raise TemplateError(f"Placeholder '{{{field}}}' cannot use a format spec or conversion")
+        if field not in TEMPLATE_PLACEHOLDERS:
+            supported = ", ".join(sorted(TEMPLATE_PLACEHOLDERS))
+            raise TemplateError(f"Unknown placeholder '{{{field}}}'. Supported: {supported}")
+        segments.append((literal, field))
+
+    return RenderPlan(
+        segments=tuple(segments),
+        placeholders=frozenset(f for _, f in segments if f is not None),
+    )
+
+
+@lru_cache(maxsize=RENDER_PLAN_CACHE_SIZE)
+def get_render_plan(prompt_text: str) -> RenderPlan:
+    """Compiled plan for a template, parsed once per distinct text."""
+    return compile_template(prompt_text)
@@ -0,0 +1,61 @@
+"""
+Prompt Vault Usage
+Accumulates prompt selections in memory and flushes them as atomic increments
+Filosofía: No velocity, only precision 🐢💎
+"""
+from typing import Dict
+from collections import Counter
+import threading
+import logging
+
+from app.infrastructure.supabase_service import get_supabase_service
+from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PromptUsageCounter:
+    """Thread-safe prompt_id -> selections since the last flush"""
+
+    def __init__(self):
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, prompt_id: str) -> None:
+        with self._lock:
+            self._counts[prompt_id] += 1
+
+    def drain(self) -> Dict[str, int]:
+        """Take every pending count and reset."""
+        with self._lock:
+            counts, self._counts = dict(self._counts), Counter()
+        return counts
+
+    def requeue(self, counts: Dict[str, int]) -> None:
+        """Put back counts whose flush failed."""
+        with self._lock:
+            self._counts.update(counts)
+
+
+# Global instance
+prompt_usage_counter = PromptUsageCounter()
+
+
+async def flush_prompt_usage() -> int:
+    """
+    Apply accumulated selections as one `times_used = times_used + n` RPC.
+
+    Returns:
+        Number of prompts updated
+    """
+    counts = prompt_usage_counter.drain()
+    if not counts:
+        return 0
+    try:
+        updated = PromptVaultRepository(get_supabase_service()).increment_usage_many(counts)
+        logger.info(f"Prompt usage flushed: {updated} prompts, {sum(counts.values())} selections")
+        return updated
+    except Exception as e:
+        prompt_usage_counter.requeue(counts)
+        logger.error(f"Error flushing prompt usage: {e}")
+        return 0
@@ -2,10 +2,12 @@
 Sentiment Processor
 Pure sentiment analysis and text processing logic
 """
-from typing import List
+from typing import List, Set
 from pydantic import BaseModel
 import re
 
+from app.services.lexicons import LanguageDetector, LexiconPack, language_detector
+
 
 class SentimentResult(BaseModel):
     """Sentiment analysis result"""
@@ -32,47 +34,16 @@ class CommentAnalysis(BaseModel):
 
 
 class SentimentProcessor:
-    """Service for sentiment analysis and text processing"""
-    
-    def __init__(self):
-        # Positive/negative word lists for simple sentiment
-        self.positive_words = {
-            'love', 'great', 'awesome', 'excellent', 'amazing', 'perfect',
-            'wonderful', 'fantastic', 'best', 'good', 'nice', 'beautiful',
-            'thank', 'thanks', 'appreciate', 'helpful', 'impressed'
-        }
-        
-        self.negative_words = {
-            'hate', 'terrible', 'awful', 'horrible', 'worst', 'bad',
-            'poor', 'disappointing', 'disappointed', 'angry', 'frustrated',
-            'useless', 'waste', 'scam', 'fraud', 'never', 'refund'
-        }
-        
-        self.question_words = {
-            'how', 'what', 'when', 'where', 'why', 'who', 'which',
-            'can', 'could', 'would', 'should', 'is', 'are', 'do', 'does'
-        }
-        
-        self.complaint_words = {
-            'problem', 'issue', 'broken', 'not working', 'error', 'bug',
-            'complaint', 'disappointed', 'refund', 'cancel', 'unsubscribe'
-        }
-        
-        self.praise_words = {
-            'love', 'amazing', 'excellent', 'perfect', 'best', 'thank',
-            'appreciate', 'wonderful', 'fantastic', 'impressed'
-        }
-        
-        self.spam_indicators = {
-            'click here', 'buy now', 'limited time', 'act now', 'free money',
-            'winner', 'congratulations', 'claim', 'prize', 'discount code'
-        }
-        
-        self.urgent_words = {
-            'urgent', 'emergency', 'asap', 'immediately', 'critical',
-            'serious', 'help', 'please help', 'crisis', 'danger'
-        }
-    
+    """
+    Service for sentiment analysis and text processing
+
+    Word lists come from per-language lexicon packs; each comment is routed
+    to its pack by the trigram language detector before scoring.
+    """
+
+    def __init__(self, detector: LanguageDetector = language_detector):
+        self.detector = detector
+
     def analyze_comment(self, text: str) -> CommentAnalysis:
         """
         Analyze comment for sentiment, intent, and urgency
@@ -84,21 +55,22 @@ class SentimentProcessor:
             Complete comment analysis
         """
         text_lower = text.lower()
-        
+
+        # Language detection routes the comment to its lexicon pack
+        pack = self.detector.detect_pack(text_lower)
+        words = set(text_lower.split())
+
         # Sentiment analysis
-        sentiment = self._calculate_sentiment(text_lower)
+        sentiment = self._calculate_sentiment(words, pack)
         
         # Intent detection
-        intent = self._detect_intent(text_lower)
-        
-        # Language detection (simple)
-        language = self._detect_language(text)
+        intent = self._detect_intent(text_lower, words, pack)
         
         # Extract keywords
-        keywords = self._extract_keywords(text_lower)
+        keywords = self._extract_keywords(text_lower, pack)
         
         # Calculate urgency
-        urgency_score = self._calculate_urgency(text_lower)
+        urgency_score = self._calculate_urgency(text_lower, words, pack)
         
         # Determine if human review needed
         requires_human = (
@@ -111,18 +83,16 @@ class SentimentProcessor:
             text=text,
             sentiment=sentiment,
             intent=intent,
-            language=language,
+            language=pack.language,
             keywords=keywords,
             urgency_score=urgency_score,
             requires_human=requires_human
         )
     
-    def _calculate_sentiment(self, text: str) -> SentimentResult:
+    def _calculate_sentiment(self, words: Set[str], pack: LexiconPack) -> SentimentResult:
         """Calculate sentiment score"""
-        words = set(text.split())
-        
-        positive_count = len(words & self.positive_words)
-        negative_count = len(words & self.negative_words)
+        positive_count = len(words & pack.positive)
+        negative_count = len(words & pack.negative)
         total_sentiment_words = positive_count + negative_count
         
         if total_sentiment_words == 0:
@@ -152,28 +122,26 @@ class SentimentProcessor:
             confidence=round(confidence, 2)
         )
     
-    def _detect_intent(self, text: str) -> IntentResult:
+    def _detect_intent(self, text: str, words: Set[str], pack: LexiconPack) -> IntentResult:
         """Detect comment intent"""
-        words = set(text.split())
-        
         # Check for spam
-        spam_score = sum(1 for indicator in self.spam_indicators if indicator in text)
+        spam_score = sum(1 for indicator in pack.spam if indicator in text)
         if spam_score >= 2:
             return IntentResult(intent="spam", confidence=0.9)
         
         # Check for question
         has_question_mark = '?' in text
-        question_word_count = len(words & self.question_words)
+        question_word_count = len(words & pack.question)
         if has_question_mark or question_word_count >= 2:
             return IntentResult(intent="question", confidence=0.8)
         
         # Check for complaint
-        complaint_score = len(words & self.complaint_words)
+        complaint_score = len(words & pack.complaint)
         if complaint_score >= 2:
             return IntentResult(intent="complaint", confidence=0.85)
         
         # Check for praise
-        praise_score = len(words & self.praise_words)
+        praise_score = len(words & pack.praise)
         if praise_score >= 2:
             return IntentResult(intent="praise", confidence=0.8)
         
@@ -181,38 +149,23 @@ class SentimentProcessor:
         return IntentResult(intent="neutral", confidence=0.6)
     
     def _detect_language(self, text: str) -> str:
-        """Simple language detection"""
-        # Very basic - just check for common Spanish words
-        spanish_words = {'hola', 'gracias', 'por favor', 'buenos', 'días'}
-        words = set(text.lower().split())
-        
-        if len(words & spanish_words) > 0:
-            return "es"
-        
-        return "en"
+        """Detect language code via the trigram detector"""
+        return self.detector.detect(text.lower())
     
-    def _extract_keywords(self, text: str) -> List[str]:
+    def _extract_keywords(self, text: str, pack: LexiconPack) -> List[str]:
         """Extract important keywords"""
-        # Remove common words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
-            'to', 'for', 'of', 'with', 'by', 'from', 'is', 'are'
-        }
-        
         # Clean and split
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = re.findall(r'\b\w+\b', text)
         
         # Filter and get unique keywords
-        keywords = [w for w in words if w not in stop_words and len(w) > 3]
+        keywords = [w for w in words if w not in pack.stop_words and len(w) > 3]
         
         # Return top 5 most relevant
         return list(set(keywords))[:5]
     
-    def _calculate_urgency(self, text: str) -> float:
+    def _calculate_urgency(self, text: str, words: Set[str], pack: LexiconPack) -> float:
         """Calculate urgency score"""
-        words = set(text.split())
-        
-        urgent_count = len(words & self.urgent_words)
+        urgent_count = len(words & pack.urgent)
         has_exclamation = text.count('!') >= 2
         has_caps = sum(1 for c in text if c.isupper()) > len(text) * 0.5
         
@@ -11,6 +11,10 @@ from datetime import datetime
 from typing import Dict, Any
 
 from app.infrastructure.supabase_service import get_supabase_service
+from app.services.db_guardian import GUARDIAN_TABLES, fetch_db_health, health_issues, probe_issues, probe_tables
+from app.services.health_checker import health_checker
+from app.services.metrics import metrics_engine
+from app.services.nova_briefing import mark_briefing_stale
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +72,7 @@ class SentinelService:
                     try:
                         r = await client.get(f"{self.base_url}{ep}")
                         latency = (time.time() - start) * 1000
+                        metrics_engine.observe_request(f"PULSE {ep}", latency, r.status_code >= 500)
                         status = "pass"
 
                         if r.status_code >= 500:
@@ -83,6 +88,12 @@ class SentinelService:
         except Exception as e:
             logger.error(f"Pulse error: {e}")
 
+        # Live traffic anomalies from the streaming baselines (no history scan)
+        for summary in metrics_engine.anomalies():
+            anomaly = health_checker.detect_baseline_anomaly(summary)
+            if anomaly:
+                issues.append({"severity": "HIGH", "type": anomaly.anomaly_type.upper(), "message": anomaly.description})
+
         score = max(0, 100 - len([i for i in issues if i["severity"] == "CRITICAL"]) * 20)
         return {
             "agent_code": "PULSE_MONITOR",
@@ -95,23 +106,12 @@ class SentinelService:
         }
 
     async def run_db_guardian(self) -> Dict[str, Any]:
-        """Verifica salud de la base de datos"""
-        supabase = get_supabase_service()
-        issues = []
-        tables = ["omega_agents", "omega_agent_memory", "nova_data", "sentinel_scans", "resellers", "clients"]
-
-        for table in tables:
-            try:
-                supabase.client.table(table).select("id").limit(1).execute()
-            except:
-                issues.append({"severity": "CRITICAL", "type": "MISSING_TABLE", "message": f"{table} no accesible"})
-
-        try:
-            agents = supabase.client.table("omega_agents").select("id", count="exact").execute()
-            if agents.count and agents.count < 44:
-                issues.append({"severity": "HIGH", "type": "DATA_INTEGRITY", "message": f"omega_agents: {agents.count} (esperados 44+)"})
-        except Exception as e:
-            logger.error(f"DB error: {e}")
+        """Verifica salud de la base de datos: probes concurrentes + sentinel_db_health RPC"""
+        probes, health = await asyncio.gather(probe_tables(GUARDIAN_TABLES), fetch_db_health(GUARDIAN_TABLES))
+        issues = probe_issues(probes) + health_issues(health)
+        logger.info(
+            "DB guardian probes: " + ", ".join(f"{p['table']}={p['latency_ms']:.0f}ms" for p in probes)
+        )
 
         score = self._calculate_score(issues)
         return {
@@ -120,6 +120,7 @@ class SentinelService:
             "status": self._get_status(score),
             "security_score": score,
             "issues": issues,
+            "details": {"probes": probes, "health": health},
             "deploy_decision": "BLOCK" if score < 70 else "APPROVE"
         }
 
@@ -128,16 +129,20 @@ class SentinelService:
         try:
             results = await asyncio.gather(self.run_vault_scan(), self.run_pulse_monitor(), self.run_db_guardian(), return_exceptions=True)
             weights = {"VAULT": 0.35, "PULSE_MONITOR": 0.35, "DB_GUARDIAN": 0.30}
-            global_score, all_issues = 0, []
-            supabase = get_supabase_service()
+            global_score, all_issues, scan_rows = 0, [], []
 
             for result in results:
                 if isinstance(result, dict):
                     agent = result["agent_code"]
                     global_score += result["security_score"] * weights.get(agent, 0.33)
                     all_issues.extend(result.get("issues", []))
-                    insert_data = self._prepare_for_insert({**result, "triggered_by": "cron"})
-                    supabase.client.table("sentinel_scans").insert(insert_data).execute()
+                    scan_rows.append(self._prepare_for_insert({**result, "triggered_by": "cron"}))
+
+            # Every sub-scan row in one insert
+            if scan_rows:
+                table = get_supabase_service().client.table("sentinel_scans")
+                await asyncio.to_thread(table.insert(scan_rows).execute)
+                mark_briefing_stale("system_status")
 
             global_score = round(global_score)
             status = "presidencial" if global_score >= 85 else "warning" if global_score >= 70 else "critical"
@@ -0,0 +1,171 @@
+"""
+Significance Engine
+Vectorized N-variant two-proportion tests with exact and always-valid p-values
+"""
+from typing import List, Optional, Sequence
+from pydantic import BaseModel
+import math
+import numpy as np
+
+DEFAULT_ALPHA = 0.05
+# Prior variance of the true rate difference for the mSPRT mixture;
+# 1e-4 puts most prior mass on lifts within ~±1 percentage point.
+DEFAULT_MIXTURE_VARIANCE = 1e-4
+
+# math.erfc is exact to double precision; frompyfunc maps it over arrays
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+
+
+class VariantComparison(BaseModel):
+    """One variant-vs-variant two-proportion test"""
+    baseline: str
+    challenger: str
+    baseline_rate: float
+    challenger_rate: float
+    lift_percent: float
+    z_score: float
+    p_value: float  # fixed-horizon, two-sided
+    adjusted_p_value: float  # Holm-corrected within its comparison family
+    always_valid_p_value: float  # mSPRT, safe to check continuously
+    is_significant: bool
+
+
+class SignificanceReport(BaseModel):
+    """All comparisons for one experiment"""
+    control: str
+    best_variant: str
+    rates: dict[str, float]
+    versus_control: List[VariantComparison]
+    pairwise: List[VariantComparison]
+    alpha: float
+
+
+def two_sided_p_values(z: np.ndarray) -> np.ndarray:
+    """Exact two-sided normal p-values: P(|Z| >= |z|) = erfc(|z| / sqrt(2))."""
+    return _erfc(np.abs(z) / math.sqrt(2)).astype(np.float64)
+
+
+def holm_adjust(p_values: np.ndarray) -> np.ndarray:
+    """Holm-Bonferroni step-down adjustment (controls family-wise error)."""
+    m = p_values.size
+    if m == 0:
+        return p_values
+    order = np.argsort(p_values)
+    stepped = np.maximum.accumulate(p_values[order] * (m - np.arange(m)))
+    adjusted = np.empty(m)
+    adjusted[order] = np.minimum(stepped, 1.0)
+    return adjusted
+
+
+def always_valid_p_values(
+    diff: np.ndarray,
+    variance: np.ndarray,
+    mixture_variance: float = DEFAULT_MIXTURE_VARIANCE,
+    previous: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    mSPRT always-valid p-values with a normal mixture prior (Johari et al.).
+
+    Lambda = sqrt(V / (V + tau2)) * exp(diff^2 * tau2 / (2 V (V + tau2)))
+    p = min(1, 1 / Lambda), then the running minimum with `previous`, so a
+    caller that stores the last value can re-check after every batch of
+    counts without ever touching raw impressions.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        total = variance + mixture_variance
+        log_lambda = 0.5 * np.log(variance / total) + (
+            diff ** 2 * mixture_variance / (2 * variance * total)
+        )
+        p = np.where(variance > 0, np.minimum(1.0, np.exp(-log_lambda)), 1.0)
+    if previous is not None:
+        p = np.minimum(p, previous)
+    return p
+
+
+def _compare(
+    names: Sequence[str],
+    impressions: np.ndarray,
+    successes: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    alpha: float,
+    mixture_variance: float,
+    previous: Optional[np.ndarray] = None,
+) -> List[VariantComparison]:
+    """Vectorized tests for every (left[k], right[k]) index pair."""
+    rates = np.divide(successes, impressions, out=np.zeros(impressions.size), where=impressions > 0)
+    n_l, n_r = impressions[left], impressions[right]
+    p_l, p_r = rates[left], rates[right]
+    diff = p_r - p_l
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pooled = (successes[left] + successes[right]) / (n_l + n_r)
+        se = np.sqrt(pooled * (1 - pooled) * (1 / n_l + 1 / n_r))
+        z = np.where(se > 0, diff / se, 0.0)
+        lift = np.where(p_l > 0, diff / p_l * 100, 0.0)
+        variance = p_l * (1 - p_l) / n_l + p_r * (1 - p_r) / n_r
+
+    p_values = two_sided_p_values(z)
+    adjusted = holm_adjust(p_values)
+    sequential = always_valid_p_values(
+        np.nan_to_num(diff), np.nan_to_num(variance), mixture_variance, previous
+    )
+
+    return [
+        VariantComparison(
+            baseline=names[left[k]], challenger=names[right[k]],
+            baseline_rate=round(float(p_l[k]), 6), challenger_rate=round(float(p_r[k]), 6),
+            lift_percent=round(float(lift[k]), 2), z_score=round(float(z[k]), 4),
+            p_value=float(p_values[k]), adjusted_p_value=float(adjusted[k]),
+            always_valid_p_value=float(sequential[k]),
+            is_significant=bool(adjusted[k] < alpha),
+        )
+        for k in range(left.size)
+    ]
+
+
+def compare_variants(
+    names: Sequence[str],
+    impressions: Sequence[int],
+    successes: Sequence[int],
+    control_index: int = 0,
+    alpha: float = DEFAULT_ALPHA,
+    mixture_variance: float = DEFAULT_MIXTURE_VARIANCE,
+    previous_always_valid: Optional[Sequence[float]] = None,
+) -> SignificanceReport:
+    """
+    Control-vs-all and all-pairwise tests for N variants in one pass.
+
+    Inputs are aggregate counts only (O(variants)), never raw events.
+
+    Args:
+        names: Variant names, e.g. ["A", "B", "C"]
+        impressions: Impressions per variant
+        successes: Engagements (or conversions) per variant
+        control_index: Position of the control variant
+        alpha: Significance level for the Holm-adjusted decision
+        previous_always_valid: Last always-valid p-value per challenger
+            (versus_control order) to continue the running minimum
+
+    Returns:
+        SignificanceReport with both comparison families
+    """
+    if len(names) < 2:
+        raise ValueError("Need at least 2 variants to compare")
+    n = np.asarray(impressions, dtype=np.float64)
+    x = np.asarray(successes, dtype=np.float64)
+    rates = np.divide(x, n, out=np.zeros(n.size), where=n > 0)
+
+    challengers = np.array([i for i in range(n.size) if i != control_index])
+    controls = np.full(challengers.size, control_index)
+    left, right = np.triu_indices(n.size, k=1)
+    previous = np.asarray(previous_always_valid, dtype=np.float64) if previous_always_valid else None
+
+    return SignificanceReport(
+        control=names[control_index],
+        best_variant=names[int(np.argmax(rates))],
+        rates={name: float(r) for name, r in zip(names, rates)},
+        versus_control=_compare(names, n, x, controls, challengers, alpha, mixture_variance, previous),
+        pairwise=_compare(names, n, x, left, right, alpha, mixture_variance),
+        alpha=alpha,
+    )
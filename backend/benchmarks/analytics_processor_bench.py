@@ -0,0 +1,71 @@
+"""
+AnalyticsProcessor Benchmark
+Times the array-backed analytics kernels against the previous pure-Python loops
+
+Run from backend/:  python -m benchmarks.analytics_processor_bench [points]
+"""
+from typing import Callable, Dict, List
+import random
+import sys
+import time
+
+import numpy as np
+
+from app.services import analytics_arrays
+from app.services.analytics_processor import analytics_processor
+
+DEFAULT_POINTS = 1_000_000
+WINDOW = 7
+
+
+def _timed(label: str, fn: Callable[[], object]) -> float:
+    """Run fn once and print its wall time in milliseconds"""
+    start = time.perf_counter()
+    fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<38} {elapsed:>10.1f} ms")
+    return elapsed
+
+
+def _python_moving_average(data: List[float], window: int) -> List[float]:
+    """Previous O(n·w) implementation, kept here only for comparison"""
+    return [
+        data[i] if i < window - 1 else sum(data[i - window + 1:i + 1]) / window
+        for i in range(len(data))
+    ]
+
+
+def _python_zscores(data: List[float]) -> List[float]:
+    """Previous multi-pass implementation, kept here only for comparison"""
+    mean = sum(data) / len(data)
+    std = (sum((x - mean) ** 2 for x in data) / len(data)) ** 0.5
+    return [abs((x - mean) / std) for x in data]
+
+
+def run(points: int) -> Dict[str, float]:
+    """Benchmark every kernel at the given series length"""
+    data = [random.gauss(100.0, 15.0) for _ in range(points)]
+    values = np.asarray(data)
+    keys = [f"2026-01-{i % 28 + 1:02d}" for i in range(points)]
+    likes = np.random.randint(0, 500, size=points)
+
+    print(f"AnalyticsProcessor benchmark — {points:,} points")
+    return {
+        "python_moving_average": _timed("moving average (python loop)", lambda: _python_moving_average(data, WINDOW)),
+        "moving_average": _timed("moving average (cumsum)", lambda: analytics_arrays.moving_average(values, WINDOW)),
+        "python_zscore": _timed("z-score (python passes)", lambda: _python_zscores(data)),
+        "zscore": _timed("z-score (vectorized)", lambda: analytics_arrays.zscore(values)),
+        "robust_zscore": _timed("MAD z-score (vectorized)", lambda: analytics_arrays.robust_zscore(values)),
+        "ewma": _timed("EWMA alpha=0.05 (blocked cumsum)", lambda: analytics_arrays.ewma(values, 0.05)),
+        "group_sums": _timed("grouped sums (28 keys)", lambda: analytics_arrays.group_sums(keys, {"likes": likes})),
+        "processor_moving_average": _timed(
+            "processor.calculate_moving_average", lambda: analytics_processor.calculate_moving_average(data, WINDOW)
+        ),
+        "processor_detect_anomalies": _timed(
+            "processor.detect_anomalies", lambda: analytics_processor.detect_anomalies(data)
+        ),
+    }
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_POINTS)
@@ -0,0 +1,79 @@
+"""
+Database Read Benchmark
+Latency of the hot read paths through PostgREST vs the direct Postgres pool
+
+Run from backend/:  python -m benchmarks.db_read_bench [client_id] [runs]
+Needs the API environment (SUPABASE_*, DATABASE_URL) pointing at a real database.
+"""
+from typing import Callable, Dict, List, Optional
+import statistics
+import sys
+import time
+
+from app.config import settings
+from app.infrastructure.data_loader import RowLoader
+from app.infrastructure.postgres import direct_reads_enabled, get_engine
+from app.infrastructure.repositories.prompt_vault_repository import PromptVaultRepository
+from app.infrastructure.supabase_service import get_supabase_service
+
+DEFAULT_RUNS = 50
+
+
+def _reads(client_id: Optional[str]) -> Dict[str, Callable[[], object]]:
+    """Each read builds a fresh RowLoader so nothing is served from the memo"""
+    vault = PromptVaultRepository(get_supabase_service())
+    reads: Dict[str, Callable[[], object]] = {
+        "prompt_vault_version": vault.get_version,
+        "prompt_vault active rows": vault.find_active,
+    }
+    if client_id:
+        reads["client_context by client_id"] = lambda: RowLoader("client_context", "client_id").get(client_id)
+        reads["clients by id"] = lambda: RowLoader("clients").get(client_id)
+        reads["social_accounts by client_id"] = lambda: RowLoader("social_accounts", "client_id", many=True).get(client_id)
+    return reads
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def measure(read: Callable[[], object], runs: int, direct: bool) -> Dict[str, float]:
+    """p50/p95 ms of one read on one path (first call is a discarded warm-up)"""
+    settings.direct_db_reads = direct
+    read()
+    if direct and not direct_reads_enabled():
+        raise RuntimeError("Direct Postgres unavailable (see log); not timing the PostgREST fallback")
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        read()
+        samples.append((time.perf_counter() - start) * 1000)
+    return _percentiles(samples)
+
+
+def run(client_id: Optional[str], runs: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """PostgREST vs direct pool for every hot read"""
+    get_engine()  # pool creation is not part of the per-read latency
+    results = {}
+    print(f"Hot reads — {runs} runs each, ms (p50 / p95)")
+    print(f"  {'read':<32} {'PostgREST':>19} {'direct pool':>19}")
+    for label, read in _reads(client_id).items():
+        postgrest = measure(read, runs, direct=False)
+        direct = measure(read, runs, direct=True)
+        results[label] = {"postgrest": postgrest, "direct": direct}
+        print(
+            f"  {label:<32} {postgrest['p50']:>8.1f} / {postgrest['p95']:>7.1f}"
+            f" {direct['p50']:>8.1f} / {direct['p95']:>7.1f}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    run(
+        sys.argv[1] if len(sys.argv) > 1 else None,
+        int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RUNS,
+    )
@@ -0,0 +1,77 @@
+"""
+Prompt Performance Benchmark
+Throughput of the folded EWMA pipeline against per-signal score updates,
+plus an exactness check for concurrent (split) batches
+
+Run from backend/:  python -m benchmarks.prompt_performance_bench [signals] [prompts]
+"""
+from typing import Dict, List, Tuple
+import random
+import sys
+import time
+
+from app.services.prompt_vault.performance import (
+    SCORE_KEEP,
+    SCORE_SCALE,
+    fold_performance_signals,
+)
+
+DEFAULT_SIGNALS = 100_000
+DEFAULT_PROMPTS = 300
+INITIAL_SCORE = 5.0
+
+
+def _sequential_scores(ids: List[str], rates: List[float]) -> Dict[str, float]:
+    """Previous per-signal update (one SELECT + UPDATE each), replayed in memory"""
+    scores: Dict[str, float] = {}
+    for prompt_id, rate in zip(ids, rates):
+        old = scores.get(prompt_id, INITIAL_SCORE)
+        scores[prompt_id] = max(0.0, min(10.0, old * SCORE_KEEP + rate * SCORE_SCALE * (1 - SCORE_KEEP)))
+    return scores
+
+
+def _apply(scores: Dict[str, float], ids: List[str], rates: List[float]) -> None:
+    """What the RPC does with one batch: score * decay + increment"""
+    for delta in fold_performance_signals(ids, rates):
+        old = scores.get(delta["prompt_id"], INITIAL_SCORE)
+        scores[delta["prompt_id"]] = old * delta["decay"] + delta["increment"]
+
+
+def _max_error(a: Dict[str, float], b: Dict[str, float]) -> float:
+    return max(abs(a[k] - b[k]) for k in a)
+
+
+def run(signals: int, prompts: int) -> Tuple[float, float]:
+    """Time both paths and verify they agree, including a two-way split"""
+    ids = [f"prompt-{random.randrange(prompts)}" for _ in range(signals)]
+    rates = [random.betavariate(2, 40) for _ in range(signals)]
+
+    print(f"Prompt performance benchmark — {signals:,} signals over {prompts} prompts")
+    start = time.perf_counter()
+    expected = _sequential_scores(ids, rates)
+    sequential_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    deltas = fold_performance_signals(ids, rates)
+    fold_ms = (time.perf_counter() - start) * 1000
+
+    folded: Dict[str, float] = {}
+    _apply(folded, ids, rates)
+    half = signals // 2
+    split: Dict[str, float] = {}
+    _apply(split, ids[:half], rates[:half])
+    _apply(split, ids[half:], rates[half:])
+
+    print(f"  per-signal replay (no DB)      {sequential_ms:>10.1f} ms   ({signals:,} round-trips before)")
+    print(f"  vectorized fold                {fold_ms:>10.1f} ms   ({len(deltas)} rows, 1 statement)")
+    print(f"  fold throughput                {signals / (fold_ms / 1000):>10,.0f} signals/s")
+    print(f"  max |fold - sequential|        {_max_error(expected, folded):>10.2e}")
+    print(f"  max |split batches - seq|      {_max_error(expected, split):>10.2e}")
+    return sequential_ms, fold_ms
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIGNALS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PROMPTS,
+    )
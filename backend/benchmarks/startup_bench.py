@@ -0,0 +1,81 @@
+"""
+Startup Benchmark
+Cold-start profile of app.main: `python -X importtime` breakdown plus
+time-to-first-request with lazy route groups on and off
+
+Run from backend/:  python -m benchmarks.startup_bench [runs] [top]
+Needs the same environment variables as the API (SECRET_KEY, STRIPE_*, ...).
+"""
+from typing import Dict, List, Tuple
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+DEFAULT_RUNS = 5
+DEFAULT_TOP = 20
+
+# One cold process: import the app, then serve a single cheap request
+_FIRST_REQUEST = """
+import time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+TestClient(app).get("/api/v1/status")
+print(f"{(imported - start) * 1000:.1f} {(time.perf_counter() - start) * 1000:.1f}")
+"""
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def _python(code: str, env: Dict[str, str], importtime: bool = False) -> subprocess.CompletedProcess:
+    args = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    return subprocess.run(args, env=env, capture_output=True, text=True, check=True)
+
+
+def import_profile(top: int) -> List[Tuple[str, float, float]]:
+    """(module, self ms, cumulative ms) for the slowest imports of app.main"""
+    stderr = _python("import app.main", dict(os.environ), importtime=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append((match[4], int(match[1]) / 1000, int(match[2]) / 1000))
+    packages: Dict[str, float] = {}
+    for module, _, cumulative in rows:
+        if "." not in module:
+            packages[module] = max(packages.get(module, 0.0), cumulative)
+    print(f"Slowest top-level imports (cumulative) — {sum(r[1] for r in rows):.0f} ms total")
+    for name, cumulative in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {name:<40} {cumulative:>8.1f} ms")
+    return sorted(rows, key=lambda row: -row[2])[:top]
+
+
+def first_request(runs: int, lazy: bool) -> Dict[str, float]:
+    """Median import and import+first-request wall times over fresh processes"""
+    env = {**os.environ, "LAZY_ROUTE_GROUPS": "true" if lazy else "false"}
+    imports, totals = [], []
+    for _ in range(runs):
+        imported, total = map(float, _python(_FIRST_REQUEST, env).stdout.split()[-2:])
+        imports.append(imported)
+        totals.append(total)
+    result = {"import_ms": statistics.median(imports), "first_request_ms": statistics.median(totals)}
+    label = "lazy route groups" if lazy else "eager route groups"
+    print(f"  {label:<24} import {result['import_ms']:>8.1f} ms   first request {result['first_request_ms']:>8.1f} ms")
+    return result
+
+
+def run(runs: int, top: int) -> Dict[str, Dict[str, float]]:
+    """Import profile, then eager vs lazy cold starts"""
+    import_profile(top)
+    print(f"Time to first request — median of {runs} cold processes")
+    return {"eager": first_request(runs, lazy=False), "lazy": first_request(runs, lazy=True)}
+
+
+if __name__ == "__main__":
+    run(
+        int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TOP,
+    )
@@ -0,0 +1,11 @@
+-- Migration: Add derivatives column to content_lab_generated
+-- Purpose: Store WebP/AVIF variants (images) or poster frames (videos) of
+-- DALL-E / Fal outputs; provider URLs expire, the variants live in the
+-- 'generated-media' Storage bucket (public, must exist)
+-- Date: 2026-10-19
+
+ALTER TABLE content_lab_generated
+ADD COLUMN IF NOT EXISTS derivatives JSONB;
+
+COMMENT ON COLUMN content_lab_generated.derivatives IS
+'Variant name -> public URL (thumb_webp, display_webp, display_avif, poster_jpg). NULL until the background pipeline finishes.';
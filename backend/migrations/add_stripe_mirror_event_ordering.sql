@@ -0,0 +1,53 @@
+-- Stripe Mirror Event Ordering Migration
+-- Every mirrored row remembers the Stripe time of the state it holds
+-- (event `created` for webhooks, sync time for the backfill); upserts only
+-- replace a row with state at least as new, so retried or out-of-order
+-- events can never overwrite newer data (e.g. resurrect a deleted subscription)
+-- Filosofía: No velocity, only precision 🐢💎
+
+ALTER TABLE stripe_customers ADD COLUMN IF NOT EXISTS event_created BIGINT;
+ALTER TABLE stripe_subscriptions ADD COLUMN IF NOT EXISTS event_created BIGINT;
+ALTER TABLE stripe_charges ADD COLUMN IF NOT EXISTS event_created BIGINT;
+ALTER TABLE stripe_invoices ADD COLUMN IF NOT EXISTS event_created BIGINT;
+
+-- Rows share one set of keys (one mapper per table); returns rows written
+CREATE OR REPLACE FUNCTION upsert_stripe_mirror(p_table TEXT, p_rows JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    insert_columns TEXT;
+    update_columns TEXT;
+    affected INTEGER;
+BEGIN
+    IF p_table NOT IN ('stripe_customers', 'stripe_subscriptions', 'stripe_charges', 'stripe_invoices') THEN
+        RAISE EXCEPTION 'Not a Stripe mirror table: %', p_table;
+    END IF;
+    IF jsonb_array_length(p_rows) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    SELECT
+        string_agg(quote_ident(key), ', '),
+        string_agg(format('%I = excluded.%I', key, key), ', ') FILTER (WHERE key <> 'id')
+    INTO insert_columns, update_columns
+    FROM jsonb_object_keys(p_rows -> 0) AS key;
+
+    EXECUTE format(
+        'INSERT INTO %1$I AS t (%2$s)
+         SELECT %2$s FROM jsonb_populate_recordset(NULL::%1$I, $1)
+         ON CONFLICT (id) DO UPDATE SET %3$s
+         WHERE t.event_created IS NULL OR excluded.event_created >= t.event_created',
+        p_table, insert_columns, update_columns
+    ) USING p_rows;
+    GET DIAGNOSTICS affected = ROW_COUNT;
+    RETURN affected;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Writes to the mirror come from the backend only
+REVOKE ALL ON FUNCTION upsert_stripe_mirror(TEXT, JSONB) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION upsert_stripe_mirror(TEXT, JSONB) TO service_role;
+
+-- Earlier unfinished events of one customer (the worker holds later ones until they settle)
+CREATE INDEX IF NOT EXISTS idx_stripe_webhook_events_customer
+    ON stripe_webhook_events(customer_id, stripe_created)
+    WHERE status IN ('pending', 'processing', 'failed');
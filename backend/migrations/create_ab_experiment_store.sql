@@ -0,0 +1,136 @@
+-- A/B Experiment Store Migration
+-- Persistent experiments with append-only counter events and materialized per-variant aggregates
+-- Analysis reads one ab_variant_counters row per variant, never the event log
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE TABLE IF NOT EXISTS ab_experiments (
+    experiment_id TEXT PRIMARY KEY,
+    client_id TEXT NOT NULL,
+    hypothesis TEXT NOT NULL,
+    variable_tested TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'running'
+        CHECK (status IN ('draft', 'running', 'completed', 'inconclusive')),
+    target_sample_size INTEGER NOT NULL DEFAULT 0,
+    started_at TIMESTAMPTZ DEFAULT NOW(),
+    completed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_ab_experiments_client ON ab_experiments(client_id);
+
+-- Materialized aggregates: one row per variant, only ever incremented
+CREATE TABLE IF NOT EXISTS ab_variant_counters (
+    experiment_id TEXT NOT NULL REFERENCES ab_experiments(experiment_id) ON DELETE CASCADE,
+    variant_name TEXT NOT NULL,
+    position SMALLINT NOT NULL DEFAULT 0,  -- 0 = control
+    variant_id TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    content JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    impressions BIGINT NOT NULL DEFAULT 0,
+    engagements BIGINT NOT NULL DEFAULT 0,
+    clicks BIGINT NOT NULL DEFAULT 0,
+    conversions BIGINT NOT NULL DEFAULT 0,
+
+    -- Running minimum of the mSPRT always-valid p-value vs control
+    always_valid_p DOUBLE PRECISION,
+
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (experiment_id, variant_name)
+);
+
+-- Append-only audit log of every flushed increment batch
+CREATE TABLE IF NOT EXISTS ab_variant_events (
+    id BIGSERIAL PRIMARY KEY,
+    experiment_id TEXT NOT NULL REFERENCES ab_experiments(experiment_id) ON DELETE CASCADE,
+    variant_name TEXT NOT NULL,
+    impressions BIGINT NOT NULL DEFAULT 0,
+    engagements BIGINT NOT NULL DEFAULT 0,
+    clicks BIGINT NOT NULL DEFAULT 0,
+    conversions BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_ab_variant_events_experiment
+    ON ab_variant_events(experiment_id, created_at);
+
+-- Apply a batch of increments atomically: log them, then add them to the
+-- aggregates in a single UPDATE (no read-modify-write, no lost updates).
+-- Events for unknown variants are ignored. Returns the number of variant rows touched.
+CREATE OR REPLACE FUNCTION ab_apply_variant_increments(p_increments JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    touched INTEGER;
+BEGIN
+    WITH batch AS (
+        SELECT i.experiment_id, i.variant_name,
+               SUM(i.impressions) AS impressions, SUM(i.engagements) AS engagements,
+               SUM(i.clicks) AS clicks, SUM(i.conversions) AS conversions
+        FROM jsonb_to_recordset(p_increments) AS i(
+            experiment_id TEXT, variant_name TEXT,
+            impressions BIGINT, engagements BIGINT, clicks BIGINT, conversions BIGINT
+        )
+        GROUP BY i.experiment_id, i.variant_name
+    ),
+    applied AS (
+        UPDATE ab_variant_counters c SET
+            impressions = c.impressions + COALESCE(b.impressions, 0),
+            engagements = c.engagements + COALESCE(b.engagements, 0),
+            clicks = c.clicks + COALESCE(b.clicks, 0),
+            conversions = c.conversions + COALESCE(b.conversions, 0),
+            updated_at = NOW()
+        FROM batch b
+        WHERE c.experiment_id = b.experiment_id AND c.variant_name = b.variant_name
+        RETURNING b.*
+    ),
+    logged AS (
+        INSERT INTO ab_variant_events (experiment_id, variant_name, impressions, engagements, clicks, conversions)
+        SELECT experiment_id, variant_name,
+               COALESCE(impressions, 0), COALESCE(engagements, 0),
+               COALESCE(clicks, 0), COALESCE(conversions, 0)
+        FROM applied
+        RETURNING 1
+    )
+    SELECT COUNT(*) INTO touched FROM logged;
+    RETURN touched;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Advance the always-valid running minimum for a batch of challengers
+-- (computed at counter flush). LEAST keeps it a minimum even if two flushes
+-- race. Returns the number of variant rows touched.
+CREATE OR REPLACE FUNCTION ab_save_always_valid(p_values JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    touched INTEGER;
+BEGIN
+    UPDATE ab_variant_counters c SET
+        always_valid_p = LEAST(COALESCE(c.always_valid_p, 1.0), v.always_valid_p)
+    FROM jsonb_to_recordset(p_values) AS v(
+        experiment_id TEXT, variant_name TEXT, always_valid_p DOUBLE PRECISION
+    )
+    WHERE c.experiment_id = v.experiment_id AND c.variant_name = v.variant_name;
+    GET DIAGNOSTICS touched = ROW_COUNT;
+    RETURN touched;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create an experiment and its zeroed counter rows in one transaction, so a
+-- failure never leaves an experiment without variants
+CREATE OR REPLACE FUNCTION ab_create_experiment(p_experiment JSONB, p_variants JSONB)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO ab_experiments (
+        experiment_id, client_id, hypothesis, variable_tested, platform,
+        status, target_sample_size, started_at, completed_at
+    )
+    SELECT experiment_id, client_id, hypothesis, variable_tested, platform,
+           status, target_sample_size, started_at, completed_at
+    FROM jsonb_populate_record(NULL::ab_experiments, p_experiment);
+
+    INSERT INTO ab_variant_counters (experiment_id, variant_name, position, variant_id, description, content)
+    SELECT experiment_id, variant_name, position, variant_id,
+           COALESCE(description, ''), COALESCE(content, '{}'::jsonb)
+    FROM jsonb_populate_recordset(NULL::ab_variant_counters, p_variants);
+END;
+$$ LANGUAGE plpgsql;
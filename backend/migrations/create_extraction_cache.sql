@@ -0,0 +1,28 @@
+-- Extraction Cache Migration
+-- Content-addressed cache of cleaned document text for the context library
+-- extraction_cache: one row per (sha256 of source bytes, extractor kind)
+-- extraction_urls: URL -> last content hash + HTTP validators for conditional GETs
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    content_hash CHAR(64) NOT NULL,
+    kind TEXT NOT NULL CHECK (kind IN ('pdf', 'html', 'text')),
+    content TEXT NOT NULL,
+    -- title, page_count, pages_read, truncated
+    metadata JSONB NOT NULL DEFAULT '{}'::jsonb,
+    source_bytes BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (content_hash, kind)
+);
+
+CREATE TABLE IF NOT EXISTS extraction_urls (
+    url TEXT PRIMARY KEY,
+    content_hash CHAR(64) NOT NULL,
+    kind TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at TIMESTAMPTZ DEFAULT NOW(),
+    FOREIGN KEY (content_hash, kind) REFERENCES extraction_cache(content_hash, kind) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_extraction_urls_hash ON extraction_urls(content_hash, kind);
@@ -0,0 +1,31 @@
+-- Metric Snapshots Migration
+-- Periodic snapshots of the in-process streaming metrics engine
+-- One row per (scope, name, metric) series, overwritten on every flush
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE TABLE IF NOT EXISTS metric_snapshots (
+    scope TEXT NOT NULL CHECK (scope IN ('agent', 'endpoint', 'prompt')),
+    name TEXT NOT NULL,
+    metric TEXT NOT NULL,
+
+    -- RunningStats.to_dict(): Welford + EWMA accumulators
+    stats JSONB NOT NULL DEFAULT '{}'::jsonb,
+    -- QuantileSketch.to_dict(): log-bucket histogram
+    sketch JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (scope, name, metric)
+);
+
+CREATE OR REPLACE FUNCTION touch_metric_snapshots_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_metric_snapshots_updated_at ON metric_snapshots;
+CREATE TRIGGER trg_metric_snapshots_updated_at
+    BEFORE UPDATE ON metric_snapshots
+    FOR EACH ROW EXECUTE FUNCTION touch_metric_snapshots_updated_at();
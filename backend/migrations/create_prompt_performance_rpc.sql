@@ -0,0 +1,41 @@
+-- Prompt Performance RPC Migration
+-- Set-based application of folded EWMA deltas to prompt_vault performance scores
+-- Each batch is one UPDATE: score' = score * decay + increment, so concurrent
+-- batches compose exactly (row locks serialize them, nothing is read first)
+-- Filosofía: No velocity, only precision 🐢💎
+
+-- Number of engagement signals folded into engagement_avg
+ALTER TABLE prompt_vault
+ADD COLUMN IF NOT EXISTS engagement_count INTEGER NOT NULL DEFAULT 0;
+
+-- Existing averages were computed over times_used
+UPDATE prompt_vault
+SET engagement_count = GREATEST(times_used, 1)
+WHERE engagement_avg IS NOT NULL AND engagement_count = 0;
+
+CREATE OR REPLACE FUNCTION apply_prompt_performance(p_deltas JSONB)
+RETURNS TABLE (
+    id UUID,
+    performance_score NUMERIC,
+    engagement_avg NUMERIC,
+    engagement_count INTEGER,
+    times_used INTEGER
+) AS $$
+    UPDATE prompt_vault p SET
+        performance_score = ROUND(
+            LEAST(10, GREATEST(0, p.performance_score * d.decay + d.increment))::numeric, 2
+        ),
+        engagement_avg = ROUND(
+            ((COALESCE(p.engagement_avg, 0) * p.engagement_count + d.rate_sum)
+             / (p.engagement_count + d.signals))::numeric, 4
+        ),
+        engagement_count = p.engagement_count + d.signals,
+        last_updated = NOW()
+    FROM jsonb_to_recordset(p_deltas) AS d(
+        prompt_id UUID, decay DOUBLE PRECISION, increment DOUBLE PRECISION,
+        rate_sum DOUBLE PRECISION, signals INTEGER
+    )
+    WHERE p.id = d.prompt_id
+    RETURNING p.id, p.performance_score::numeric, p.engagement_avg::numeric,
+              p.engagement_count, p.times_used;
+$$ LANGUAGE sql;
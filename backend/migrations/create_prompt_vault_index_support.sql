@@ -0,0 +1,56 @@
+-- Prompt Vault Index Support Migration
+-- Version stamp + NOTIFY for the in-process prompt index, and atomic usage increments
+-- Usage-only updates (times_used / last_updated) do NOT bump the version,
+-- so batched usage flushes never invalidate the index
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE TABLE IF NOT EXISTS prompt_vault_version (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    version BIGINT NOT NULL DEFAULT 0,
+    changed_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+INSERT INTO prompt_vault_version (id, version) VALUES (1, 0)
+ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_prompt_vault_version()
+RETURNS TRIGGER AS $$
+DECLARE
+    new_version BIGINT;
+BEGIN
+    UPDATE prompt_vault_version
+    SET version = version + 1, changed_at = NOW()
+    WHERE id = 1
+    RETURNING version INTO new_version;
+    PERFORM pg_notify('prompt_vault_changed', new_version::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_prompt_vault_version_write ON prompt_vault;
+CREATE TRIGGER trg_prompt_vault_version_write
+    AFTER INSERT OR DELETE ON prompt_vault
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_prompt_vault_version();
+
+DROP TRIGGER IF EXISTS trg_prompt_vault_version_update ON prompt_vault;
+CREATE TRIGGER trg_prompt_vault_version_update
+    AFTER UPDATE OF name, category, vertical, platform, agent_code, technique,
+                    prompt_text, performance_score, is_active, version
+    ON prompt_vault
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_prompt_vault_version();
+
+-- Add accumulated selections to times_used: one statement, no read-modify-write
+CREATE OR REPLACE FUNCTION increment_prompt_usage(p_counts JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    touched INTEGER;
+BEGIN
+    UPDATE prompt_vault p
+    SET times_used = p.times_used + c.value::INTEGER,
+        last_updated = NOW()
+    FROM jsonb_each_text(p_counts) AS c
+    WHERE p.id = c.key::UUID;
+    GET DIAGNOSTICS touched = ROW_COUNT;
+    RETURN touched;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,36 @@
+-- Prompt Vault Stats RPC Migration
+-- One aggregate pass over prompt_vault for the vault stats endpoint and NOVA briefing
+-- Replaces four count/scan queries with a single round-trip returning JSONB
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE OR REPLACE FUNCTION prompt_vault_stats()
+RETURNS JSONB AS $$
+    WITH totals AS (
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE is_active) AS active,
+            AVG(performance_score) FILTER (WHERE is_active) AS avg_score,
+            percentile_cont(ARRAY[0.25, 0.5, 0.75, 0.9])
+                WITHIN GROUP (ORDER BY performance_score::float8)
+                FILTER (WHERE is_active) AS pct
+        FROM prompt_vault
+    ),
+    verticals AS (
+        SELECT vertical, COUNT(*) AS prompts
+        FROM prompt_vault
+        WHERE is_active AND vertical IS NOT NULL
+        GROUP BY vertical
+    )
+    SELECT jsonb_build_object(
+        'total', t.total,
+        'active', t.active,
+        'avg_score', COALESCE(ROUND(t.avg_score::numeric, 2), 0),
+        'percentiles', jsonb_build_object(
+            'p25', t.pct[1], 'p50', t.pct[2], 'p75', t.pct[3], 'p90', t.pct[4]
+        ),
+        'by_vertical', COALESCE(
+            (SELECT jsonb_object_agg(vertical, prompts) FROM verticals), '{}'::jsonb
+        )
+    )
+    FROM totals t;
+$$ LANGUAGE sql STABLE;
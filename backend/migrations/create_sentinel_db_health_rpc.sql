@@ -0,0 +1,130 @@
+-- Sentinel DB Health RPC Migration
+-- One round-trip of database health for the SENTINEL DB Guardian:
+-- row-count estimates and dead rows per table (pg_class / pg_stat_user_tables),
+-- estimated btree index bloat and unused indexes (pg_stat_user_indexes),
+-- and the slowest statements from pg_stat_statements when the extension is installed
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE OR REPLACE FUNCTION sentinel_db_health(
+    p_tables TEXT[] DEFAULT NULL,
+    p_slow_query_limit INTEGER DEFAULT 5,
+    p_slow_query_min_calls INTEGER DEFAULT 5
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public, pg_catalog
+AS $$
+DECLARE
+    block_size NUMERIC := current_setting('block_size')::numeric;
+    tables JSONB;
+    indexes JSONB;
+    slow_queries JSONB;
+    statements_schema TEXT;
+BEGIN
+    SELECT COALESCE(jsonb_agg(jsonb_build_object(
+        'table', c.relname,
+        'row_estimate', GREATEST(c.reltuples, 0)::bigint,
+        'live_rows', s.n_live_tup,
+        'dead_rows', s.n_dead_tup,
+        'dead_ratio', ROUND(s.n_dead_tup::numeric / NULLIF(s.n_live_tup + s.n_dead_tup, 0), 4),
+        'seq_scans', s.seq_scan,
+        'index_scans', s.idx_scan,
+        'table_bytes', pg_table_size(c.oid),
+        'index_bytes', pg_indexes_size(c.oid),
+        'last_autovacuum', s.last_autovacuum,
+        'last_autoanalyze', s.last_autoanalyze
+    ) ORDER BY c.relname), '[]'::jsonb)
+    INTO tables
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE n.nspname = 'public'
+      AND c.relkind IN ('r', 'p')
+      AND (p_tables IS NULL OR c.relname = ANY(p_tables));
+
+    -- Expected btree size from tuple count and average key width (pg_stats),
+    -- 90% leaf fill; anything above that is counted as bloat
+    WITH btree AS (
+        SELECT
+            ic.relname AS index_name,
+            t.relname AS table_name,
+            i.indisunique OR i.indisprimary AS is_unique,
+            COALESCE(s.idx_scan, 0) AS scans,
+            pg_relation_size(i.indexrelid) AS bytes,
+            ic.relpages,
+            GREATEST(ic.reltuples, 0) AS tuples,
+            COALESCE((
+                SELECT SUM(st.avg_width)
+                FROM pg_attribute a
+                JOIN pg_stats st
+                  ON st.schemaname = n.nspname AND st.tablename = t.relname AND st.attname = a.attname
+                WHERE a.attrelid = t.oid AND a.attnum = ANY(i.indkey::int2[])
+            ), 8) AS key_width
+        FROM pg_index i
+        JOIN pg_class ic ON ic.oid = i.indexrelid
+        JOIN pg_class t ON t.oid = i.indrelid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        JOIN pg_am am ON am.oid = ic.relam
+        LEFT JOIN pg_stat_user_indexes s ON s.indexrelid = i.indexrelid
+        WHERE n.nspname = 'public'
+          AND am.amname = 'btree'
+          AND (p_tables IS NULL OR t.relname = ANY(p_tables))
+    ),
+    estimated AS (
+        SELECT *,
+            GREATEST(
+                relpages - CEIL(tuples * (key_width + 12) / (block_size * 0.9 - 24)) - 1, 0
+            ) * block_size AS bloat_bytes
+        FROM btree
+    )
+    SELECT COALESCE(jsonb_agg(jsonb_build_object(
+        'index', index_name,
+        'table', table_name,
+        'bytes', bytes,
+        'scans', scans,
+        'unused', scans = 0 AND NOT is_unique,
+        'bloat_bytes', bloat_bytes::bigint,
+        'bloat_ratio', ROUND(bloat_bytes / NULLIF(bytes, 0), 4)
+    ) ORDER BY bloat_bytes DESC), '[]'::jsonb)
+    INTO indexes
+    FROM estimated;
+
+    SELECT e.extnamespace::regnamespace::text
+    INTO statements_schema
+    FROM pg_extension e
+    WHERE e.extname = 'pg_stat_statements';
+
+    IF statements_schema IS NOT NULL THEN
+        EXECUTE format($sql$
+            SELECT COALESCE(jsonb_agg(q), '[]'::jsonb) FROM (
+                SELECT
+                    LEFT(regexp_replace(query, '\s+', ' ', 'g'), 200) AS query,
+                    calls,
+                    ROUND(mean_exec_time::numeric, 1) AS mean_ms,
+                    ROUND(total_exec_time::numeric, 1) AS total_ms,
+                    rows
+                FROM %I.pg_stat_statements
+                WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+                  AND calls >= %s
+                ORDER BY mean_exec_time DESC
+                LIMIT %s
+            ) q
+        $sql$, statements_schema, p_slow_query_min_calls, p_slow_query_limit)
+        INTO slow_queries;
+    END IF;
+
+    RETURN jsonb_build_object(
+        'tables', tables,
+        'indexes', indexes,
+        -- NULL when pg_stat_statements is not installed
+        'slow_queries', slow_queries,
+        'collected_at', now()
+    );
+END;
+$$;
+
+-- Query texts and catalog sizes are for the backend only
+REVOKE ALL ON FUNCTION sentinel_db_health(TEXT[], INTEGER, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION sentinel_db_health(TEXT[], INTEGER, INTEGER) TO service_role;
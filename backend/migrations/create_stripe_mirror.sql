@@ -0,0 +1,113 @@
+-- Stripe Mirror Migration
+-- Local copy of Stripe customers, subscriptions, charges and invoices
+-- Filled by a paginated backfill job, kept current by billing webhooks
+-- Revenue dashboards aggregate these tables instead of calling Stripe
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE TABLE IF NOT EXISTS stripe_customers (
+    id TEXT PRIMARY KEY,
+    email TEXT,
+    name TEXT,
+    deleted BOOLEAN NOT NULL DEFAULT false,
+    created TIMESTAMPTZ,
+    synced_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS stripe_subscriptions (
+    id TEXT PRIMARY KEY,
+    customer_id TEXT,
+    status TEXT NOT NULL,
+    price_id TEXT,
+    plan_name TEXT,
+    billing_interval TEXT,
+    interval_count INTEGER NOT NULL DEFAULT 1,
+    unit_amount BIGINT NOT NULL DEFAULT 0,  -- cents
+    quantity INTEGER NOT NULL DEFAULT 1,
+    currency TEXT,
+    -- Recurring amount normalized to one month, in cents
+    mrr_amount BIGINT NOT NULL DEFAULT 0,
+    cancel_at_period_end BOOLEAN NOT NULL DEFAULT false,
+    current_period_end TIMESTAMPTZ,
+    created TIMESTAMPTZ,
+    synced_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_stripe_subscriptions_status ON stripe_subscriptions(status);
+CREATE INDEX IF NOT EXISTS idx_stripe_subscriptions_customer ON stripe_subscriptions(customer_id);
+
+CREATE TABLE IF NOT EXISTS stripe_charges (
+    id TEXT PRIMARY KEY,
+    customer_id TEXT,
+    invoice_id TEXT,
+    amount BIGINT NOT NULL DEFAULT 0,  -- cents
+    amount_refunded BIGINT NOT NULL DEFAULT 0,
+    currency TEXT,
+    paid BOOLEAN NOT NULL DEFAULT false,
+    status TEXT,
+    created TIMESTAMPTZ,
+    synced_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_stripe_charges_created ON stripe_charges(created DESC);
+
+CREATE TABLE IF NOT EXISTS stripe_invoices (
+    id TEXT PRIMARY KEY,
+    customer_id TEXT,
+    subscription_id TEXT,
+    status TEXT,
+    amount_due BIGINT NOT NULL DEFAULT 0,  -- cents
+    amount_paid BIGINT NOT NULL DEFAULT 0,
+    currency TEXT,
+    period_start TIMESTAMPTZ,
+    period_end TIMESTAMPTZ,
+    created TIMESTAMPTZ,
+    synced_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_stripe_invoices_created ON stripe_invoices(created DESC);
+
+-- All revenue aggregates in one round-trip (amounts in cents)
+CREATE OR REPLACE FUNCTION stripe_revenue_summary(p_recent INTEGER DEFAULT 10)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'mrr_amount', (SELECT COALESCE(SUM(mrr_amount), 0) FROM stripe_subscriptions WHERE status = 'active'),
+        'active_subscriptions', (SELECT COUNT(*) FROM stripe_subscriptions WHERE status = 'active'),
+        'by_plan', (
+            SELECT COALESCE(jsonb_object_agg(plan, jsonb_build_object('count', n, 'revenue', mrr)), '{}'::jsonb)
+            FROM (
+                SELECT COALESCE(plan_name, price_id, 'unknown') AS plan, COUNT(*) AS n, SUM(mrr_amount) AS mrr
+                FROM stripe_subscriptions WHERE status = 'active'
+                GROUP BY 1
+            ) p
+        ),
+        'total_revenue', (SELECT COALESCE(SUM(amount), 0) FROM stripe_charges WHERE paid),
+        'total_customers', (SELECT COUNT(*) FROM stripe_customers WHERE NOT deleted),
+        'recent_charges', (
+            SELECT COALESCE(jsonb_agg(c ORDER BY c.created DESC), '[]'::jsonb)
+            FROM (
+                -- created as Unix seconds, like the Stripe API
+                SELECT id, amount, currency, paid, EXTRACT(EPOCH FROM created)::BIGINT AS created
+                FROM stripe_charges ORDER BY created DESC LIMIT p_recent
+            ) c
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Customer PII and revenue are for the backend only: RLS with no anon/authenticated
+-- policies keeps the public anon key out of these tables
+ALTER TABLE stripe_customers ENABLE ROW LEVEL SECURITY;
+ALTER TABLE stripe_subscriptions ENABLE ROW LEVEL SECURITY;
+ALTER TABLE stripe_charges ENABLE ROW LEVEL SECURITY;
+ALTER TABLE stripe_invoices ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "service_role_all_access" ON stripe_customers;
+CREATE POLICY "service_role_all_access" ON stripe_customers FOR ALL TO service_role USING (true) WITH CHECK (true);
+DROP POLICY IF EXISTS "service_role_all_access" ON stripe_subscriptions;
+CREATE POLICY "service_role_all_access" ON stripe_subscriptions FOR ALL TO service_role USING (true) WITH CHECK (true);
+DROP POLICY IF EXISTS "service_role_all_access" ON stripe_charges;
+CREATE POLICY "service_role_all_access" ON stripe_charges FOR ALL TO service_role USING (true) WITH CHECK (true);
+DROP POLICY IF EXISTS "service_role_all_access" ON stripe_invoices;
+CREATE POLICY "service_role_all_access" ON stripe_invoices FOR ALL TO service_role USING (true) WITH CHECK (true);
+
+REVOKE ALL ON FUNCTION stripe_revenue_summary(INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION stripe_revenue_summary(INTEGER) TO service_role;
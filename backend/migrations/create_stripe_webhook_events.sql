@@ -0,0 +1,31 @@
+-- Stripe Webhook Events Migration
+-- Durable, deduplicated inbox for Stripe webhooks
+-- The endpoint verifies + inserts (event id is the primary key) and acks;
+-- a worker processes rows in order per customer. Duplicates never re-run.
+-- Filosofía: No velocity, only precision 🐢💎
+
+CREATE TABLE IF NOT EXISTS stripe_webhook_events (
+    id TEXT PRIMARY KEY,  -- Stripe event id (evt_...)
+    type TEXT NOT NULL,
+    customer_id TEXT,     -- ordering lane; NULL = events without a customer
+    stripe_created BIGINT NOT NULL,
+    payload JSONB NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'processing', 'processed', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    received_at TIMESTAMPTZ DEFAULT NOW(),
+    claimed_at TIMESTAMPTZ,  -- set when a worker starts processing
+    processed_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_stripe_webhook_events_queue
+    ON stripe_webhook_events(status, stripe_created)
+    WHERE status IN ('pending', 'processing', 'failed');
+
+-- Raw Stripe payloads (PII, amounts) and the processing queue are backend-only:
+-- without this the anon key could read events or insert forged pending rows
+ALTER TABLE stripe_webhook_events ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "service_role_all_access" ON stripe_webhook_events;
+CREATE POLICY "service_role_all_access" ON stripe_webhook_events FOR ALL TO service_role USING (true) WITH CHECK (true);
@@ -0,0 +1,9 @@
+-- Migration: Add content_hash to brand_files for upload dedup
+-- Date: 2026-10-19
+-- Purpose: SHA-256 of the uploaded bytes; identical re-uploads return the existing file
+
+ALTER TABLE brand_files
+ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+
+CREATE INDEX IF NOT EXISTS idx_brand_files_client_hash
+ON brand_files(client_id, content_hash);
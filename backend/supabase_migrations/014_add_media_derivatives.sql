@@ -0,0 +1,10 @@
+-- Migration: Add derivative URLs next to original media
+-- Date: 2026-10-19
+-- Purpose: Thumbnails, WebP/AVIF variants and video posters generated in background
+-- Shape: {"thumb_webp": url, "display_webp": url, "display_avif": url, "poster_jpg": url}
+
+ALTER TABLE brand_files
+ADD COLUMN IF NOT EXISTS derivatives JSONB;
+
+ALTER TABLE reseller_branding
+ADD COLUMN IF NOT EXISTS hero_media_derivatives JSONB;
@@ -0,0 +1,28 @@
+-- Migration: Composite indexes for keyset (cursor) pagination
+-- Date: 2026-10-19
+-- Purpose: Each list endpoint filters, then orders by (sort columns, id) and seeks past the cursor;
+--          these indexes serve filter + order + seek in one range scan at any depth
+
+-- Calendar: per account / per client, in schedule order
+CREATE INDEX IF NOT EXISTS idx_scheduled_posts_account_keyset
+ON scheduled_posts(account_id, scheduled_date, scheduled_time, id)
+WHERE is_active;
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_posts_client_keyset
+ON scheduled_posts(client_id, scheduled_date, scheduled_time, id)
+WHERE is_active;
+
+-- Content Lab: newest first per client
+CREATE INDEX IF NOT EXISTS idx_content_lab_generated_client_keyset
+ON content_lab_generated(client_id, created_at DESC, id DESC);
+
+-- OMEGA admin lists: newest first
+CREATE INDEX IF NOT EXISTS idx_clients_created_keyset
+ON clients(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_resellers_created_keyset
+ON resellers(created_at DESC, id DESC);
+
+-- Reseller leads: newest first per reseller
+CREATE INDEX IF NOT EXISTS idx_leads_reseller_keyset
+ON leads(reseller_id, created_at DESC, id DESC);